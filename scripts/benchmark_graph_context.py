@@ -3,7 +3,8 @@
 
 Builds a synthetic person→hub graph, then measures:
   1. batched neighbour-set fetch time for all records (one AQL per edge collection)
-  2. in-memory pair-feature join throughput over N candidate pairs
+  2. in-memory pair-feature join throughput over N candidate pairs, for the
+     per-pair set join and the vectorized NeighborCSR batch path
 
 Run against any ArangoDB via env (ARANGO_HOST/PORT/ROOT_PASSWORD/USERNAME/DATABASE):
 
@@ -21,7 +22,7 @@ import uuid
 
 from arango import ArangoClient
 
-from entity_resolution.similarity.graph_context import GraphContextSimilarity
+from entity_resolution.similarity.graph_context import GraphContextSimilarity, NeighborCSR
 
 
 def _db():
@@ -80,8 +81,15 @@ def main() -> int:
         for a, b in pairs:
             gcs.pair_features(a, b, cache)
         join_s = time.time() - t1
-        print(f"Pair-feature join: {args.pairs} pairs in {join_s:.3f}s "
+        print(f"Pair-feature join (sets):  {args.pairs} pairs in {join_s:.3f}s "
               f"({args.pairs / join_s:,.0f} pairs/s)")
+
+        csr = NeighborCSR.from_sets(cache)
+        t2 = time.time()
+        gcs.pair_features_batch(pairs, csr)
+        batch_s = time.time() - t2
+        print(f"Pair-feature join (CSR):   {args.pairs} pairs in {batch_s:.3f}s "
+              f"({args.pairs / batch_s:,.0f} pairs/s, {join_s / batch_s:.1f}x)")
     finally:
         for n in (person, hub, edge):
             if db.has_collection(n):
@@ -1244,6 +1244,29 @@ def estimate(config, sample_size, max_iterations, no_term_frequencies, database,
         sys.exit(1)
 
 
+def _resolve_one_by_one(maintainer, keys, failed):
+    """Fallback for a failed ``resolve_many`` batch in ``watch``.
+
+    Resolves each key with ``resolve_and_commit`` so one bad record cannot
+    stall the rest; keys that still fail are reported and added to ``failed``.
+    """
+    from entity_resolution.services.feedback_application_service import FeedbackApplicationError
+
+    outcome = {"resolved": [], "locked": [], "missing": []}
+    for k in keys:
+        try:
+            maintainer.resolve_and_commit(k)
+            outcome["resolved"].append(k)
+        except KeyError:
+            outcome["missing"].append(k)
+        except FeedbackApplicationError:
+            outcome["locked"].append(k)
+        except Exception as exc:
+            failed.add(k)
+            click.echo(click.style(f"  [error] {k}: {exc}; skipping", fg="red"), err=True)
+    return outcome
+
+
 @main.command("watch")
 @click.option("--config", required=True, help="Path to the ER pipeline config (YAML/JSON).")
 @click.option("--interval", type=float, default=5.0, show_default=True,
@@ -1251,13 +1274,22 @@ def estimate(config, sample_size, max_iterations, no_term_frequencies, database,
 @click.option("--once", is_flag=True, help="Process the current backlog once and exit.")
 @click.option("--batch", type=int, default=100, show_default=True,
               help="Max records to process per poll.")
+@click.option("--queue", "use_queue", is_flag=True,
+              help="Drain the er_resolution_queue with leases (safe for several workers) "
+                   "instead of scanning for unstamped records.")
+@click.option("--backfill-queue", is_flag=True,
+              help="With --queue: first enqueue every record lacking an _er_resolved_at stamp.")
+@click.option("--max-attempts", type=int, default=5, show_default=True,
+              help="With --queue: leases a record gets before it is parked as failed.")
 @connection_options
-def watch(config, interval, once, batch, database, host, port, username, password):
+def watch(config, interval, once, batch, use_queue, backfill_queue, max_attempts,
+          database, host, port, username, password):
     """Incrementally resolve new/updated records into clusters (plan 3.3).
 
     Polls the source collection for records lacking an ``_er_resolved_at`` stamp
-    and resolves each one — blocking, scoring, linking, and re-clustering only
-    the affected component — honouring confirmed/suppressed edges.
+    and resolves each poll's batch together — blocking, scoring, linking, and
+    re-clustering only the affected components — honouring confirmed/suppressed
+    edges.
     """
     import time as _time
 
@@ -1271,6 +1303,14 @@ def watch(config, interval, once, batch, database, host, port, username, passwor
         if not fields:
             raise click.ClickException("No similarity fields configured; cannot resolve records.")
 
+        queue = None
+        if use_queue:
+            from entity_resolution.core.resolution_queue import ResolutionQueue
+
+            queue = ResolutionQueue(db, cfg.collection_name, max_attempts=max_attempts)
+            if backfill_queue:
+                click.echo(f"Queued {queue.enqueue_unresolved()} unresolved record(s).")
+
         maintainer = IncrementalMaintainer(
             db=db,
             collection=cfg.collection_name,
@@ -1278,19 +1318,38 @@ def watch(config, interval, once, batch, database, host, port, username, passwor
             edge_collection=cfg.edge_collection,
             cluster_collection=cfg.cluster_collection,
             confidence_threshold=cfg.similarity.threshold,
+            queue=queue,
         )
 
         total = 0
+        failed: set = set()  # keys that failed on their own; skipped until restart
         while True:
-            keys = maintainer.pending_keys(limit=batch)
-            for k in keys:
-                try:
-                    maintainer.resolve_and_commit(k)
-                    total += 1
-                except Exception as exc:  # keep the watcher alive on per-record errors
-                    click.echo(click.style(f"  [warn] {k}: {exc}", fg="yellow"), err=True)
+            try:
+                if queue is not None:
+                    outcome = maintainer.drain(limit=batch)
+                    keys = outcome["leased"]
+                else:
+                    keys = [
+                        k for k in maintainer.pending_keys(limit=batch + len(failed))
+                        if k not in failed
+                    ][:batch]
+                    try:
+                        outcome = maintainer.resolve_many(keys)
+                    except Exception as exc:
+                        click.echo(click.style(
+                            f"  [warn] batch: {exc}; retrying record by record", fg="yellow"
+                        ), err=True)
+                        outcome = _resolve_one_by_one(maintainer, keys, failed)
+            except Exception as exc:  # keep the watcher alive on batch errors
+                click.echo(click.style(f"  [warn] batch: {exc}", fg="yellow"), err=True)
+                keys = []
             if keys:
-                click.echo(f"Resolved {len(keys)} record(s) (total {total}).")
+                total += len(outcome["resolved"])
+                for k in outcome["locked"]:
+                    click.echo(click.style(f"  [warn] {k}: component locked; will retry", fg="yellow"), err=True)
+                for k in outcome.get("failed", []):
+                    click.echo(click.style(f"  [warn] {k}: failed; will retry until parked", fg="yellow"), err=True)
+                click.echo(f"Resolved {len(outcome['resolved'])} record(s) (total {total}).")
             if once:
                 break
             if not keys:
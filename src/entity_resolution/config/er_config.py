@@ -202,6 +202,10 @@ class GraphContextConfig:
     Adds graph evidence — shared neighbours and short-path connectivity over
     configured *non-similarity* edge collections (shared employer / address /
     device / phone, etc.) — as extra comparison fields.
+
+    ``backend: csr`` stores neighbourhoods as interned integer arrays and
+    computes features for whole batches of pairs at once; prefer it for
+    hub-heavy relationship graphs.
     """
 
     def __init__(
@@ -210,12 +214,14 @@ class GraphContextConfig:
         max_hops: int = 2,
         features: Optional[List[str]] = None,
         count_saturation: int = 5,
+        backend: str = "sets",
     ):
         self.edge_collections = list(edge_collections or [])
         self.max_hops = int(max_hops)
         self.features = list(features or GRAPH_CONTEXT_FEATURES)
         # shared_neighbor_count is normalised to [0,1] by dividing by this cap.
         self.count_saturation = int(count_saturation)
+        self.backend = backend
 
     @property
     def enabled(self) -> bool:
@@ -230,6 +236,7 @@ class GraphContextConfig:
             max_hops=config_dict.get("max_hops", 2),
             features=config_dict.get("features"),
             count_saturation=config_dict.get("count_saturation", 5),
+            backend=config_dict.get("backend", "sets"),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -238,6 +245,7 @@ class GraphContextConfig:
             "max_hops": self.max_hops,
             "features": self.features,
             "count_saturation": self.count_saturation,
+            "backend": self.backend,
         }
 
     def validate(self) -> List[str]:
@@ -252,6 +260,8 @@ class GraphContextConfig:
             )
         if self.count_saturation < 1:
             errors.append("similarity.graph_context.count_saturation must be >= 1")
+        if self.backend not in ("sets", "csr"):
+            errors.append("similarity.graph_context.backend must be 'sets' or 'csr'")
         return errors
 
 
@@ -387,12 +397,18 @@ class SimilarityConfig:
         auto_threshold: bool = False,
         auto_threshold_min_valley_depth: float = 0.15,
         comparison_levels: Optional[Dict[str, Any]] = None,
+        fetch_concurrency: int = 4,
+        server_side_normalization: bool = False,
+        batch_workers: int = 1,
+        minhash_threshold: Optional[int] = None,
+        minhash_permutations: int = 128,
     ):
         """
         Initialize similarity configuration.
 
         Args:
-            algorithm: Similarity algorithm ("jaro_winkler", "levenshtein", "jaccard")
+            algorithm: Similarity algorithm ("jaro_winkler", "levenshtein", "jaccard",
+                "overlap")
             threshold: Minimum similarity threshold (0.0-1.0). Default DEFAULT_SIMILARITY_THRESHOLD (0.75).
             batch_size: Batch size for similarity computation. Default DEFAULT_BATCH_SIZE (5000).
             field_weights: Dictionary of field names to weights
@@ -439,6 +455,18 @@ class SimilarityConfig:
                 weighted similarity's 0.541 on Abt-Buy because word-based
                 Jaccard over long descriptions almost never cleared one
                 threshold. Fields left unconfigured keep the binary model.
+            fetch_concurrency: Document fetch chunks of ``batch_size`` keys in
+                flight at once. Default 4.
+            server_side_normalization: Normalize string fields (strip, case,
+                whitespace) in the AQL fetch projection instead of in Python.
+                Fields with transformers are still normalized in Python.
+            batch_workers: Threads for the vectorized rapidfuzz string kernel
+                (-1 = all cores). Default 1.
+            minhash_threshold: For "jaccard"/"overlap", pairs whose token
+                sets both have at least this many distinct tokens are scored
+                from MinHash signatures instead of exactly. Default None
+                (always exact).
+            minhash_permutations: MinHash signature length. Default 128.
         """
         if scoring_method not in ("weighted_heuristic", "fellegi_sunter"):
             raise ValueError(
@@ -456,6 +484,11 @@ class SimilarityConfig:
         self.auto_threshold = auto_threshold
         self.auto_threshold_min_valley_depth = auto_threshold_min_valley_depth
         self.comparison_levels = normalize_comparison_levels(comparison_levels)
+        self.fetch_concurrency = fetch_concurrency
+        self.server_side_normalization = server_side_normalization
+        self.batch_workers = batch_workers
+        self.minhash_threshold = minhash_threshold
+        self.minhash_permutations = minhash_permutations
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'SimilarityConfig':
@@ -474,6 +507,11 @@ class SimilarityConfig:
                 'auto_threshold_min_valley_depth', 0.15),
             comparison_levels=config_dict.get('comparison_levels'),
             graph_context=GraphContextConfig.from_dict(config_dict.get('graph_context')),
+            fetch_concurrency=config_dict.get('fetch_concurrency', 4),
+            server_side_normalization=config_dict.get('server_side_normalization', False),
+            batch_workers=config_dict.get('batch_workers', 1),
+            minhash_threshold=config_dict.get('minhash_threshold'),
+            minhash_permutations=config_dict.get('minhash_permutations', 128),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -489,6 +527,11 @@ class SimilarityConfig:
             'scoring_method': self.scoring_method,
             'match_prior': self.match_prior,
             'agreement_thresholds': self.agreement_thresholds,
+            'fetch_concurrency': self.fetch_concurrency,
+            'server_side_normalization': self.server_side_normalization,
+            'batch_workers': self.batch_workers,
+            'minhash_threshold': self.minhash_threshold,
+            'minhash_permutations': self.minhash_permutations,
         }
         # Round-tripped explicitly: a config flag dropped by to_dict is silently
         # lost on save/reload, and comparison levels change what a learned model
@@ -613,6 +656,7 @@ class ClusteringConfig:
         sparse_backend_enabled: bool = True,
         gae: Optional[GAEClusteringConfig] = None,
         repair: Optional[Dict[str, Any]] = None,
+        maintain_membership: bool = False,
     ):
         """
         Initialize clustering configuration.
@@ -632,6 +676,9 @@ class ClusteringConfig:
             repair: Optional cluster-repair settings (plan 1.3):
                 ``{enabled: bool, min_coherence: float, auto_split: bool}``.
                 Defaults to disabled. Consumed by ClusterRepairService.
+            maintain_membership: Create and maintain the
+                ``<cluster_collection>_membership`` member -> cluster index
+                when clusters are stored. Default False.
         """
         import warnings
 
@@ -641,6 +688,7 @@ class ClusteringConfig:
         self.auto_select_threshold_edges = auto_select_threshold_edges
         self.sparse_backend_enabled = sparse_backend_enabled
         self.gae = gae
+        self.maintain_membership = maintain_membership
         self.repair = {
             "enabled": False,
             "min_coherence": 0.5,
@@ -679,6 +727,7 @@ class ClusteringConfig:
             sparse_backend_enabled=config_dict.get('sparse_backend_enabled', True),
             gae=gae,
             repair=config_dict.get('repair'),
+            maintain_membership=config_dict.get('maintain_membership', False),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -697,6 +746,8 @@ class ClusteringConfig:
             result['gae'] = self.gae.to_dict()
         if self.repair.get("enabled"):
             result['repair'] = self.repair
+        if self.maintain_membership:
+            result['maintain_membership'] = self.maintain_membership
         return result
 
     def validate(self) -> List[str]:
@@ -1028,6 +1079,10 @@ class ActiveLearningConfig:
     The ``llm`` field accepts a structured :class:`LLMProviderConfig`.
     When set, ``effective_model_string()`` prefers it over the bare
     ``model`` string for backward compatibility.
+
+    ``max_concurrency`` / ``requests_per_minute`` bound how hard uncertain
+    pairs are fanned out to the LLM; ``cache_verdicts`` reuses earlier
+    verdicts for unchanged record pairs (stored in ``verdict_cache_collection``).
     """
 
     def __init__(
@@ -1041,6 +1096,10 @@ class ActiveLearningConfig:
         optimizer_target_precision: float = 0.95,
         optimizer_min_samples: int = 20,
         llm: Optional[LLMProviderConfig] = None,
+        max_concurrency: int = 1,
+        requests_per_minute: Optional[float] = None,
+        cache_verdicts: bool = False,
+        verdict_cache_collection: Optional[str] = None,
     ):
         self.enabled = enabled
         self.feedback_collection = feedback_collection
@@ -1051,6 +1110,10 @@ class ActiveLearningConfig:
         self.optimizer_target_precision = optimizer_target_precision
         self.optimizer_min_samples = optimizer_min_samples
         self.llm = llm
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.cache_verdicts = cache_verdicts
+        self.verdict_cache_collection = verdict_cache_collection
 
     def effective_model_string(self) -> Optional[str]:
         """Return the litellm model string, preferring ``llm`` over bare ``model``."""
@@ -1073,6 +1136,10 @@ class ActiveLearningConfig:
             optimizer_target_precision=config_dict.get('optimizer_target_precision', 0.95),
             optimizer_min_samples=config_dict.get('optimizer_min_samples', 20),
             llm=llm,
+            max_concurrency=config_dict.get('max_concurrency', 1),
+            requests_per_minute=config_dict.get('requests_per_minute'),
+            cache_verdicts=config_dict.get('cache_verdicts', False),
+            verdict_cache_collection=config_dict.get('verdict_cache_collection'),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1084,6 +1151,8 @@ class ActiveLearningConfig:
             'high_threshold': self.high_threshold,
             'optimizer_target_precision': self.optimizer_target_precision,
             'optimizer_min_samples': self.optimizer_min_samples,
+            'max_concurrency': self.max_concurrency,
+            'cache_verdicts': self.cache_verdicts,
         }
         if self.feedback_collection is not None:
             result['feedback_collection'] = self.feedback_collection
@@ -1091,6 +1160,10 @@ class ActiveLearningConfig:
             result['model'] = self.model
         if self.llm is not None:
             result['llm'] = self.llm.to_dict()
+        if self.requests_per_minute is not None:
+            result['requests_per_minute'] = self.requests_per_minute
+        if self.verdict_cache_collection is not None:
+            result['verdict_cache_collection'] = self.verdict_cache_collection
         return result
 
     def validate(self) -> List[str]:
@@ -1115,6 +1188,12 @@ class ActiveLearningConfig:
             errors.append(
                 f"optimizer_min_samples must be >= 1, got: {self.optimizer_min_samples}"
             )
+        if self.max_concurrency < 1:
+            errors.append(f"max_concurrency must be >= 1, got: {self.max_concurrency}")
+        if self.requests_per_minute is not None and self.requests_per_minute <= 0:
+            errors.append(
+                f"requests_per_minute must be > 0, got: {self.requests_per_minute}"
+            )
         if self.llm is not None:
             errors.extend(self.llm.validate())
         return errors
@@ -1195,19 +1274,32 @@ class CollectiveConfig:
     entities as sharing each other's relationships, re-scores candidate pairs
     whose graph-context features changed, re-clusters, and repeats to a fixpoint
     (or ``max_rounds``). Only meaningful when ``similarity.graph_context`` is set.
+
+    ``incremental`` re-scores only pairs touching records whose augmented
+    neighbour set changed, and computes attribute-level field scores once
+    instead of once per round.
     """
 
-    def __init__(self, enabled: bool = False, max_rounds: int = 5):
+    def __init__(self, enabled: bool = False, max_rounds: int = 5, incremental: bool = False):
         self.enabled = bool(enabled)
         self.max_rounds = int(max_rounds)
+        self.incremental = bool(incremental)
 
     @classmethod
     def from_dict(cls, config_dict: Optional[Dict[str, Any]]) -> "CollectiveConfig":
         d = config_dict or {}
-        return cls(enabled=d.get("enabled", False), max_rounds=d.get("max_rounds", 5))
+        return cls(
+            enabled=d.get("enabled", False),
+            max_rounds=d.get("max_rounds", 5),
+            incremental=d.get("incremental", False),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"enabled": self.enabled, "max_rounds": self.max_rounds}
+        return {
+            "enabled": self.enabled,
+            "max_rounds": self.max_rounds,
+            "incremental": self.incremental,
+        }
 
     def validate(self) -> List[str]:
         errors: List[str] = []
@@ -1445,15 +1537,37 @@ class ERPipelineConfig:
                 f"got: {self.similarity.threshold}"
             )
         
-        if self.similarity.algorithm not in ('jaro_winkler', 'levenshtein', 'jaccard'):
+        if self.similarity.algorithm not in ('jaro_winkler', 'levenshtein', 'jaccard', 'overlap'):
             errors.append(
-                f"similarity.algorithm must be 'jaro_winkler', 'levenshtein', or 'jaccard', "
+                f"similarity.algorithm must be 'jaro_winkler', 'levenshtein', 'jaccard', "
+                f"or 'overlap', "
                 f"got: {self.similarity.algorithm}"
             )
         
         if self.similarity.field_weights:
             if not all(w >= 0 for w in self.similarity.field_weights.values()):
                 errors.append("similarity.field_weights must be non-negative")
+        if getattr(self.similarity, "fetch_concurrency", 1) < 1:
+            errors.append(
+                f"similarity.fetch_concurrency must be >= 1, "
+                f"got: {self.similarity.fetch_concurrency}"
+            )
+        batch_workers = getattr(self.similarity, "batch_workers", 1)
+        if batch_workers != -1 and batch_workers < 1:
+            errors.append(
+                f"similarity.batch_workers must be >= 1 or -1 (all cores), "
+                f"got: {batch_workers}"
+            )
+        minhash_threshold = getattr(self.similarity, "minhash_threshold", None)
+        if minhash_threshold is not None and minhash_threshold < 1:
+            errors.append(
+                f"similarity.minhash_threshold must be >= 1, got: {minhash_threshold}"
+            )
+        if getattr(self.similarity, "minhash_permutations", 128) < 1:
+            errors.append(
+                f"similarity.minhash_permutations must be >= 1, "
+                f"got: {self.similarity.minhash_permutations}"
+            )
         if getattr(self.similarity, "graph_context", None) is not None:
             errors.extend(self.similarity.graph_context.validate())
         if not isinstance(self.similarity.transformers, dict):
@@ -21,16 +21,39 @@ Usage (concurrent blocking strategies)::
     candidates = await pipeline.run_blocking_concurrent(
         strategies=["exact", "bm25", "vector"]
     )
+
+Usage (native async I/O, pipelined per chunk)::
+
+    async with AsyncArangoClient(hosts, database="er", username="root",
+                                 password=pw) as client:
+        pipeline = AsyncERPipeline(db, config=cfg, client=client)
+        async for stage_name, result in pipeline.run_streaming():
+            if result["partial"]:
+                handle_chunk(result)
+
+With a ``client`` the data plane skips the thread pool: blocking results
+stream from an async AQL cursor, each chunk's documents are fetched and its
+edges bulk-imported over async HTTP, and chunk N's edge writes overlap the
+scoring of chunk N+1. Only CPU-bound scoring, one-time setup and clustering
+still run in the executor. Configs that use a stage the native path does not
+implement (address ER, embedding setup, active learning, auto threshold,
+collective resolution) run ``ConfigurableERPipeline.run()`` in the executor
+instead, so a client never changes what a config does.
 """
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from entity_resolution.utils.async_arango import AsyncArangoClient
+
 logger = logging.getLogger(__name__)
 
 # Shared executor — reused across pipeline instances for efficiency
@@ -60,6 +83,16 @@ class AsyncERPipeline:
     progress_callback:
         Optional ``async`` callable ``(stage: str, result: dict) -> None``
         called after each stage completes.
+    client:
+        Optional :class:`~entity_resolution.utils.async_arango.AsyncArangoClient`.
+        When given, :meth:`run_streaming` takes the native async path and
+        yields a ``partial`` result per chunk before each stage's summary.
+    chunk_size:
+        Candidate pairs per chunk on the native path (also the AQL cursor
+        batch size).
+    max_pending_writes:
+        Edge-import chunks allowed in flight before scoring waits for one
+        to finish (native path only).
     """
 
     def __init__(
@@ -69,12 +102,23 @@ class AsyncERPipeline:
         config_path: Optional[Union[str, Path]] = None,
         executor: Optional[ThreadPoolExecutor] = None,
         progress_callback=None,
+        client: Optional["AsyncArangoClient"] = None,
+        chunk_size: int = 5000,
+        max_pending_writes: int = 4,
     ) -> None:
         from entity_resolution.config.er_config import ERPipelineConfig
 
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if max_pending_writes < 1:
+            raise ValueError(f"max_pending_writes must be >= 1, got {max_pending_writes}")
+
         self.db = db
         self.executor = executor or _EXECUTOR
         self.progress_callback = progress_callback
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_pending_writes = max_pending_writes
 
         if config is not None:
             self.config = config
@@ -109,7 +153,28 @@ class AsyncERPipeline:
 
         Consumers can update progress bars or stream partial results to
         MCP clients without waiting for the full pipeline.
+
+        On the native path (``client`` given) each chunk first yields
+        ``("blocking", ...)`` and ``("similarity", ...)`` results with
+        ``partial=True`` (the similarity one carries that chunk's
+        ``matches``); the per-stage summaries follow with ``partial=False``.
         """
+        if self.client is not None:
+            unsupported = self._native_unsupported_features()
+            if unsupported:
+                logger.info(
+                    "Native async path does not implement %s; running the sync pipeline",
+                    ", ".join(unsupported),
+                )
+                stages = self._run_sync_pipeline_streaming()
+            else:
+                stages = self._run_native_streaming()
+            async for stage, result in stages:
+                yield stage, result
+                if self.progress_callback:
+                    await self.progress_callback(stage, result)
+            return
+
         loop = asyncio.get_running_loop()
 
         # --- Stage 1: Blocking (concurrent strategies) --------------------
@@ -155,6 +220,240 @@ class AsyncERPipeline:
         loop = asyncio.get_running_loop()
         return await self._run_blocking_concurrent(loop, strategy_names=strategies)
 
+    # ------------------------------------------------------------------
+    # Native async path
+    # ------------------------------------------------------------------
+
+    def _native_unsupported_features(self) -> List[str]:
+        """Configured stages that only ``ConfigurableERPipeline.run()`` implements."""
+        cfg = self.config
+        features = []
+        if cfg.entity_type == "address":
+            features.append("entity_type 'address'")
+        if cfg.embedding:
+            features.append("embedding")
+        active_learning = getattr(cfg, "active_learning", None)
+        if active_learning is not None and active_learning.enabled:
+            features.append("active_learning")
+        if getattr(cfg.similarity, "auto_threshold", False):
+            features.append("similarity.auto_threshold")
+        collective = getattr(cfg, "collective", None)
+        if collective is not None and collective.enabled:
+            features.append("collective")
+        return features
+
+    async def _run_sync_pipeline_streaming(self) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Run ``ConfigurableERPipeline.run()`` in the executor and yield its stages."""
+        from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
+
+        loop = asyncio.get_running_loop()
+        sync_pipeline = ConfigurableERPipeline(db=self.db, config=self.config)
+        results = await loop.run_in_executor(self.executor, sync_pipeline.run)
+        for stage, result in results.items():
+            if isinstance(result, dict):
+                yield stage, {**result, "partial": False}
+
+    async def _run_native_streaming(self) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Pipelined run: cursor batches -> fetch -> score -> concurrent imports."""
+        loop = asyncio.get_running_loop()
+        sync_pipeline, sim_service, edge_service = await loop.run_in_executor(
+            self.executor, self._prepare_native_services
+        )
+        threshold = self.config.similarity.threshold
+        edge_metadata = {
+            "timestamp": datetime.now().isoformat(),
+            "method": "configurable_pipeline",
+        }
+        on_duplicate = "ignore" if edge_service.use_deterministic_keys else "error"
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(self._produce_candidate_chunks(queue))
+        pending: set = set()
+        import_results: List[Dict[str, int]] = []
+        pairs_scored = 0
+        matches_found = 0
+        chunk_index = 0
+        t0 = time.perf_counter()
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+
+                yield "blocking", {
+                    "partial": True,
+                    "chunk": chunk_index,
+                    "candidate_pairs": len(chunk),
+                }
+
+                doc_cache, neighbor_cache = await self._native_fetch_documents(
+                    sim_service, chunk
+                )
+                matches = await loop.run_in_executor(
+                    self.executor,
+                    functools.partial(
+                        sim_service.score_pairs, chunk, doc_cache, threshold,
+                        neighbor_cache=neighbor_cache,
+                    ),
+                )
+                pairs_scored += len(chunk)
+                matches_found += len(matches)
+
+                if matches:
+                    if len(pending) >= self.max_pending_writes:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        import_results.extend(task.result() for task in done)
+                    edges = edge_service.build_edge_documents(matches, edge_metadata)
+                    pending.add(asyncio.create_task(self.client.import_documents(
+                        edge_service.edge_collection_name, edges,
+                        on_duplicate=on_duplicate,
+                    )))
+
+                yield "similarity", {
+                    "partial": True,
+                    "chunk": chunk_index,
+                    "pairs_scored": len(chunk),
+                    "matches_found": len(matches),
+                    "matches": matches,
+                }
+                chunk_index += 1
+
+            blocking_summary = await producer
+            import_results.extend(await asyncio.gather(*pending))
+            pending = set()
+        finally:
+            producer.cancel()
+            for task in pending:
+                task.cancel()
+
+        blocking_summary.update(partial=False, chunks=chunk_index)
+        yield "blocking", blocking_summary
+
+        edges_created = sum(r["created"] for r in import_results)
+        edges_ignored = sum(r["ignored"] for r in import_results)
+        yield "similarity", {
+            "partial": False,
+            "pairs_scored": pairs_scored,
+            "matches_found": matches_found,
+            "edges_created": edges_created,
+            "edges_ignored": edges_ignored,
+            "edge_errors": sum(r["errors"] for r in import_results),
+            "duration_s": round(time.perf_counter() - t0, 2),
+        }
+
+        # Like ConfigurableERPipeline.run(): cluster only when edges were written.
+        t0 = time.perf_counter()
+        clusters: List[List[str]] = []
+        if self.config.clustering.store_results and edges_created + edges_ignored > 0:
+            clusters = await loop.run_in_executor(self.executor, sync_pipeline.run_clustering)
+        yield "clustering", {
+            "partial": False,
+            "clusters_found": len(clusters),
+            "total_entities": sum(len(c) for c in clusters),
+            "duration_s": round(time.perf_counter() - t0, 2),
+        }
+
+    def _prepare_native_services(self) -> Tuple[Any, Any, Any]:
+        """One-time setup (migrations, collection checks, model loading) run in the executor.
+
+        Services are built exactly as ``ConfigurableERPipeline.run()`` builds
+        them, so both paths score and write the same edges.
+        """
+        from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
+        from entity_resolution.services.similarity_edge_service import SimilarityEdgeService
+
+        sync_pipeline = ConfigurableERPipeline(db=self.db, config=self.config)
+        sync_pipeline._maybe_migrate_schema({})
+        sim_service = sync_pipeline.build_similarity_service()
+        edge_service = SimilarityEdgeService(
+            db=self.db,
+            edge_collection=self.config.edge_collection,
+            batch_size=1000,
+        )
+        return sync_pipeline, sim_service, edge_service
+
+    async def _produce_candidate_chunks(self, queue: asyncio.Queue) -> Optional[Dict[str, Any]]:
+        """Feed candidate-pair chunks into *queue*, then ``None``.
+
+        A failure is put on the queue instead, so the consumer re-raises it
+        rather than waiting forever.
+        """
+        t0 = time.perf_counter()
+        total = 0
+        try:
+            async for chunk in self._native_candidate_chunks():
+                if chunk:
+                    total += len(chunk)
+                    await queue.put(chunk)
+        except Exception as exc:
+            await queue.put(exc)
+            return None
+        await queue.put(None)
+        return {
+            "strategy": self.config.blocking.strategy,
+            "total_unique_pairs": total,
+            "duration_s": round(time.perf_counter() - t0, 2),
+        }
+
+    async def _native_candidate_chunks(self) -> AsyncIterator[List[Tuple[str, str]]]:
+        """Yield ``(doc1_key, doc2_key)`` chunks of at most ``chunk_size`` pairs.
+
+        Exact (COLLECT) blocking streams straight from an async cursor. Other
+        strategies have no native query yet; they run once in the executor
+        and their pairs are chunked.
+        """
+        from entity_resolution.strategies import CollectBlockingStrategy
+
+        blocking = self.config.blocking
+        if blocking.strategy == "exact":
+            fields, computed_fields = blocking.parse_fields()
+            strategy = CollectBlockingStrategy(
+                db=self.db,
+                collection=self.config.collection_name,
+                blocking_fields=fields,
+                max_block_size=blocking.max_block_size,
+                min_block_size=blocking.min_block_size,
+                computed_fields=computed_fields or None,
+                allow_unsafe_expressions=blocking.allow_unsafe_expressions,
+            )
+            query, bind_vars = strategy._build_collect_query()
+            async for batch in self.client.aql(query, bind_vars, batch_size=self.chunk_size):
+                yield [(p["doc1_key"], p["doc2_key"]) for p in strategy._normalize_pairs(batch)]
+            return
+
+        from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
+
+        loop = asyncio.get_running_loop()
+        sync_pipeline = ConfigurableERPipeline(db=self.db, config=self.config)
+        pairs = await loop.run_in_executor(self.executor, sync_pipeline.run_blocking)
+        for i in range(0, len(pairs), self.chunk_size):
+            yield [(p["doc1_key"], p["doc2_key"]) for p in pairs[i:i + self.chunk_size]]
+
+    async def _native_fetch_documents(
+        self, sim_service: Any, chunk: List[Tuple[str, str]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Fetch the chunk's documents (and graph features, if configured)."""
+        keys = sorted({k for pair in chunk for k in pair})
+        docs = await self.client.aql_all(
+            sim_service.fetch_query(),
+            {"@collection": sim_service.collection, "keys": keys},
+            batch_size=max(len(keys), 1),
+        )
+        neighbor_cache = None
+        if sim_service.graph_context is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                neighbor_cache = await loop.run_in_executor(
+                    self.executor, sim_service.graph_context.batch_fetch_neighbor_sets, set(keys)
+                )
+            except Exception:
+                neighbor_cache = None
+        return {doc["_key"]: doc for doc in docs}, neighbor_cache
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -13,6 +13,13 @@ via graph-context features (plan 3.1). Collective resolution iterates:
 This module is a pure orchestrator: scoring and clustering are injected as
 callables, so it is fully unit-testable and reused by the pipeline with real
 ``BatchSimilarityService`` + graph context + a connected-components clusterer.
+
+With ``incremental=True`` each round after the first re-scores only the pairs
+touching a record whose augmented neighbour set actually changed; every other
+pair keeps its previous score. Graph features depend only on the two endpoint
+neighbour sets, so the result is the same as a full re-score. The scorer can
+additionally cache attribute-level work between calls
+(``BatchSimilarityService.compute_similarities_cached``).
 """
 
 from __future__ import annotations
@@ -63,12 +70,14 @@ class CollectiveResolver:
         base_neighbor_cache: NeighborCache,
         threshold: float = 0.75,
         max_rounds: int = 5,
+        incremental: bool = False,
     ) -> None:
         self.score_pairs = score_pairs
         self.cluster = cluster
         self.base_neighbor_cache = {k: set(v) for k, v in base_neighbor_cache.items()}
         self.threshold = threshold
         self.max_rounds = max(1, int(max_rounds))
+        self.incremental = bool(incremental)
 
     @staticmethod
     def _signature(clusters: Sequence[Sequence[str]]) -> FrozenSet[FrozenSet[str]]:
@@ -93,8 +102,41 @@ class CollectiveResolver:
                 cache[k] = cache.get(k, set()) | shared
         return cache
 
+    def _augment_delta(
+        self,
+        clusters: Sequence[Sequence[str]],
+        previous: NeighborCache,
+        previous_clustered: Set[str],
+    ) -> Tuple[NeighborCache, Set[str], Set[str]]:
+        """:meth:`_augment` without copying unchanged sets, plus what changed.
+
+        Records outside multi-member clusters share the base set object, so
+        only clustered records get a new set. Only records clustered in this
+        round or the previous one can differ from ``previous``, so only those
+        are compared. Returns ``(cache, changed_records, clustered_records)``.
+        """
+        base = self.base_neighbor_cache
+        cache: NeighborCache = dict(base)
+        clustered: Set[str] = set()
+        for comp in clusters:
+            if len(comp) < 2:
+                continue
+            shared: Set[str] = set()
+            for k in comp:
+                shared |= base.get(k, set())
+            for k in comp:
+                cache[k] = base.get(k, set()) | shared
+                clustered.add(k)
+        changed = {
+            k for k in clustered | previous_clustered
+            if cache.get(k, set()) != previous.get(k, set())
+        }
+        return cache, changed, clustered
+
     def resolve(self, candidate_pairs: Sequence[Pair]) -> Dict[str, Any]:
         """Iterate to a fixpoint; returns clusters + convergence metadata."""
+        if self.incremental:
+            return self._resolve_incremental(candidate_pairs)
         cache = {k: set(v) for k, v in self.base_neighbor_cache.items()}
         seen: List[FrozenSet[FrozenSet[str]]] = []
         prev_sig = None
@@ -130,4 +172,62 @@ class CollectiveResolver:
             "clusters": clusters,
             "edges": edges,
             "num_clusters": sum(1 for c in clusters if len(c) >= 2),
+            "pairs_scored": [len(candidate_pairs)] * rounds,
+        }
+
+    def _resolve_incremental(self, candidate_pairs: Sequence[Pair]) -> Dict[str, Any]:
+        """:meth:`resolve` re-scoring only pairs incident to changed records."""
+        incident: Dict[str, List[int]] = {}
+        for i, (a, b) in enumerate(candidate_pairs):
+            incident.setdefault(a, []).append(i)
+            incident.setdefault(b, []).append(i)
+
+        cache: NeighborCache = dict(self.base_neighbor_cache)
+        clustered: Set[str] = set()
+        scores: Dict[Pair, float] = {}
+        to_score: Sequence[Pair] = candidate_pairs
+        pairs_scored: List[int] = []
+        seen: List[FrozenSet[FrozenSet[str]]] = []
+        prev_sig = None
+        clusters: List[List[str]] = []
+        edges: List[Pair] = []
+        rounds = 0
+        converged = False
+        oscillated = False
+
+        for r in range(1, self.max_rounds + 1):
+            rounds = r
+            pairs_scored.append(len(to_score))
+            if to_score:
+                for a, b, score in self.score_pairs(to_score, cache):
+                    scores[(a, b)] = score
+            edges = [pair for pair, score in scores.items() if score >= self.threshold]
+            clusters = self.cluster(edges)
+            sig = self._signature(clusters)
+
+            if sig == prev_sig:
+                converged = True
+                break
+            if sig in seen:
+                oscillated = True
+                logger.warning("collective: oscillation detected at round %d; stopping", r)
+                break
+            seen.append(sig)
+            prev_sig = sig
+            cache, changed, clustered = self._augment_delta(clusters, cache, clustered)
+            affected = sorted({i for k in changed for i in incident.get(k, ())})
+            to_score = [candidate_pairs[i] for i in affected]
+            logger.debug(
+                "collective: round %d changed %d records, re-scoring %d pairs",
+                r, len(changed), len(to_score),
+            )
+
+        return {
+            "rounds": rounds,
+            "converged": converged,
+            "oscillated": oscillated,
+            "clusters": clusters,
+            "edges": edges,
+            "num_clusters": sum(1 for c in clusters if len(c) >= 2),
+            "pairs_scored": pairs_scored,
         }
@@ -763,6 +763,13 @@ class ConfigurableERPipeline:
             scoring_method=scoring_method,
             fs_scorer=fs_scorer,
             graph_context=self._build_graph_context(),
+            batch_workers=getattr(self.config.similarity, "batch_workers", 1),
+            minhash_threshold=getattr(self.config.similarity, "minhash_threshold", None),
+            minhash_permutations=getattr(self.config.similarity, "minhash_permutations", 128),
+            fetch_concurrency=getattr(self.config.similarity, "fetch_concurrency", 4),
+            server_side_normalization=getattr(
+                self.config.similarity, "server_side_normalization", False
+            ),
         )
 
     def run_collective(self, candidate_pairs: list):
@@ -796,7 +803,16 @@ class ConfigurableERPipeline:
             keys.add(b)
         base_cache = graph_context.batch_fetch_neighbor_sets(keys)
 
+        incremental = getattr(cfg, "incremental", False)
+        attribute_cache: dict = {}
+
         def score_fn(pairs, cache):
+            if incremental:
+                # Attribute comparisons are computed once; rounds only redo
+                # graph features for the pairs the resolver hands back.
+                return sim.compute_similarities_cached(
+                    list(pairs), attribute_cache, neighbor_cache=cache
+                )
             return sim.compute_similarities(
                 list(pairs), threshold=0.0, return_all=True, neighbor_cache=cache
             )
@@ -807,6 +823,7 @@ class ConfigurableERPipeline:
             base_neighbor_cache=base_cache,
             threshold=self.config.similarity.threshold,
             max_rounds=cfg.max_rounds,
+            incremental=incremental,
         )
         result = resolver.resolve(pair_tuples)
         self.logger.info(
@@ -829,6 +846,7 @@ class ConfigurableERPipeline:
             max_hops=gc.max_hops,
             features=gc.features,
             count_saturation=gc.count_saturation,
+            backend=gc.backend,
         )
 
     def _graph_feature_names(self) -> list:
@@ -1033,24 +1051,39 @@ class ConfigurableERPipeline:
             'pairs_reviewed': 0,
             'llm_calls': 0,
             'score_overrides': 0,
+            'cache_hits': 0,
             'feedback_collection': verifier.store.collection,
         }
 
-        for item in detailed_matches:
+        # Uncertain pairs go to the verifier as one batch so it can fan
+        # them out concurrently and serve repeats from the verdict cache.
+        uncertain = [
+            i for i, item in enumerate(detailed_matches)
+            if verifier.verifier.needs_verification(item['weighted_score'])
+        ]
+        verdicts = dict(zip(uncertain, verifier.verify_batch(
+            [
+                (
+                    doc_cache.get(detailed_matches[i]['doc1_key'], {'_key': detailed_matches[i]['doc1_key']}),
+                    doc_cache.get(detailed_matches[i]['doc2_key'], {'_key': detailed_matches[i]['doc2_key']}),
+                    detailed_matches[i]['weighted_score'],
+                )
+                for i in uncertain
+            ],
+            [self._format_field_scores_for_llm(detailed_matches[i]['field_scores']) for i in uncertain],
+        )))
+
+        for i, item in enumerate(detailed_matches):
             score = item['weighted_score']
             final_score = score
             self._active_learning_stats['pairs_reviewed'] += 1
 
-            if verifier.verifier.needs_verification(score):
-                field_scores = self._format_field_scores_for_llm(item['field_scores'])
-                result = verifier.verify(
-                    doc_cache.get(item['doc1_key'], {'_key': item['doc1_key']}),
-                    doc_cache.get(item['doc2_key'], {'_key': item['doc2_key']}),
-                    score=score,
-                    field_scores=field_scores,
-                )
+            result = verdicts.get(i)
+            if result is not None:
                 if result.get('llm_called'):
                     self._active_learning_stats['llm_calls'] += 1
+                if result.get('cached'):
+                    self._active_learning_stats['cache_hits'] += 1
                 if result.get('score_override') is not None:
                     final_score = result['score_override']
                     self._active_learning_stats['score_overrides'] += 1
@@ -1063,11 +1096,22 @@ class ConfigurableERPipeline:
 
     def _build_active_learning_verifier(self):
         """Construct the active learning verifier for this pipeline run."""
-        from entity_resolution.reasoning.feedback import AdaptiveLLMVerifier, FeedbackStore
+        from entity_resolution.reasoning.feedback import (
+            AdaptiveLLMVerifier,
+            FeedbackStore,
+            VerdictCache,
+        )
 
         cfg = self.config.active_learning
         feedback_collection = cfg.feedback_collection or f"{self.config.collection_name}_llm_feedback"
         store = FeedbackStore(self.db, collection=feedback_collection)
+        verdict_cache = None
+        if cfg.cache_verdicts:
+            verdict_cache = VerdictCache(
+                self.db,
+                collection=cfg.verdict_cache_collection
+                or f"{self.config.collection_name}_llm_verdicts",
+            )
         return AdaptiveLLMVerifier(
             feedback_store=store,
             refresh_every=cfg.refresh_every,
@@ -1077,6 +1121,9 @@ class ConfigurableERPipeline:
             entity_type=self.config.entity_type,
             optimizer_target_precision=cfg.optimizer_target_precision,
             optimizer_min_samples=cfg.optimizer_min_samples,
+            max_concurrency=cfg.max_concurrency,
+            requests_per_minute=cfg.requests_per_minute,
+            verdict_cache=verdict_cache,
         )
 
     def _format_field_scores_for_llm(self, field_scores: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
@@ -1122,6 +1169,7 @@ class ConfigurableERPipeline:
             auto_select_threshold_edges=self.config.clustering.auto_select_threshold_edges,
             sparse_backend_enabled=self.config.clustering.sparse_backend_enabled,
             gae_config=self.config.clustering.gae,
+            maintain_membership=getattr(self.config.clustering, "maintain_membership", False),
         )
         
         clusters = clustering_service.cluster(
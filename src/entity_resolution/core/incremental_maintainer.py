@@ -20,7 +20,7 @@ from __future__ import annotations
 import hashlib
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from ..services.feedback_application_service import (
     FeedbackApplicationError,
@@ -29,6 +29,10 @@ from ..services.feedback_application_service import (
 from ..utils.graph_utils import format_vertex_id
 from .incremental_resolver import IncrementalResolver
 
+if TYPE_CHECKING:
+    from .resident_index import ResidentBlockingIndex
+    from .resolution_queue import ResolutionQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,15 +49,22 @@ class IncrementalMaintainer:
         confidence_threshold: float = 0.80,
         blocking_strategy: str = "prefix",
         prefix_length: int = 3,
+        resident_index: Optional["ResidentBlockingIndex"] = None,
+        queue: Optional["ResolutionQueue"] = None,
     ) -> None:
         self.db = db
         self.collection = collection
+        self.fields = list(fields)
         self.edge_collection = edge_collection
+        # When set, pending work comes from the lease-based queue instead of a
+        # scan for unstamped records (see :meth:`drain`).
+        self.queue = queue
         self.resolver = IncrementalResolver(
             db, collection, fields,
             confidence_threshold=confidence_threshold,
             blocking_strategy=blocking_strategy,
             prefix_length=prefix_length,
+            resident_index=resident_index,
         )
         self.applier = FeedbackApplicationService(
             db=db,
@@ -74,10 +85,10 @@ class IncrementalMaintainer:
         The ``UPDATE {}`` preserves any existing edge — crucially, a human
         ``suppressed``/``confirmed`` edge is left exactly as-is.
         """
-        from_id = format_vertex_id(key_a, self.collection)
-        to_id = format_vertex_id(key_b, self.collection)
-        c_from, c_to = (from_id, to_id) if from_id < to_id else (to_id, from_id)
-        edge_key = self._edge_key(from_id, to_id)
+        doc = self._edge_doc(
+            key_a, key_b, score,
+            datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
         self.db.aql.execute(
             """
             UPSERT { _key: @key }
@@ -85,17 +96,66 @@ class IncrementalMaintainer:
             UPDATE {}
             IN @@edges
             """,
-            bind_vars={
-                "key": edge_key,
-                "doc": {
-                    "_key": edge_key, "_from": c_from, "_to": c_to,
-                    "similarity": round(score, 4), "method": "incremental",
-                    "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-                },
-                "@edges": self.edge_collection,
-            },
+            bind_vars={"key": doc["_key"], "doc": doc, "@edges": self.edge_collection},
         )
 
+    def _edge_doc(self, key_a: str, key_b: str, score: float, now: str) -> Dict[str, Any]:
+        from_id = format_vertex_id(key_a, self.collection)
+        to_id = format_vertex_id(key_b, self.collection)
+        c_from, c_to = (from_id, to_id) if from_id < to_id else (to_id, from_id)
+        edge_key = self._edge_key(from_id, to_id)
+        return {
+            "_key": edge_key, "_from": c_from, "_to": c_to,
+            "similarity": round(score, 4), "method": "incremental",
+            "timestamp": now,
+        }
+
+    def _upsert_similarity_edges(self, edges: List[Dict[str, Any]]) -> None:
+        """Bulk form of :meth:`_upsert_similarity_edge` — one AQL for many edges."""
+        if not edges:
+            return
+        self.db.aql.execute(
+            """
+            FOR e IN @edges
+                UPSERT { _key: e._key }
+                INSERT e
+                UPDATE {}
+                IN @@edges
+            """,
+            bind_vars={"edges": edges, "@edges": self.edge_collection},
+        )
+
+    def _lock_names(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Map each key to the name of the lock guarding its component.
+
+        A record already in a cluster is guarded by that cluster, so new
+        records linking to different members of one cluster contend for the
+        same lock; an unclustered record is guarded by its own key.
+        """
+        keys = set(keys)
+        names = {k: k for k in keys}
+        for doc in self.applier._clusters_containing(keys):
+            for k in doc.get("member_keys", []):
+                if k in keys:
+                    names[k] = f"cluster:{doc['_key']}"
+        return names
+
+    def _acquire_locks(self, names: Iterable[str]) -> Optional[List[str]]:
+        """Acquire every lock in ``names`` (sorted), or none of them.
+
+        The canonical order keeps two writers from each holding part of the
+        other's set. Returns the held lock keys, or None on contention.
+        """
+        held: List[str] = []
+        for name in sorted(set(names)):
+            lock_key = self.applier._acquire_lock(name)
+            if lock_key is None:
+                for k in held:
+                    self.applier._release_lock(k)
+                return None
+            held.append(lock_key)
+        return held
+
     def resolve_and_commit(
         self,
         key: str,
@@ -118,8 +178,8 @@ class IncrementalMaintainer:
 
         # Serialize per-component work with the same TTL lock the verdict loop
         # uses, so a concurrent verdict/edit cannot interleave re-cluster writes.
-        lock_key = self.applier._acquire_lock(key)
-        if lock_key is None:
+        held = self._acquire_locks(self._lock_names([key, *match_keys]).values())
+        if held is None:
             raise FeedbackApplicationError(
                 f"component for '{key}' is locked by a concurrent operation; retry"
             )
@@ -130,7 +190,13 @@ class IncrementalMaintainer:
                 key, *match_keys, auto_refresh=auto_refresh
             )
         finally:
-            self.applier._release_lock(lock_key)
+            for lock_key in held:
+                self.applier._release_lock(lock_key)
+
+        # Committed records become candidates for later resolves without a
+        # rebuild of the resident index.
+        if self.resolver.resident_index is not None:
+            self.resolver.resident_index.upsert(doc)
 
         if stamp:
             try:
@@ -142,8 +208,187 @@ class IncrementalMaintainer:
 
         return {"key": key, "matches": matches, "recluster": recluster}
 
+    def resolve_many(
+        self,
+        keys: Iterable[str],
+        *,
+        top_k: int = 25,
+        auto_refresh: bool = False,
+        stamp: bool = True,
+    ) -> Dict[str, Any]:
+        """Resolve a micro-batch of records and update their clusters.
+
+        Batched counterpart of :meth:`resolve_and_commit` for draining
+        :meth:`pending_keys`: one projected fetch for all records, shared
+        candidate lookups (:meth:`IncrementalResolver.resolve_many`), one bulk
+        edge upsert, one set of cluster locks per group of records linked by the
+        new edges or an existing cluster, a single scoped re-cluster covering every affected component, and one
+        bulk stamp.
+
+        Groups whose lock is held by a concurrent operation are skipped — no
+        edges written, not stamped — and reported under ``locked`` so a later
+        poll retries them. Keys that no longer exist are reported under
+        ``missing``. Returns ``{resolved, matches, locked, missing, recluster}``.
+        """
+        keys = list(dict.fromkeys(k for k in keys if k))
+        result: Dict[str, Any] = {
+            "resolved": [], "matches": {}, "locked": [], "missing": [], "recluster": None,
+        }
+        if not keys:
+            return result
+
+        docs = list(self.db.aql.execute(
+            "FOR d IN @@col FILTER d._key IN @keys RETURN KEEP(d, @fields)",
+            bind_vars={
+                "@col": self.collection,
+                "keys": keys,
+                "fields": ["_key", "_id", *self.fields],
+            },
+        ))
+        found = {d["_key"] for d in docs}
+        result["missing"] = [k for k in keys if k not in found]
+
+        matches_by_key = dict(zip(
+            (d["_key"] for d in docs),
+            self.resolver.resolve_many(docs, top_k=top_k),
+        ))
+        result["matches"] = matches_by_key
+
+        # Group the batch by the components the new edges connect and the
+        # existing clusters they touch; each group locks the clusters (or
+        # unclustered records) it touches, so concurrent batches reaching the
+        # same existing cluster through different records collide.
+        touched = {k: [k, *(m["_key"] for m in ms)] for k, ms in matches_by_key.items()}
+        lock_names = self._lock_names(x for xs in touched.values() for x in xs)
+        groups = self.applier._union_find(
+            [(k, lock_names[x]) for k, xs in touched.items() for x in xs]
+        )
+        members_by_root: Dict[str, List[str]] = {}
+        for k in matches_by_key:
+            members_by_root.setdefault(groups[k], []).append(k)
+
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        held: List[str] = []
+        committed: List[str] = []
+        edges: Dict[str, Dict[str, Any]] = {}
+        seeds: List[str] = []
+        try:
+            for members in members_by_root.values():
+                group_locks = self._acquire_locks(
+                    lock_names[x] for k in members for x in touched[k]
+                )
+                if group_locks is None:
+                    result["locked"].extend(members)
+                    continue
+                held.extend(group_locks)
+                committed.extend(members)
+                for k in members:
+                    seeds.append(k)
+                    for m in matches_by_key[k]:
+                        doc = self._edge_doc(k, m["_key"], m["score"], now)
+                        edges.setdefault(doc["_key"], doc)
+                        seeds.append(m["_key"])
+            self._upsert_similarity_edges(list(edges.values()))
+            if seeds:
+                result["recluster"] = self.applier.recluster_component(
+                    *dict.fromkeys(seeds), auto_refresh=auto_refresh
+                )
+        finally:
+            for lock_key in held:
+                self.applier._release_lock(lock_key)
+
+        if self.resolver.resident_index is not None:
+            committed_set = set(committed)
+            for d in docs:
+                if d["_key"] in committed_set:
+                    self.resolver.resident_index.upsert(d)
+
+        if stamp and committed:
+            try:
+                self.db.aql.execute(
+                    """
+                    FOR k IN @keys
+                        UPDATE { _key: k, _er_resolved_at: @now } IN @@col
+                    """,
+                    bind_vars={"@col": self.collection, "keys": committed, "now": now},
+                )
+            except Exception as exc:
+                logger.warning("IncrementalMaintainer: bulk stamp failed: %s", exc)
+
+        result["resolved"] = committed
+        return result
+
+    def drain(
+        self,
+        limit: int = 100,
+        *,
+        lease_seconds: int = 300,
+        top_k: int = 25,
+        auto_refresh: bool = False,
+        stamp: bool = True,
+    ) -> Dict[str, Any]:
+        """Lease a batch from :attr:`queue`, resolve it, and ack it.
+
+        Safe to run from several workers against the same queue: each batch is
+        leased to one worker. Resolved and missing keys are acked; keys skipped
+        for lock contention are released for a later lease without using up
+        an attempt. If the batch fails, its keys are resolved one at a time
+        and those that still fail are released under ``failed``, counting the
+        attempt — the queue parks them once they reach its ``max_attempts``.
+        A failing single-key batch is released the same way before
+        re-raising. Returns the :meth:`resolve_many` outcome plus ``leased``
+        and ``failed``.
+        """
+        if self.queue is None:
+            raise ValueError("drain() requires a ResolutionQueue (queue=...)")
+        keys = self.queue.lease(limit=limit, lease_seconds=lease_seconds)
+        if not keys:
+            return {"leased": [], "resolved": [], "matches": {}, "locked": [],
+                    "missing": [], "failed": [], "recluster": None}
+        kwargs = {"top_k": top_k, "auto_refresh": auto_refresh, "stamp": stamp}
+        try:
+            outcome = {**self.resolve_many(keys, **kwargs), "failed": []}
+        except Exception as exc:
+            if len(keys) == 1:
+                self.queue.release(keys, count_attempt=True)
+                raise
+            logger.warning(
+                "IncrementalMaintainer: batch of %d failed (%s); resolving one at a time",
+                len(keys), exc,
+            )
+            outcome = self._resolve_individually(keys, **kwargs)
+        self.queue.ack(outcome["resolved"] + outcome["missing"])
+        self.queue.release(outcome["locked"])
+        self.queue.release(outcome["failed"], count_attempt=True)
+        return {"leased": keys, **outcome}
+
+    def _resolve_individually(self, keys: List[str], **kwargs: Any) -> Dict[str, Any]:
+        """Resolve ``keys`` one :meth:`resolve_many` call each, collecting failures."""
+        outcome: Dict[str, Any] = {
+            "resolved": [], "matches": {}, "locked": [], "missing": [],
+            "failed": [], "recluster": None,
+        }
+        for k in keys:
+            try:
+                single = self.resolve_many([k], **kwargs)
+            except Exception as exc:
+                logger.warning("IncrementalMaintainer: resolving %r failed: %s", k, exc)
+                outcome["failed"].append(k)
+                continue
+            for field in ("resolved", "locked", "missing"):
+                outcome[field].extend(single[field])
+            outcome["matches"].update(single["matches"])
+        return outcome
+
     def pending_keys(self, limit: int = 100) -> List[str]:
-        """Keys of records not yet resolved (no ``_er_resolved_at`` stamp)."""
+        """Keys of records not yet resolved.
+
+        Read from the queue head when a :attr:`queue` is configured (an index
+        lookup); otherwise records lacking an ``_er_resolved_at`` stamp, which
+        scans the source collection.
+        """
+        if self.queue is not None:
+            return self.queue.peek(limit)
         cursor = self.db.aql.execute(
             """
             FOR d IN @@col
@@ -8,13 +8,17 @@ collection, making it suitable for real-time / streaming use cases.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from entity_resolution.core.resident_index import aql_string
 from entity_resolution.utils.validation import (
     validate_collection_name,
     validate_field_names,
 )
 
+if TYPE_CHECKING:
+    from entity_resolution.core.resident_index import ResidentBlockingIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +47,13 @@ class IncrementalResolver:
         compares against all documents (only safe for small collections).
     prefix_length:
         Number of characters used for prefix blocking keys.
+    resident_index:
+        Optional :class:`~entity_resolution.core.resident_index.ResidentBlockingIndex`
+        over *collection*. When given, candidates come from the in-memory
+        index (built on first use if needed) instead of an AQL scan, and
+        ``blocking_strategy`` is ignored. Its fields must cover *fields*.
+        A record with no derivable blocking key yields no candidates rather
+        than a full collection scan.
     """
 
     def __init__(
@@ -53,6 +64,7 @@ class IncrementalResolver:
         confidence_threshold: float = 0.80,
         blocking_strategy: str = "prefix",
         prefix_length: int = 3,
+        resident_index: Optional["ResidentBlockingIndex"] = None,
     ) -> None:
         # Validate identifiers up front: ``collection`` and ``fields`` are
         # interpolated directly into AQL (the field names cannot be passed as
@@ -69,6 +81,18 @@ class IncrementalResolver:
             raise ValueError("prefix_length must be a positive integer") from exc
         if self.prefix_length <= 0:
             raise ValueError("prefix_length must be a positive integer")
+        if resident_index is not None:
+            if resident_index.collection != self.collection:
+                raise ValueError(
+                    f"resident_index is over '{resident_index.collection}', "
+                    f"not '{self.collection}'"
+                )
+            missing = set(self.fields) - set(resident_index.fields)
+            if missing:
+                raise ValueError(
+                    f"resident_index does not project fields {sorted(missing)}"
+                )
+        self.resident_index = resident_index
 
     # ------------------------------------------------------------------
     # Public API
@@ -91,23 +115,29 @@ class IncrementalResolver:
         """
         candidates = self._fetch_candidates(record)
         logger.debug("IncrementalResolver: %d raw candidates for blocking", len(candidates))
+        return self._rank(record, candidates, top_k, exclude_key)
 
-        scored = []
-        for candidate in candidates:
-            if exclude_key and candidate.get("_key") == exclude_key:
-                continue
-            score, field_scores = self._score(record, candidate)
-            if score >= self.confidence_threshold:
-                scored.append({
-                    "_key": candidate.get("_key"),
-                    "_id": candidate.get("_id"),
-                    "score": round(score, 4),
-                    "field_scores": field_scores,
-                    "match": True,
-                })
+    def resolve_many(
+        self,
+        records: List[Dict[str, Any]],
+        top_k: int = 10,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Resolve a micro-batch of records with shared candidate lookups.
 
-        scored.sort(key=lambda r: r["score"], reverse=True)
-        return scored[:top_k]
+        Equivalent to calling :meth:`resolve` per record (each record's own
+        ``_key`` is excluded from its matches), but blocking keys from the
+        whole batch are fetched with ONE query — a single projected pass over
+        the collection instead of one scan per record. Results are aligned
+        with *records*.
+        """
+        if not records:
+            return []
+        pools = self._fetch_candidates_many(records)
+        return [
+            self._rank(record, pool, top_k, record.get("_key"))
+            for record, pool in zip(records, pools)
+        ]
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -115,6 +145,10 @@ class IncrementalResolver:
 
     def _fetch_candidates(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fetch candidate documents from ArangoDB using blocking keys."""
+        if self.resident_index is not None:
+            self.resident_index.ensure_built(self.db)
+            return self.resident_index.candidates(record)
+
         if self.blocking_strategy == "full":
             cursor = self.db.aql.execute(
                 "FOR doc IN @@col RETURN doc",
@@ -126,10 +160,9 @@ class IncrementalResolver:
         conditions = []
         bind_vars: Dict[str, Any] = {"@col": self.collection}
         for i, field in enumerate(self.fields):
-            value = record.get(field)
-            if not value or not isinstance(value, str):
+            prefix = self._prefix_key(record.get(field))
+            if prefix is None:
                 continue
-            prefix = value[: self.prefix_length].lower()
             param = f"prefix_{i}"
             conditions.append(
                 f"LOWER(LEFT(doc.{field}, {self.prefix_length})) == @{param}"
@@ -154,6 +187,108 @@ class IncrementalResolver:
         cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
         return list(cursor)
 
+    def _rank(
+        self,
+        record: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        top_k: int,
+        exclude_key: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Score *candidates* against *record*; keep the top-k above threshold."""
+        scored = []
+        for candidate in candidates:
+            if exclude_key and candidate.get("_key") == exclude_key:
+                continue
+            score, field_scores = self._score(record, candidate)
+            if score >= self.confidence_threshold:
+                scored.append({
+                    "_key": candidate.get("_key"),
+                    "_id": candidate.get("_id"),
+                    "score": round(score, 4),
+                    "field_scores": field_scores,
+                    "match": True,
+                })
+
+        scored.sort(key=lambda r: r["score"], reverse=True)
+        return scored[:top_k]
+
+    def _prefix_key(self, value: Any) -> Optional[str]:
+        """Blocking prefix of *value*, matching ``LOWER(LEFT(doc.field, n))``."""
+        text = aql_string(value)
+        if text is None:
+            return None
+        return text[: self.prefix_length].lower()
+
+    def _fetch_candidates_many(
+        self, records: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Candidate pools for a batch of records, one shared query."""
+        if self.resident_index is not None:
+            return [self._fetch_candidates(r) for r in records]
+
+        projection = ["_key", "_id", *self.fields]
+        needs_scan = self.blocking_strategy == "full" or any(
+            all(self._prefix_key(r.get(f)) is None for f in self.fields)
+            for r in records
+        )
+        if needs_scan:
+            # At least one record has no blocking key (or blocking is off):
+            # one scan serves the whole batch.
+            if self.blocking_strategy != "full":
+                logger.warning(
+                    "IncrementalResolver: no blocking keys derived for some records "
+                    "on fields %s — falling back to one full collection scan",
+                    self.fields,
+                )
+            pool = list(self.db.aql.execute(
+                "FOR doc IN @@col RETURN KEEP(doc, @fields)",
+                bind_vars={"@col": self.collection, "fields": projection},
+            ))
+            if self.blocking_strategy == "full":
+                return [pool for _ in records]
+        else:
+            conditions = []
+            bind_vars: Dict[str, Any] = {"@col": self.collection, "fields": projection}
+            for i, field in enumerate(self.fields):
+                prefixes = sorted({
+                    p for p in (self._prefix_key(r.get(field)) for r in records) if p
+                })
+                if not prefixes:
+                    continue
+                param = f"prefixes_{i}"
+                conditions.append(
+                    f"LOWER(LEFT(doc.{field}, {self.prefix_length})) IN @{param}"
+                )
+                bind_vars[param] = prefixes
+            filter_clause = " OR ".join(f"({c})" for c in conditions)
+            pool = list(self.db.aql.execute(
+                f"FOR doc IN @@col FILTER {filter_clause} RETURN KEEP(doc, @fields)",
+                bind_vars=bind_vars,
+            ))
+
+        by_key: Dict[tuple, List[Dict[str, Any]]] = {}
+        for doc in pool:
+            for field in self.fields:
+                prefix = self._prefix_key(doc.get(field))
+                if prefix is not None:
+                    by_key.setdefault((field, prefix), []).append(doc)
+
+        pools: List[List[Dict[str, Any]]] = []
+        for record in records:
+            keys = [
+                (f, p) for f in self.fields
+                for p in [self._prefix_key(record.get(f))] if p is not None
+            ]
+            if not keys:
+                pools.append(pool)
+                continue
+            seen: Dict[Any, Dict[str, Any]] = {}
+            for bkey in keys:
+                for doc in by_key.get(bkey, ()):
+                    seen.setdefault(doc.get("_key"), doc)
+            pools.append(list(seen.values()))
+        return pools
+
     def _score(
         self,
         record: Dict[str, Any],
@@ -1,8 +1,8 @@
 """
 Multi-strategy blocking orchestrator.
 
-Runs multiple blocking strategies in sequence and merges/deduplicates
-candidate pairs. This allows combining strategies with different strengths
+Runs multiple blocking strategies (in sequence or concurrently) and
+merges/deduplicates candidate pairs. This allows combining strategies with different strengths
 (e.g. exact key blocking + fuzzy BM25 + semantic vector search) into a
 single candidate set with provenance tracking.
 """
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Dict, List, Literal, Optional, Sequence, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from ..strategies.base_strategy import BlockingStrategy
 
@@ -40,6 +41,22 @@ class MultiStrategyOrchestrator:
     deduplicate:
         When True (default), candidate pairs are deduplicated by
         ``(doc1_key, doc2_key)`` after merging.
+    parallel:
+        When True, run the strategies concurrently in a thread pool.  Most
+        strategies spend their time waiting on AQL, so wall-clock time drops
+        from the sum of the strategy runtimes to roughly the slowest one.
+        Strategies must not share mutable state (each owns its statistics).
+    max_workers:
+        Thread pool size for ``parallel=True``.  Defaults to one thread per
+        strategy.
+    cost_ordered:
+        Only valid with ``merge_mode="intersection"``.  Run the strategies
+        one at a time, most selective first, and intersect incrementally:
+        pairs that drop out are released immediately and, once the running
+        intersection is empty, the remaining strategies are skipped.
+        Selectivity is the candidate count observed on the previous
+        :meth:`run`; on the first run the declared order is used, so list
+        the cheapest, most selective strategy first.
 
     Example
     -------
@@ -58,16 +75,31 @@ class MultiStrategyOrchestrator:
         strategies: Sequence[BlockingStrategy],
         merge_mode: MergeMode = "union",
         deduplicate: bool = True,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        cost_ordered: bool = False,
     ) -> None:
         if not strategies:
             raise ValueError("At least one blocking strategy is required")
         if merge_mode not in ("union", "intersection"):
             raise ValueError(f"merge_mode must be 'union' or 'intersection', got '{merge_mode}'")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if cost_ordered and merge_mode != "intersection":
+            raise ValueError("cost_ordered requires merge_mode='intersection'")
+        if cost_ordered and parallel:
+            raise ValueError("cost_ordered runs strategies one at a time; it cannot be combined with parallel")
 
         self.strategies = list(strategies)
         self.merge_mode = merge_mode
         self.deduplicate = deduplicate
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.cost_ordered = cost_ordered
         self._stats: Dict[str, Any] = {}
+        # Candidate counts from the previous run, keyed by strategy position;
+        # used to order strategies for cost-ordered intersection.
+        self._observed_counts: Dict[int, int] = {}
 
     def run(self) -> List[Dict[str, Any]]:
         """Execute all strategies and merge results.
@@ -80,33 +112,28 @@ class MultiStrategyOrchestrator:
             produced it.
         """
         start = time.time()
-        per_strategy_pairs: List[List[Dict[str, Any]]] = []
-        strategy_stats: List[Dict[str, Any]] = []
+        skipped: List[str] = []
 
-        for strategy in self.strategies:
-            name = strategy.__class__.__name__
-            logger.info("Running blocking strategy: %s", name)
-            s_start = time.time()
-            pairs = strategy.generate_candidates()
-            s_elapsed = time.time() - s_start
-            per_strategy_pairs.append(pairs)
-
-            stats = strategy.get_statistics()
-            stats["strategy_name"] = name
-            stats["execution_time_seconds"] = round(s_elapsed, 3)
-            stats["candidate_count"] = len(pairs)
-            strategy_stats.append(stats)
-            logger.info(
-                "  %s produced %d candidates in %.2fs",
-                name,
-                len(pairs),
-                s_elapsed,
-            )
-
-        if self.merge_mode == "union":
-            merged = self._merge_union(per_strategy_pairs)
+        if self.cost_ordered:
+            merged, strategy_stats, skipped = self._run_cost_ordered()
         else:
-            merged = self._merge_intersection(per_strategy_pairs)
+            if self.parallel and len(self.strategies) > 1:
+                workers = self.max_workers or len(self.strategies)
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="er-blocking"
+                ) as executor:
+                    outcomes = list(executor.map(self._run_strategy, self.strategies))
+            else:
+                outcomes = [self._run_strategy(s) for s in self.strategies]
+
+            per_strategy_pairs = [pairs for pairs, _ in outcomes]
+            strategy_stats = [stats for _, stats in outcomes]
+            self._observed_counts = {i: len(p) for i, p in enumerate(per_strategy_pairs)}
+
+            if self.merge_mode == "union":
+                merged = self._merge_union(per_strategy_pairs)
+            else:
+                merged = self._merge_intersection(per_strategy_pairs)
 
         if self.deduplicate:
             merged = self._deduplicate(merged)
@@ -115,7 +142,10 @@ class MultiStrategyOrchestrator:
         self._stats = {
             "merge_mode": self.merge_mode,
             "deduplicate": self.deduplicate,
+            "parallel": self.parallel,
+            "cost_ordered": self.cost_ordered,
             "total_strategies": len(self.strategies),
+            "strategies_skipped": skipped,
             "total_candidates": len(merged),
             "execution_time_seconds": round(elapsed, 3),
             "per_strategy": strategy_stats,
@@ -132,6 +162,89 @@ class MultiStrategyOrchestrator:
         """Return statistics from the most recent :meth:`run` call."""
         return self._stats.copy()
 
+    # ------------------------------------------------------------------
+    # Execution helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _run_strategy(
+        strategy: BlockingStrategy,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Run one strategy and return its pairs with per-strategy stats."""
+        name = strategy.__class__.__name__
+        logger.info("Running blocking strategy: %s", name)
+        s_start = time.time()
+        pairs = strategy.generate_candidates()
+        s_elapsed = time.time() - s_start
+
+        stats = strategy.get_statistics()
+        stats["strategy_name"] = name
+        stats["execution_time_seconds"] = round(s_elapsed, 3)
+        stats["candidate_count"] = len(pairs)
+        logger.info(
+            "  %s produced %d candidates in %.2fs",
+            name,
+            len(pairs),
+            s_elapsed,
+        )
+        return pairs, stats
+
+    def _run_cost_ordered(
+        self,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+        """Intersect strategies incrementally, most selective first.
+
+        Returns the surviving pairs, the stats of the strategies that ran
+        (in execution order), and the names of the strategies skipped once
+        the intersection became empty.
+        """
+        order = sorted(
+            range(len(self.strategies)),
+            key=lambda i: (self._observed_counts.get(i, float("inf")), i),
+        )
+
+        running: Optional[Dict[tuple, Dict[str, Any]]] = None
+        strategy_stats: List[Dict[str, Any]] = []
+        skipped: List[str] = []
+        for idx in order:
+            strategy = self.strategies[idx]
+            name = strategy.__class__.__name__
+            if running is not None and not running:
+                skipped.append(name)
+                continue
+
+            pairs, stats = self._run_strategy(strategy)
+            self._observed_counts[idx] = len(pairs)
+            if running is None:
+                running = {}
+                for pair in pairs:
+                    key = self._pair_key(pair)
+                    if key not in running:
+                        entry = pair.copy()
+                        entry["sources"] = [name]
+                        running[key] = entry
+            else:
+                survivors: Dict[tuple, Dict[str, Any]] = {}
+                for pair in pairs:
+                    key = self._pair_key(pair)
+                    entry = running.get(key)
+                    if entry is None:
+                        continue
+                    if name not in entry["sources"]:
+                        entry["sources"].append(name)
+                    survivors[key] = entry
+                running = survivors
+            stats["surviving_candidates"] = len(running)
+            strategy_stats.append(stats)
+
+        if skipped:
+            logger.info(
+                "Intersection empty; skipped %d strategies: %s",
+                len(skipped),
+                ", ".join(skipped),
+            )
+        return list((running or {}).values()), strategy_stats, skipped
+
     # ------------------------------------------------------------------
     # Merge helpers
     # ------------------------------------------------------------------
@@ -217,6 +330,9 @@ class MultiStrategyOrchestrator:
             orchestrator:
               merge_mode: union
               deduplicate: true
+              parallel: true          # optional; run strategies concurrently
+              max_workers: 4          # optional; defaults to one per strategy
+              cost_ordered: false     # optional; intersection mode only
               strategies:
                 - type: collect
                   collection: companies
@@ -306,4 +422,7 @@ class MultiStrategyOrchestrator:
             strategies=strategies,
             merge_mode=config.get("merge_mode", "union"),
             deduplicate=config.get("deduplicate", True),
+            parallel=config.get("parallel", False),
+            max_workers=config.get("max_workers"),
+            cost_ordered=config.get("cost_ordered", False),
         )
@@ -0,0 +1,352 @@
+"""
+ResidentBlockingIndex — in-memory candidate index for IncrementalResolver.
+
+``IncrementalResolver`` normally derives candidates with an AQL
+``LOWER(LEFT(doc.field, n)) == @prefix`` filter, which no persistent index can
+serve, so every single-record resolve is a collection scan on the server.
+For real-time use the index below keeps the blocking keys resident in the
+client process instead:
+
+- it is **built once** by streaming the collection with a projected cursor
+  (only ``_key`` plus the indexed fields leave the server);
+- it maps blocking keys — ``prefix`` (of any scalar, stringified as AQL
+  does), ``phonetic`` (per-token Soundex) and ``token`` — to posting sets of
+  document keys, so a candidate lookup is a handful of dict reads;
+- it is **kept fresh** with :meth:`upsert` / :meth:`remove` (called by
+  ``IncrementalMaintainer`` after each commit, or by a change-feed consumer),
+  and :meth:`refresh` re-reads a batch of keys from the collection.
+
+The ``prefix`` key type reproduces the AQL prefix filter, and its postings
+are served in full by default (``max_postings`` only drops ``token`` and
+``phonetic`` hubs), so switching a resolver to the resident index does not
+change its candidate set.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from entity_resolution.utils.validation import (
+    validate_collection_name,
+    validate_field_names,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Supported blocking key types.
+KEY_TYPES = ("prefix", "phonetic", "token")
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+# (key_type, field, value)
+BlockingKey = Tuple[str, str, str]
+
+
+def aql_string(value: Any) -> Optional[str]:
+    """*value* as AQL string functions such as ``LEFT()`` see it.
+
+    Numbers, booleans, arrays and objects are stringified the way AQL casts
+    them (``1.0`` -> ``"1"``, ``true`` -> ``"true"``, arrays as compact JSON),
+    so prefixes computed client-side agree with ``LOWER(LEFT(doc.f, n))``.
+    Returns None for null, the empty string and non-finite numbers, which
+    yield no blocking key.
+    """
+    if value is None or isinstance(value, str):
+        return value or None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        return str(int(value)) if value.is_integer() else repr(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+class ResidentBlockingIndex:
+    """
+    In-memory blocking index over projected fields of one collection.
+
+    Usage::
+
+        index = ResidentBlockingIndex("companies", ["name", "city"],
+                                      key_types=("prefix", "phonetic"))
+        index.build(db)
+        resolver = IncrementalResolver(db, "companies", ["name", "city"],
+                                       resident_index=index)
+
+    Parameters
+    ----------
+    collection:
+        Name of the document collection being indexed.
+    fields:
+        Fields to project and derive blocking keys from. Must cover the
+        resolver's scoring fields, since candidates are scored locally from
+        the projected values.
+    key_types:
+        Any of ``"prefix"`` (first ``prefix_length`` chars, lower-cased —
+        same semantics as the resolver's AQL prefix blocking),
+        ``"phonetic"`` (Soundex of each alphabetic token) and ``"token"``
+        (lower-cased alphanumeric tokens).
+    prefix_length:
+        Number of characters used for prefix keys.
+    max_postings:
+        ``token`` and ``phonetic`` posting lists larger than this are ignored
+        at lookup time (the resident equivalent of ``max_block_size``), so hub
+        keys such as a common token do not flood a resolve with candidates.
+        None disables the cut-off.
+    max_prefix_postings:
+        Same cut-off for ``prefix`` keys. Default None: prefix postings are
+        served in full, exactly like the AQL filter.
+    min_token_length:
+        Tokens shorter than this produce no ``token``/``phonetic`` keys.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        fields: Sequence[str],
+        key_types: Sequence[str] = ("prefix",),
+        prefix_length: int = 3,
+        max_postings: Optional[int] = 10_000,
+        max_prefix_postings: Optional[int] = None,
+        min_token_length: int = 2,
+    ) -> None:
+        self.collection = validate_collection_name(collection)
+        self.fields = validate_field_names(list(fields or []))
+        if not self.fields:
+            raise ValueError("fields cannot be empty")
+        unknown = [k for k in key_types if k not in KEY_TYPES]
+        if unknown or not key_types:
+            raise ValueError(
+                f"key_types must be a non-empty subset of {KEY_TYPES}, got {list(key_types)}"
+            )
+        self.key_types = tuple(key_types)
+        if int(prefix_length) <= 0:
+            raise ValueError("prefix_length must be a positive integer")
+        self.prefix_length = int(prefix_length)
+        self.max_postings = None if max_postings is None else int(max_postings)
+        self.max_prefix_postings = (
+            None if max_prefix_postings is None else int(max_prefix_postings)
+        )
+        self.min_token_length = int(min_token_length)
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[BlockingKey, Set[str]] = defaultdict(set)
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self.built = False
+
+        if "phonetic" in self.key_types:
+            import jellyfish
+
+            self._soundex = jellyfish.soundex
+
+    # ------------------------------------------------------------------
+    # Build / maintenance
+    # ------------------------------------------------------------------
+
+    def build(self, db, batch_size: int = 10_000) -> int:
+        """Stream the collection into a fresh index and swap it in.
+
+        Lookups keep being served from the previous index while the new one
+        is built. Returns the number of indexed records.
+        """
+        cursor = db.aql.execute(
+            "FOR doc IN @@col RETURN KEEP(doc, @fields)",
+            bind_vars={"@col": self.collection, "fields": ["_key", *self.fields]},
+            batch_size=batch_size,
+            stream=True,
+        )
+        records: Dict[str, Dict[str, Any]] = {}
+        postings: Dict[BlockingKey, Set[str]] = defaultdict(set)
+        for doc in cursor:
+            key = doc.get("_key")
+            if key is None:
+                continue
+            records[key] = doc
+            for bkey in self.blocking_keys(doc):
+                postings[bkey].add(key)
+
+        with self._lock:
+            self._records = records
+            self._postings = postings
+            self.built = True
+        logger.info(
+            "ResidentBlockingIndex(%s): indexed %d records under %d keys",
+            self.collection, len(records), len(postings),
+        )
+        return len(records)
+
+    def ensure_built(self, db) -> bool:
+        """Build the index unless it already is; returns whether this call built it.
+
+        Concurrent first callers wait for a single :meth:`build` instead of
+        each streaming the collection.
+        """
+        if self.built:
+            return False
+        with self._build_lock:
+            if self.built:
+                return False
+            self.build(db)
+            return True
+
+    def upsert(self, doc: Dict[str, Any]) -> None:
+        """Insert or replace one record (full or projected document)."""
+        key = doc.get("_key")
+        if key is None:
+            raise ValueError("document has no _key")
+        projected = {"_key": key}
+        projected.update({f: doc[f] for f in self.fields if f in doc})
+        with self._lock:
+            self._unlink(key)
+            self._records[key] = projected
+            for bkey in self.blocking_keys(projected):
+                self._postings[bkey].add(key)
+
+    def remove(self, key: str) -> bool:
+        """Drop one record; returns ``False`` if it was not indexed."""
+        with self._lock:
+            return self._unlink(key)
+
+    def refresh(self, db, keys: Iterable[str]) -> int:
+        """Re-read *keys* from the collection; keys no longer present are removed."""
+        keys = list(keys)
+        if not keys:
+            return 0
+        cursor = db.aql.execute(
+            "FOR doc IN @@col FILTER doc._key IN @keys RETURN KEEP(doc, @fields)",
+            bind_vars={"@col": self.collection, "keys": keys, "fields": ["_key", *self.fields]},
+        )
+        seen = set()
+        for doc in cursor:
+            self.upsert(doc)
+            seen.add(doc["_key"])
+        for key in keys:
+            if key not in seen:
+                self.remove(key)
+        return len(seen)
+
+    def _unlink(self, key: str) -> bool:
+        old = self._records.pop(key, None)
+        if old is None:
+            return False
+        for bkey in self.blocking_keys(old):
+            posting = self._postings.get(bkey)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[bkey]
+        return True
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def blocking_keys(self, record: Dict[str, Any]) -> Set[BlockingKey]:
+        """Blocking keys derived from the configured fields of *record*."""
+        keys: Set[BlockingKey] = set()
+        for field in self.fields:
+            value = record.get(field)
+            if "prefix" in self.key_types:
+                text = aql_string(value)
+                if text is not None:
+                    keys.add(("prefix", field, text[: self.prefix_length].lower()))
+            if not value or not isinstance(value, str):
+                continue
+            lowered = value.lower()
+            if "token" in self.key_types or "phonetic" in self.key_types:
+                tokens = [
+                    t for t in _TOKEN_RE.findall(lowered)
+                    if len(t) >= self.min_token_length
+                ]
+                if "token" in self.key_types:
+                    keys.update(("token", field, t) for t in tokens)
+                if "phonetic" in self.key_types:
+                    keys.update(
+                        ("phonetic", field, self._soundex(t))
+                        for t in tokens if t.isalpha()
+                    )
+        return keys
+
+    def candidates(
+        self,
+        record: Dict[str, Any],
+        exclude_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Projected candidate records sharing at least one blocking key."""
+        bkeys = self.blocking_keys(record)
+        with self._lock:
+            keys: Set[str] = set()
+            for posting in self._usable_postings(bkeys):
+                keys.update(posting)
+            keys.discard(exclude_key)
+            found = [self._records[k] for k in keys]
+        return [
+            {**doc, "_id": f"{self.collection}/{doc['_key']}"} for doc in found
+        ]
+
+    def ranked_candidates(
+        self,
+        record: Dict[str, Any],
+        limit: int,
+        exclude_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top ``limit`` candidates by number of blocking keys shared with *record*.
+
+        Same posting rules as :meth:`candidates` (hub keys skipped); ties are
+        broken by document key so the cut is deterministic.
+        """
+        bkeys = self.blocking_keys(record)
+        counts: Counter = Counter()
+        with self._lock:
+            for posting in self._usable_postings(bkeys):
+                counts.update(posting)
+            counts.pop(exclude_key, None)
+            top = heapq.nsmallest(limit, counts.items(), key=lambda kv: (-kv[1], kv[0]))
+            found = [self._records[k] for k, _ in top]
+        return [
+            {**doc, "_id": f"{self.collection}/{doc['_key']}"} for doc in found
+        ]
+
+    def _usable_postings(self, bkeys: Iterable[BlockingKey]) -> List[Set[str]]:
+        """Postings of *bkeys* within their cut-off. Caller holds the lock."""
+        out = []
+        for bkey in bkeys:
+            posting = self._postings.get(bkey)
+            if not posting:
+                continue
+            limit = self.max_prefix_postings if bkey[0] == "prefix" else self.max_postings
+            if limit is not None and len(posting) > limit:
+                logger.warning(
+                    "ResidentBlockingIndex(%s): skipping hub key %s (%d postings > %d)",
+                    self.collection, bkey, len(posting), limit,
+                )
+                continue
+            out.append(posting)
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size summary."""
+        with self._lock:
+            return {
+                "collection": self.collection,
+                "records": len(self._records),
+                "blocking_keys": len(self._postings),
+                "key_types": list(self.key_types),
+                "built": self.built,
+            }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._records
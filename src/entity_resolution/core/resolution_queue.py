@@ -0,0 +1,320 @@
+"""Pending-work queue for incremental maintenance.
+
+``IncrementalMaintainer.pending_keys`` finds unresolved records with
+``FILTER d._er_resolved_at == null`` — a full scan of the source collection on
+every poll — and a single watcher is the only safe consumer. This module keeps
+the pending set in a small dedicated collection (``er_resolution_queue``)
+instead:
+
+- **Index-backed polling.** Entries carry ``(collection, lease_until)`` under a
+  persistent index (migration #7), so a dequeue reads only the queue head; poll
+  cost depends on the batch size, not on the size of the source collection.
+- **Leases, not deletes.** :meth:`ResolutionQueue.lease` claims a batch for
+  ``lease_seconds``; :meth:`ResolutionQueue.ack` removes it once committed. A
+  crashed worker's lease simply expires and another worker picks the keys up,
+  so several maintainers can drain one queue without double work.
+- **Re-enqueue while leased is not lost.** Enqueuing a key that a worker holds
+  marks it ``requeue``; the ack then returns it to the queue instead of
+  deleting it, so an update that lands mid-resolve is resolved again.
+- **Poison records are parked.** Every lease counts an attempt, and a
+  release for lock contention gives it back; an entry leased
+  ``max_attempts`` times without an ack is marked ``failed`` and moved
+  past the lease horizon, so it stops being handed out. Enqueuing the key
+  again (e.g. after fixing the record) revives it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import uuid
+from typing import Any, Iterable, List, Optional
+
+from ..utils.validation import validate_collection_name
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_COLLECTION = "er_resolution_queue"
+_DEFAULT_LEASE_SECONDS = 300
+_ENQUEUE_CHUNK = 10_000
+_DEFAULT_MAX_ATTEMPTS = 5
+# lease_until of failed entries: beyond any real lease, so the index-backed
+# ``lease_until <= now`` head scan never reaches them.
+_FAILED_LEASE_UNTIL = 2 ** 53 - 1
+
+
+class ResolutionQueue:
+    """Lease-based queue of record keys awaiting incremental resolution.
+
+    Parameters
+    ----------
+    db:
+        ArangoDB database connection.
+    collection:
+        Source collection whose records are queued. One queue collection is
+        shared by all source collections; entries are scoped by this name.
+    queue_collection:
+        Queue collection name (default ``er_resolution_queue``).
+    worker_id:
+        Lease owner recorded on claimed entries. Defaults to a random id, so
+        each instance is a distinct worker.
+    max_attempts:
+        Leases an entry gets before it is marked ``failed`` instead of being
+        leased again (see :meth:`failed_keys`).
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        collection: str,
+        queue_collection: str = _QUEUE_COLLECTION,
+        worker_id: Optional[str] = None,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+        self.db = db
+        self.collection = validate_collection_name(collection)
+        self.queue_collection = validate_collection_name(queue_collection)
+        self.worker_id = worker_id or uuid.uuid4().hex[:12]
+        self.max_attempts = int(max_attempts)
+        self._ensure_collection()
+
+    def _ensure_collection(self) -> None:
+        # Normally created by migration #7; create defensively for direct use.
+        if not self.db.has_collection(self.queue_collection):
+            self.db.create_collection(self.queue_collection)
+        try:
+            self.db.collection(self.queue_collection).add_persistent_index(
+                fields=["collection", "lease_until"],
+                name="idx_queue_lease",
+            )
+        except Exception as exc:  # pragma: no cover - index is an optimisation
+            logger.debug("Could not ensure queue lease index: %s", exc)
+
+    def _entry_key(self, key: str) -> str:
+        return "q_" + hashlib.md5(f"{self.collection}/{key}".encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, keys: Iterable[str]) -> int:
+        """Queue record keys (idempotent). Returns the number of keys submitted.
+
+        Bulk loaders call this with the keys they just imported; it writes in
+        chunks of 10k with one AQL per chunk. A ``failed`` entry is revived
+        with a fresh attempt budget.
+        """
+        keys = list(dict.fromkeys(k for k in keys if k))
+        now = time.time()
+        for i in range(0, len(keys), _ENQUEUE_CHUNK):
+            chunk = keys[i:i + _ENQUEUE_CHUNK]
+            self.db.aql.execute(
+                """
+                FOR e IN @entries
+                    UPSERT { _key: e._key }
+                    INSERT MERGE(e, { lease_until: 0, lease_owner: null,
+                                      attempts: 0, requeue: false })
+                    UPDATE OLD.failed == true
+                        ? { lease_until: 0, lease_owner: null, attempts: 0,
+                            requeue: false, failed: false }
+                        : { requeue: OLD.lease_until > @now }
+                    IN @@queue
+                """,
+                bind_vars={
+                    "entries": [
+                        {
+                            "_key": self._entry_key(k),
+                            "collection": self.collection,
+                            "record_key": k,
+                            "enqueued_at": now,
+                        }
+                        for k in chunk
+                    ],
+                    "now": now,
+                    "@queue": self.queue_collection,
+                },
+            )
+        return len(keys)
+
+    def enqueue_unresolved(self) -> int:
+        """One-time backfill: queue every record lacking an ``_er_resolved_at`` stamp.
+
+        Runs server-side as a single ``INSERT ... ignoreErrors`` pass, so it is
+        safe to repeat and never disturbs entries already queued or leased.
+        Returns the number of unresolved records submitted.
+        """
+        cursor = self.db.aql.execute(
+            """
+            LET submitted = (
+                FOR d IN @@col
+                    FILTER d._er_resolved_at == null
+                    INSERT {
+                        _key: CONCAT("q_", MD5(CONCAT(@col_name, "/", d._key))),
+                        collection: @col_name, record_key: d._key,
+                        enqueued_at: @now, lease_until: 0, lease_owner: null,
+                        attempts: 0, requeue: false
+                    } INTO @@queue OPTIONS { ignoreErrors: true }
+                    RETURN 1
+            )
+            RETURN LENGTH(submitted)
+            """,
+            bind_vars={
+                "@col": self.collection,
+                "col_name": self.collection,
+                "now": time.time(),
+                "@queue": self.queue_collection,
+            },
+        )
+        return next(iter(cursor), 0)
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def lease(self, limit: int = 100, lease_seconds: int = _DEFAULT_LEASE_SECONDS) -> List[str]:
+        """Claim up to *limit* available keys for this worker.
+
+        Available means never leased or whose lease expired. Head entries
+        that already used ``max_attempts`` leases are marked ``failed`` rather
+        than claimed, so the batch may come back short. A write-write
+        conflict with a concurrent worker leasing the same head entries aborts
+        the query; it is retried once, then reported as an empty batch.
+        """
+        for attempt in range(2):
+            now = time.time()
+            try:
+                cursor = self.db.aql.execute(
+                    """
+                    FOR q IN @@queue
+                        FILTER q.collection == @col AND q.lease_until <= @now
+                        SORT q.lease_until
+                        LIMIT @limit
+                        LET exhausted = q.attempts >= @max_attempts
+                        UPDATE q WITH exhausted
+                            ? { lease_until: @failed_until, lease_owner: null,
+                                failed: true, failed_at: @now }
+                            : { lease_until: @until, lease_owner: @owner,
+                                attempts: q.attempts + 1, requeue: false }
+                        IN @@queue
+                        RETURN exhausted ? null : NEW.record_key
+                    """,
+                    bind_vars={
+                        "@queue": self.queue_collection,
+                        "col": self.collection,
+                        "now": now,
+                        "until": now + lease_seconds,
+                        "owner": self.worker_id,
+                        "limit": int(limit),
+                        "max_attempts": self.max_attempts,
+                        "failed_until": _FAILED_LEASE_UNTIL,
+                    },
+                )
+                return [k for k in cursor if k is not None]
+            except Exception as exc:
+                logger.debug("ResolutionQueue: lease attempt %d conflicted: %s", attempt + 1, exc)
+        return []
+
+    def ack(self, keys: Iterable[str]) -> None:
+        """Mark leased keys done: remove them, or re-queue if updated meanwhile.
+
+        Only entries still leased by this worker are touched, so an ack after
+        the lease expired and another worker took over is a no-op.
+        """
+        entry_keys = [self._entry_key(k) for k in keys]
+        if not entry_keys:
+            return
+        self.db.aql.execute(
+            """
+            FOR q IN @@queue
+                FILTER q._key IN @keys AND q.lease_owner == @owner
+                FILTER q.requeue != true
+                REMOVE q IN @@queue
+            """,
+            bind_vars={"@queue": self.queue_collection, "keys": entry_keys, "owner": self.worker_id},
+        )
+        self.release(keys)
+
+    def release(self, keys: Iterable[str], count_attempt: bool = False) -> None:
+        """Return leased keys to the queue immediately.
+
+        By default the lease is handed back without using up an attempt (lock
+        contention, a re-queued ack), so only real failures count towards
+        ``max_attempts``. Pass ``count_attempt=True`` for keys whose resolve
+        failed.
+        """
+        entry_keys = [self._entry_key(k) for k in keys]
+        if not entry_keys:
+            return
+        self.db.aql.execute(
+            """
+            FOR q IN @@queue
+                FILTER q._key IN @keys AND q.lease_owner == @owner
+                UPDATE q WITH {
+                    lease_until: 0, lease_owner: null, requeue: false,
+                    attempts: @count_attempt ? q.attempts : MAX([0, q.attempts - 1])
+                } IN @@queue
+            """,
+            bind_vars={
+                "@queue": self.queue_collection,
+                "keys": entry_keys,
+                "owner": self.worker_id,
+                "count_attempt": bool(count_attempt),
+            },
+        )
+
+    def peek(self, limit: int = 100) -> List[str]:
+        """Available keys without leasing them (index-backed)."""
+        cursor = self.db.aql.execute(
+            """
+            FOR q IN @@queue
+                FILTER q.collection == @col AND q.lease_until <= @now
+                SORT q.lease_until
+                LIMIT @limit
+                RETURN q.record_key
+            """,
+            bind_vars={
+                "@queue": self.queue_collection,
+                "col": self.collection,
+                "now": time.time(),
+                "limit": int(limit),
+            },
+        )
+        return list(cursor)
+
+    def depth(self) -> int:
+        """Number of queued entries (available and leased) for this collection."""
+        cursor = self.db.aql.execute(
+            """
+            FOR q IN @@queue
+                FILTER q.collection == @col AND q.lease_until < @failed_until
+                COLLECT WITH COUNT INTO n
+                RETURN n
+            """,
+            bind_vars={
+                "@queue": self.queue_collection,
+                "col": self.collection,
+                "failed_until": _FAILED_LEASE_UNTIL,
+            },
+        )
+        return next(iter(cursor), 0)
+
+    def failed_keys(self, limit: int = 100) -> List[str]:
+        """Keys parked after ``max_attempts`` leases without an ack."""
+        cursor = self.db.aql.execute(
+            """
+            FOR q IN @@queue
+                FILTER q.collection == @col AND q.lease_until == @failed_until
+                LIMIT @limit
+                RETURN q.record_key
+            """,
+            bind_vars={
+                "@queue": self.queue_collection,
+                "col": self.collection,
+                "failed_until": _FAILED_LEASE_UNTIL,
+                "limit": int(limit),
+            },
+        )
+        return list(cursor)
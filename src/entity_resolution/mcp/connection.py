@@ -1,9 +1,37 @@
 """
 Shared ArangoDB connection helpers for MCP tools/resources.
+
+MCP tools and the UI routes that call them receive plain connection
+parameters on every invocation. :func:`get_pooled_db` turns those into a
+process-wide cached database handle. This avoids a new ``ArangoClient`` (a new
+HTTP session and TLS handshake) per tool call. Pooling is tuned through
+environment variables:
+
+- ``ARANGO_POOL_SIZE``: keep-alive connections held per endpoint (default 10)
+- ``ARANGO_REQUEST_TIMEOUT``: per-request timeout in seconds (default 60)
+- ``ARANGO_POOL_HEALTH_CHECK_SECONDS``: a handle idle for longer than this is
+  probed before reuse, and rebuilt if the probe fails (default 30; 0 probes
+  every reuse)
 """
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
+import threading
+import time
+from typing import Dict, Tuple
+
+from arango import ArangoClient
+from arango.http import DefaultHTTPClient
+
+logger = logging.getLogger(__name__)
+
+_POOL_LOCK = threading.Lock()
+# hosts URL -> client (one HTTP session per endpoint)
+_CLIENTS: Dict[str, ArangoClient] = {}
+# (hosts, database, username, password digest) -> [db handle, last-used monotonic time]
+_DATABASES: Dict[Tuple[str, str, str, str], list] = {}
 
 
 def get_arango_hosts(host: str, port: int) -> str:
@@ -30,3 +58,90 @@ def get_arango_hosts(host: str, port: int) -> str:
     if ":" in host_text and not host_text.startswith("["):
         return f"{scheme}://{host_text}"
     return f"{scheme}://{host_text}:{port}"
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", name, os.getenv(name))
+        return default
+
+
+def _client_for(hosts: str) -> ArangoClient:
+    client = _CLIENTS.get(hosts)
+    if client is None:
+        pool_size = max(1, int(_env_number("ARANGO_POOL_SIZE", 10)))
+        timeout = _env_number("ARANGO_REQUEST_TIMEOUT", 60)
+        client = ArangoClient(
+            hosts=hosts,
+            http_client=DefaultHTTPClient(
+                request_timeout=timeout,
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+            ),
+            request_timeout=timeout,
+        )
+        _CLIENTS[hosts] = client
+    return client
+
+
+def get_pooled_db(host: str, port: int, username: str, password: str, database: str):
+    """Return a cached, authenticated database handle for these parameters.
+
+    Handles are shared process-wide (thread-safe), keyed by endpoint,
+    database and credentials. A handle idle for longer than
+    ``ARANGO_POOL_HEALTH_CHECK_SECONDS`` is probed with a version call before
+    it is returned. If the probe fails, the handle and its client are rebuilt.
+    """
+    hosts = get_arango_hosts(host, port)
+    digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+    key = (hosts, database, username, digest)
+    interval = _env_number("ARANGO_POOL_HEALTH_CHECK_SECONDS", 30)
+
+    with _POOL_LOCK:
+        entry = _DATABASES.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] <= interval:
+            entry[1] = now
+            return entry[0]
+
+    if entry is not None:
+        # Probe outside the lock so a slow server does not stall other callers.
+        try:
+            entry[0].version()
+            with _POOL_LOCK:
+                entry[1] = time.monotonic()
+            return entry[0]
+        except Exception as exc:
+            logger.info("Pooled ArangoDB handle for %s/%s failed health check: %s", hosts, database, exc)
+            # Every handle on this endpoint shares the failed session.
+            with _POOL_LOCK:
+                for k in [k for k in _DATABASES if k[0] == hosts]:
+                    del _DATABASES[k]
+                stale = _CLIENTS.pop(hosts, None)
+            if stale is not None:
+                try:
+                    stale.close()
+                except Exception:
+                    pass
+
+    with _POOL_LOCK:
+        entry = _DATABASES.get(key)
+        if entry is None:
+            db = _client_for(hosts).db(database, username=username, password=password)
+            entry = _DATABASES[key] = [db, time.monotonic()]
+        return entry[0]
+
+
+def close_pooled_connections() -> None:
+    """Drop every pooled handle and close the underlying HTTP sessions."""
+    with _POOL_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _DATABASES.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
@@ -0,0 +1,228 @@
+"""
+Background jobs and result caching for long-running MCP tools.
+
+Agent clients time out on tool calls that run for minutes. Tools that accept
+``run_async=True`` submit their work to :class:`JobManager` and return a job
+id at once; the ``job_status`` tool then reports state, progress events, and
+the result once the job finishes.
+
+:class:`ResultCache` serves repeated advisor calls instantly. Keys hash the
+tool name and its normalized arguments, plus the source collection's revision
+(or document count when the server cannot report a revision) for tools that
+read data. A changed collection therefore misses the cache instead of
+returning a stale profile.
+
+Tune both with environment variables:
+
+- ``ER_MCP_JOB_WORKERS``: concurrent background jobs (default 2)
+- ``ER_MCP_CACHE_SIZE``: cached results kept, least recently used evicted (default 128)
+- ``ER_MCP_CACHE_TTL_SECONDS``: age after which a cached result is recomputed (default 900)
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for ``job_status`` before the oldest are forgotten.
+_MAX_FINISHED_JOBS = 200
+# Progress events kept per job (the most recent ones).
+_MAX_PROGRESS_EVENTS = 50
+
+
+class JobManager:
+    """Run tool calls on a bounded worker pool and track their outcome.
+
+    Parameters
+    ----------
+    max_workers:
+        Jobs allowed to run at once; further submissions queue.
+    max_finished:
+        Finished jobs retained for status queries.
+    """
+
+    def __init__(self, max_workers: int = 2, max_finished: int = _MAX_FINISHED_JOBS) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_finished = max(1, int(max_finished))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="er-mcp-job"
+        )
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        tool: str,
+        fn: Callable[[Callable[[Dict[str, Any]], None]], Any],
+    ) -> Dict[str, Any]:
+        """Queue ``fn(on_progress)`` and return the new job's snapshot.
+
+        ``fn`` receives a progress callback it may call with event dicts.
+        """
+        job_id = uuid.uuid4().hex
+        job: Dict[str, Any] = {
+            "job_id": job_id,
+            "tool": tool,
+            "state": "queued",
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "progress": [],
+            "result": None,
+            "error": None,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._evict_finished()
+        self._executor.submit(self._run, job, fn)
+        return self.status(job_id)
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of a job (None when unknown or already evicted)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = dict(job)
+            snapshot["progress"] = list(job["progress"])
+        end = snapshot["finished_at"] or time.time()
+        if snapshot["started_at"] is not None:
+            snapshot["elapsed_seconds"] = round(end - snapshot["started_at"], 3)
+        return snapshot
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Summaries of all tracked jobs, oldest first (results omitted)."""
+        with self._lock:
+            return [
+                {k: job[k] for k in ("job_id", "tool", "state", "submitted_at", "finished_at")}
+                for job in self._jobs.values()
+            ]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Dict[str, Any], fn: Callable[..., Any]) -> None:
+        def on_progress(event: Dict[str, Any]) -> None:
+            with self._lock:
+                job["progress"].append(event)
+                del job["progress"][:-_MAX_PROGRESS_EVENTS]
+
+        with self._lock:
+            job["state"] = "running"
+            job["started_at"] = time.time()
+        try:
+            result = fn(on_progress)
+        except Exception as exc:
+            logger.exception("MCP job %s (%s) failed", job["job_id"], job["tool"])
+            with self._lock:
+                job.update(state="failed", error=str(exc), finished_at=time.time())
+            return
+        with self._lock:
+            job.update(state="succeeded", result=result, finished_at=time.time())
+
+    def _evict_finished(self) -> None:
+        finished = [jid for jid, j in self._jobs.items() if j["state"] in ("succeeded", "failed")]
+        for jid in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[jid]
+
+
+class ResultCache:
+    """Thread-safe LRU cache of tool results with a time-to-live.
+
+    Values are deep-copied in and out so callers cannot mutate cached entries.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 900.0) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(tool: str, args: Dict[str, Any], revision: Optional[str] = None) -> str:
+        """Stable key over the tool name, its arguments, and a data revision."""
+        payload = json.dumps(
+            {"tool": tool, "args": args, "revision": revision},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def collection_revision(db: Any, collection: str) -> Optional[str]:
+    """Revision token for *collection*: its revision id, else its document count.
+
+    Returns None when the collection does not exist (the tool reports that).
+    """
+    if not db.has_collection(collection):
+        return None
+    coll = db.collection(collection)
+    try:
+        return f"rev:{coll.revision()}"
+    except Exception:
+        return f"count:{coll.count()}"
+
+
+_JOB_MANAGER: Optional[JobManager] = None
+_RESULT_CACHE: Optional[ResultCache] = None
+_SINGLETON_LOCK = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Process-wide job manager (created on first use)."""
+    global _JOB_MANAGER
+    with _SINGLETON_LOCK:
+        if _JOB_MANAGER is None:
+            _JOB_MANAGER = JobManager(max_workers=int(os.getenv("ER_MCP_JOB_WORKERS", "2")))
+        return _JOB_MANAGER
+
+
+def get_result_cache() -> ResultCache:
+    """Process-wide result cache (created on first use)."""
+    global _RESULT_CACHE
+    with _SINGLETON_LOCK:
+        if _RESULT_CACHE is None:
+            _RESULT_CACHE = ResultCache(
+                max_entries=int(os.getenv("ER_MCP_CACHE_SIZE", "128")),
+                ttl_seconds=float(os.getenv("ER_MCP_CACHE_TTL_SECONDS", "900")),
+            )
+        return _RESULT_CACHE
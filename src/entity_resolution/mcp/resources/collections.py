@@ -6,7 +6,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
-from entity_resolution.mcp.connection import get_arango_hosts
+from entity_resolution.mcp.connection import get_pooled_db
 
 
 def get_collection_summary(
@@ -20,10 +20,7 @@ def get_collection_summary(
     sample_size: int = 3,
 ) -> str:
     """Return a JSON summary of a collection (schema sample + doc count)."""
-    from arango import ArangoClient
-
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     if not db.has_collection(collection_name):
         return json.dumps({"error": f"Collection '{collection_name}' not found"})
@@ -68,10 +65,7 @@ def get_cluster_detail(
     representative_key: str,
 ) -> str:
     """Return the full cluster containing *representative_key*."""
-    from arango import ArangoClient
-
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     edge_coll = f"{collection_name}_similarity_edges"
     if not db.has_collection(edge_coll):
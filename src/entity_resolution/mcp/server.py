@@ -15,7 +15,7 @@ import hmac
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from mcp.server.fastmcp import FastMCP
 
@@ -143,6 +143,47 @@ def _conn() -> Dict[str, Any]:
     )
 
 
+def _submit_job(tool: str, compute: Callable[[Callable[[Dict[str, Any]], None]], Any]) -> Dict[str, Any]:
+    """Run *compute* as a background job and return its id for ``job_status``."""
+    from entity_resolution.mcp.jobs import get_job_manager
+
+    job = get_job_manager().submit(tool, compute)
+    return _attach_schema_version({
+        "status": "accepted",
+        "job_id": job["job_id"],
+        "tool": tool,
+        "state": job["state"],
+        "poll_with": "job_status",
+    })
+
+
+def _cached_advisor_result(
+    tool: str,
+    args: Dict[str, Any],
+    request_id: Optional[str],
+    compute: Callable[[], Dict[str, Any]],
+    revision: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Serve an advisor result from the result cache, computing it on a miss.
+
+    ``request_id`` is echoed per call, so it is not part of the key. Only
+    successful (``status == "ok"``) results are cached.
+    """
+    from entity_resolution.mcp.jobs import ResultCache, get_result_cache
+
+    cache = get_result_cache()
+    key = ResultCache.key(tool, args, revision)
+    hit = cache.get(key)
+    if hit is not None:
+        hit["request_id"] = request_id
+        hit["cached"] = True
+        return hit
+    result = compute()
+    if isinstance(result, dict) and result.get("status") == "ok":
+        cache.put(key, result)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
@@ -184,12 +225,15 @@ def find_duplicates(
     active_learning_low_threshold: float = 0.55,
     active_learning_high_threshold: float = 0.80,
     options: Optional[Dict[str, Any]] = None,
+    run_async: bool = False,
 ) -> Dict[str, Any]:
     """
     Run the full entity resolution pipeline on a collection.
 
     Performs blocking → similarity computation → edge creation → clustering.
     Returns a metrics summary with counts and runtimes for each phase.
+    With ``run_async=True`` returns a ``job_id`` immediately; poll
+    ``job_status`` for stage progress and the summary.
 
     Args:
         collection: Name of the ArangoDB document collection to deduplicate.
@@ -205,6 +249,7 @@ def find_duplicates(
         active_learning_model: Optional litellm model override for active learning.
         active_learning_low_threshold: Lower bound of the uncertain-score band.
         active_learning_high_threshold: Upper bound of the uncertain-score band.
+        run_async: Run as a background job instead of inside this call.
     """
     from entity_resolution.mcp.normalization import normalize_find_duplicates_args
     from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
@@ -227,12 +272,45 @@ def find_duplicates(
     for warning in req.deprecation_warnings:
         logger.warning("find_duplicates normalization warning: %s", warning)
 
-    result = run_find_duplicates_request(
-        **_conn(),
-        request=req,
-    )
-    result = _attach_deprecation_warnings(result, req.deprecation_warnings)
-    return _attach_schema_version(result)
+    conn = _conn()
+
+    def compute(on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        result = run_find_duplicates_request(**conn, request=req, on_progress=on_progress)
+        result = _attach_deprecation_warnings(result, req.deprecation_warnings)
+        return _attach_schema_version(result)
+
+    if run_async:
+        return _submit_job("find_duplicates", compute)
+    return compute()
+
+
+@mcp.tool()
+def job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Report on background jobs started with ``run_async=True``.
+
+    With a ``job_id``, returns its state (queued, running, succeeded, failed),
+    progress events, elapsed time, and, once finished, its result or error.
+    Without one, lists all tracked jobs.
+
+    Args:
+        job_id: Id returned by the tool call that started the job.
+    """
+    from entity_resolution.mcp.jobs import get_job_manager
+
+    manager = get_job_manager()
+    if job_id is None:
+        return _attach_schema_version({"status": "ok", "jobs": manager.list_jobs()})
+    job = manager.status(job_id)
+    if job is None:
+        return _attach_schema_version({
+            "status": "error",
+            "error": {
+                "code": "job_not_found",
+                "message": f"Unknown or expired job id: {job_id}",
+            },
+        })
+    return _attach_schema_version({"status": "ok", **job})
 
 
 @mcp.tool()
@@ -450,25 +528,61 @@ def profile_dataset(
     include_fields: Optional[List[str]] = None,
     exclude_fields: Optional[List[str]] = None,
     compute_pairwise_signals: bool = True,
+    run_async: bool = False,
 ) -> Dict[str, Any]:
     """
     Profile a dataset and return ER-relevant field statistics.
 
     Returns null rates, distinct counts, heavy hitters, token stats, and
     optional duplicate/hub risk signals to guide strategy selection.
+    Repeat calls on an unchanged collection are served from cache
+    (``cached: true``). ``run_async=True`` returns a ``job_id`` for ``job_status``.
     """
+    from entity_resolution.mcp.connection import get_arango_hosts, get_pooled_db
+    from entity_resolution.mcp.jobs import collection_revision
     from entity_resolution.mcp.tools.advisor import run_profile_dataset
-    result = run_profile_dataset(
-        **_conn(),
-        source_type=source_type,
-        dataset_id=dataset_id,
-        request_id=request_id,
-        sample_limit=sample_limit,
-        include_fields=include_fields,
-        exclude_fields=exclude_fields,
-        compute_pairwise_signals=compute_pairwise_signals,
-    )
-    return _attach_schema_version(result)
+
+    conn = _conn()
+
+    def compute(on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        def profile() -> Dict[str, Any]:
+            return run_profile_dataset(
+                **conn,
+                source_type=source_type,
+                dataset_id=dataset_id,
+                request_id=request_id,
+                sample_limit=sample_limit,
+                include_fields=include_fields,
+                exclude_fields=exclude_fields,
+                compute_pairwise_signals=compute_pairwise_signals,
+            )
+
+        revision = None
+        if source_type == "collection":
+            revision = collection_revision(get_pooled_db(**conn), dataset_id)
+        if revision is None:
+            return _attach_schema_version(profile())
+        result = _cached_advisor_result(
+            "profile_dataset",
+            {
+                "hosts": get_arango_hosts(conn["host"], conn["port"]),
+                "database": conn["database"],
+                "source_type": source_type,
+                "dataset_id": dataset_id,
+                "sample_limit": sample_limit,
+                "include_fields": include_fields,
+                "exclude_fields": exclude_fields,
+                "compute_pairwise_signals": compute_pairwise_signals,
+            },
+            request_id,
+            profile,
+            revision=revision,
+        )
+        return _attach_schema_version(result)
+
+    if run_async:
+        return _submit_job("profile_dataset", compute)
+    return compute()
 
 
 @mcp.tool()
@@ -577,20 +691,34 @@ def simulate_pipeline_variants(
     variants: List[Dict[str, Any]],
     objective_profile: Optional[Dict[str, Any]] = None,
     request_id: Optional[str] = None,
+    run_async: bool = False,
 ) -> Dict[str, Any]:
     """
     Simulate and rank multiple candidate ER pipeline variants.
 
     Returns per-variant runtime/memory/quality estimates, a ranked list by
     objective fit, and a winner rationale to support pre-commit decisions.
+    Identical requests are served from cache. ``run_async=True`` returns a
+    ``job_id`` for ``job_status``.
     """
     from entity_resolution.mcp.tools.advisor import run_simulate_pipeline_variants
-    result = run_simulate_pipeline_variants(
-        variants=variants,
-        objective_profile=objective_profile,
-        request_id=request_id,
-    )
-    return _attach_schema_version(result)
+
+    def compute(on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        result = _cached_advisor_result(
+            "simulate_pipeline_variants",
+            {"variants": variants, "objective_profile": objective_profile},
+            request_id,
+            lambda: run_simulate_pipeline_variants(
+                variants=variants,
+                objective_profile=objective_profile,
+                request_id=request_id,
+            ),
+        )
+        return _attach_schema_version(result)
+
+    if run_async:
+        return _submit_job("simulate_pipeline_variants", compute)
+    return compute()
 
 
 @mcp.tool()
@@ -621,20 +749,34 @@ def evaluate_blocking_plan(
     profile: Dict[str, Any],
     blocking_plan: Dict[str, Any],
     request_id: Optional[str] = None,
+    run_async: bool = False,
 ) -> Dict[str, Any]:
     """
     Evaluate a proposed blocking plan before pipeline execution.
 
     Estimates candidate-pair volume and block-size distribution, then returns
     risk flags plus recommended guardrails for safer execution.
+    Identical requests are served from cache. ``run_async=True`` returns a
+    ``job_id`` for ``job_status``.
     """
     from entity_resolution.mcp.tools.advisor import run_evaluate_blocking_plan
-    result = run_evaluate_blocking_plan(
-        profile=profile,
-        blocking_plan=blocking_plan,
-        request_id=request_id,
-    )
-    return _attach_schema_version(result)
+
+    def compute(on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        result = _cached_advisor_result(
+            "evaluate_blocking_plan",
+            {"profile": profile, "blocking_plan": blocking_plan},
+            request_id,
+            lambda: run_evaluate_blocking_plan(
+                profile=profile,
+                blocking_plan=blocking_plan,
+                request_id=request_id,
+            ),
+        )
+        return _attach_schema_version(result)
+
+    if run_async:
+        return _submit_job("evaluate_blocking_plan", compute)
+    return compute()
 
 
 @mcp.tool()
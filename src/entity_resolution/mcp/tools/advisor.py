@@ -11,8 +11,7 @@ from itertools import combinations
 from typing import Any, Dict, List, Optional
 
 import yaml
-from arango import ArangoClient
-from entity_resolution.mcp.connection import get_arango_hosts
+from entity_resolution.mcp.connection import get_pooled_db
 
 TOOL_VERSION = "1.0.0"
 ADVISOR_POLICY_VERSION = "2026-03-01"
@@ -20,8 +19,8 @@ ER_OPTIONS_SCHEMA_VERSION = "1.0"
 
 
 def _get_db(host: str, port: int, username: str, password: str, database: str):
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    return client.db(database, username=username, password=password)
+    """Return a pooled, authenticated ArangoDB database handle."""
+    return get_pooled_db(host, port, username, password, database)
 
 
 def run_profile_dataset(
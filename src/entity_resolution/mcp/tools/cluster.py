@@ -6,8 +6,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
-from arango import ArangoClient
-from entity_resolution.mcp.connection import get_arango_hosts
+from entity_resolution.mcp.connection import get_pooled_db
 
 
 SYSTEM_FIELDS = {"_id", "_key", "_rev"}
@@ -37,8 +36,7 @@ def run_get_clusters(
     Reads from the stored cluster collection (populated by find_duplicates).
     Falls back to a WCC graph query if no stored clusters exist yet.
     """
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     # Try stored cluster collections in order of convention
     for cluster_coll_name in (f"{collection}_clusters", "entity_clusters"):
@@ -120,8 +118,7 @@ def run_merge_entities(
     - "newest": prefer the most recently inserted document
     - "first": use the first key as the canonical record
     """
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
     ordered_keys = list(dict.fromkeys(entity_keys))
     if not ordered_keys:
         raise ValueError("entity_keys must contain at least one document key")
@@ -161,8 +158,7 @@ def run_list_collections(
 ) -> List[Dict[str, Any]]:
     """List all document collections in the database with document counts."""
 
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     collections = []
     for coll in db.collections():
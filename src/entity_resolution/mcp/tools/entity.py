@@ -8,9 +8,8 @@ import re
 from typing import Any, Dict, List, Optional
 
 import jellyfish
-from arango import ArangoClient
 from entity_resolution.mcp.contracts import CrossCollectionRequest, ResolveEntityRequest
-from entity_resolution.mcp.connection import get_arango_hosts
+from entity_resolution.mcp.connection import get_pooled_db
 
 ER_OPTIONS_SCHEMA_VERSION = "1.0"
 
@@ -65,8 +64,7 @@ def run_resolve_entity_request(
     """Resolve entity matches from a canonical normalized request object."""
     from entity_resolution.core.incremental_resolver import IncrementalResolver
 
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     resolver = IncrementalResolver(
         db=db,
@@ -147,8 +145,7 @@ def run_explain_match(
     two entity documents match.
     """
 
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     coll = db.collection(collection)
     doc_a = coll.get(key_a)
@@ -287,8 +284,7 @@ def run_resolve_and_commit(
     """Incrementally resolve one record and update its cluster (plan 3.3)."""
     from ...core.incremental_maintainer import IncrementalMaintainer
 
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
     edge_collection = edge_collection or f"{collection}_similarity_edges"
     cluster_collection = cluster_collection or f"{collection}_clusters"
 
@@ -697,8 +693,7 @@ def run_resolve_cross_collection_request(
         if source_filter:
             custom_filters["source"] = source_filter
 
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    db = client.db(database, username=username, password=password)
+    db = get_pooled_db(host, port, username, password, database)
 
     service = CrossCollectionMatchingService(
         db=db,
@@ -7,22 +7,25 @@ import logging
 import re
 import time
 from collections import defaultdict
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-from arango import ArangoClient
 from entity_resolution.mcp.contracts import FindDuplicatesRequest
-from entity_resolution.mcp.connection import get_arango_hosts
+from entity_resolution.mcp.connection import get_pooled_db
 from entity_resolution.utils.pipeline_utils import count_inferred_edges, validate_edge_quality
 
 ER_OPTIONS_SCHEMA_VERSION = "1.0"
 
+# Keys per projection query and rows per cursor round trip for the
+# precision-gate document fetches and the unresolved-document scan.
+_FETCH_CHUNK = 5_000
+_CURSOR_BATCH_SIZE = 10_000
+
 
 def _get_db(host: str, port: int, username: str, password: str, database: str):
-    """Return an authenticated ArangoDB database handle."""
-    client = ArangoClient(hosts=get_arango_hosts(host, port))
-    return client.db(database, username=username, password=password)
+    """Return a pooled, authenticated ArangoDB database handle."""
+    return get_pooled_db(host, port, username, password, database)
 
 
 def run_find_duplicates(
@@ -83,11 +86,13 @@ def run_find_duplicates_request(
     password: str,
     database: str,
     request: FindDuplicatesRequest,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """
     Run find_duplicates using a canonical normalized request object.
 
     Preferred internal entrypoint for MCP wrappers after normalization.
+    ``on_progress`` receives the pipeline's stage events (single-stage runs).
     """
     from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
 
@@ -115,7 +120,7 @@ def run_find_duplicates_request(
             store_clusters=request.store_clusters,
         )
         pipeline = ConfigurableERPipeline(db=db, config=cfg)
-        return _with_schema_version(pipeline.run())
+        return _with_schema_version(pipeline.run(on_progress=on_progress))
 
     if len(request.stages) == 1:
         stage_strategy, stage_fields, stage_threshold, stage_meta = _resolve_stage_scaffold(request)
@@ -139,7 +144,7 @@ def run_find_duplicates_request(
             store_clusters=request.store_clusters,
         )
         pipeline = ConfigurableERPipeline(db=db, config=cfg)
-        results = pipeline.run()
+        results = pipeline.run(on_progress=on_progress)
         results["stages"] = stage_meta
         return _with_schema_version(results)
 
@@ -490,30 +495,40 @@ def _resolve_stage_config(stage: Dict[str, Any], request: FindDuplicatesRequest)
 
 
 def _get_unresolved_doc_ids(db: Any, collection: str, edge_collection: str) -> set[str]:
+    """Ids of documents in *collection* with no edge in *edge_collection*.
+
+    The linked set comes from one ``COLLECT`` pass over the edges rather than
+    a per-document edge subquery, so the cost is one scan of each collection.
+    """
     if not db.has_collection(collection):
         return set()
-    if not db.has_collection(edge_collection):
-        cursor = db.aql.execute("FOR d IN @@collection RETURN d._id", bind_vars={"@collection": collection})
-        return {str(doc_id) for doc_id in cursor}
+    cursor = db.aql.execute(
+        "FOR d IN @@collection RETURN d._id",
+        bind_vars={"@collection": collection},
+        batch_size=_CURSOR_BATCH_SIZE,
+        stream=True,
+    )
+    doc_ids = {str(doc_id) for doc_id in cursor}
+    if not doc_ids or not db.has_collection(edge_collection):
+        return doc_ids
 
     cursor = db.aql.execute(
         """
-        FOR d IN @@collection
-          LET linked = LENGTH(
-            FOR e IN @@edge_collection
-              FILTER e._from == d._id OR e._to == d._id
-              LIMIT 1
-              RETURN 1
-          )
-          FILTER linked == 0
-          RETURN d._id
+        FOR e IN @@edge_collection
+          FOR v IN [e._from, e._to]
+            FILTER STARTS_WITH(v, @prefix)
+            COLLECT doc_id = v
+            RETURN doc_id
         """,
         bind_vars={
-            "@collection": collection,
             "@edge_collection": edge_collection,
+            "prefix": f"{collection}/",
         },
+        batch_size=_CURSOR_BATCH_SIZE,
+        stream=True,
     )
-    return {str(doc_id) for doc_id in cursor}
+    doc_ids.difference_update(str(doc_id) for doc_id in cursor)
+    return doc_ids
 
 
 def _filter_candidate_pairs_by_doc_ids(
@@ -642,7 +657,18 @@ def _apply_precision_gates(
     margin_index = _build_margin_index(matches, collection=collection)
     token_index: Dict[str, set[str]] = {}
     jaccard_fields = _merge_unique_fields(request.token_jaccard_fields, fields)
-    if request.similarity_type == "token_jaccard" or request.require_token_overlap or request.token_type_affinity:
+    needs_tokens = bool(
+        request.similarity_type == "token_jaccard" or request.require_token_overlap or request.token_type_affinity
+    )
+    type_index: Dict[str, str] = {}
+    if needs_tokens:
+        # One projected fetch serves both the token and the type index.
+        projected = _merge_unique_fields(jaccard_fields, alias_profile.get("field_sources", []))
+        if request.token_type_affinity:
+            projected = _merge_unique_fields(projected, [request.target_type_field])
+        docs = _fetch_doc_projections(
+            db, collection=collection, doc_ids=_match_doc_ids(matches, collection=collection), fields=projected
+        )
         token_index = _build_doc_token_index(
             db=db,
             collection=collection,
@@ -650,15 +676,16 @@ def _apply_precision_gates(
             fields=jaccard_fields,
             stopwords=request.word_index_stopwords,
             alias_profile=alias_profile,
+            docs=docs,
         )
-    type_index: Dict[str, str] = {}
-    if request.token_type_affinity:
-        type_index = _build_doc_type_index(
-            db=db,
-            collection=collection,
-            matches=matches,
-            target_type_field=request.target_type_field,
-        )
+        if request.token_type_affinity:
+            type_index = _build_doc_type_index(
+                db=db,
+                collection=collection,
+                matches=matches,
+                target_type_field=request.target_type_field,
+                docs=docs,
+            )
     min_token_jaccard = (
         request.token_jaccard_min_score
         if request.token_jaccard_min_score > 0.0
@@ -764,6 +791,56 @@ def _build_margin_index(matches: list[Any], *, collection: str) -> Dict[str, Tup
     return idx
 
 
+def _match_doc_ids(matches: list[Any], *, collection: str) -> set[str]:
+    doc_ids: set[str] = set()
+    for m in matches:
+        doc1, doc2, _score = _match_parts(m, collection=collection)
+        if doc1:
+            doc_ids.add(doc1)
+        if doc2:
+            doc_ids.add(doc2)
+    return doc_ids
+
+
+def _fetch_doc_projections(
+    db: Any,
+    *,
+    collection: str,
+    doc_ids: set[str],
+    fields: list[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch only *fields* of the referenced documents, ``_FETCH_CHUNK`` keys per query.
+
+    Documents are looked up by key in *collection* (as the gates always have),
+    and returned keyed by the caller's doc id. Missing documents map to ``{}``.
+    """
+    ids_by_key: Dict[str, list[str]] = defaultdict(list)
+    for doc_id in doc_ids:
+        ids_by_key[doc_id.split("/", 1)[1] if "/" in doc_id else doc_id].append(doc_id)
+    keys = sorted(ids_by_key)
+
+    docs: Dict[str, Dict[str, Any]] = {doc_id: {} for doc_id in doc_ids}
+    for start in range(0, len(keys), _FETCH_CHUNK):
+        cursor = db.aql.execute(
+            """
+            FOR d IN @@collection
+              FILTER d._key IN @keys
+              RETURN MERGE(KEEP(d, @fields), { _key: d._key })
+            """,
+            bind_vars={
+                "@collection": collection,
+                "keys": keys[start:start + _FETCH_CHUNK],
+                "fields": list(fields),
+            },
+            batch_size=_CURSOR_BATCH_SIZE,
+            stream=True,
+        )
+        for doc in cursor:
+            for doc_id in ids_by_key.get(str(doc.get("_key")), ()):
+                docs[doc_id] = doc
+    return docs
+
+
 def _build_doc_token_index(
     *,
     db: Any,
@@ -772,23 +849,19 @@ def _build_doc_token_index(
     fields: list[str],
     stopwords: list[str],
     alias_profile: Dict[str, Any],
+    docs: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, set[str]]:
-    coll = db.collection(collection)
-    doc_ids: set[str] = set()
-    for m in matches:
-        doc1, doc2, _score = _match_parts(m, collection=collection)
-        if doc1:
-            doc_ids.add(doc1)
-        if doc2:
-            doc_ids.add(doc2)
+    alias_fields = alias_profile.get("field_sources", [])
+    token_fields = _merge_unique_fields(fields, alias_fields)
+    if docs is None:
+        docs = _fetch_doc_projections(
+            db, collection=collection, doc_ids=_match_doc_ids(matches, collection=collection), fields=token_fields
+        )
 
     index: Dict[str, set[str]] = {}
-    alias_fields = alias_profile.get("field_sources", [])
-    for doc_id in doc_ids:
-        key = doc_id.split("/", 1)[1] if "/" in doc_id else doc_id
-        doc = coll.get(key) or {}
+    for doc_id, doc in docs.items():
         tokens: set[str] = set()
-        for field in _merge_unique_fields(fields, alias_fields):
+        for field in token_fields:
             val = doc.get(field)
             if val is None:
                 continue
@@ -819,20 +892,15 @@ def _build_doc_type_index(
     collection: str,
     matches: list[Any],
     target_type_field: str,
+    docs: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, str]:
-    coll = db.collection(collection)
-    doc_ids: set[str] = set()
-    for m in matches:
-        doc1, doc2, _score = _match_parts(m, collection=collection)
-        if doc1:
-            doc_ids.add(doc1)
-        if doc2:
-            doc_ids.add(doc2)
+    if docs is None:
+        docs = _fetch_doc_projections(
+            db, collection=collection, doc_ids=_match_doc_ids(matches, collection=collection), fields=[target_type_field]
+        )
 
     index: Dict[str, str] = {}
-    for doc_id in doc_ids:
-        key = doc_id.split("/", 1)[1] if "/" in doc_id else doc_id
-        doc = coll.get(key) or {}
+    for doc_id, doc in docs.items():
         val = doc.get(target_type_field)
         if val is None:
             continue
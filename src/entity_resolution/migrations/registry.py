@@ -93,4 +93,17 @@ MIGRATIONS: List[Migration] = [
             "idx_audit_history",
         ),
     ),
+    Migration(
+        id=7,
+        name="index_er_resolution_queue",
+        description=(
+            "Pending-work queue for incremental maintenance, indexed on "
+            "(collection, lease_until) so dequeue reads only the queue head."
+        ),
+        apply=_add_persistent_index(
+            "er_resolution_queue",
+            ["collection", "lease_until"],
+            "idx_queue_lease",
+        ),
+    ),
 ]
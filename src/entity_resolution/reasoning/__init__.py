@@ -5,6 +5,7 @@ from entity_resolution.reasoning.feedback import (
     FeedbackStore,
     ThresholdOptimizer,
     AdaptiveLLMVerifier,
+    VerdictCache,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "FeedbackStore",
     "ThresholdOptimizer",
     "AdaptiveLLMVerifier",
+    "VerdictCache",
 ]
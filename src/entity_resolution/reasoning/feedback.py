@@ -16,6 +16,11 @@ training data.  This module:
    auto-loads updated thresholds from the feedback store at configurable
    intervals.
 
+4. **VerdictCache** — content-addressed LLM verdicts, keyed by
+   (model, prompt version, content hash of both records), consulted by
+   ``LLMMatchVerifier`` before it calls the LLM so a pair seen in an earlier
+   run is never paid for twice.
+
 Usage::
 
     from entity_resolution.reasoning.feedback import FeedbackStore, AdaptiveLLMVerifier
@@ -32,12 +37,17 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 _FEEDBACK_COLLECTION = "er_llm_feedback"
+_VERDICT_CACHE_COLLECTION = "er_llm_verdict_cache"
+
+#: Result fields stored in (and replayed from) the verdict cache.
+_CACHED_FIELDS = ("decision", "confidence", "reasoning", "score_override", "model")
 
 
 # ---------------------------------------------------------------------------
@@ -258,6 +268,74 @@ class FeedbackStore:
         return next(iter(cursor), 0)
 
 
+# ---------------------------------------------------------------------------
+# VerdictCache
+# ---------------------------------------------------------------------------
+
+class VerdictCache:
+    """
+    Persistent LLM verdict cache keyed by model, prompt version and content.
+
+    The cache key is ``md5(model | prompt_version | sorted(content_hash(a),
+    content_hash(b)))``. Because it uses record *content* (``_``-prefixed
+    fields excluded), it covers both the same pair in a later run and a
+    different pair of records with identical content. Only decisive verdicts
+    (``match`` / ``no_match``) are stored. Reads go through an in-process
+    dict first, and batches are fetched with one query.
+    """
+
+    def __init__(self, db, collection: str = _VERDICT_CACHE_COLLECTION) -> None:
+        self.db = db
+        self.collection = collection
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if not self.db.has_collection(self.collection):
+            self.db.create_collection(self.collection)
+            logger.info("VerdictCache: created collection '%s'", self.collection)
+
+    @staticmethod
+    def key_for(
+        model: Optional[str],
+        prompt_version: str,
+        record_a: Dict[str, Any],
+        record_b: Dict[str, Any],
+    ) -> str:
+        """Order-independent cache key for a record pair."""
+        ha, hb = sorted((_content_hash(record_a), _content_hash(record_b)))
+        return hashlib.md5(f"{model}|{prompt_version}|{ha}|{hb}".encode()).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached verdicts for the subset of ``keys`` that has one."""
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            found = {k: self._memory[k] for k in keys if k in self._memory}
+        missing = [k for k in keys if k not in found]
+        if missing:
+            cursor = self.db.aql.execute(
+                "FOR doc IN @@col FILTER doc._key IN @keys RETURN doc",
+                bind_vars={"@col": self.collection, "keys": missing},
+            )
+            loaded = {doc["_key"]: {f: doc.get(f) for f in _CACHED_FIELDS} for doc in cursor}
+            with self._lock:
+                self._memory.update(loaded)
+            found.update(loaded)
+        return found
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get_many([key]).get(key)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a decisive verdict (other outcomes are ignored)."""
+        if result.get("decision") not in ("match", "no_match"):
+            return
+        entry = {f: result.get(f) for f in _CACHED_FIELDS}
+        with self._lock:
+            self._memory[key] = entry
+        self.db.collection(self.collection).insert(
+            {"_key": key, **entry, "ts": time.time()}, overwrite=True
+        )
+
+
 # ---------------------------------------------------------------------------
 # ThresholdOptimizer
 # ---------------------------------------------------------------------------
@@ -418,6 +496,7 @@ class AdaptiveLLMVerifier:
         self.store = feedback_store
         self.refresh_every = refresh_every
         self._call_count = 0
+        self._refreshed_at = 0
         self._optimizer = ThresholdOptimizer(
             feedback_store,
             target_precision=optimizer_target_precision,
@@ -439,7 +518,35 @@ class AdaptiveLLMVerifier:
         """Verify, save verdict, auto-refresh thresholds."""
         self._maybe_refresh_thresholds()
         result = self.verifier.verify(record_a, record_b, score, field_scores)
+        self._save(record_a, record_b, score, field_scores, result)
+        self._call_count += 1
+        return result
+
+    def verify_batch(
+        self,
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any], float]],
+        field_scores_list: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Verify a batch (concurrently when the verifier allows it).
 
+        Thresholds are refreshed before each ``refresh_every``-sized slice
+        rather than mid-flight, so every pair in a slice sees the same range.
+        """
+        field_scores_list = field_scores_list or [None] * len(pairs)
+        results: List[Dict[str, Any]] = []
+        step = max(1, self.refresh_every)
+        for start in range(0, len(pairs), step):
+            self._maybe_refresh_thresholds()
+            chunk = pairs[start:start + step]
+            chunk_fs = field_scores_list[start:start + step]
+            chunk_results = self.verifier.verify_batch(chunk, chunk_fs)
+            for (a, b, s), fs, result in zip(chunk, chunk_fs, chunk_results):
+                self._save(a, b, s, fs, result)
+            self._call_count += len(chunk)
+            results.extend(chunk_results)
+        return results
+
+    def _save(self, record_a, record_b, score, field_scores, result) -> None:
         # Only persist decisive labels; "error"/"pending_review" outcomes are
         # not training data and must not reach the ThresholdOptimizer.
         if result.get("llm_called") and result.get("decision") in ("match", "no_match"):
@@ -453,19 +560,6 @@ class AdaptiveLLMVerifier:
                 field_scores=field_scores,
             )
 
-        self._call_count += 1
-        return result
-
-    def verify_batch(
-        self,
-        pairs: List[Tuple[Dict[str, Any], Dict[str, Any], float]],
-        field_scores_list: Optional[List[Dict[str, Any]]] = None,
-    ) -> List[Dict[str, Any]]:
-        return [
-            self.verify(a, b, s, (field_scores_list or [None] * len(pairs))[i])
-            for i, (a, b, s) in enumerate(pairs)
-        ]
-
     def record_human_correction(self, key_a: str, key_b: str, correct_decision: str) -> None:
         """Record a human override for a previous LLM decision."""
         self.store.record_human_correction(key_a, key_b, correct_decision)
@@ -495,7 +589,8 @@ class AdaptiveLLMVerifier:
     # ------------------------------------------------------------------
 
     def _maybe_refresh_thresholds(self) -> None:
-        if self._call_count > 0 and self._call_count % self.refresh_every == 0:
+        if self._call_count - self._refreshed_at >= self.refresh_every:
+            self._refreshed_at = self._call_count
             self.optimize_thresholds()
 
 
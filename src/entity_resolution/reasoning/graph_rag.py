@@ -3,6 +3,14 @@ GraphRAG: Document entity extraction and linking.
 
 Uses an LLM to extract structured entities from unstructured text and
 links them to existing entities in an ArangoDB graph.
+
+Linking looks up every distinct extracted name in one pass. With
+``retrieval="scan"`` (the default) that is a single streamed read of the
+entity collection per :meth:`GraphRAGLinker.link` / :meth:`~GraphRAGLinker.link_batch`
+call, rather than one read per mention. ``retrieval="index"`` keeps a resident
+name index (:class:`~entity_resolution.core.resident_index.ResidentBlockingIndex`)
+built once and shared across calls, and rescores only the top
+``candidate_limit`` candidates per name.
 """
 
 from __future__ import annotations
@@ -10,10 +18,12 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+RETRIEVAL_MODES = ("scan", "index")
+
 EXTRACTION_PROMPT = """\
 You are an expert in Named Entity Recognition and data extraction.
 
@@ -152,6 +162,19 @@ class GraphRAGLinker:
         document -> entity, so this (together with ``source_doc_key`` at
         link time) is required for edges to be created; matches found
         without document context are returned with ``edge_key: None``.
+    retrieval:
+        ``"scan"`` streams the entity collection once per call and scores every
+        distinct name against it. This is exact. ``"index"`` looks names up in
+        a resident prefix/token index and rescores only the top
+        ``candidate_limit`` candidates. This is much faster on large
+        collections, but misses entities that share no prefix or token with
+        the mention.
+    name_index:
+        Prebuilt ``ResidentBlockingIndex`` over ``name_field`` to share between
+        linkers. When omitted in index mode, one is built on first use and
+        reused by later calls (see :meth:`rebuild_index`).
+    candidate_limit:
+        Candidates rescored per name in index mode.
     """
 
     def __init__(
@@ -162,13 +185,23 @@ class GraphRAGLinker:
         similarity_threshold: float = 0.70,
         name_field: str = "name",
         document_collection: Optional[str] = None,
+        retrieval: str = "scan",
+        name_index: Optional[Any] = None,
+        candidate_limit: int = 100,
     ) -> None:
+        if retrieval not in RETRIEVAL_MODES:
+            raise ValueError(f"retrieval must be one of {RETRIEVAL_MODES}, got {retrieval!r}")
+        if candidate_limit < 1:
+            raise ValueError(f"candidate_limit must be >= 1, got {candidate_limit}")
         self.db = db
         self.entity_collection = entity_collection
         self.edge_collection = edge_collection
         self.similarity_threshold = similarity_threshold
         self.name_field = name_field
         self.document_collection = document_collection
+        self.retrieval = retrieval
+        self.candidate_limit = int(candidate_limit)
+        self._name_index = name_index
 
     def link(
         self,
@@ -192,58 +225,121 @@ class GraphRAGLinker:
             None when no provenance edge was created (requires both
             ``document_collection`` and ``source_doc_key``).
         """
-        import jellyfish
+        return self.link_batch([extracted_entities], [source_doc_key])[0]
 
-        results = []
-        for entity in extracted_entities:
-            name = entity.get("name", "")
-            if not name:
-                results.append(self._no_match(entity))
-                continue
-
-            best = self._find_best_match(name, jellyfish)
-            if best and best["score"] >= self.similarity_threshold:
-                edge_key = self._create_edge(
-                    best["key"], entity, source_doc_key
-                )
-                results.append({
-                    "extracted": entity,
-                    "matched_key": best["key"],
-                    "matched_name": best["name"],
-                    "score": best["score"],
-                    "linked": True,
-                    "edge_key": edge_key,
-                })
-            else:
-                results.append(self._no_match(entity))
-
-        logger.info(
-            "Linked %d / %d entities (threshold=%.2f)",
-            sum(1 for r in results if r["linked"]),
-            len(results),
-            self.similarity_threshold,
+    def link_batch(
+        self,
+        extracted_batch: List[List[Dict[str, Any]]],
+        source_doc_keys: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """:meth:`link` for many documents with one lookup for all their names.
+
+        Parameters
+        ----------
+        extracted_batch:
+            Output from :meth:`DocumentEntityExtractor.extract_batch`.
+        source_doc_keys:
+            Source document key per entry of ``extracted_batch`` (or None).
+
+        Returns
+        -------
+        list[list[dict]]
+            One :meth:`link` result list per document.
+        """
+        if source_doc_keys is None:
+            source_doc_keys = [None] * len(extracted_batch)
+        if len(source_doc_keys) != len(extracted_batch):
+            raise ValueError("source_doc_keys must have one entry per document")
+
+        best_by_name = self._find_best_matches(
+            entity.get("name", "") for entities in extracted_batch for entity in entities
         )
-        return results
 
-    def _find_best_match(self, name: str, jellyfish_mod) -> Optional[Dict[str, Any]]:
+        batch_results = []
+        for entities, source_doc_key in zip(extracted_batch, source_doc_keys):
+            results = []
+            for entity in entities:
+                name = entity.get("name", "")
+                best = best_by_name.get(name) if name else None
+                if best and best["score"] >= self.similarity_threshold:
+                    edge_key = self._create_edge(
+                        best["key"], entity, source_doc_key
+                    )
+                    results.append({
+                        "extracted": entity,
+                        "matched_key": best["key"],
+                        "matched_name": best["name"],
+                        "score": best["score"],
+                        "linked": True,
+                        "edge_key": edge_key,
+                    })
+                else:
+                    results.append(self._no_match(entity))
+
+            logger.info(
+                "Linked %d / %d entities (threshold=%.2f)",
+                sum(1 for r in results if r["linked"]),
+                len(results),
+                self.similarity_threshold,
+            )
+            batch_results.append(results)
+        return batch_results
+
+    def rebuild_index(self) -> int:
+        """(Re)build the resident name index used by ``retrieval="index"``."""
+        from ..core.resident_index import ResidentBlockingIndex
+
+        if self._name_index is None:
+            # Candidates are only ranked here, so prefix hubs are cut like tokens.
+            self._name_index = ResidentBlockingIndex(
+                self.entity_collection, [self.name_field], key_types=("prefix", "token"),
+                max_prefix_postings=10_000,
+            )
+        return self._name_index.build(self.db)
+
+    def _find_best_matches(self, names: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Best-scoring entity per distinct non-empty name."""
+        import jellyfish
+
+        unique = list(dict.fromkeys(n for n in names if n))
+        if not unique:
+            return {}
+        lowered = [n.lower() for n in unique]
+        best: Dict[str, Optional[Dict[str, Any]]] = {n: None for n in unique}
+
+        if self.retrieval == "index":
+            if self._name_index is None or not self._name_index.built:
+                self.rebuild_index()
+            for name, low in zip(unique, lowered):
+                for row in self._name_index.ranked_candidates(
+                    {self.name_field: name}, self.candidate_limit
+                ):
+                    self._consider(best, name, low, row["_key"], row.get(self.name_field), jellyfish)
+            return best
+
         cursor = self.db.aql.execute(
             "FOR doc IN @@col RETURN {key: doc._key, name: doc.@field}",
             bind_vars={
                 "@col": self.entity_collection,
                 "field": self.name_field,
             },
+            batch_size=10_000,
+            stream=True,
         )
-        best: Optional[Dict[str, Any]] = None
         for row in cursor:
-            if not row.get("name"):
-                continue
-            score = jellyfish_mod.jaro_winkler_similarity(
-                name.lower(), row["name"].lower()
-            )
-            if best is None or score > best["score"]:
-                best = {"key": row["key"], "name": row["name"], "score": round(score, 4)}
+            for name, low in zip(unique, lowered):
+                self._consider(best, name, low, row["key"], row.get("name"), jellyfish)
         return best
 
+    @staticmethod
+    def _consider(best, name, lowered_name, key, candidate_name, jellyfish_mod) -> None:
+        if not candidate_name:
+            return
+        score = jellyfish_mod.jaro_winkler_similarity(lowered_name, candidate_name.lower())
+        current = best[name]
+        if current is None or score > current["score"]:
+            best[name] = {"key": key, "name": candidate_name, "score": round(score, 4)}
+
     def _create_edge(
         self,
         matched_key: str,
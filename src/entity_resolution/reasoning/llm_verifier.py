@@ -11,6 +11,11 @@ Supports any litellm-compatible model:
     openai/gpt-4o
     anthropic/claude-3-5-sonnet-20241022
     ollama/mistral  (local, no API key needed)
+
+``verify_batch`` can run up to ``max_concurrency`` LLM calls at once, paced by
+a token bucket (``requests_per_minute``) and still bounded by the call/cost
+budget. A :class:`~entity_resolution.reasoning.feedback.VerdictCache` is
+consulted before any call.
 """
 from __future__ import annotations
 
@@ -19,12 +24,16 @@ import json
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import litellm
 
 if TYPE_CHECKING:
     from ..config.er_config import LLMProviderConfig
+    from .feedback import VerdictCache
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +68,32 @@ the SAME real-world {entity_type}.
 - Do NOT add any text outside the JSON object.
 """
 
+#: Part of the verdict-cache key: editing the prompt invalidates cached verdicts.
+PROMPT_VERSION = hashlib.md5(MATCH_PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:12]
+
+
+class _TokenBucket:
+    """Blocking token bucket: ``rate`` acquisitions per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class LLMMatchVerifier:
     """
@@ -78,6 +113,13 @@ class LLMMatchVerifier:
         Human-readable entity type for the prompt (e.g. "company", "person").
     api_key:
         Override API key; otherwise read from OPENROUTER_API_KEY / OPENAI_API_KEY.
+    max_concurrency:
+        LLM calls :meth:`verify_batch` may have in flight at once (1 = serial).
+    requests_per_minute:
+        Token-bucket pacing applied to every completion request (None = unpaced).
+    verdict_cache:
+        Optional :class:`~entity_resolution.reasoning.feedback.VerdictCache`
+        consulted before calling the LLM; decisive verdicts are written back.
     """
 
     def __init__(
@@ -92,7 +134,14 @@ class LLMMatchVerifier:
         max_cost_usd: Optional[float] = None,
         max_calls: Optional[int] = None,
         mask_fields: Optional[List[str]] = None,
+        max_concurrency: int = 1,
+        requests_per_minute: Optional[float] = None,
+        verdict_cache: Optional["VerdictCache"] = None,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be > 0, got {requests_per_minute}")
         self.model = model or os.getenv("OPENROUTER_MODEL", "openrouter/google/gemini-2.0-flash")
         self.low_threshold = low_threshold
         self.high_threshold = high_threshold
@@ -107,6 +156,12 @@ class LLMMatchVerifier:
         # Field values to replace with stable hashes before sending to the LLM.
         self.mask_fields = set(mask_fields or [])
 
+        self.max_concurrency = int(max_concurrency)
+        self._rate_limiter = (
+            _TokenBucket(requests_per_minute / 60.0) if requests_per_minute else None
+        )
+        self.verdict_cache = verdict_cache
+
         self._stats: Dict[str, Any] = {
             "calls": 0,
             "tokens_in": 0,
@@ -114,7 +169,11 @@ class LLMMatchVerifier:
             "cost_usd": 0.0,
             "parse_failures": 0,
             "budget_stops": 0,
+            "cache_hits": 0,
         }
+        # Guards _stats and _in_flight when verify_batch runs concurrently.
+        self._lock = threading.RLock()
+        self._in_flight = 0
 
     @classmethod
     def from_provider_config(
@@ -177,16 +236,23 @@ class LLMMatchVerifier:
         return self.low_threshold <= score < self.high_threshold
 
     def stats(self) -> Dict[str, Any]:
-        """Cumulative LLM usage: calls, tokens, cost (USD), parse/budget stops."""
-        return dict(self._stats)
+        """Cumulative LLM usage: calls, tokens, cost (USD), parse/budget stops, cache hits."""
+        with self._lock:
+            return dict(self._stats)
 
     def budget_exceeded(self) -> bool:
-        """True once the per-run call or cost budget is reached."""
-        if self.max_calls is not None and self._stats["calls"] >= self.max_calls:
-            return True
-        if self.max_cost_usd is not None and self._stats["cost_usd"] >= self.max_cost_usd:
-            return True
-        return False
+        """True once the per-run call or cost budget is reached.
+
+        Calls already in flight count against ``max_calls``, so concurrent
+        batches cannot overshoot it. The cost budget is only known after a
+        call returns, so it can be exceeded by at most the in-flight calls.
+        """
+        with self._lock:
+            if self.max_calls is not None and self._stats["calls"] + self._in_flight >= self.max_calls:
+                return True
+            if self.max_cost_usd is not None and self._stats["cost_usd"] >= self.max_cost_usd:
+                return True
+            return False
 
     def estimate_cost(self, num_pairs: int, avg_total_tokens: int = 400) -> Dict[str, Any]:
         """Best-effort pre-run cost estimate for *num_pairs* uncertain pairs.
@@ -241,23 +307,45 @@ class LLMMatchVerifier:
         if score < self.low_threshold:
             return self._fast_result("no_match", score, llm_called=False)
 
+        cache_key = None
+        if self.verdict_cache is not None:
+            cache_key = self.verdict_cache.key_for(self.model, PROMPT_VERSION, record_a, record_b)
+            cached = self.verdict_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached)
+        return self._verify_uncached(record_a, record_b, score, field_scores, cache_key)
+
+    def _verify_uncached(
+        self,
+        record_a: Dict[str, Any],
+        record_b: Dict[str, Any],
+        score: float,
+        field_scores: Optional[Dict[str, Any]],
+        cache_key: Optional[str],
+    ) -> Dict[str, Any]:
         # Budget guard: once the run's cost/call ceiling is hit, stop calling
-        # the LLM and route remaining uncertain pairs to human review.
-        if self.budget_exceeded():
-            self._stats["budget_stops"] += 1
-            return {
-                "decision": "pending_review",
-                "confidence": 0.0,
-                "reasoning": "LLM budget exhausted; routed to human review.",
-                "score_override": None,
-                "llm_called": False,
-                "needs_review": True,
-                "model": self.model,
-            }
+        # the LLM and route remaining uncertain pairs to human review. The
+        # check and the in-flight reservation are one atomic step.
+        with self._lock:
+            if self.budget_exceeded():
+                self._stats["budget_stops"] += 1
+                return {
+                    "decision": "pending_review",
+                    "confidence": 0.0,
+                    "reasoning": "LLM budget exhausted; routed to human review.",
+                    "score_override": None,
+                    "llm_called": False,
+                    "needs_review": True,
+                    "model": self.model,
+                }
+            self._in_flight += 1
 
         # LLM call for uncertain pairs
         try:
-            return self._call_llm(record_a, record_b, score, field_scores or {})
+            result = self._call_llm(record_a, record_b, score, field_scores or {})
+            if cache_key is not None:
+                self.verdict_cache.put(cache_key, result)
+            return result
         except Exception as exc:
             logger.warning("LLM verification failed (falling back to score): %s", exc)
             decision = "match" if score >= (self.low_threshold + self.high_threshold) / 2 else "no_match"
@@ -270,6 +358,9 @@ class LLMMatchVerifier:
                 "model": self.model,
                 "error": str(exc),
             }
+        finally:
+            with self._lock:
+                self._in_flight -= 1
 
     def verify_batch(
         self,
@@ -279,12 +370,45 @@ class LLMMatchVerifier:
         """
         Verify a list of (record_a, record_b, score) tuples.
 
-        Only calls the LLM for pairs in the uncertain range.
+        Only calls the LLM for pairs in the uncertain range. Cached verdicts
+        for the whole batch are looked up in one query. The remaining uncertain
+        pairs run on up to ``max_concurrency`` threads. Results are returned in
+        input order.
         """
-        results = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+        pending: List[int] = []
         for i, (a, b, score) in enumerate(pairs):
+            if score >= self.high_threshold:
+                results[i] = self._fast_result("match", score, llm_called=False)
+            elif score < self.low_threshold:
+                results[i] = self._fast_result("no_match", score, llm_called=False)
+            else:
+                pending.append(i)
+
+        cache_keys: Dict[int, str] = {}
+        if self.verdict_cache is not None and pending:
+            cache_keys = {
+                i: self.verdict_cache.key_for(self.model, PROMPT_VERSION, pairs[i][0], pairs[i][1])
+                for i in pending
+            }
+            cached = self.verdict_cache.get_many(cache_keys.values())
+            for i in pending:
+                if cache_keys[i] in cached:
+                    results[i] = self._cached_result(cached[cache_keys[i]])
+            pending = [i for i in pending if results[i] is None]
+
+        def run(i: int) -> Dict[str, Any]:
+            a, b, score = pairs[i]
             fs = field_scores_list[i] if field_scores_list else None
-            results.append(self.verify(a, b, score, fs))
+            return self._verify_uncached(a, b, score, fs, cache_keys.get(i))
+
+        if self.max_concurrency > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pending))) as pool:
+                for i, result in zip(pending, pool.map(run, pending)):
+                    results[i] = result
+        else:
+            for i in pending:
+                results[i] = run(i)
         return results
 
     # ------------------------------------------------------------------
@@ -327,7 +451,8 @@ class LLMMatchVerifier:
             parsed, raw = self._complete_and_parse(retry_prompt)
 
         if parsed is None:
-            self._stats["parse_failures"] += 1
+            with self._lock:
+                self._stats["parse_failures"] += 1
             logger.warning("LLM returned unparseable output after retry: %s", (raw or "")[:200])
             return {
                 "decision": "error",
@@ -396,6 +521,8 @@ class LLMMatchVerifier:
         if self.base_url:
             kwargs["api_base"] = self.base_url
 
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
         response = litellm.completion(**kwargs)
         self._account(response)
         raw = (response.choices[0].message.content or "").strip()
@@ -403,20 +530,24 @@ class LLMMatchVerifier:
 
     def _account(self, response: Any) -> None:
         """Accumulate call count, token usage, and cost (all best-effort)."""
-        self._stats["calls"] += 1
+        tokens_in = tokens_out = 0
         try:
             usage = getattr(response, "usage", None)
             if usage is not None:
-                self._stats["tokens_in"] += int(getattr(usage, "prompt_tokens", 0) or 0)
-                self._stats["tokens_out"] += int(getattr(usage, "completion_tokens", 0) or 0)
+                tokens_in = int(getattr(usage, "prompt_tokens", 0) or 0)
+                tokens_out = int(getattr(usage, "completion_tokens", 0) or 0)
         except (TypeError, ValueError):
             pass
         try:
-            cost = litellm.completion_cost(completion_response=response)
-            self._stats["cost_usd"] += float(cost)
+            cost = float(litellm.completion_cost(completion_response=response))
         except Exception:
             # Pricing unknown for this model/provider, or a mocked response.
-            pass
+            cost = 0.0
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["tokens_in"] += tokens_in
+            self._stats["tokens_out"] += tokens_out
+            self._stats["cost_usd"] += cost
 
     @staticmethod
     def _parse_verdict(raw: str) -> Optional[Dict[str, Any]]:
@@ -433,6 +564,11 @@ class LLMMatchVerifier:
             return None
         return parsed
 
+    def _cached_result(self, cached: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._stats["cache_hits"] += 1
+        return {**cached, "llm_called": False, "cached": True}
+
     @staticmethod
     def _fast_result(decision: str, score: float, *, llm_called: bool) -> Dict[str, Any]:
         return {
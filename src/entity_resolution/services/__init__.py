@@ -5,6 +5,7 @@ from .tuple_embedding_serializer import TupleEmbeddingSerializer
 from .ab_evaluation_harness import ABEvaluationHarness, EvaluationMetrics
 from .ab_evaluation_runner import run_blocking_benchmark, load_ground_truth
 from .cluster_export_service import ClusterExportService
+from .cluster_membership import ClusterMembershipIndex
 from .golden_record_persistence_service import GoldenRecordPersistenceService
 from .node2vec_embedding_service import Node2VecEmbeddingService, Node2VecParams
 from .onnx_embedding_backend import OnnxRuntimeEmbeddingBackend
@@ -25,6 +26,7 @@ __all__ = [
     'run_blocking_benchmark',
     'load_ground_truth',
     'ClusterExportService',
+    'ClusterMembershipIndex',
     'GoldenRecordPersistenceService',
     'Node2VecEmbeddingService',
     'Node2VecParams',
@@ -5,7 +5,7 @@ Complete address deduplication pipeline using ArangoDB analyzers and
 ArangoSearch views. Handles address normalization, blocking, and edge creation.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from arango.database import StandardDatabase
 from arango.collection import EdgeCollection, StandardCollection
 import shutil
@@ -14,9 +14,15 @@ from datetime import datetime
 import logging
 
 from .wcc_clustering_service import WCCClusteringService
+from ..utils.graph_utils import extract_key_from_vertex_id
 from ..utils.validation import validate_collection_name, validate_field_name, sanitize_string_for_display
 from ..utils.constants import DEFAULT_BATCH_SIZE, DEFAULT_EDGE_BATCH_SIZE, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_USERNAME
 
+# How a duplicate block is wired into sameAs edges. Blocks are exact-match
+# groups, so 'star' and 'chain' (n-1 edges) give WCC the same components as
+# 'clique' (n*(n-1)/2 edges).
+EDGE_TOPOLOGIES = ('clique', 'star', 'chain')
+
 
 class AddressERService:
     """
@@ -32,8 +38,8 @@ class AddressERService:
     Features:
     - Configurable field mapping (works with any address schema)
     - Max block size limit (prevents edge explosion from registered agents)
-    - Bulk edge creation
-    - Integration with WCC clustering
+    - Bulk edge creation (clique, star, or chain edges per block)
+    - Integration with WCC clustering, or clusters stored straight from blocks
     
     Example:
         ```python
@@ -112,7 +118,16 @@ class AddressERService:
                     'blocking_mode': 'single_query',  # 'single_query' or 'shard_parallel'
                     'shard_key_field': None,  # defaults to postal_code field
                     'shard_key_prefix_length': 3,
+                    'edge_topology': 'clique',  # 'clique', 'star', or 'chain'
                 }
+                ``edge_topology`` controls the sameAs edges written per block:
+                'clique' links every pair (n*(n-1)/2 edges, the historical
+                behaviour); 'star' links every address to the block's first
+                address and 'chain' links consecutive addresses (n-1 edges
+                each). All three yield the same WCC clusters.
+
+        Raises:
+            ValueError: If ``edge_topology`` is not one of EDGE_TOPOLOGIES.
         """
         self.db = db
         # Validate collection names to prevent AQL injection
@@ -144,6 +159,11 @@ class AddressERService:
         self.blocking_mode = self.config.get('blocking_mode', 'single_query')
         self.shard_key_field = self.config.get('shard_key_field')
         self.shard_key_prefix_length = self.config.get('shard_key_prefix_length', 3)
+        self.edge_topology = self.config.get('edge_topology', 'clique')
+        if self.edge_topology not in EDGE_TOPOLOGIES:
+            raise ValueError(
+                f"edge_topology must be one of {EDGE_TOPOLOGIES}, got: {self.edge_topology!r}"
+            )
         
         # Initialize logger
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -202,7 +222,8 @@ class AddressERService:
         max_block_size: Optional[int] = None,
         create_edges: bool = True,
         cluster: bool = False,
-        min_cluster_size: int = 2
+        min_cluster_size: int = 2,
+        cluster_from_blocks: bool = False
     ) -> Dict[str, Any]:
         """
         Run complete address ER pipeline.
@@ -212,6 +233,12 @@ class AddressERService:
             create_edges: Whether to create sameAs edges. Default True.
             cluster: Whether to run WCC clustering. Default False.
             min_cluster_size: Minimum cluster size for clustering. Default 2.
+            cluster_from_blocks: With ``cluster=True``, store each duplicate
+                block as a cluster directly instead of running WCC over the
+                edge collection. Blocks are disjoint exact-match groups, so
+                the clusters are the same; combine with ``create_edges=False``
+                to skip edge materialization entirely when only clusters are
+                needed. Default False.
         
         Returns:
             Results dictionary:
@@ -255,10 +282,7 @@ class AddressERService:
         
         # Phase 2: Edge Creation
         edges_created = 0
-        estimated_edges = sum(
-            (len(addrs) * (len(addrs) - 1)) // 2
-            for addrs in blocks.values()
-        )
+        estimated_edges = self._count_block_edges(blocks)
         
         if create_edges:
             self.logger.info("Phase 2: Creating sameAs edges...")
@@ -301,7 +325,10 @@ class AddressERService:
         clusters_found = None
         if cluster:
             self.logger.info("Phase 3: Clustering addresses...")
-            clusters = self._cluster_addresses(min_cluster_size)
+            if cluster_from_blocks:
+                clusters = self._cluster_blocks(blocks, min_cluster_size)
+            else:
+                clusters = self._cluster_addresses(min_cluster_size)
             clusters_found = len(clusters)
             results['clusters_found'] = clusters_found
         else:
@@ -756,13 +783,12 @@ class AddressERService:
             self.logger.info(f"Truncating existing {self.edge_collection} collection...")
             self.db.collection(self.edge_collection).truncate()
         
-        # Calculate total edges (each block of n addresses creates n*(n-1)/2 edges)
-        total_edges = sum(
-            (len(addrs) * (len(addrs) - 1)) // 2
-            for addrs in blocks.values()
-        )
+        total_edges = self._count_block_edges(blocks)
         
-        self.logger.info(f"Will create ~{total_edges:,} edges from {len(blocks):,} blocks")
+        self.logger.info(
+            f"Will create ~{total_edges:,} edges from {len(blocks):,} blocks "
+            f"({self.edge_topology} topology)"
+        )
         self.logger.info(f"Using optimized batching (batch size: {self.edge_batch_size:,})")
         
         # Create edges in larger batches (across blocks)
@@ -772,30 +798,28 @@ class AddressERService:
         timestamp = datetime.now().isoformat()
         
         for block_key, addresses in blocks.items():
-            # Generate all pairs for this block
-            for i, addr1_id in enumerate(addresses):
-                for addr2_id in addresses[i + 1:]:
-                    batch.append({
-                        '_from': addr1_id,
-                        '_to': addr2_id,
-                        'block_key': block_key,
-                        'timestamp': timestamp,
-                        'type': 'address_sameAs'
-                    })
-                    
-                    # Insert when batch is full
-                    if len(batch) >= self.edge_batch_size:
-                        try:
-                            edge_collection.insert_many(batch)
-                            edges_created += len(batch)
-                            batch = []
-                            
-                            # Progress logging
-                            if edges_created % 100000 == 0:
-                                self.logger.info(f"  Created {edges_created:,} edges...")
-                        except Exception as e:
-                            self.logger.error(f"Failed to insert edge batch: {e}", exc_info=True)
-                            # Continue with next batch
+            for addr1_id, addr2_id in self._block_pairs(addresses):
+                batch.append({
+                    '_from': addr1_id,
+                    '_to': addr2_id,
+                    'block_key': block_key,
+                    'timestamp': timestamp,
+                    'type': 'address_sameAs'
+                })
+                
+                # Insert when batch is full
+                if len(batch) >= self.edge_batch_size:
+                    try:
+                        edge_collection.insert_many(batch)
+                        edges_created += len(batch)
+                        batch = []
+                        
+                        # Progress logging
+                        if edges_created % 100000 == 0:
+                            self.logger.info(f"  Created {edges_created:,} edges...")
+                    except Exception as e:
+                        self.logger.error(f"Failed to insert edge batch: {e}", exc_info=True)
+                        # Continue with next batch
         
         # Insert remaining edges
         if batch:
@@ -809,6 +833,26 @@ class AddressERService:
         
         return edges_created
     
+    def _block_pairs(self, addresses: List[str]) -> Iterator[Tuple[str, str]]:
+        """Yield the (from, to) address pairs of one block for ``edge_topology``."""
+        if self.edge_topology == 'star':
+            hub = addresses[0]
+            for addr_id in addresses[1:]:
+                yield hub, addr_id
+        elif self.edge_topology == 'chain':
+            for i in range(len(addresses) - 1):
+                yield addresses[i], addresses[i + 1]
+        else:
+            for i, addr1_id in enumerate(addresses):
+                for addr2_id in addresses[i + 1:]:
+                    yield addr1_id, addr2_id
+    
+    def _count_block_edges(self, blocks: Dict[str, List[str]]) -> int:
+        """Number of edges ``_block_pairs`` yields across ``blocks``."""
+        if self.edge_topology == 'clique':
+            return sum((len(addrs) * (len(addrs) - 1)) // 2 for addrs in blocks.values())
+        return sum(max(len(addrs) - 1, 0) for addrs in blocks.values())
+    
     def _create_edges_via_csv(
         self, 
         blocks: Dict[str, List[str]], 
@@ -845,11 +889,7 @@ class AddressERService:
         
         self.logger.info(f"Exporting edges to CSV: {csv_path}")
         
-        # Calculate total edges
-        total_edges = sum(
-            (len(addrs) * (len(addrs) - 1)) // 2
-            for addrs in blocks.values()
-        )
+        total_edges = self._count_block_edges(blocks)
         
         self.logger.info(f"Will export ~{total_edges:,} edges to CSV")
         
@@ -874,20 +914,19 @@ class AddressERService:
                 
                 # Write edges
                 for block_key, addresses in blocks.items():
-                    for i, addr1_id in enumerate(addresses):
-                        for addr2_id in addresses[i + 1:]:
-                            writer.writerow([
-                                addr1_id,
-                                addr2_id,
-                                block_key,
-                                timestamp,
-                                'address_sameAs'
-                            ])
-                            edges_written += 1
-                            
-                            # Progress logging
-                            if edges_written % 100000 == 0:
-                                self.logger.info(f"  Exported {edges_written:,} edges...")
+                    for addr1_id, addr2_id in self._block_pairs(addresses):
+                        writer.writerow([
+                            addr1_id,
+                            addr2_id,
+                            block_key,
+                            timestamp,
+                            'address_sameAs'
+                        ])
+                        edges_written += 1
+                        
+                        # Progress logging
+                        if edges_written % 100000 == 0:
+                            self.logger.info(f"  Exported {edges_written:,} edges...")
             
             self.logger.info(f"[OK] Exported {edges_written:,} edges to CSV")
             
@@ -1051,6 +1090,43 @@ class AddressERService:
         
         return clusters
     
+    def _cluster_blocks(
+        self,
+        blocks: Dict[str, List[str]],
+        min_cluster_size: int
+    ) -> List[List[str]]:
+        """
+        Store duplicate blocks as clusters without reading any edges.
+        
+        Each address falls into exactly one block key, so the blocks already
+        are the connected components WCC would find over the sameAs edges.
+        The edge-based cluster quality pass is skipped for the same reason.
+        
+        Args:
+            blocks: Dictionary mapping block keys to lists of address IDs
+            min_cluster_size: Minimum cluster size
+        
+        Returns:
+            List of clusters (sorted document keys)
+        """
+        clusters = [
+            sorted(extract_key_from_vertex_id(addr_id) for addr_id in addresses)
+            for addresses in blocks.values()
+            if len(addresses) >= min_cluster_size
+        ]
+        clustering_service = WCCClusteringService(
+            db=self.db,
+            edge_collection=self.edge_collection,
+            cluster_collection=f'{self.collection}_clusters',
+            vertex_collection=self.collection,
+            min_cluster_size=min_cluster_size,
+        )
+        # Quality metrics come from edge similarities; blocks have none to read.
+        clustering_service.store_clusters(clusters, compute_quality=False)
+        self.logger.info(f"[OK] Stored {len(clusters):,} clusters directly from blocks")
+        
+        return clusters
+    
     def run_canonical_etl(
         self,
         input_path: str,
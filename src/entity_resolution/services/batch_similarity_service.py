@@ -11,6 +11,7 @@ Performance: ~100K+ pairs/second for Jaro-Winkler
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 from arango.database import StandardDatabase
 import time
@@ -18,10 +19,20 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+from ..similarity.graph_context import NeighborCSR
 from ..similarity.weighted_field_similarity import WeightedFieldSimilarity
 from ..utils.validation import validate_collection_name, validate_field_name
 from ..utils.constants import DEFAULT_SIMILARITY_THRESHOLD, DEFAULT_BATCH_SIZE
 
+# Pairs scored per compute_batch() call on the weighted-heuristic path: large
+# enough to amortize the per-field kernel call, small enough to keep the
+# per-chunk document lists and score vectors modest.
+_SCORE_CHUNK_SIZE = 50_000
+
+# ASCII punctuation (exactly Python's string.punctuation) as an AQL regex
+# string literal, for remove_punctuation pushed into the fetch projection.
+_AQL_PUNCTUATION_CLASS = "[!-/:-@\\\\[-`{-~]"
+
 
 class BatchSimilarityService:
     """
@@ -35,6 +46,7 @@ class BatchSimilarityService:
     - jaro_winkler: Best for names and addresses (jellyfish)
     - levenshtein: Edit distance (python-Levenshtein)
     - jaccard: Set-based similarity
+    - overlap: Token overlap coefficient
     - custom: Provide your own callable
     
     Performance: ~100K+ pairs/second for Jaro-Winkler
@@ -73,6 +85,15 @@ class BatchSimilarityService:
         scoring_method: str = "weighted_heuristic",
         fs_scorer: Optional[Any] = None,
         graph_context: Optional[Any] = None,
+        batch_backend: str = "auto",
+        batch_workers: int = 1,
+        minhash_threshold: Optional[int] = None,
+        minhash_permutations: int = 128,
+        fetch_concurrency: int = 4,
+        fetch_retries: int = 3,
+        fetch_retry_backoff_seconds: float = 0.5,
+        server_side_normalization: bool = False,
+        allow_partial_fetch: bool = False,
     ):
         """
         Initialize batch similarity service.
@@ -87,6 +108,7 @@ class BatchSimilarityService:
                 - "jaro_winkler" (default, requires jellyfish)
                 - "levenshtein" (requires python-Levenshtein)
                 - "jaccard" (built-in)
+                - "overlap" (built-in)
                 - Custom callable: (str1, str2) -> float (0.0-1.0)
             batch_size: Documents to fetch per query. Default DEFAULT_BATCH_SIZE (5000).
             normalization_config: Field normalization options:
@@ -100,6 +122,29 @@ class BatchSimilarityService:
             field_transformers: Optional per-field transformer chains applied before
                 normalization_config.
             progress_callback: Optional callback(current, total) for progress updates
+            batch_backend: String-kernel backend for weighted-heuristic scoring
+                ("auto", "rapidfuzz" or "numpy"); see WeightedFieldSimilarity.
+                Pairs are scored in vectorized chunks instead of one Python
+                call per field per pair.
+            batch_workers: Threads for the rapidfuzz kernel (-1 = all cores).
+            minhash_threshold, minhash_permutations: MinHash estimation of
+                large token sets for "jaccard"/"overlap"; see
+                WeightedFieldSimilarity. Default None (always exact).
+            fetch_concurrency: Document fetch chunks (of ``batch_size`` keys)
+                in flight at once. Default 4.
+            fetch_retries: Retries for a failed fetch chunk before the fetch
+                fails. Default 3.
+            fetch_retry_backoff_seconds: Delay before the first retry,
+                doubled on each further retry. Default 0.5.
+            server_side_normalization: Apply normalization_config (strip,
+                case, whitespace collapse, punctuation removal) in the AQL
+                projection instead of in Python, for fields without
+                field_transformers. Intended for string fields; a numeric
+                value is stringified by AQL rather than by Python.
+            allow_partial_fetch: Leave out the keys of a chunk that still
+                fails after ``fetch_retries`` (counted in
+                ``fetch_failed_keys``) instead of raising. Their pairs are
+                then not scored. Default False.
         
         Raises:
             ValueError: If configuration is invalid
@@ -136,6 +181,11 @@ class BatchSimilarityService:
             handle_nulls='skip',
             normalization_config=self.normalization_config,
             field_transformers=self.field_transformers,
+            batch_backend=batch_backend,
+            batch_workers=batch_workers,
+            minhash_threshold=minhash_threshold,
+            minhash_permutations=minhash_permutations,
+            prenormalized_fields=list(normalized_weights) if server_side_normalization else None,
         )
         self.algorithm_name = similarity_algorithm if isinstance(similarity_algorithm, str) else "custom"
 
@@ -153,12 +203,24 @@ class BatchSimilarityService:
         # comparison vector with batched relationship features.
         self.graph_context = graph_context
 
+        if fetch_concurrency < 1:
+            raise ValueError(f"fetch_concurrency must be >= 1, got {fetch_concurrency}")
+        if fetch_retries < 0:
+            raise ValueError(f"fetch_retries must be >= 0, got {fetch_retries}")
+        self.fetch_concurrency = fetch_concurrency
+        self.fetch_retries = fetch_retries
+        self.fetch_retry_backoff_seconds = fetch_retry_backoff_seconds
+        self.server_side_normalization = server_side_normalization
+        self.allow_partial_fetch = allow_partial_fetch
+
         # Statistics tracking
         self._stats = {
             'pairs_processed': 0,
             'pairs_above_threshold': 0,
             'documents_cached': 0,
             'batch_count': 0,
+            'fetch_retries': 0,
+            'fetch_failed_keys': 0,
             'execution_time_seconds': 0.0,
             'pairs_per_second': 0,
             'timestamp': None
@@ -210,28 +272,76 @@ class BatchSimilarityService:
                 neighbor_cache = None
         
         # Step 3: Compute similarities in-memory
+        matches = self.score_pairs(
+            candidate_pairs, doc_cache, threshold,
+            return_all=return_all, neighbor_cache=neighbor_cache,
+        )
+        
+        # Update statistics
+        execution_time = time.time() - start_time
+        self._update_statistics(len(candidate_pairs), len(matches), len(doc_cache), execution_time)
+        
+        return matches
+    
+    def score_pairs(
+        self,
+        candidate_pairs: List[Tuple[str, str]],
+        doc_cache: Dict[str, Dict[str, Any]],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        return_all: bool = False,
+        neighbor_cache: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Score candidate pairs against already-fetched documents.
+        
+        The in-memory half of :meth:`compute_similarities`, for callers that
+        fetch documents themselves (e.g. the native async pipeline). Pairs
+        with a document missing from ``doc_cache`` are skipped.
+        
+        Returns:
+            List of (doc1_key, doc2_key, similarity_score) tuples
+            Sorted by similarity score descending
+        """
         matches = []
         processed = 0
         total = len(candidate_pairs)
-        
-        for doc1_key, doc2_key in candidate_pairs:
-            processed += 1
-            
-            # Progress callback
-            if self.progress_callback and processed % 10000 == 0:
-                self.progress_callback(processed, total)
-            
-            doc1 = doc_cache.get(doc1_key)
-            doc2 = doc_cache.get(doc2_key)
-            
-            if not doc1 or not doc2:
-                continue
 
-            # Compute the pair score under the configured method.
-            score = self._score_pair(doc1, doc2, doc1_key, doc2_key, neighbor_cache)
+        if self.scoring_method == "weighted_heuristic":
+            # Vectorized path: score whole chunks of pairs per field kernel call.
+            for start in range(0, total, _SCORE_CHUNK_SIZE):
+                chunk = [
+                    (k1, k2, doc_cache[k1], doc_cache[k2])
+                    for k1, k2 in candidate_pairs[start:start + _SCORE_CHUNK_SIZE]
+                    if doc_cache.get(k1) and doc_cache.get(k2)
+                ]
+                scores = self.similarity_computer.compute_batch(
+                    [c[2] for c in chunk], [c[3] for c in chunk]
+                )
+                for (k1, k2, _, _), score in zip(chunk, scores.tolist()):
+                    if return_all or score >= threshold:
+                        matches.append((k1, k2, score))
+                if self.progress_callback and start + _SCORE_CHUNK_SIZE < total:
+                    self.progress_callback(start + _SCORE_CHUNK_SIZE, total)
+        else:
+            present = [
+                (k1, k2) for k1, k2 in candidate_pairs if doc_cache.get(k1) and doc_cache.get(k2)
+            ]
+            graph_rows = self._graph_feature_rows(present, neighbor_cache)
+            for i, (doc1_key, doc2_key) in enumerate(present):
+                processed += 1
+
+                # Progress callback
+                if self.progress_callback and processed % 10000 == 0:
+                    self.progress_callback(processed, total)
 
-            if return_all or score >= threshold:
-                matches.append((doc1_key, doc2_key, score))
+                # Compute the pair score under the configured method.
+                score = self._score_pair(
+                    doc_cache[doc1_key], doc_cache[doc2_key],
+                    graph_features=graph_rows[i] if graph_rows is not None else None,
+                )
+
+                if return_all or score >= threshold:
+                    matches.append((doc1_key, doc2_key, score))
         
         # Final progress callback
         if self.progress_callback:
@@ -239,13 +349,73 @@ class BatchSimilarityService:
         
         # Sort by score descending
         matches.sort(key=lambda x: x[2], reverse=True)
-        
-        # Update statistics
-        execution_time = time.time() - start_time
-        self._update_statistics(len(candidate_pairs), len(matches), len(doc_cache), execution_time)
-        
         return matches
     
+    def compute_similarities_cached(
+        self,
+        candidate_pairs: List[Tuple[str, str]],
+        attribute_cache: Dict[Tuple[str, str], Any],
+        neighbor_cache: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """Score pairs, reusing attribute-level work across repeated calls.
+
+        Built for collective resolution (plan 3.2), which re-scores the same
+        pairs round after round under a changing ``neighbor_cache``. Only the
+        graph-context features can change between those rounds. The first time
+        a pair is seen, its documents are fetched and its attribute comparison
+        is stored in ``attribute_cache``:
+
+        - ``weighted_heuristic`` stores the final score. Graph features do not
+          enter this score.
+        - ``fellegi_sunter`` stores the per-field scores and exact-shared
+          values.
+
+        Later calls only join the pair's graph features and apply the FS
+        scorer. Returns ``(doc1_key, doc2_key, score)`` for every scorable pair,
+        in input order (``return_all`` semantics). Pairs with a missing document
+        are omitted.
+        """
+        missing = [pair for pair in candidate_pairs if pair not in attribute_cache]
+        if missing:
+            start_time = time.time()
+            keys = {k for pair in missing for k in pair}
+            doc_cache = self.batch_fetch_documents(list(keys))
+            for start in range(0, len(missing), _SCORE_CHUNK_SIZE):
+                chunk = missing[start:start + _SCORE_CHUNK_SIZE]
+                present = [p for p in chunk if doc_cache.get(p[0]) and doc_cache.get(p[1])]
+                for pair in chunk:
+                    attribute_cache[pair] = None
+                if self.scoring_method == "weighted_heuristic":
+                    scores = self.similarity_computer.compute_batch(
+                        [doc_cache[a] for a, _ in present], [doc_cache[b] for _, b in present]
+                    )
+                    attribute_cache.update(zip(present, scores.tolist()))
+                else:
+                    for a, b in present:
+                        field_scores, _ = self._compute_detailed_similarity(
+                            doc_cache[a], doc_cache[b], preserve_missing=True
+                        )
+                        attribute_cache[(a, b)] = (
+                            field_scores,
+                            self._exact_shared_values(doc_cache[a], doc_cache[b]),
+                        )
+            self._update_statistics(
+                len(missing), len(missing), len(doc_cache), time.time() - start_time
+            )
+
+        scorable = [pair for pair in candidate_pairs if attribute_cache.get(pair) is not None]
+        if self.scoring_method == "weighted_heuristic":
+            return [(a, b, attribute_cache[(a, b)]) for a, b in scorable]
+
+        graph_rows = self._graph_feature_rows(scorable, neighbor_cache)
+        results: List[Tuple[str, str, float]] = []
+        for i, (a, b) in enumerate(scorable):
+            field_scores, shared = attribute_cache[(a, b)]
+            if graph_rows is not None:
+                field_scores = {**field_scores, **graph_rows[i]}
+            results.append((a, b, self.fs_scorer.score(field_scores, shared)))
+        return results
+
     def compute_similarities_detailed(
         self,
         candidate_pairs: List[Tuple[str, str]],
@@ -308,27 +478,23 @@ class BatchSimilarityService:
         detailed_matches = []
         processed = 0
         total = len(candidate_pairs)
+        present = [
+            (k1, k2) for k1, k2 in candidate_pairs if doc_cache.get(k1) and doc_cache.get(k2)
+        ]
+        graph_rows = self._graph_feature_rows(present, neighbor_cache)
         
-        for doc1_key, doc2_key in candidate_pairs:
+        for i, (doc1_key, doc2_key) in enumerate(present):
             processed += 1
             
             if self.progress_callback and processed % 10000 == 0:
                 self.progress_callback(processed, total)
             
-            doc1 = doc_cache.get(doc1_key)
-            doc2 = doc_cache.get(doc2_key)
-            
-            if not doc1 or not doc2:
-                continue
-            
             # Compute detailed scores
             field_scores, weighted_score = self._compute_detailed_similarity(
-                doc1, doc2, preserve_missing=preserve_missing
+                doc_cache[doc1_key], doc_cache[doc2_key], preserve_missing=preserve_missing
             )
-            if neighbor_cache is not None:
-                field_scores.update(
-                    self.graph_context.pair_features(doc1_key, doc2_key, neighbor_cache)
-                )
+            if graph_rows is not None:
+                field_scores.update(graph_rows[i])
             
             if weighted_score >= threshold:
                 detailed_matches.append({
@@ -361,10 +527,57 @@ class BatchSimilarityService:
         """
         return self._stats.copy()
     
+    def fetch_query(self) -> str:
+        """
+        AQL that fetches the weighted fields for ``@keys`` from ``@@collection``.
+        
+        ``DOCUMENT()`` resolves the keys through the primary index, and only
+        the weighted fields are returned (normalized server-side when
+        ``server_side_normalization`` is set). Shared with callers that run
+        the fetch through another client, so both paths return the same
+        document shape.
+        """
+        fields_str = ', '.join(
+            f'"{f}": {self._projection_expression(f)}' for f in self.field_weights
+        )
+        return f"""
+            FOR doc IN DOCUMENT(@@collection, @keys)
+                RETURN {{
+                    _key: doc._key,
+                    {fields_str}
+                }}
+            """
+    
+    def _projection_expression(self, field: str) -> str:
+        """AQL expression for one projected field, mirroring _normalize_value."""
+        expression = f'doc.{field} || ""'
+        if field not in self.similarity_computer.prenormalized_fields:
+            return expression
+        
+        config = self.normalization_config
+        if config.get("strip"):
+            expression = f"TRIM({expression})"
+        if config.get("case") == "upper":
+            expression = f"UPPER({expression})"
+        elif config.get("case") == "lower":
+            expression = f"LOWER({expression})"
+        if config.get("remove_extra_whitespace"):
+            expression = f'TRIM(REGEX_REPLACE({expression}, "\\\\s+", " "))'
+        if config.get("remove_punctuation"):
+            expression = f'REGEX_REPLACE({expression}, "{_AQL_PUNCTUATION_CLASS}", "")'
+        return expression
+    
     def batch_fetch_documents(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Fetch documents in batches for efficient retrieval.
         
+        Chunks of ``batch_size`` keys are fetched with up to
+        ``fetch_concurrency`` in flight. A failed chunk is retried with
+        exponential backoff. A chunk that still fails after ``fetch_retries``
+        re-raises its last error, unless ``allow_partial_fetch`` is set, in
+        which case its keys are logged and left out (counted in
+        ``fetch_failed_keys``).
+        
         Args:
             keys: List of document keys to fetch
         
@@ -372,47 +585,87 @@ class BatchSimilarityService:
             Dictionary mapping document keys to document data
         """
         doc_cache = {}
-        batch_count = 0
-        
-        # Fetch in batches
-        for i in range(0, len(keys), self.batch_size):
-            batch = keys[i:i + self.batch_size]
-            batch_count += 1
-            
-            # Build query to fetch only needed fields
-            fields = list(self.field_weights.keys())
-            fields_str = ', '.join([f'"{f}": doc.{f} || ""' for f in fields])
-            
-            query = f"""
-            FOR doc IN @@collection
-                FILTER doc._key IN @keys
-                RETURN {{
-                    _key: doc._key,
-                    {fields_str}
-                }}
-            """
-            
-            try:
-                cursor = self.db.aql.execute(query, bind_vars={
-                    '@collection': self.collection,
-                    'keys': batch,
-                })
-                for doc in cursor:
+        query = self.fetch_query()
+        chunks = [keys[i:i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+        self._stats['fetch_retries'] = 0
+        self._stats['fetch_failed_keys'] = 0
+        
+        # Workers only return their chunk's outcome; counters are summed here,
+        # on the calling thread.
+        def collect(results):
+            for batch, (docs, retries) in zip(chunks, results):
+                self._stats['fetch_retries'] += retries
+                if docs is None:
+                    self._stats['fetch_failed_keys'] += len(batch)
+                    continue
+                for doc in docs:
                     doc_cache[doc['_key']] = doc
-            except Exception as e:
-                # Fallback to individual fetches for this batch
-                for key in batch:
-                    try:
-                        doc = self.db.collection(self.collection).get(key)
-                        if doc:
-                            doc_cache[key] = doc
-                    except Exception as e:
-                        logger.warning("Failed to fetch document %s from %s: %s", key, self.collection, e)
         
-        self._stats['batch_count'] = batch_count
+        workers = min(self.fetch_concurrency, len(chunks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="er-fetch") as executor:
+                collect(executor.map(lambda batch: self._fetch_chunk(query, batch), chunks))
+        else:
+            collect(self._fetch_chunk(query, batch) for batch in chunks)
+        
+        self._stats['batch_count'] = len(chunks)
+        if self._stats['fetch_failed_keys']:
+            logger.error(
+                "Gave up fetching %d of %d documents from %s after %d retries",
+                self._stats['fetch_failed_keys'], len(keys), self.collection, self.fetch_retries,
+            )
         
         return doc_cache
     
+    def _fetch_chunk(
+        self, query: str, batch: List[str]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+        """Run the fetch query for one chunk, retrying with backoff.
+
+        Returns ``(documents, retries)``. After the last retry the error is
+        re-raised, or with ``allow_partial_fetch`` the documents are None.
+        """
+        delay = self.fetch_retry_backoff_seconds
+        for attempt in range(self.fetch_retries + 1):
+            try:
+                cursor = self.db.aql.execute(
+                    query,
+                    bind_vars={'@collection': self.collection, 'keys': batch},
+                    batch_size=max(len(batch), 1),
+                )
+                return list(cursor), attempt
+            except Exception as e:
+                if attempt == self.fetch_retries:
+                    logger.warning(
+                        "Failed to fetch %d documents from %s: %s", len(batch), self.collection, e
+                    )
+                    if not self.allow_partial_fetch:
+                        raise
+                    return None, attempt
+                logger.warning(
+                    "Fetch of %d documents from %s failed (attempt %d of %d), retrying in %.2fs: %s",
+                    len(batch), self.collection, attempt + 1, self.fetch_retries + 1, delay, e,
+                )
+                time.sleep(delay)
+                delay *= 2
+        return None, self.fetch_retries
+    
+    def _graph_feature_rows(
+        self,
+        pairs: List[Tuple[str, str]],
+        neighbor_cache: Optional[Dict[str, Any]],
+    ) -> Optional[List[Dict[str, float]]]:
+        """Graph-context features for ``pairs``, or None.
+
+        A :class:`NeighborCSR` cache goes through the vectorized batch path;
+        ``"sets"`` caches keep the per-pair set join.
+        """
+        if neighbor_cache is None or self.graph_context is None:
+            return None
+        if isinstance(neighbor_cache, NeighborCSR):
+            return self.graph_context.pair_features_batch(pairs, neighbor_cache)
+        return [self.graph_context.pair_features(a, b, neighbor_cache) for a, b in pairs]
+
     def _score_pair(
         self,
         doc1: Dict[str, Any],
@@ -420,13 +673,15 @@ class BatchSimilarityService:
         key1: Optional[str] = None,
         key2: Optional[str] = None,
         neighbor_cache: Optional[Dict[str, Any]] = None,
+        graph_features: Optional[Dict[str, float]] = None,
     ) -> float:
         """Score a pair under the configured method.
 
         ``weighted_heuristic`` returns the weighted 0-1 average; ``fellegi_sunter``
         returns the calibrated posterior from learned m/u over per-field scores.
         When a graph-context + neighbour cache are supplied, relationship features
-        are merged into the FS comparison vector (plan 3.1).
+        are merged into the FS comparison vector (plan 3.1); ``graph_features``
+        passes features already computed in a batch instead.
         """
         if self.scoring_method == "fellegi_sunter":
             # preserve_missing=True: unobserved fields must reach the scorer as
@@ -434,7 +689,9 @@ class BatchSimilarityService:
             field_scores, _ = self._compute_detailed_similarity(
                 doc1, doc2, preserve_missing=True
             )
-            if neighbor_cache is not None and self.graph_context is not None and key1 and key2:
+            if graph_features is not None:
+                field_scores.update(graph_features)
+            elif neighbor_cache is not None and self.graph_context is not None and key1 and key2:
                 field_scores.update(
                     self.graph_context.pair_features(key1, key2, neighbor_cache)
                 )
@@ -3,21 +3,62 @@ Cluster export and reporting helpers.
 
 Builds portable JSON/CSV artifacts from persisted cluster results and existing
 pipeline statistics without recomputing clustering.
+
+:meth:`ClusterExportService.export` holds every cluster in memory (it writes
+one JSON document containing them all). :meth:`ClusterExportService.export_stream`
+is the bounded-memory path for large results: clusters are read from a
+streaming cursor, quality rollups are aggregated incrementally, and rows are
+written in chunks to CSV / JSONL / Parquet files, optionally compressed and
+sharded.
 """
 
 from __future__ import annotations
 
+import bz2
 import csv
+import gzip
 import json
+import lzma
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 from arango.database import StandardDatabase
 
 from ..utils.pipeline_utils import get_pipeline_statistics
 from ..utils.validation import validate_collection_name
 
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+#: compression name -> (opener, file suffix) for the text formats. Parquet
+#: compresses column chunks internally instead (see export_stream).
+_TEXT_COMPRESSION = {
+    None: (open, ""),
+    "gzip": (gzip.open, ".gz"),
+    "bz2": (bz2.open, ".bz2"),
+    "xz": (lzma.open, ".xz"),
+}
+
+CSV_FIELDNAMES = [
+    "cluster_id",
+    "size",
+    "representative",
+    "edge_count",
+    "average_similarity",
+    "min_similarity",
+    "max_similarity",
+    "density",
+    "quality_score",
+    "member_keys",
+]
+
 
 class ClusterExportService:
     """Export persisted cluster results plus summary stats."""
@@ -55,14 +96,7 @@ class ClusterExportService:
         stats["quality"] = self._quality_summary(clusters)
 
         return {
-            "metadata": {
-                "source_collection": self.source_collection,
-                "edge_collection": self.edge_collection,
-                "cluster_collection": self.cluster_collection,
-                "golden_collection": self.golden_collection,
-                "resolved_edge_collection": self.resolved_edge_collection,
-                "generated_at": datetime.utcnow().isoformat(),
-            },
+            "metadata": self._metadata(),
             "stats": stats,
             "clusters": clusters,
         }
@@ -92,51 +126,194 @@ class ClusterExportService:
             "clusters_exported": len(report["clusters"]),
         }
 
+    def export_stream(
+        self,
+        output_dir: str,
+        filename_prefix: str = "cluster_export",
+        formats: Sequence[str] = ("csv",),
+        limit: Optional[int] = None,
+        batch_size: int = 10_000,
+        rows_per_shard: Optional[int] = None,
+        compression: Optional[str] = None,
+        sort_by_size: bool = False,
+    ) -> Dict[str, Any]:
+        """Write cluster rows to disk without holding the result set in memory.
+
+        Args:
+            output_dir: Directory for the artifacts (created if missing).
+            filename_prefix: Prefix for every artifact file name.
+            formats: Any of ``"csv"`` (flat summary rows, member keys joined
+                with ``|``), ``"jsonl"`` (one normalized cluster per line) and
+                ``"parquet"`` (requires pyarrow; one row group per batch).
+            limit: Optional maximum number of clusters to export.
+            batch_size: Cursor batch size and write chunk size.
+            rows_per_shard: Start a new file per format every this many rows
+                (``..._00000.csv``, ``..._00001.csv``, ...) so downstream loads
+                can run in parallel. None writes a single file per format.
+            compression: ``"gzip"``, ``"bz2"`` or ``"xz"`` for CSV/JSONL files.
+                Parquet uses ``"gzip"`` as its column codec and its default
+                (snappy) otherwise; bz2/xz are rejected when Parquet is
+                requested.
+            sort_by_size: Export largest clusters first, like
+                :meth:`build_report`. This makes the server sort the whole
+                collection before streaming. Default False, which streams in
+                primary-index order.
+
+        Returns:
+            ``{"files": {format: [paths]}, "summary": path, "clusters_exported": n}``.
+            The summary JSON holds the report metadata and stats (including
+            the incrementally aggregated quality rollup) without the clusters.
+        """
+        formats = list(dict.fromkeys(formats))
+        unknown = [f for f in formats if f not in EXPORT_FORMATS]
+        if unknown or not formats:
+            raise ValueError(f"formats must be a non-empty subset of {EXPORT_FORMATS}, got: {formats}")
+        if compression not in _TEXT_COMPRESSION:
+            raise ValueError(
+                f"compression must be one of {sorted(c for c in _TEXT_COMPRESSION if c)} or None, "
+                f"got: {compression!r}"
+            )
+        if "parquet" in formats:
+            if not PYARROW_AVAILABLE:
+                raise ImportError(
+                    "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+                )
+            if compression not in (None, "gzip"):
+                raise ValueError(f"Parquet export does not support compression={compression!r}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+        if rows_per_shard is not None and rows_per_shard < 1:
+            raise ValueError(f"rows_per_shard must be >= 1, got: {rows_per_shard}")
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        base = output_path / f"{filename_prefix}_{timestamp}"
+
+        writers = [
+            _ShardedWriter(base, fmt, compression, rows_per_shard) for fmt in formats
+        ]
+        quality = _QualityAggregate()
+        exported = 0
+        try:
+            chunk: List[Dict[str, Any]] = []
+            for cluster in self._iter_clusters(limit, batch_size, sort_by_size):
+                quality.add(cluster)
+                chunk.append(cluster)
+                if len(chunk) >= batch_size:
+                    for writer in writers:
+                        writer.write(chunk)
+                    exported += len(chunk)
+                    chunk = []
+            if chunk:
+                for writer in writers:
+                    writer.write(chunk)
+                exported += len(chunk)
+        finally:
+            for writer in writers:
+                writer.close()
+
+        stats = get_pipeline_statistics(
+            self.db,
+            vertex_collection=self.source_collection,
+            edge_collection=self.edge_collection,
+            cluster_collection=self.cluster_collection,
+        )
+        stats["artifacts"] = self._artifact_counts()
+        stats["quality"] = quality.summary()
+        summary_path = Path(f"{base}_summary.json")
+        summary_path.write_text(
+            json.dumps(
+                {
+                    "metadata": self._metadata(),
+                    "stats": stats,
+                    "clusters_exported": exported,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+        return {
+            "files": {writer.fmt: [str(p) for p in writer.paths] for writer in writers},
+            "summary": str(summary_path),
+            "clusters_exported": exported,
+        }
+
     def _load_clusters(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Load stored cluster documents and normalize them for export."""
+        return list(self._iter_clusters(limit=limit, sort_by_size=True))
+
+    def _iter_clusters(
+        self,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        sort_by_size: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield normalized clusters; streams the cursor when ``batch_size`` is set."""
         if not self.db.has_collection(self.cluster_collection):
-            return []
+            return
 
+        sort_clause = (
+            "SORT (c.size != null ? c.size : LENGTH(c.members)) DESC, c._key"
+            if sort_by_size
+            else ""
+        )
         limit_clause = "LIMIT @limit" if limit is not None else ""
         query = f"""
         FOR c IN @@cluster_collection
-            SORT (c.size != null ? c.size : LENGTH(c.members)) DESC, c._key
+            {sort_clause}
             {limit_clause}
             RETURN c
         """
         bind_vars: dict = {"@cluster_collection": self.cluster_collection}
         if limit is not None:
             bind_vars["limit"] = int(limit)
-        cursor = self.db.aql.execute(query, bind_vars=bind_vars)
+        if batch_size is not None:
+            cursor = self.db.aql.execute(
+                query, bind_vars=bind_vars, batch_size=batch_size, stream=True
+            )
+        else:
+            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
 
-        clusters: List[Dict[str, Any]] = []
         for raw in cursor:
-            members = list(raw.get("members") or [])
-            member_keys = list(raw.get("member_keys") or raw.get("memberKeys") or [])
-            if not member_keys and members:
-                member_keys = [str(member).split("/")[-1] for member in members]
+            yield self._normalize_cluster(raw)
 
-            size = raw.get("size")
-            if size is None:
-                size = len(member_keys or members)
+    @staticmethod
+    def _normalize_cluster(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize one stored cluster document for export."""
+        members = list(raw.get("members") or [])
+        member_keys = list(raw.get("member_keys") or raw.get("memberKeys") or [])
+        if not member_keys and members:
+            member_keys = [str(member).split("/")[-1] for member in members]
 
-            clusters.append(
-                {
-                    "cluster_id": raw.get("cluster_id") or raw.get("_key"),
-                    "representative": raw.get("representative"),
-                    "size": size,
-                    "members": members,
-                    "member_keys": member_keys,
-                    "edge_count": raw.get("edge_count"),
-                    "average_similarity": raw.get("average_similarity"),
-                    "min_similarity": raw.get("min_similarity"),
-                    "max_similarity": raw.get("max_similarity"),
-                    "density": raw.get("density"),
-                    "quality_score": raw.get("quality_score"),
-                }
-            )
+        size = raw.get("size")
+        if size is None:
+            size = len(member_keys or members)
+
+        return {
+            "cluster_id": raw.get("cluster_id") or raw.get("_key"),
+            "representative": raw.get("representative"),
+            "size": size,
+            "members": members,
+            "member_keys": member_keys,
+            "edge_count": raw.get("edge_count"),
+            "average_similarity": raw.get("average_similarity"),
+            "min_similarity": raw.get("min_similarity"),
+            "max_similarity": raw.get("max_similarity"),
+            "density": raw.get("density"),
+            "quality_score": raw.get("quality_score"),
+        }
 
-        return clusters
+    def _metadata(self) -> Dict[str, Any]:
+        return {
+            "source_collection": self.source_collection,
+            "edge_collection": self.edge_collection,
+            "cluster_collection": self.cluster_collection,
+            "golden_collection": self.golden_collection,
+            "resolved_edge_collection": self.resolved_edge_collection,
+            "generated_at": datetime.utcnow().isoformat(),
+        }
 
     def _artifact_counts(self) -> Dict[str, int]:
         """Return counts for downstream persistence artifacts when present."""
@@ -153,48 +330,150 @@ class ClusterExportService:
     @staticmethod
     def _quality_summary(clusters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggregate quality-oriented rollups for exported clusters."""
-        quality_scores = [
-            float(cluster["quality_score"])
-            for cluster in clusters
-            if isinstance(cluster.get("quality_score"), (int, float))
-        ]
-        avg_similarities = [
-            float(cluster["average_similarity"])
-            for cluster in clusters
-            if isinstance(cluster.get("average_similarity"), (int, float))
-        ]
-
-        return {
-            "clusters_with_quality": len(quality_scores),
-            "avg_quality_score": round(sum(quality_scores) / len(quality_scores), 4)
-            if quality_scores
-            else None,
-            "min_quality_score": round(min(quality_scores), 4) if quality_scores else None,
-            "max_quality_score": round(max(quality_scores), 4) if quality_scores else None,
-            "avg_cluster_similarity": round(sum(avg_similarities) / len(avg_similarities), 4)
-            if avg_similarities
-            else None,
-        }
+        aggregate = _QualityAggregate()
+        for cluster in clusters:
+            aggregate.add(cluster)
+        return aggregate.summary()
 
     @staticmethod
     def _write_csv(path: Path, clusters: List[Dict[str, Any]]) -> None:
         """Write a flat cluster summary CSV."""
-        fieldnames = [
-            "cluster_id",
-            "size",
-            "representative",
-            "edge_count",
-            "average_similarity",
-            "min_similarity",
-            "max_similarity",
-            "density",
-            "quality_score",
-            "member_keys",
-        ]
         with path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
+            writer = csv.DictWriter(handle, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
-            for cluster in clusters:
-                row = dict(cluster)
-                row["member_keys"] = "|".join(cluster.get("member_keys") or [])
-                writer.writerow({key: row.get(key) for key in fieldnames})
+            writer.writerows(_csv_row(cluster) for cluster in clusters)
+
+
+def _csv_row(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    row = {key: cluster.get(key) for key in CSV_FIELDNAMES}
+    row["member_keys"] = "|".join(cluster.get("member_keys") or [])
+    return row
+
+
+class _QualityAggregate:
+    """Running count / sum / min / max behind the ``quality`` rollup."""
+
+    def __init__(self) -> None:
+        self.quality_count = 0
+        self.quality_sum = 0.0
+        self.quality_min: Optional[float] = None
+        self.quality_max: Optional[float] = None
+        self.similarity_count = 0
+        self.similarity_sum = 0.0
+
+    def add(self, cluster: Dict[str, Any]) -> None:
+        quality = cluster.get("quality_score")
+        if isinstance(quality, (int, float)):
+            quality = float(quality)
+            self.quality_count += 1
+            self.quality_sum += quality
+            self.quality_min = quality if self.quality_min is None else min(self.quality_min, quality)
+            self.quality_max = quality if self.quality_max is None else max(self.quality_max, quality)
+        similarity = cluster.get("average_similarity")
+        if isinstance(similarity, (int, float)):
+            self.similarity_count += 1
+            self.similarity_sum += float(similarity)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "clusters_with_quality": self.quality_count,
+            "avg_quality_score": round(self.quality_sum / self.quality_count, 4)
+            if self.quality_count
+            else None,
+            "min_quality_score": round(self.quality_min, 4) if self.quality_count else None,
+            "max_quality_score": round(self.quality_max, 4) if self.quality_count else None,
+            "avg_cluster_similarity": round(self.similarity_sum / self.similarity_count, 4)
+            if self.similarity_count
+            else None,
+        }
+
+
+class _ShardedWriter:
+    """Chunked writer for one export format, rotating files every N rows."""
+
+    def __init__(
+        self,
+        base: Path,
+        fmt: str,
+        compression: Optional[str],
+        rows_per_shard: Optional[int],
+    ) -> None:
+        self.base = base
+        self.fmt = fmt
+        self.compression = compression
+        self.rows_per_shard = rows_per_shard
+        self.paths: List[Path] = []
+        self._handle: Optional[IO[str]] = None
+        self._csv: Optional[csv.DictWriter] = None
+        self._parquet: Optional[Any] = None
+        self._rows_in_shard = 0
+
+    def write(self, clusters: List[Dict[str, Any]]) -> None:
+        start = 0
+        while start < len(clusters):
+            if self._rows_in_shard == 0 or (
+                self.rows_per_shard and self._rows_in_shard >= self.rows_per_shard
+            ):
+                self._open_shard()
+            room = (
+                self.rows_per_shard - self._rows_in_shard
+                if self.rows_per_shard
+                else len(clusters) - start
+            )
+            part = clusters[start:start + room]
+            self._write_rows(part)
+            self._rows_in_shard += len(part)
+            start += len(part)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open_shard(self) -> None:
+        self.close()
+        shard = f"_{len(self.paths):05d}" if self.rows_per_shard else ""
+        if self.fmt == "parquet":
+            path = Path(f"{self.base}{shard}.parquet")
+        else:
+            opener, suffix = _TEXT_COMPRESSION[self.compression]
+            path = Path(f"{self.base}{shard}.{self.fmt}{suffix}")
+            self._handle = opener(path, "wt", newline="", encoding="utf-8")
+            if self.fmt == "csv":
+                self._csv = csv.DictWriter(self._handle, fieldnames=CSV_FIELDNAMES)
+                self._csv.writeheader()
+        self.paths.append(path)
+        self._rows_in_shard = 0
+
+    def _write_rows(self, clusters: Iterable[Dict[str, Any]]) -> None:
+        if self.fmt == "csv":
+            self._csv.writerows(_csv_row(cluster) for cluster in clusters)
+        elif self.fmt == "jsonl":
+            self._handle.writelines(json.dumps(cluster) + "\n" for cluster in clusters)
+        else:
+            table = pa.Table.from_pylist(list(clusters), schema=_parquet_schema())
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(
+                    str(self.paths[-1]), table.schema,
+                    compression=self.compression or "snappy",
+                )
+            self._parquet.write_table(table)
+
+
+def _parquet_schema() -> "pa.Schema":
+    return pa.schema([
+        ("cluster_id", pa.string()),
+        ("representative", pa.string()),
+        ("size", pa.int64()),
+        ("members", pa.list_(pa.string())),
+        ("member_keys", pa.list_(pa.string())),
+        ("edge_count", pa.int64()),
+        ("average_similarity", pa.float64()),
+        ("min_similarity", pa.float64()),
+        ("max_similarity", pa.float64()),
+        ("density", pa.float64()),
+        ("quality_score", pa.float64()),
+    ])
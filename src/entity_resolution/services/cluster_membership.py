@@ -0,0 +1,351 @@
+"""
+Persistent member -> cluster index.
+
+Cluster documents store their members as arrays (``members`` /
+``member_keys``), so "which cluster holds this record?" used to be a scan of
+every cluster document. ``ClusterMembershipIndex`` keeps a compact side
+collection, ``<cluster_collection>_membership``, with one document per
+clustered record::
+
+    {"_key": <member_key>, "cluster_key": <cluster _key>, "golden_key": <golden _key>}
+
+Keyed by the member's own ``_key``, every lookup is a primary-index read.
+Writers that change cluster membership keep it in step:
+
+- ``WCCClusteringService(maintain_membership=True)`` creates and rebuilds it
+  when it stores clusters;
+- ``FeedbackApplicationService.recluster_component`` re-points the members of
+  the clusters it rewrites;
+- ``GoldenRecordPersistenceService`` stamps ``golden_key`` so golden records
+  can be found by member without scanning their ``memberKeys`` arrays, and
+  marks each golden record it indexed ``membershipIndexed: true``.
+
+Those writers stamp the cluster documents they write (``membership_run``)
+and the rows they assign (``run``) with the same run id. Readers use the index
+only while it is :attr:`~ClusterMembershipIndex.available` — the collection
+exists and a cluster document still carries the index's run — and otherwise
+fall back to the array scans: clusters written before the index existed, or
+rewritten by a writer that left it alone (reused ``cluster_000000`` keys would
+otherwise resolve to the wrong members). Golden lookups additionally need
+:meth:`~ClusterMembershipIndex.golden_covered`: golden records written before
+the index existed, or by a writer that skipped it, have no ``golden_key`` rows
+and would otherwise never be found. :meth:`rebuild` backfills it from an
+existing cluster (and golden) collection.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..utils.validation import validate_collection_name
+
+logger = logging.getLogger(__name__)
+
+_WRITE_BATCH = 10_000
+
+#: Golden-record attribute set to ``true`` once the record's members carry its
+#: ``golden_key``; writers that leave the index alone store null instead.
+GOLDEN_INDEXED_FIELD = "membershipIndexed"
+
+
+def membership_collection_name(cluster_collection: str) -> str:
+    """Name of the membership index collection for a cluster collection."""
+    return f"{cluster_collection}_membership"
+
+
+class ClusterMembershipIndex:
+    """member_key -> cluster_key (and golden_key) mapping collection.
+
+    Parameters
+    ----------
+    db:
+        ArangoDB database connection.
+    cluster_collection:
+        Cluster collection the index describes.
+    create:
+        Create the membership collection if missing. Default False: readers
+        check :attr:`available` and fall back to scans, and writers opt in
+        (see :meth:`ensure_collection`).
+    """
+
+    def __init__(self, db: Any, cluster_collection: str, create: bool = False) -> None:
+        self.db = db
+        self.cluster_collection = validate_collection_name(cluster_collection)
+        self.collection = validate_collection_name(
+            membership_collection_name(self.cluster_collection)
+        )
+        if create:
+            self.ensure_collection()
+
+    def ensure_collection(self) -> None:
+        """Create the membership collection if it does not exist."""
+        if not self.db.has_collection(self.collection):
+            self.db.create_collection(self.collection)
+
+    @staticmethod
+    def new_run_id() -> str:
+        """A fresh run id for a writer that rebuilds the index."""
+        return uuid.uuid4().hex
+
+    @property
+    def available(self) -> bool:
+        """Whether the index exists and is in step with the cluster collection.
+
+        A sampled cluster document must carry the run id the index rows hold;
+        an empty cluster collection trivially matches.
+        """
+        if not self.db.has_collection(self.collection):
+            return False
+        cursor = self.db.aql.execute(
+            """
+            LET cluster = FIRST(FOR c IN @@clusters LIMIT 1 RETURN { run: c.membership_run })
+            RETURN cluster == null
+                OR (cluster.run != null AND cluster.run == FIRST(
+                    FOR m IN @@members
+                        FILTER m.cluster_key != null
+                        LIMIT 1
+                        RETURN m.run
+                ))
+            """,
+            bind_vars={"@clusters": self.cluster_collection, "@members": self.collection},
+        )
+        return bool(next(iter(cursor), False))
+
+    def golden_covered(self, golden_collection: str) -> bool:
+        """Whether every golden record can be found through the index.
+
+        True when no record in ``golden_collection`` lacks the
+        :data:`GOLDEN_INDEXED_FIELD` stamp (an empty collection trivially is).
+        The stamp is a plain attribute filter, served by the persistent index
+        :meth:`ensure_golden_index` adds.
+        """
+        cursor = self.db.aql.execute(
+            """
+            RETURN FIRST(
+                FOR g IN @@golden
+                    FILTER g.membershipIndexed == null
+                    LIMIT 1
+                    RETURN 1
+            ) == null
+            """,
+            bind_vars={"@golden": validate_collection_name(golden_collection)},
+        )
+        return bool(next(iter(cursor), False))
+
+    def ensure_golden_index(self, golden_collection: str) -> None:
+        """Index the coverage stamp so :meth:`golden_covered` skips the scan."""
+        try:
+            self.db.collection(validate_collection_name(golden_collection)).add_persistent_index(
+                fields=[GOLDEN_INDEXED_FIELD], name="idx_golden_membership_indexed",
+                sparse=False, unique=False,
+            )
+        except Exception as exc:  # index is an optimisation only
+            logger.debug("Could not ensure golden coverage index: %s", exc)
+
+    def run_id(self) -> Optional[str]:
+        """Run id the index rows carry, or None when no member is assigned."""
+        cursor = self.db.aql.execute(
+            """
+            FOR m IN @@members
+                FILTER m.cluster_key != null
+                LIMIT 1
+                RETURN m.run
+            """,
+            bind_vars={"@members": self.collection},
+        )
+        return next(iter(cursor), None)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _merge(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert-or-merge membership rows (other attributes are preserved)."""
+        for i in range(0, len(rows), _WRITE_BATCH):
+            self.db.aql.execute(
+                """
+                FOR r IN @rows
+                    INSERT r INTO @@members OPTIONS { overwriteMode: "update" }
+                """,
+                bind_vars={"rows": rows[i:i + _WRITE_BATCH], "@members": self.collection},
+            )
+
+    def assign(self, cluster_key: str, member_keys: Iterable[str], run_id: str) -> None:
+        """Point ``member_keys`` at ``cluster_key``."""
+        self.assign_many({cluster_key: member_keys}, run_id)
+
+    def assign_many(self, clusters: Dict[str, Iterable[str]], run_id: str) -> None:
+        """Point the members of several clusters at their cluster keys.
+
+        ``run_id`` must match the ``membership_run`` stamped on the cluster
+        documents written alongside.
+        """
+        rows = [
+            {"_key": str(k), "cluster_key": ck, "run": run_id}
+            for ck, members in clusters.items()
+            for k in members
+        ]
+        if rows:
+            self._merge(rows)
+
+    def unassign(self, member_keys: Iterable[str]) -> None:
+        """Mark ``member_keys`` as belonging to no cluster (golden_key is kept)."""
+        keys = sorted({str(k) for k in member_keys})
+        for i in range(0, len(keys), _WRITE_BATCH):
+            self.db.aql.execute(
+                """
+                FOR m IN @@members
+                    FILTER m._key IN @keys AND m.cluster_key != null
+                    UPDATE m WITH { cluster_key: null } IN @@members
+                """,
+                bind_vars={"keys": keys[i:i + _WRITE_BATCH], "@members": self.collection},
+            )
+
+    def set_golden(self, golden_by_member: Dict[str, str]) -> None:
+        """Record the golden record each member resolved to."""
+        rows = [{"_key": str(k), "golden_key": gk} for k, gk in golden_by_member.items()]
+        if rows:
+            self._merge(rows)
+
+    def reset_clusters(self) -> None:
+        """Forget every cluster assignment before a full re-cluster.
+
+        Rows carrying a ``golden_key`` keep it (golden records outlive a
+        re-cluster and are found through it by the staleness check); rows
+        without one are removed.
+        """
+        self.db.aql.execute(
+            "FOR m IN @@members FILTER m.golden_key == null REMOVE m IN @@members",
+            bind_vars={"@members": self.collection},
+        )
+        self.db.aql.execute(
+            """
+            FOR m IN @@members
+                FILTER m.cluster_key != null
+                UPDATE m WITH { cluster_key: null } IN @@members
+            """,
+            bind_vars={"@members": self.collection},
+        )
+
+    def rebuild(self, golden_collection: Optional[str] = None) -> int:
+        """Backfill the index from the cluster (and golden) collection.
+
+        Server-side pass over existing cluster documents, which are stamped
+        with a new run id; returns the number of member rows written. Use for
+        clusters stored before the index existed, or to bring a stale index
+        back in step. Given ``golden_collection``, every golden record is
+        indexed and stamped as covered. Creates the collection if needed.
+        """
+        self.ensure_collection()
+        self.reset_clusters()
+        run_id = self.new_run_id()
+        self.db.aql.execute(
+            "FOR c IN @@clusters UPDATE c WITH { membership_run: @run } IN @@clusters",
+            bind_vars={"@clusters": self.cluster_collection, "run": run_id},
+        )
+        cursor = self.db.aql.execute(
+            """
+            LET written = (
+                FOR c IN @@clusters
+                    LET keys = LENGTH(c.member_keys) > 0
+                        ? c.member_keys
+                        : (FOR m IN c.members || [] RETURN LAST(SPLIT(m, "/")))
+                    FOR k IN keys
+                        INSERT { _key: k, cluster_key: c._key, run: @run } INTO @@members
+                            OPTIONS { overwriteMode: "update" }
+                        RETURN 1
+            )
+            RETURN LENGTH(written)
+            """,
+            bind_vars={
+                "@clusters": self.cluster_collection,
+                "@members": self.collection,
+                "run": run_id,
+            },
+        )
+        written = next(iter(cursor), 0)
+        if golden_collection and self.db.has_collection(golden_collection):
+            self.db.aql.execute(
+                """
+                FOR g IN @@golden
+                    FOR k IN g.memberKeys || []
+                        INSERT { _key: k, golden_key: g._key } INTO @@members
+                            OPTIONS { overwriteMode: "update" }
+                """,
+                bind_vars={
+                    "@golden": validate_collection_name(golden_collection),
+                    "@members": self.collection,
+                },
+            )
+            self.db.aql.execute(
+                """
+                FOR g IN @@golden
+                    UPDATE g WITH { membershipIndexed: true } IN @@golden
+                """,
+                bind_vars={"@golden": validate_collection_name(golden_collection)},
+            )
+            self.ensure_golden_index(golden_collection)
+        return written
+
+    # ------------------------------------------------------------------
+    # Reads (primary-index lookups)
+    # ------------------------------------------------------------------
+
+    def cluster_key_of(self, member_key: str) -> Optional[str]:
+        """Cluster key holding ``member_key``, or None."""
+        doc = self.db.collection(self.collection).get(str(member_key))
+        return (doc or {}).get("cluster_key")
+
+    def cluster_keys_of(self, member_keys: Sequence[str]) -> Dict[str, str]:
+        """member_key -> cluster_key for the clustered subset of ``member_keys``."""
+        cursor = self.db.aql.execute(
+            """
+            FOR m IN @@members
+                FILTER m._key IN @keys AND m.cluster_key != null
+                RETURN [m._key, m.cluster_key]
+            """,
+            bind_vars={"keys": sorted({str(k) for k in member_keys}), "@members": self.collection},
+        )
+        return {k: ck for k, ck in cursor}
+
+    def clusters_containing(self, member_keys: Sequence[str]) -> List[Dict[str, Any]]:
+        """Cluster documents holding any of ``member_keys`` (each returned once)."""
+        cursor = self.db.aql.execute(
+            """
+            FOR m IN @@members
+                FILTER m._key IN @keys AND m.cluster_key != null
+                COLLECT ck = m.cluster_key
+                FOR c IN @@clusters
+                    FILTER c._key == ck
+                    RETURN c
+            """,
+            bind_vars={
+                "keys": sorted({str(k) for k in member_keys}),
+                "@members": self.collection,
+                "@clusters": self.cluster_collection,
+            },
+        )
+        return list(cursor)
+
+    def golden_records_containing(
+        self, golden_collection: str, member_keys: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """Golden records any of ``member_keys`` resolved to (each returned once)."""
+        cursor = self.db.aql.execute(
+            """
+            FOR m IN @@members
+                FILTER m._key IN @keys AND m.golden_key != null
+                COLLECT gk = m.golden_key
+                FOR g IN @@golden
+                    FILTER g._key == gk
+                    RETURN g
+            """,
+            bind_vars={
+                "keys": sorted({str(k) for k in member_keys}),
+                "@members": self.collection,
+                "@golden": validate_collection_name(golden_collection),
+            },
+        )
+        return list(cursor)
@@ -12,21 +12,69 @@ Key features:
 - Configurable blocking strategies (state, city, ZIP, custom fields)
 - Hybrid BM25 + Levenshtein scoring
 - Detailed confidence metrics with per-field scores
-- Batch processing with offset-based pagination
+- Batch processing with keyset (or legacy offset) pagination and parallel batches
 - Resume capability for long-running jobs
 - Inferred edge tracking
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Deque, Set, Tuple
 from arango.database import StandardDatabase
 from arango.collection import EdgeCollection
+import math
+import re
 import time
 from datetime import datetime
 import logging
 
+from ..learning.fellegi_sunter_scorer import FellegiSunterScorer
+from ..similarity.weighted_field_similarity import WeightedFieldSimilarity
 from ..utils.validation import validate_collection_name, validate_view_name, validate_field_name
 
 
+def _score_pairs(
+    similarity: WeightedFieldSimilarity,
+    fs_scorer: Optional[FellegiSunterScorer],
+    sources: List[Dict[str, Any]],
+    targets: List[Dict[str, Any]],
+) -> List[Tuple[float, Dict[str, Optional[float]]]]:
+    """Score aligned source/target docs; returns ``(confidence, field_scores)``.
+    
+    Module-level so it can run in a worker process.
+    """
+    scores, columns = similarity.compute_batch_detailed(sources, targets)
+    results = []
+    for i, score in enumerate(scores.tolist()):
+        field_scores = {
+            field: None if math.isnan(column[i]) else round(float(column[i]), 4)
+            for field, column in columns.items()
+        }
+        if fs_scorer is not None:
+            score = round(fs_scorer.score(field_scores), 4)
+        results.append((score, field_scores))
+    return results
+
+
+def _score_pairs_sharded(
+    similarity: WeightedFieldSimilarity,
+    fs_scorer: Optional[FellegiSunterScorer],
+    sources: List[Dict[str, Any]],
+    targets: List[Dict[str, Any]],
+    pool: Optional[Executor],
+    workers: int,
+) -> List[Tuple[float, Dict[str, Optional[float]]]]:
+    """:func:`_score_pairs`, split into contiguous shards across ``pool``."""
+    if pool is None or len(sources) < 2:
+        return _score_pairs(similarity, fs_scorer, sources, targets)
+    shard = max(1, -(-len(sources) // workers))
+    futures = [
+        pool.submit(_score_pairs, similarity, fs_scorer, sources[i:i + shard], targets[i:i + shard])
+        for i in range(0, len(sources), shard)
+    ]
+    return [result for future in futures for result in future.result()]
+
+
 class CrossCollectionMatchingService:
     """
     Match entities between two different collections.
@@ -139,6 +187,7 @@ class CrossCollectionMatchingService:
             'candidates_evaluated': 0,
             'batches_processed': 0,
             'source_records_processed': 0,
+            'last_key': None,
             'execution_time_seconds': 0.0,
             'timestamp': None
         }
@@ -216,6 +265,15 @@ class CrossCollectionMatchingService:
         progress_callback: Optional[Callable[[int, int], None]] = None,
         max_runtime_seconds: float = 300.0,
         deterministic_tiebreak: bool = True,
+        pagination: str = "keyset",
+        after_key: Optional[str] = None,
+        concurrency: int = 1,
+        scoring: str = "server",
+        similarity: Optional[WeightedFieldSimilarity] = None,
+        fs_scorer: Optional[FellegiSunterScorer] = None,
+        candidates_per_source: int = 10,
+        scoring_workers: int = 1,
+        max_block_size: int = 10_000,
     ) -> Dict[str, Any]:
         """
         Match entities between source and target collections.
@@ -225,6 +283,7 @@ class CrossCollectionMatchingService:
             batch_size: Source records to process per batch. Default 100.
             limit: Maximum source records to process (for testing). None = all.
             offset: Starting offset for resuming interrupted jobs. Default 0.
+                Only valid with ``pagination="offset"``.
             use_bm25: Use BM25 for initial candidate ranking if search_view available.
                 Default True. Falls back to Levenshtein if no view.
             bm25_weight: Weight for BM25 score in hybrid scoring (0.0-1.0).
@@ -235,6 +294,44 @@ class CrossCollectionMatchingService:
             max_runtime_seconds: Max runtime allowed per batch AQL query.
             deterministic_tiebreak: Add deterministic secondary sort key for stable
                 winner selection when scores tie.
+            pagination: How batches walk the source collection:
+                - "keyset" (default): page source ``_key`` values in primary-index
+                  order (``FILTER s._key > @after_key``), drop keys already
+                  matched using a set of edge ``_to`` ids read once up front, and
+                  match each page by key. Per-batch cost is constant and edges
+                  created during the run cannot shift the window.
+                - "offset": the legacy ``LIMIT @offset, @batch_size`` scan with a
+                  per-row edge subquery.
+            after_key: Keyset resume point: only source keys sorting after it are
+                processed. Pass the ``last_key`` of an interrupted run.
+            concurrency: Keyset batch queries kept in flight at once (default 1).
+                Pages are read in order and edges are written in page order, so
+                ``last_key`` is always a safe resume point.
+            scoring: Where candidates are scored:
+                - "server" (default): BM25 / Levenshtein scoring in AQL.
+                - "local": the database only returns candidate keys: the top
+                  ``candidates_per_source`` by BM25 with a search view, or
+                  every target in the source's block without one (as the
+                  AQL Levenshtein scorer compares); source and candidate
+                  fields are then fetched with projected queries and scored
+                  in this process with ``similarity``.
+                  Requires ``pagination="keyset"``.
+            similarity: Scorer for ``scoring="local"``. Scores are compared to
+                ``threshold`` and must use the logical field names. Default: a
+                Levenshtein ``WeightedFieldSimilarity`` over ``field_weights``
+                with the same upper-case/trim normalization as the AQL scorer.
+            fs_scorer: Optional ``FellegiSunterScorer`` for ``scoring="local"``;
+                when given, the confidence compared to ``threshold`` is its
+                match posterior over the per-field similarities.
+            candidates_per_source: Candidate keys returned per source record
+                in local scoring with BM25. Default 10.
+            max_block_size: Cap on the targets fetched per source record in
+                local scoring without BM25. A block over the cap is cut to
+                its first ``max_block_size`` targets by key, with a warning.
+                Default 10,000.
+            scoring_workers: Worker processes scoring candidate pairs in local
+                scoring (default 1 = in-process). ``similarity`` and
+                ``fs_scorer`` must be picklable when above 1.
         
         Returns:
             Results dictionary:
@@ -243,30 +340,109 @@ class CrossCollectionMatchingService:
                 "candidates_evaluated": 5678,
                 "batches_processed": 57,
                 "source_records_processed": 5700,
+                "last_key": "src_05700",   # keyset only; None for offset
                 "execution_time_seconds": 123.45,
                 "timestamp": "2025-12-02T10:30:00"
             }
         """
         if not self.source_fields or not self.target_fields:
             raise ValueError("Must call configure_matching() before match_entities()")
+        if pagination not in ("keyset", "offset"):
+            raise ValueError(f"pagination must be 'keyset' or 'offset', got: {pagination!r}")
+        if pagination == "keyset" and offset:
+            raise ValueError("offset requires pagination='offset'; resume keyset runs with after_key")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got: {concurrency}")
+        if scoring not in ("server", "local"):
+            raise ValueError(f"scoring must be 'server' or 'local', got: {scoring!r}")
+        if scoring == "local" and pagination != "keyset":
+            raise ValueError("scoring='local' requires pagination='keyset'")
+        if candidates_per_source < 1:
+            raise ValueError(f"candidates_per_source must be >= 1, got: {candidates_per_source}")
+        if max_block_size < 1:
+            raise ValueError(f"max_block_size must be >= 1, got: {max_block_size}")
+        if scoring_workers < 1:
+            raise ValueError(f"scoring_workers must be >= 1, got: {scoring_workers}")
         
         start_time = time.time()
-        edges_created = 0
-        candidates_evaluated = 0
-        batches_processed = 0
-        source_records_processed = 0
         
         # Count total source records (for progress tracking)
         total_query = self._build_count_query()
         cursor = self.db.aql.execute(
-            total_query, bind_vars=self._collection_bind_vars()
+            total_query, bind_vars=self._bind_vars_for(total_query, self._collection_bind_vars())
         )
         result = list(cursor)
         total_records = result[0] if result else 0
         
         self.logger.info(f"Starting cross-collection matching: {total_records:,} source records to process")
         
-        # Process in batches
+        query_options = dict(
+            threshold=threshold,
+            use_bm25=use_bm25 and self.search_view is not None,
+            bm25_weight=bm25_weight,
+            deterministic_tiebreak=deterministic_tiebreak,
+        )
+        if scoring == "local":
+            pool = ProcessPoolExecutor(max_workers=scoring_workers) if scoring_workers > 1 else None
+            try:
+                run_batch = self._local_batch_matcher(
+                    query_options, max_runtime_seconds, candidates_per_source,
+                    similarity, fs_scorer, pool, scoring_workers, max_block_size,
+                )
+                counts = self._match_keyset(
+                    run_batch, batch_size, limit, after_key, concurrency,
+                    mark_as_inferred, progress_callback, total_records,
+                )
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+        elif pagination == "keyset":
+            counts = self._match_keyset(
+                self._server_batch_matcher(query_options, max_runtime_seconds),
+                batch_size, limit, after_key, concurrency,
+                mark_as_inferred, progress_callback, total_records,
+            )
+        else:
+            counts = self._match_offset(
+                query_options, batch_size, limit, offset,
+                max_runtime_seconds, mark_as_inferred, progress_callback, total_records,
+            )
+        
+        # Final progress callback
+        if progress_callback:
+            progress_callback(counts['source_records_processed'], total_records)
+        
+        # Update statistics
+        execution_time = time.time() - start_time
+        self._stats.update(counts)
+        self._stats.update({
+            'execution_time_seconds': round(execution_time, 2),
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        self.logger.info(
+            f"Matching complete: {counts['edges_created']:,} edges created from "
+            f"{counts['source_records_processed']:,} source records in {execution_time:.2f}s"
+        )
+        
+        return self._stats.copy()
+    
+    def _match_offset(
+        self,
+        query_options: Dict[str, Any],
+        batch_size: int,
+        limit: Optional[int],
+        offset: int,
+        max_runtime_seconds: float,
+        mark_as_inferred: bool,
+        progress_callback: Optional[Callable[[int, int], None]],
+        total_records: int,
+    ) -> Dict[str, Any]:
+        """Legacy ``LIMIT @offset, @batch_size`` batch loop."""
+        edges_created = 0
+        candidates_evaluated = 0
+        batches_processed = 0
+        source_records_processed = 0
         current_offset = offset
         
         while True:
@@ -279,14 +455,11 @@ class CrossCollectionMatchingService:
             batch_query = self._build_matching_query(
                 batch_size=batch_size,
                 offset=current_offset,
-                threshold=threshold,
-                use_bm25=use_bm25 and self.search_view is not None,
-                    bm25_weight=bm25_weight,
-                    deterministic_tiebreak=deterministic_tiebreak,
+                **query_options,
             )
             
             try:
-                bind_vars = self._build_bind_vars(threshold, batch_size, current_offset)
+                bind_vars = self._build_bind_vars(query_options['threshold'], batch_size, current_offset)
                 cursor = self.db.aql.execute(
                     batch_query,
                     bind_vars=bind_vars,
@@ -325,27 +498,300 @@ class CrossCollectionMatchingService:
                 self.logger.error(f"Error processing batch at offset {current_offset}: {e}", exc_info=True)
                 break
         
-        # Final progress callback
-        if progress_callback:
-            progress_callback(source_records_processed, total_records)
-        
-        # Update statistics
-        execution_time = time.time() - start_time
-        self._stats.update({
+        return {
             'edges_created': edges_created,
             'candidates_evaluated': candidates_evaluated,
             'batches_processed': batches_processed,
             'source_records_processed': source_records_processed,
-            'execution_time_seconds': round(execution_time, 2),
-            'timestamp': datetime.now().isoformat()
-        })
+            'last_key': None,
+        }
+    
+    def _server_batch_matcher(
+        self, query_options: Dict[str, Any], max_runtime_seconds: float
+    ) -> Callable[[List[str]], List[Dict[str, Any]]]:
+        """Batch matcher that scores a page of source keys entirely in AQL."""
+        match_query = self._build_matching_query(batch_size=0, offset=0, keyset=True, **query_options)
+        match_bind_base = self._bind_vars_for(
+            match_query,
+            {**self._collection_bind_vars(), 'threshold': query_options['threshold']},
+        )
+        max_runtime = max(1.0, float(max_runtime_seconds))
         
-        self.logger.info(
-            f"Matching complete: {edges_created:,} edges created from {source_records_processed:,} "
-            f"source records in {execution_time:.2f}s"
+        def run_batch(keys: List[str]) -> List[Dict[str, Any]]:
+            return list(self.db.aql.execute(
+                match_query,
+                bind_vars={**match_bind_base, 'keys': keys},
+                max_runtime=max_runtime,
+            ))
+        
+        return run_batch
+    
+    def _match_keyset(
+        self,
+        run_batch: Callable[[List[str]], List[Dict[str, Any]]],
+        batch_size: int,
+        limit: Optional[int],
+        after_key: Optional[str],
+        concurrency: int,
+        mark_as_inferred: bool,
+        progress_callback: Optional[Callable[[int, int], None]],
+        total_records: int,
+    ) -> Dict[str, Any]:
+        """Keyset batch loop with up to ``concurrency`` batches in flight.
+        
+        Key pages are read serially (cheap primary-index range scans);
+        ``run_batch`` matches each page on a thread pool and results are
+        consumed in page order, so edges are written and ``last_key`` advances
+        in key order.
+        """
+        matched = self._matched_source_keys()
+        self.logger.info(f"Skipping {len(matched):,} already-matched source records")
+        
+        counts: Dict[str, Any] = {
+            'edges_created': 0,
+            'candidates_evaluated': 0,
+            'batches_processed': 0,
+            'source_records_processed': 0,
+            'last_key': after_key,
+        }
+        page_key = after_key
+        dispatched = 0
+        exhausted = False
+        # (future or None, resume key after this page, keys in this batch)
+        pending: Deque[Tuple[Optional[Future], str, int]] = deque()
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    if limit and dispatched >= limit:
+                        self.logger.info(f"Reached limit of {limit} records")
+                        exhausted = True
+                        break
+                    page = self._next_source_key_page(page_key, batch_size)
+                    if not page:
+                        exhausted = True
+                        break
+                    page_key = page[-1]
+                    keys = [k for k in page if k not in matched]
+                    if limit and dispatched + len(keys) > limit:
+                        keys = keys[:limit - dispatched]
+                        page_key = keys[-1]
+                    dispatched += len(keys)
+                    future = executor.submit(run_batch, keys) if keys else None
+                    pending.append((future, page_key, len(keys)))
+                
+                if not pending:
+                    break
+                
+                future, resume_key, n_keys = pending.popleft()
+                try:
+                    batch_results = future.result() if future is not None else []
+                except Exception as e:
+                    self.logger.error(
+                        f"Error processing batch after key {counts['last_key']!r}: {e}", exc_info=True
+                    )
+                    for later, _, _ in pending:
+                        if later is not None:
+                            later.cancel()
+                    break
+                
+                counts['edges_created'] += self._create_edges_from_matches(
+                    batch_results,
+                    mark_as_inferred=mark_as_inferred
+                )
+                counts['candidates_evaluated'] += len(batch_results)
+                counts['source_records_processed'] += n_keys
+                counts['last_key'] = resume_key
+                if future is not None:
+                    counts['batches_processed'] += 1
+                
+                if progress_callback:
+                    progress_callback(counts['source_records_processed'], total_records)
+                
+                if future is not None and counts['batches_processed'] % 10 == 0:
+                    self.logger.info(
+                        f"Batch {counts['batches_processed']}: processed "
+                        f"{counts['source_records_processed']:,}/{total_records:,} records, "
+                        f"created {counts['edges_created']:,} edges"
+                    )
+        
+        return counts
+    
+    def _local_batch_matcher(
+        self,
+        query_options: Dict[str, Any],
+        max_runtime_seconds: float,
+        candidates_per_source: int,
+        similarity: Optional[WeightedFieldSimilarity],
+        fs_scorer: Optional[FellegiSunterScorer],
+        pool: Optional[Executor],
+        scoring_workers: int,
+        max_block_size: int,
+    ) -> Callable[[List[str]], List[Dict[str, Any]]]:
+        """Batch matcher that fetches candidate keys in AQL and scores locally."""
+        if similarity is None:
+            similarity = WeightedFieldSimilarity(
+                field_weights=self.field_weights,
+                algorithm="levenshtein",
+                handle_nulls="zero",
+                # Mirror UPPER(TRIM(value || "")) in the AQL scorer.
+                normalization_config={"remove_extra_whitespace": False},
+            )
+        use_bm25 = query_options['use_bm25']
+        candidate_query = self._build_candidate_key_query(use_bm25)
+        # Without BM25 the whole block is scored; one extra key reveals a
+        # block that overflows the cap.
+        candidate_limit = candidates_per_source if use_bm25 else max_block_size + 1
+        candidate_binds = self._bind_vars_for(
+            candidate_query,
+            {**self._collection_bind_vars(), 'candidate_limit': candidate_limit},
         )
+        source_query = self._build_projection_query(self.source_fields)
+        target_query = self._build_projection_query(self.target_fields)
+        threshold = query_options['threshold']
+        max_runtime = max(1.0, float(max_runtime_seconds))
+        
+        def run_batch(keys: List[str]) -> List[Dict[str, Any]]:
+            rows = list(self.db.aql.execute(
+                candidate_query,
+                bind_vars={**candidate_binds, 'keys': keys},
+                max_runtime=max_runtime,
+            ))
+            if not rows:
+                return []
+            if not use_bm25:
+                for row in rows:
+                    if len(row['candidates']) > max_block_size:
+                        self.logger.warning(
+                            "Block of source %s exceeds max_block_size=%d; scoring only "
+                            "its first %d targets by key",
+                            row['source_key'], max_block_size, max_block_size,
+                        )
+                        row['candidates'] = row['candidates'][:max_block_size]
+            target_keys = sorted({key for row in rows for key, _ in row['candidates']})
+            sources = self._fetch_projected(source_query, self.source_collection_name, keys)
+            targets = self._fetch_projected(target_query, self.target_collection_name, target_keys)
+            
+            pairs = [
+                (row['source_key'], target_key, bm25)
+                for row in rows if row['source_key'] in sources
+                for target_key, bm25 in row['candidates'] if target_key in targets
+            ]
+            scored = _score_pairs_sharded(
+                similarity, fs_scorer,
+                [sources[s] for s, _, _ in pairs], [targets[t] for _, t, _ in pairs],
+                pool, scoring_workers,
+            )
+            
+            best: Dict[str, Dict[str, Any]] = {}
+            for (source_key, target_key, bm25), (score, field_scores) in zip(pairs, scored):
+                if score < threshold:
+                    continue
+                current = best.get(source_key)
+                # Same winner as the AQL scorer: highest score, then lowest target key.
+                if current is None or (score, current['target_key']) > (current['confidence'], target_key):
+                    best[source_key] = {
+                        'source_key': source_key,
+                        'target_key': target_key,
+                        'confidence': score,
+                        'bm25_score': bm25,
+                        'field_scores': field_scores,
+                    }
+            return list(best.values())
+        
+        return run_batch
+    
+    def _build_candidate_key_query(self, use_bm25: bool) -> str:
+        """Query returning up to ``@candidate_limit`` target keys per source key.
         
-        return self._stats.copy()
+        No string comparison runs on the server: candidates are ranked by BM25
+        when a search view is used, otherwise the block is returned in target
+        key order (the caller sizes the limit to cover the whole block).
+        """
+        lines = [
+            "FOR s IN @@source_collection",
+            "    FILTER s._key IN @keys",
+            "    LET candidates = (",
+        ]
+        blocking = [
+            (self.source_fields[f], self.target_fields[f])
+            for f in self.blocking_fields if f in self.source_fields
+        ]
+        if use_bm25 and self.search_view:
+            lines.append("        FOR t IN @@search_view")
+            if blocking:
+                lines.append("            SEARCH " + "\n                AND ".join(
+                    f'ANALYZER(t.{tf} == s.{sf}, "identity")' for sf, tf in blocking
+                ))
+            lines.append("            LET bm25_score = BM25(t)")
+            lines.append("            SORT bm25_score DESC, t._key ASC")
+        else:
+            lines.append("        FOR t IN @@target_collection")
+            if 'target' in self.custom_filters:
+                conditions, _ = self._build_filter_conditions('t', self.custom_filters['target'])
+                for condition in conditions:
+                    lines.append(f"            FILTER {condition}")
+            for sf, tf in blocking:
+                lines.append(f"            FILTER t.{tf} == s.{sf}")
+            lines.append("            LET bm25_score = null")
+            lines.append("            SORT t._key ASC")
+        lines.append("            LIMIT @candidate_limit")
+        lines.append("            RETURN [t._key, bm25_score]")
+        lines.append("    )")
+        lines.append("    FILTER LENGTH(candidates) > 0")
+        lines.append("    RETURN { source_key: s._key, candidates: candidates }")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _build_projection_query(fields: Dict[str, str]) -> str:
+        """Key lookup returning only the matched fields, under their logical names."""
+        projection = ", ".join(
+            ["_key: d._key"] + [f"{logical}: d.{actual}" for logical, actual in fields.items()]
+        )
+        return f"FOR d IN @@collection FILTER d._key IN @keys RETURN {{{projection}}}"
+    
+    def _fetch_projected(self, query: str, collection: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run a projection query for ``keys``; returns docs keyed by ``_key``."""
+        if not keys:
+            return {}
+        cursor = self.db.aql.execute(query, bind_vars={"@collection": collection, "keys": keys})
+        return {doc['_key']: doc for doc in cursor}
+    
+    def _matched_source_keys(self) -> Set[str]:
+        """Source keys that already have an edge, read once per run."""
+        prefix = f"{self.source_collection_name}/"
+        cursor = self.db.aql.execute(
+            "FOR e IN @@edge_collection RETURN DISTINCT e._to",
+            bind_vars={"@edge_collection": self.edge_collection_name},
+            batch_size=10_000,
+            stream=True,
+        )
+        return {
+            to_id[len(prefix):] for to_id in cursor
+            if isinstance(to_id, str) and to_id.startswith(prefix)
+        }
+    
+    def _next_source_key_page(self, after_key: Optional[str], batch_size: int) -> List[str]:
+        """Next ``batch_size`` filtered source keys after ``after_key``, in key order."""
+        query_parts = ["FOR s IN @@source_collection"]
+        bind_vars: Dict[str, Any] = {
+            "@source_collection": self.source_collection_name,
+            "batch_size": batch_size,
+        }
+        if after_key is not None:
+            query_parts.append("    FILTER s._key > @after_key")
+            bind_vars["after_key"] = after_key
+        if 'source' in self.custom_filters:
+            conditions, filter_binds = self._build_filter_conditions(
+                's', self.custom_filters['source']
+            )
+            for condition in conditions:
+                query_parts.append(f"    FILTER {condition}")
+            bind_vars.update(filter_binds)
+        query_parts.append("    SORT s._key")
+        query_parts.append("    LIMIT @batch_size")
+        query_parts.append("    RETURN s._key")
+        return list(self.db.aql.execute("\n".join(query_parts), bind_vars=bind_vars))
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -425,6 +871,7 @@ class CrossCollectionMatchingService:
         use_bm25: bool,
         bm25_weight: float,
         deterministic_tiebreak: bool = True,
+        keyset: bool = False,
     ) -> str:
         """
         Build AQL query for matching entities in a batch.
@@ -434,26 +881,33 @@ class CrossCollectionMatchingService:
         2. For each source record, find candidate targets (using blocking)
         3. Compute similarity scores (BM25 + Levenshtein)
         4. Return matches above threshold
+        
+        With ``keyset=True`` step 1 is a primary-index lookup of ``@keys``
+        (already filtered and de-duplicated against existing edges by the
+        caller) instead of an offset scan with a per-row edge subquery.
         """
         query_parts = ["FOR s IN @@source_collection"]
         
-        # Add source filters
-        if 'source' in self.custom_filters:
-            conditions, _ = self._build_filter_conditions(
-                's', self.custom_filters['source']
-            )
-            for condition in conditions:
-                query_parts.append(f"    FILTER {condition}")
-        
-        # Check if already has edge (skip already matched)
-        query_parts.append("""    FILTER s._id NOT IN (
+        if keyset:
+            query_parts.append("    FILTER s._key IN @keys")
+        else:
+            # Add source filters
+            if 'source' in self.custom_filters:
+                conditions, _ = self._build_filter_conditions(
+                    's', self.custom_filters['source']
+                )
+                for condition in conditions:
+                    query_parts.append(f"    FILTER {condition}")
+            
+            # Check if already has edge (skip already matched)
+            query_parts.append("""    FILTER s._id NOT IN (
             FOR e IN @@edge_collection
             FILTER e._to == s._id
             LIMIT 1
             RETURN e._to
         )""")
-        
-        query_parts.append("    LIMIT @offset, @batch_size")
+            
+            query_parts.append("    LIMIT @offset, @batch_size")
         
         # Candidate generation with blocking
         if use_bm25 and self.search_view:
@@ -671,6 +1125,18 @@ class CrossCollectionMatchingService:
                 bv.update(filter_binds)
         return bv
 
+    @staticmethod
+    def _bind_vars_for(query: str, bind_vars: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the bind variables ``query`` references.
+        
+        AQL rejects undeclared bind parameters, and the shared collection /
+        filter bind vars cover every query shape.
+        """
+        return {
+            k: v for k, v in bind_vars.items()
+            if re.search(rf"@{re.escape(k)}\b", query)
+        }
+    
     def _build_bind_vars(self, threshold: float, batch_size: int, offset: int) -> Dict[str, Any]:
         """Build bind variables for the query."""
         bv = self._collection_bind_vars()
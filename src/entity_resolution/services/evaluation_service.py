@@ -12,9 +12,13 @@ Two complementary capabilities:
    in production), per-cluster coherence metrics and bridge-edge detection over
    the similarity graph, so low-quality clusters can be surfaced for review.
 
-The metric math (:func:`threshold_sweep`, :func:`confusion_at`) is pure and
-dependency-free for unit testing; :class:`EvaluationService` wires it to
-ArangoDB collections.
+The metric math (:func:`threshold_sweep`, :func:`confusion_at`) is pure for
+unit testing; :class:`EvaluationService` wires it to ArangoDB collections. The
+sweep itself runs on numpy arrays (:func:`threshold_sweep_arrays`): scores are
+sorted once and every curve point is read off cumulative true/false-positive
+counts. The service path also interns record ids to integers
+(:class:`PairInterner`), so million-pair truth sets never become Python sets of
+pair strings.
 """
 
 from __future__ import annotations
@@ -22,12 +26,16 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
+
 from ..utils.validation import validate_collection_name, validate_field_name
 
 logger = logging.getLogger(__name__)
 
 ScoredPair = Tuple[str, str, float]
 
+_CURSOR_BATCH_SIZE = 10_000
+
 
 def canonical_pair_id(id_a: str, id_b: str) -> str:
     """Order-independent pair id so (a,b) and (b,a) collapse."""
@@ -102,65 +110,113 @@ def threshold_sweep(
     threshold (the exact curve). Recall is against all truth pairs.
     """
     scores = _dedupe_max(scored_pairs)
-    n_true_total = len(truth_pairs)
-    truth_in_candidates = sum(1 for pid in scores if pid in truth_pairs)
-
-    # (score, is_true) sorted by score descending.
-    items = sorted(
-        ((s, pid in truth_pairs) for pid, s in scores.items()),
-        key=lambda x: x[0],
-        reverse=True,
+    return threshold_sweep_arrays(
+        np.fromiter(scores.values(), dtype=np.float64, count=len(scores)),
+        np.fromiter((pid in truth_pairs for pid in scores), dtype=bool, count=len(scores)),
+        len(truth_pairs),
+        thresholds=thresholds,
     )
 
-    points: List[Dict[str, Any]] = []
 
-    def _emit(threshold: float, tp: int, fp: int) -> None:
-        precision, recall, f1 = _prf(tp, fp, n_true_total)
+def threshold_sweep_arrays(
+    scores: np.ndarray,
+    is_true: np.ndarray,
+    n_true_total: int,
+    thresholds: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
+    """:func:`threshold_sweep` over already-deduplicated pairs held as arrays.
+
+    ``scores[i]`` is the (max) score of the i-th distinct pair and
+    ``is_true[i]`` whether that pair is in the ground truth. Scores are sorted
+    once; every point is read from cumulative true-positive counts, so the exact
+    curve over n pairs costs one O(n log n) sort.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    is_true = np.asarray(is_true, dtype=bool)
+    n = int(scores.size)
+
+    order = np.argsort(-scores, kind="stable")
+    ranked = scores[order]
+    cum_tp = np.cumsum(is_true[order], dtype=np.int64)
+
+    if thresholds is not None:
+        # Number of pairs scoring >= t, via the ascending view of ``ranked``.
+        ascending = ranked[::-1]
+        counts = n - np.searchsorted(ascending, np.asarray(thresholds, dtype=np.float64), side="left")
+        threshold_values = [float(t) for t in thresholds]
+    else:
+        # Last index of each run of equal scores (distinct scores high→low).
+        ends = np.flatnonzero(np.append(ranked[1:] != ranked[:-1], True)) if n else np.empty(0, np.int64)
+        counts = ends + 1
+        threshold_values = ranked[ends].tolist()
+
+    counts = np.asarray(counts, dtype=np.int64)
+    tp = np.where(counts > 0, cum_tp[np.maximum(counts - 1, 0)] if n else 0, 0)
+    fp = counts - tp
+
+    points: List[Dict[str, Any]] = []
+    for threshold, t_tp, t_fp in zip(threshold_values, tp.tolist(), fp.tolist()):
+        precision, recall, f1 = _prf(t_tp, t_fp, n_true_total)
         points.append({
-            "threshold": round(float(threshold), 6),
-            "true_positives": tp,
-            "false_positives": fp,
-            "false_negatives": n_true_total - tp,
+            "threshold": round(threshold, 6),
+            "true_positives": t_tp,
+            "false_positives": t_fp,
+            "false_negatives": n_true_total - t_tp,
             "precision": round(precision, 6),
             "recall": round(recall, 6),
             "f1": round(f1, 6),
         })
 
-    if thresholds is not None:
-        for t in thresholds:
-            tp = fp = 0
-            for s, is_true in items:
-                if s >= t:
-                    tp += is_true
-                    fp += not is_true
-                else:
-                    break  # items sorted desc
-            _emit(t, tp, fp)
-    else:
-        # Walk distinct scores high→low, accumulating predicted positives.
-        tp = fp = 0
-        i = 0
-        n = len(items)
-        while i < n:
-            s = items[i][0]
-            while i < n and items[i][0] == s:
-                if items[i][1]:
-                    tp += 1
-                else:
-                    fp += 1
-                i += 1
-            _emit(s, tp, fp)
-
     best = max(points, key=lambda p: p["f1"], default=None)
     return {
         "points": points,
         "best_f1": best,
         "n_true_total": n_true_total,
-        "n_true_in_candidates": truth_in_candidates,
-        "n_scored": len(scores),
+        "n_true_in_candidates": int(cum_tp[-1]) if n else 0,
+        "n_scored": n,
     }
 
 
+class PairInterner:
+    """Interns record ids to dense integers and encodes unordered pairs as int64.
+
+    A pair ``(a, b)`` becomes ``min(id) << 32 | max(id)``, the integer analogue of
+    :func:`canonical_pair_id`, so dedupe and truth membership are numpy
+    operations instead of string hashing.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, record_id: str) -> int:
+        ids = self._ids
+        value = ids.get(record_id)
+        if value is None:
+            value = ids[record_id] = len(ids)
+        return value
+
+    def pair_keys(self, pairs: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """int64 canonical keys for ``(a, b)`` pairs, in input order."""
+        intern = self.intern
+        flat = np.fromiter(
+            (intern(str(x)) for pair in pairs for x in pair), dtype=np.int64
+        ).reshape(-1, 2)
+        return (np.minimum(flat[:, 0], flat[:, 1]) << 32) | np.maximum(flat[:, 0], flat[:, 1])
+
+
+def _dedupe_max_keys(keys: np.ndarray, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Array form of :func:`_dedupe_max`: unique keys with their max score."""
+    if keys.size == 0:
+        return keys, scores
+    order = np.lexsort((-scores, keys))  # by key, highest score first
+    keys, scores = keys[order], scores[order]
+    first = np.append(True, keys[1:] != keys[:-1])
+    return keys[first], scores[first]
+
+
 def cluster_quality_summary(
     clusters: Sequence[Sequence[str]],
     edge_scores: Dict[str, float],
@@ -288,15 +344,59 @@ class EvaluationService:
                 truth.add(canonical_pair_id(str(a), str(b)))
         return truth
 
+    def _load_scored_arrays(self, interner: PairInterner) -> Tuple[np.ndarray, np.ndarray]:
+        """Deduplicated ``(pair_keys, scores)`` for stored edges, streamed."""
+        cursor = self.db.aql.execute(
+            f"""
+            FOR e IN @@edges
+                FILTER e.suppressed != true AND e.{self.score_field} != null
+                RETURN [e._from, e._to, e.{self.score_field}]
+            """,
+            bind_vars={"@edges": self.edge_collection},
+            batch_size=_CURSOR_BATCH_SIZE,
+            stream=True,
+        )
+        scores: List[float] = []
+
+        def _pairs():
+            for a, b, score in cursor:
+                scores.append(float(score))
+                yield a, b
+
+        keys = interner.pair_keys(_pairs())
+        return _dedupe_max_keys(keys, np.asarray(scores, dtype=np.float64))
+
+    def _load_truth_keys(self, truth_collection: str, interner: PairInterner) -> np.ndarray:
+        """Sorted unique int64 keys of the ground-truth pairs (see :meth:`_load_truth`)."""
+        cursor = self.db.aql.execute(
+            """
+            FOR d IN @@truth
+                LET a = d._from != null ? d._from : d.id_a
+                LET b = d._to != null ? d._to : d.id_b
+                FILTER a != null AND b != null
+                RETURN [a, b]
+            """,
+            bind_vars={"@truth": truth_collection},
+            batch_size=_CURSOR_BATCH_SIZE,
+            stream=True,
+        )
+        return np.unique(interner.pair_keys(cursor))
+
     def threshold_sweep(
         self,
         truth_collection: str,
         thresholds: Optional[Sequence[float]] = None,
     ) -> Dict[str, Any]:
         """Compute the labeled threshold sweep from stored edges + truth collection."""
-        scored = self._load_scored_pairs()
-        truth = self._load_truth(truth_collection)
-        return threshold_sweep(scored, truth, thresholds=thresholds)
+        interner = PairInterner()
+        keys, scores = self._load_scored_arrays(interner)
+        truth_keys = self._load_truth_keys(truth_collection, interner)
+        return threshold_sweep_arrays(
+            scores,
+            np.isin(keys, truth_keys, assume_unique=True),
+            int(truth_keys.size),
+            thresholds=thresholds,
+        )
 
     def score_distribution(self, bucket: float = 0.05) -> List[Dict[str, Any]]:
         """Histogram of non-suppressed edge scores, bucketed by ``bucket`` width.
@@ -19,7 +19,14 @@ edge).
 After applying a verdict, ``recluster_component`` recomputes connected
 components for just the affected subgraph (excluding suppressed edges,
 including confirmed edges) via in-process union-find, and rewrites only the
-cluster documents that contained the affected vertices.
+cluster documents that contained the affected vertices. By default the
+connectivity comes from the full active edge set; with ``scoped=True`` it comes
+from a hop-by-hop expansion of just the affected component (edge-index lookups)
+and affected clusters are found through an array index on ``member_keys``, so
+verdict latency depends on the component size rather than the graph size.
+When the clustering run maintains a member -> cluster index
+(:mod:`.cluster_membership`), cluster and golden-record lookups go through it
+in either mode, and re-clustering keeps it up to date.
 
 Concurrency: ``apply_and_recluster`` serializes per-component work with a
 short-lived lock document (TTL-indexed ``er_locks``) so two verdicts on the
@@ -37,6 +44,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils.graph_utils import extract_key_from_vertex_id, format_vertex_id
+from .cluster_membership import ClusterMembershipIndex
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +52,9 @@ logger = logging.getLogger(__name__)
 # them for user collections, so this is "er_locks" (not "_er_locks").
 _LOCK_COLLECTION = "er_locks"
 _LOCK_TTL_SECONDS = 60
+# Scoped re-clustering falls back to the global edge scan beyond this many
+# vertices (a giant component is cheaper to handle in one pass).
+_DEFAULT_MAX_COMPONENT_SIZE = 50_000
 
 
 class FeedbackApplicationError(RuntimeError):
@@ -63,6 +74,16 @@ class FeedbackApplicationService:
         Collection the resolved entities live in (for ``key`` -> ``_id``).
     cluster_collection:
         Cluster output collection (docs with ``member_keys``).
+    golden_collection:
+        Optional golden-record collection to flag stale on cluster changes.
+    scoped:
+        Re-cluster from the affected component only: expand the seeds one hop
+        at a time over non-suppressed edges instead of fetching every active
+        edge, and look clusters up through a ``member_keys[*]`` index instead
+        of scanning them. Produces the same clusters as the global mode.
+    max_component_size:
+        Scoped expansion gives up and falls back to the global edge scan once
+        the component exceeds this many vertices.
     """
 
     def __init__(
@@ -72,6 +93,8 @@ class FeedbackApplicationService:
         vertex_collection: str,
         cluster_collection: str,
         golden_collection: Optional[str] = None,
+        scoped: bool = False,
+        max_component_size: int = _DEFAULT_MAX_COMPONENT_SIZE,
     ) -> None:
         self.db = db
         self.edge_collection = edge_collection
@@ -80,6 +103,10 @@ class FeedbackApplicationService:
         # When set, golden records whose source cluster changed are flagged
         # stale (or regenerated when auto_refresh is on).
         self.golden_collection = golden_collection
+        self.scoped = scoped
+        self.max_component_size = max_component_size
+        self._member_index_ready = False
+        self.membership = ClusterMembershipIndex(db, cluster_collection, create=False)
 
     # ------------------------------------------------------------------
     # Edge keying (must match SimilarityEdgeService deterministic keys)
@@ -174,6 +201,91 @@ class FeedbackApplicationService:
         )
         return [(row["from"], row["to"]) for row in cursor]
 
+    def _fetch_component_edges(self, member_keys) -> Optional[List[Tuple[str, str]]]:
+        """Active edges of the component(s) containing ``member_keys``.
+
+        Breadth-first expansion, one AQL round trip per hop: each hop reads the
+        non-suppressed edges incident to the frontier through the edge index.
+        Every edge of the component is returned, so union-find over the result
+        matches :meth:`_fetch_active_edges` for these vertices. Returns ``None``
+        when the component outgrows ``max_component_size``.
+        """
+        visited = {self._vid(k) for k in member_keys}
+        frontier = sorted(visited)
+        edges = set()
+        while frontier:
+            cursor = self.db.aql.execute(
+                """
+                FOR v IN @frontier
+                    FOR n, e IN 1..1 ANY v @@edges
+                        FILTER e.suppressed != true
+                        RETURN [e._from, e._to]
+                """,
+                bind_vars={"frontier": frontier, "@edges": self.edge_collection},
+            )
+            next_frontier = []
+            for a, b in cursor:
+                edges.add((a, b))
+                for vid in (a, b):
+                    if vid not in visited:
+                        visited.add(vid)
+                        next_frontier.append(vid)
+            if len(visited) > self.max_component_size:
+                logger.warning(
+                    "Scoped re-cluster: component exceeds %d vertices; "
+                    "falling back to the full edge scan",
+                    self.max_component_size,
+                )
+                return None
+            frontier = next_frontier
+        return sorted(edges)
+
+    def _ensure_member_index(self) -> None:
+        if self._member_index_ready:
+            return
+        try:
+            self.db.collection(self.cluster_collection).add_persistent_index(
+                fields=["member_keys[*]"], name="idx_cluster_member_keys"
+            )
+        except Exception as exc:  # index is an optimisation only
+            logger.debug("Could not ensure cluster member index: %s", exc)
+        self._member_index_ready = True
+
+    def _membership_run(self) -> Optional[str]:
+        """Run id to keep the member index in step with, or None if it is unusable."""
+        if not self.membership.available:
+            return None
+        return self.membership.run_id() or self.membership.new_run_id()
+
+    def _clusters_containing(self, member_keys, use_index: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Cluster documents with any of ``member_keys`` among their members."""
+        keys = sorted(set(member_keys))
+        if use_index is None:
+            use_index = self.membership.available
+        if use_index:
+            return self.membership.clusters_containing(keys)
+        if not self.scoped:
+            return list(self.db.aql.execute(
+                """
+                FOR c IN @@clusters
+                    FILTER LENGTH(INTERSECTION(c.member_keys, @touched)) > 0
+                    RETURN c
+                """,
+                bind_vars={"@clusters": self.cluster_collection, "touched": keys},
+            ))
+        self._ensure_member_index()
+        cursor = self.db.aql.execute(
+            """
+            FOR k IN @keys
+                FOR c IN @@clusters
+                    FILTER k IN c.member_keys[*]
+                    RETURN c
+            """,
+            bind_vars={"@clusters": self.cluster_collection, "keys": keys},
+        )
+        # A cluster is returned once per matching key.
+        return list({c["_key"]: c for c in cursor}.values())
+
     @staticmethod
     def _cluster_key(member_keys: List[str]) -> str:
         """Stable, content-addressed cluster key (order-independent)."""
@@ -212,25 +324,22 @@ class FeedbackApplicationService:
         no longer exists are flagged stale (and deleted when ``auto_refresh``).
         """
         seeds = [k for k in member_keys if k]
-        edges = self._fetch_active_edges()
-        roots = self._union_find(edges)
-
-        coll = self.db.collection(self.cluster_collection)
+        # Checked once: the rewrite below keeps a usable index in step.
+        membership_run = self._membership_run()
+        use_index = membership_run is not None
 
         # Old clusters that referenced any seed — their members are all affected
         # (a split moves some of them into a different component).
-        seed_docs = list(self.db.aql.execute(
-            """
-            FOR c IN @@clusters
-                FILTER LENGTH(INTERSECTION(c.member_keys, @seeds)) > 0
-                RETURN c
-            """,
-            bind_vars={"@clusters": self.cluster_collection, "seeds": seeds},
-        ))
+        seed_docs = self._clusters_containing(seeds, use_index)
         affected_keys = set(seeds)
         for d in seed_docs:
             affected_keys.update(d.get("member_keys", []))
 
+        edges = self._fetch_component_edges(affected_keys) if self.scoped else None
+        if edges is None:
+            edges = self._fetch_active_edges()
+        roots = self._union_find(edges)
+
         # Recompute the full component for every affected vertex, keyed by
         # union-find root. Pull in every vertex sharing a root with an affected
         # vertex (a confirm can attach vertices never in the seed's old
@@ -250,14 +359,7 @@ class FeedbackApplicationService:
             touched_keys.update(comp)
 
         # All old clusters intersecting the touched set are replaced.
-        old_docs = list(self.db.aql.execute(
-            """
-            FOR c IN @@clusters
-                FILTER LENGTH(INTERSECTION(c.member_keys, @touched)) > 0
-                RETURN c
-            """,
-            bind_vars={"@clusters": self.cluster_collection, "touched": list(touched_keys)},
-        ))
+        old_docs = self._clusters_containing(touched_keys, use_index)
         old_keys = {d["_key"] for d in old_docs}
 
         # Singletons (entities whose every edge was suppressed) are not stored
@@ -275,6 +377,7 @@ class FeedbackApplicationService:
                 "member_keys": comp,
                 "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
                 "method": "feedback_recluster",
+                **({"membership_run": membership_run} if use_index else {}),
             })
         new_keys = {d["_key"] for d in new_docs}
 
@@ -287,6 +390,12 @@ class FeedbackApplicationService:
                 pass
         if new_docs:
             coll.insert_many(new_docs, overwrite_mode="replace")
+        if use_index:
+            self.membership.assign_many(
+                {d["_key"]: d["member_keys"] for d in new_docs}, membership_run
+            )
+            clustered = {k for d in new_docs for k in d["member_keys"]}
+            self.membership.unassign(touched_keys - clustered)
 
         result = {
             "component_size": len(touched_keys),
@@ -314,14 +423,21 @@ class FeedbackApplicationService:
         regeneration of the new clusters happens on the next persistence run.
         """
         coll = self.db.collection(self.golden_collection)
-        affected = list(self.db.aql.execute(
-            """
-            FOR g IN @@golden
-                FILTER LENGTH(INTERSECTION(g.memberKeys, @touched)) > 0
-                RETURN g
-            """,
-            bind_vars={"@golden": self.golden_collection, "touched": list(touched_keys)},
-        ))
+        # The index only finds golden records whose members were stamped
+        # with their golden_key; any record written without it forces the scan.
+        if self.membership.available and self.membership.golden_covered(self.golden_collection):
+            affected = self.membership.golden_records_containing(
+                self.golden_collection, list(touched_keys)
+            )
+        else:
+            affected = list(self.db.aql.execute(
+                """
+                FOR g IN @@golden
+                    FILTER LENGTH(INTERSECTION(g.memberKeys, @touched)) > 0
+                    RETURN g
+                """,
+                bind_vars={"@golden": self.golden_collection, "touched": list(touched_keys)},
+            ))
 
         now = datetime.now(timezone.utc).isoformat(timespec="seconds")
         stale, deleted = 0, 0
@@ -12,12 +12,14 @@ Design goals:
 from __future__ import annotations
 
 import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from arango.database import StandardDatabase
 
 from ..utils.graph_utils import extract_key_from_vertex_id, format_vertex_id
+from .cluster_membership import GOLDEN_INDEXED_FIELD, ClusterMembershipIndex
 
 
 SYSTEM_FIELDS = {"_key", "_id", "_rev", "_from", "_to"}
@@ -36,6 +38,7 @@ GOLDEN_METADATA_FIELDS = {
     "memberIds",
     "memberKeys",
     "sourceClusterHash",
+    "sourceRevHash",
     "stale",
     "runId",
     "updatedAt",
@@ -44,10 +47,41 @@ GOLDEN_METADATA_FIELDS = {
     "fieldProvenance",
     "fieldOverrides",
     "editedBy",
+    GOLDEN_INDEXED_FIELD,
 }
 
 MERGE_STRATEGIES = ("field_voting", "most_complete", "most_recent", "source_priority")
 
+# Chunk size for incremental or multi-process runs when no batch_size is
+# given, and for the bulk stale-retirement writes.
+_DEFAULT_BATCH_SIZE = 1000
+_RETIRE_BATCH_SIZE = 10_000
+
+# Survivorship settings ``_consolidate`` reads. Only these are shipped to
+# consolidation worker processes; the database handles stay in the parent.
+_CONSOLIDATION_SETTINGS = (
+    "include_fields",
+    "include_provenance",
+    "merge_strategy",
+    "field_strategies",
+    "recency_field",
+    "source_field",
+    "source_priority",
+)
+
+
+def _consolidate_shard(
+    settings: Dict[str, Any], shard: Sequence[Sequence[Dict[str, Any]]]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Process-pool worker: consolidate a shard of clusters' member documents.
+
+    Builds a connection-less service carrying only the survivorship settings,
+    so results are exactly those of the serial path.
+    """
+    consolidator = GoldenRecordPersistenceService.__new__(GoldenRecordPersistenceService)
+    consolidator.__dict__.update(settings)
+    return [consolidator._consolidate(docs) for docs in shard]
+
 
 class GoldenRecordPersistenceService:
     """
@@ -117,6 +151,9 @@ class GoldenRecordPersistenceService:
 
         if not self.db.has_collection(self.golden_collection_name):
             self.db.create_collection(self.golden_collection_name, edge=False)
+        ClusterMembershipIndex(self.db, self.cluster_collection_name).ensure_golden_index(
+            self.golden_collection_name
+        )
         if not self.db.has_collection(self.resolved_edge_collection_name):
             self.db.create_collection(self.resolved_edge_collection_name, edge=True)
 
@@ -130,111 +167,397 @@ class GoldenRecordPersistenceService:
         run_id: Optional[str] = None,
         min_cluster_size: int = 2,
         method: str = "golden_record_persistence",
+        batch_size: Optional[int] = None,
+        incremental: bool = False,
+        workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Create/update GoldenRecords and resolvedTo edges.
 
-        Returns summary counts only (safe for logs).
+        Args:
+            run_id: Run identifier stamped on records and edges (default: now).
+            min_cluster_size: Skip clusters with fewer members.
+            method: Method label stamped on records and edges.
+            batch_size: Process clusters in chunks of this many. Each chunk
+                fetches all of its member documents with one query, prefetches
+                steward overrides with one query, and upserts its golden
+                records and edges before the next chunk is read, so round trips
+                and memory are bounded by the chunk instead of the run. None
+                (default) reads members and overrides one ``get`` at a time and
+                writes everything at the end.
+            incremental: Only rebuild clusters whose golden record is missing,
+                flagged stale, or out of date: its ``sourceClusterHash`` no
+                longer matches the live membership, or its ``sourceRevHash``
+                no longer matches the members' current ``_rev`` values (read
+                with a key/rev-only projection). Unchanged clusters are never
+                fetched or consolidated. Golden records whose source cluster
+                no longer exists are then flagged ``stale`` in bulk. Implies
+                chunked processing (``batch_size`` defaults to 1000). Run a
+                full rebuild after changing survivorship settings, which are
+                not part of the change check.
+            workers: Consolidate each chunk in a pool of this many worker
+                processes. Clusters are sharded across the pool together with
+                their prefetched member documents; workers return consolidated
+                fields and provenance, and overrides, metadata and writes stay
+                in this process. Output is identical to a serial run. Values
+                above 1 imply chunked processing (``batch_size`` defaults to
+                1000); None or 1 consolidates in-process.
+
+        Returns summary counts only (safe for logs). Incremental runs add
+        ``clusters_unchanged`` and ``golden_records_retired``.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1, got: {workers}")
         rid = run_id or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        summary = {
+            "clusters_processed": 0,
+            "golden_records_upserted": 0,
+            "resolved_edges_upserted": 0,
+        }
+        membership = ClusterMembershipIndex(self.db, self.cluster_collection_name, create=False)
+        live_keys: set = set()
+
+        if incremental:
+            batch_size = batch_size or _DEFAULT_BATCH_SIZE
+            summary["clusters_unchanged"] = 0
+        pool: Optional[Executor] = None
+        if workers and workers > 1:
+            batch_size = batch_size or _DEFAULT_BATCH_SIZE
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        if batch_size:
+            try:
+                self._run_chunks(
+                    min_cluster_size, batch_size, incremental, rid, method,
+                    membership, summary, live_keys,
+                    pool, workers or 1,
+                )
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+            if incremental:
+                summary["golden_records_retired"] = self._retire_golden_records(live_keys)
+            return summary
+
+        golden_docs = []
+        resolved_edges = []
+        for chunk in self._cluster_chunks(min_cluster_size, None, summary):
+            for cluster, member_ids in chunk:
+                member_docs = self._fetch_member_docs(member_ids)
+                if not member_docs:
+                    continue
+                golden_key = self._golden_key(member_ids)
+                golden_doc, edges = self._build_golden_record(
+                    cluster, member_ids, member_docs,
+                    self._load_field_overrides(golden_key), rid, method,
+                )
+                golden_docs.append(golden_doc)
+                resolved_edges.extend(edges)
+        self._write_golden_records(golden_docs, resolved_edges, membership, summary)
+        return summary
 
-        clusters_processed = 0
-        golden_upserted = 0
-        edges_upserted = 0
+    def _run_chunks(
+        self,
+        min_cluster_size: int,
+        batch_size: int,
+        incremental: bool,
+        rid: str,
+        method: str,
+        membership: ClusterMembershipIndex,
+        summary: Dict[str, Any],
+        live_keys: set,
+        pool: Optional[Executor],
+        workers: int,
+    ) -> None:
+        """Chunked body of :meth:`run`: fetch, consolidate and write per chunk."""
+        for chunk in self._cluster_chunks(min_cluster_size, batch_size, summary):
+            golden_keys = [self._golden_key(member_ids) for _, member_ids in chunk]
+            if incremental:
+                live_keys.update(golden_keys)
+                chunk, golden_keys, overrides = self._changed_clusters(
+                    chunk, golden_keys, summary
+                )
+            else:
+                overrides = self._load_field_overrides_bulk(golden_keys)
+            docs_by_key = self._fetch_member_docs_bulk(
+                [mid for _, member_ids in chunk for mid in member_ids]
+            )
 
-        golden_docs: List[Dict[str, Any]] = []
-        resolved_edges: List[Dict[str, Any]] = []
+            pending = []
+            for (cluster, member_ids), golden_key in zip(chunk, golden_keys):
+                member_docs = [
+                    docs_by_key[key]
+                    for key in (extract_key_from_vertex_id(mid) for mid in member_ids)
+                    if key in docs_by_key
+                ]
+                if member_docs:
+                    pending.append((cluster, member_ids, golden_key, member_docs))
+            results = self._consolidate_many([p[3] for p in pending], pool, workers)
+
+            golden_docs: List[Dict[str, Any]] = []
+            resolved_edges: List[Dict[str, Any]] = []
+            for (cluster, member_ids, golden_key, member_docs), result in zip(pending, results):
+                golden_doc, edges = self._build_golden_record(
+                    cluster, member_ids, member_docs,
+                    overrides.get(golden_key, {}), rid, method,
+                    consolidated=result,
+                )
+                golden_docs.append(golden_doc)
+                resolved_edges.extend(edges)
+            self._write_golden_records(golden_docs, resolved_edges, membership, summary)
 
+    def _consolidate_many(
+        self,
+        doc_lists: Sequence[Sequence[Dict[str, Any]]],
+        pool: Optional[Executor],
+        workers: int,
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Consolidate several clusters, in ``pool`` when one is given.
+
+        Clusters are split into contiguous shards (a few per worker, so one
+        large cluster does not idle the rest of the pool) and results come
+        back in input order.
+        """
+        if pool is None or len(doc_lists) < 2:
+            return [self._consolidate(docs) for docs in doc_lists]
+        settings = {name: getattr(self, name) for name in _CONSOLIDATION_SETTINGS}
+        shard_size = max(1, -(-len(doc_lists) // (workers * 4)))
+        shards = [doc_lists[i:i + shard_size] for i in range(0, len(doc_lists), shard_size)]
+        results: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for shard_result in pool.map(_consolidate_shard, [settings] * len(shards), shards):
+            results.extend(shard_result)
+        return results
+
+    def _cluster_chunks(
+        self,
+        min_cluster_size: int,
+        batch_size: Optional[int],
+        summary: Dict[str, Any],
+    ) -> Iterator[List[Tuple[Dict[str, Any], List[str]]]]:
+        """Yield ``(cluster, member_ids)`` chunks of eligible clusters.
+
+        ``batch_size=None`` yields a single chunk with every cluster.
+        Counts eligible clusters into ``summary["clusters_processed"]``.
+        """
+        chunk: List[Tuple[Dict[str, Any], List[str]]] = []
         for cluster in self.cluster_collection:
             member_ids = self._get_cluster_member_ids(cluster)
             if len(member_ids) < min_cluster_size:
                 continue
+            summary["clusters_processed"] += 1
+            chunk.append((cluster, member_ids))
+            if batch_size and len(chunk) >= batch_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _changed_clusters(
+        self,
+        chunk: List[Tuple[Dict[str, Any], List[str]]],
+        golden_keys: List[str],
+        summary: Dict[str, Any],
+    ) -> Tuple[List[Tuple[Dict[str, Any], List[str]]], List[str], Dict[str, Dict[str, Any]]]:
+        """Filter a chunk down to clusters whose golden record needs a rebuild.
+
+        Two projected reads per chunk: the stored golden records' change
+        markers (plus overrides, reused by the rebuild) and the members'
+        ``_rev`` values. Returns the changed clusters, their golden keys and
+        their steward overrides.
+        """
+        stored = {
+            g["_key"]: g
+            for g in self.db.aql.execute(
+                """
+                FOR g IN @@golden
+                    FILTER g._key IN @keys
+                    RETURN KEEP(g, "_key", "stale", "sourceClusterHash",
+                                "sourceRevHash", "fieldOverrides")
+                """,
+                bind_vars={"@golden": self.golden_collection_name, "keys": golden_keys},
+            )
+        }
+        member_keys = list(dict.fromkeys(
+            extract_key_from_vertex_id(mid) for _, member_ids in chunk for mid in member_ids
+        ))
+        revs = {
+            key: rev
+            for key, rev in self.db.aql.execute(
+                "FOR d IN @@source FILTER d._key IN @keys RETURN [d._key, d._rev]",
+                bind_vars={"@source": self.source_collection_name, "keys": member_keys},
+            )
+        }
 
-            clusters_processed += 1
-            member_docs = self._fetch_member_docs(member_ids)
-            if not member_docs:
+        changed: List[Tuple[Dict[str, Any], List[str]]] = []
+        changed_keys: List[str] = []
+        for item, golden_key in zip(chunk, golden_keys):
+            keys = [extract_key_from_vertex_id(mid) for mid in item[1]]
+            g = stored.get(golden_key)
+            if (
+                g is not None
+                and not g.get("stale")
+                and g.get("sourceClusterHash") == self.cluster_hash(keys)
+                and g.get("sourceRevHash") == self.revision_hash(keys, revs)
+            ):
+                summary["clusters_unchanged"] += 1
                 continue
+            changed.append(item)
+            changed_keys.append(golden_key)
+
+        overrides = {
+            key: self._clean_overrides(stored[key].get("fieldOverrides"))
+            for key in changed_keys
+            if key in stored
+        }
+        return changed, changed_keys, overrides
+
+    def _retire_golden_records(self, live_keys: set) -> int:
+        """Flag pipeline-built golden records with no live source cluster stale.
+
+        Streams the keys of current (non-stale) pipeline-built records — manual
+        steward records carry no ``sourceClusterHash`` and are left alone — and
+        flags the ones not produced by this run's clusters in bulk writes.
+        """
+        cursor = self.db.aql.execute(
+            """
+            FOR g IN @@golden
+                FILTER g.sourceClusterHash != null AND g.stale != true
+                RETURN g._key
+            """,
+            bind_vars={"@golden": self.golden_collection_name},
+            batch_size=_RETIRE_BATCH_SIZE,
+            stream=True,
+        )
+        retired = [key for key in cursor if key not in live_keys]
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for i in range(0, len(retired), _RETIRE_BATCH_SIZE):
+            self.db.aql.execute(
+                """
+                FOR k IN @keys
+                    UPDATE { _key: k, stale: true, staleReason: @reason, staleAt: @now }
+                    IN @@golden
+                """,
+                bind_vars={
+                    "@golden": self.golden_collection_name,
+                    "keys": retired[i:i + _RETIRE_BATCH_SIZE],
+                    "reason": "source cluster no longer exists",
+                    "now": now,
+                },
+            )
+        return len(retired)
+
+    def _build_golden_record(
+        self,
+        cluster: Dict[str, Any],
+        member_ids: Sequence[str],
+        member_docs: Sequence[Dict[str, Any]],
+        overrides: Dict[str, Any],
+        rid: str,
+        method: str,
+        consolidated: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Consolidate one cluster into its golden record and resolvedTo edges.
+
+        ``consolidated`` is a precomputed ``_consolidate(member_docs)`` result
+        (e.g. from a worker process); it is computed here when omitted.
+        """
+        golden_key = self._golden_key(member_ids)
+        golden_id = f"{self.golden_collection_name}/{golden_key}"
+
+        consolidated, provenance = consolidated or self._consolidate(member_docs)
+
+        # Re-apply steward field overrides on top of the recomputed values.
+        # Without this, a rerun silently reverts every manual correction:
+        # overwrite_mode="update" merges the freshly consolidated fields over
+        # the stored ones, so an analyst-supplied value is replaced by the
+        # machine's choice. Worse, `editedBy` is not recomputed and therefore
+        # survives, leaving a record that claims a human authored values the
+        # pipeline actually produced.
+        #
+        # This mirrors how pairwise adjudication already works: a verdict
+        # lives on the edge as suppressed/confirmed and re-clustering honours
+        # it, rather than being recomputed away.
+        for field, value in overrides.items():
+            consolidated[field] = value
+            if self.include_provenance:
+                provenance[field] = {
+                    "strategy": "manual_override",
+                    "chosenFrom": "steward",
+                    "distinctValues": 1,
+                    "sources": 1,
+                }
 
-            golden_key = self._golden_key(member_ids)
-            golden_id = f"{self.golden_collection_name}/{golden_key}"
-
-            consolidated, provenance = self._consolidate(member_docs)
-
-            # Re-apply steward field overrides on top of the recomputed values.
-            # Without this, a rerun silently reverts every manual correction:
-            # overwrite_mode="update" merges the freshly consolidated fields over
-            # the stored ones, so an analyst-supplied value is replaced by the
-            # machine's choice. Worse, `editedBy` is not recomputed and therefore
-            # survives, leaving a record that claims a human authored values the
-            # pipeline actually produced.
-            #
-            # This mirrors how pairwise adjudication already works: a verdict
-            # lives on the edge as suppressed/confirmed and re-clustering honours
-            # it, rather than being recomputed away.
-            overrides = self._load_field_overrides(golden_key)
-            for field, value in overrides.items():
-                consolidated[field] = value
-                if self.include_provenance:
-                    provenance[field] = {
-                        "strategy": "manual_override",
-                        "chosenFrom": "steward",
-                        "distinctValues": 1,
-                        "sources": 1,
-                    }
-
-            member_keys = [extract_key_from_vertex_id(mid) for mid in member_ids]
-            # Consolidated values first, metadata second: metadata must win any
-            # name collision (see GOLDEN_METADATA_FIELDS).
-            golden_doc: Dict[str, Any] = {
-                **consolidated,
-                "_key": golden_key,
-                "clusterId": cluster.get("cluster_id", cluster.get("_key")),
-                "clusterSize": len(member_ids),
-                "memberIds": list(member_ids),
-                "memberKeys": member_keys,
-                # Content hash of the source cluster's members. When the cluster
-                # later changes, this no longer matches any live cluster and the
-                # record can be detected as stale (see FeedbackApplicationService).
-                "sourceClusterHash": self.cluster_hash(member_keys),
-                "stale": False,
+        member_keys = [extract_key_from_vertex_id(mid) for mid in member_ids]
+        # Consolidated values first, metadata second: metadata must win any
+        # name collision (see GOLDEN_METADATA_FIELDS).
+        golden_doc: Dict[str, Any] = {
+            **consolidated,
+            "_key": golden_key,
+            "clusterId": cluster.get("cluster_id", cluster.get("_key")),
+            "clusterSize": len(member_ids),
+            "memberIds": list(member_ids),
+            "memberKeys": member_keys,
+            # Content hash of the source cluster's members. When the cluster
+            # later changes, this no longer matches any live cluster and the
+            # record can be detected as stale (see FeedbackApplicationService).
+            "sourceClusterHash": self.cluster_hash(member_keys),
+            # Content hash of the members' revisions, so an incremental run can
+            # tell that a member document changed without re-reading it.
+            "sourceRevHash": self.revision_hash(
+                member_keys, {d.get("_key"): d.get("_rev") for d in member_docs}
+            ),
+            "stale": False,
+            "runId": rid,
+            "updatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "method": method,
+            "mergeStrategy": self.merge_strategy,
+        }
+        if self.include_provenance:
+            golden_doc["fieldProvenance"] = provenance
+
+        resolved_edges = [
+            {
+                "_key": self._edge_key(mid, golden_id),
+                "_from": mid,
+                "_to": golden_id,
                 "runId": rid,
-                "updatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
                 "method": method,
-                "mergeStrategy": self.merge_strategy,
+                "inferred": True,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             }
-            if self.include_provenance:
-                golden_doc["fieldProvenance"] = provenance
-
-            golden_docs.append(golden_doc)
-
-            for mid in member_ids:
-                resolved_edges.append(
-                    {
-                        "_key": self._edge_key(mid, golden_id),
-                        "_from": mid,
-                        "_to": golden_id,
-                        "runId": rid,
-                        "method": method,
-                        "inferred": True,
-                        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-                    }
-                )
+            for mid in member_ids
+        ]
+        return golden_doc, resolved_edges
 
+    def _write_golden_records(
+        self,
+        golden_docs: List[Dict[str, Any]],
+        resolved_edges: List[Dict[str, Any]],
+        membership: ClusterMembershipIndex,
+        summary: Dict[str, Any],
+    ) -> None:
         if golden_docs:
+            # Let feedback re-clustering find these records by member through
+            # the clustering run's membership index (when it maintains one).
+            # Rows go first so a record is only stamped as indexed once its
+            # members point at it; an unindexed write clears the stamp.
+            indexed = membership.available
+            if indexed:
+                membership.set_golden({
+                    k: g["_key"] for g in golden_docs for k in g["memberKeys"] if k
+                })
+            for g in golden_docs:
+                g[GOLDEN_INDEXED_FIELD] = True if indexed else None
             # Update semantics => safe reruns (refresh metadata, no duplicates).
             self.golden_collection.insert_many(golden_docs, overwrite_mode="update")
-            golden_upserted = len(golden_docs)
+            summary["golden_records_upserted"] += len(golden_docs)
 
         if resolved_edges:
             # Deterministic keys + ignore => idempotent edge creation.
             self.resolved_edge_collection.insert_many(resolved_edges, overwrite_mode="ignore")
-            edges_upserted = len(resolved_edges)
-
-        return {
-            "clusters_processed": clusters_processed,
-            "golden_records_upserted": golden_upserted,
-            "resolved_edges_upserted": edges_upserted,
-        }
+            summary["resolved_edges_upserted"] += len(resolved_edges)
 
     def _load_field_overrides(self, golden_key: str) -> Dict[str, Any]:
         """Steward-supplied field values that must outlive a rebuild.
@@ -251,7 +574,29 @@ class GoldenRecordPersistenceService:
             return {}
         if not existing:
             return {}
-        overrides = existing.get("fieldOverrides")
+        return self._clean_overrides(existing.get("fieldOverrides"))
+
+    def _load_field_overrides_bulk(self, golden_keys: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """:meth:`_load_field_overrides` for many golden records in one query."""
+        if not golden_keys:
+            return {}
+        cursor = self.db.aql.execute(
+            """
+            FOR g IN @@golden
+                FILTER g._key IN @keys AND g.fieldOverrides != null
+                RETURN [g._key, g.fieldOverrides]
+            """,
+            bind_vars={"@golden": self.golden_collection_name, "keys": list(golden_keys)},
+        )
+        out: Dict[str, Dict[str, Any]] = {}
+        for key, overrides in cursor:
+            cleaned = self._clean_overrides(overrides)
+            if cleaned:
+                out[key] = cleaned
+        return out
+
+    @staticmethod
+    def _clean_overrides(overrides: Any) -> Dict[str, Any]:
         if not isinstance(overrides, dict):
             return {}
         return {
@@ -297,6 +642,21 @@ class GoldenRecordPersistenceService:
                 docs.append(d)
         return docs
 
+    def _fetch_member_docs_bulk(self, member_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Member documents for many clusters with one query, keyed by ``_key``."""
+        keys = list(dict.fromkeys(extract_key_from_vertex_id(vid) for vid in member_ids))
+        if not keys:
+            return {}
+        cursor = self.db.aql.execute(
+            "FOR d IN @@source FILTER d._key IN @keys RETURN d",
+            bind_vars={"@source": self.source_collection_name, "keys": keys},
+        )
+        docs: Dict[str, Dict[str, Any]] = {}
+        for d in cursor:
+            d.setdefault("_id", format_vertex_id(d["_key"], self.source_collection_name))
+            docs[d["_key"]] = d
+        return docs
+
     def _golden_key(self, member_ids: Sequence[str]) -> str:
         # Deterministic: hash of sorted member vertex ids.
         s = "|".join(sorted(member_ids))
@@ -311,6 +671,16 @@ class GoldenRecordPersistenceService:
         """
         return hashlib.md5("|".join(sorted(member_keys)).encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def revision_hash(member_keys: Sequence[str], revs: Dict[str, Any]) -> str:
+        """Order-independent hash of the members' document revisions.
+
+        Members without a document hash as ``None``, so a deleted or newly
+        created member also changes the hash.
+        """
+        joined = "|".join(f"{k}:{revs.get(k)}" for k in sorted(member_keys))
+        return hashlib.md5(joined.encode("utf-8")).hexdigest()
+
     def _edge_key(self, from_id: str, to_id: str) -> str:
         # Deterministic, order-independent.
         a, b = (from_id, to_id) if from_id < to_id else (to_id, from_id)
@@ -166,42 +166,9 @@ class SimilarityEdgeService:
         
         # Insert in batches
         for i in range(0, len(matches), self.batch_size):
-            batch = matches[i:i + self.batch_size]
-            batch_edges = []
-            
-            for doc1_key, doc2_key, score in batch:
-                # Format vertex IDs
-                from_id = self._format_vertex_id(doc1_key)
-                to_id = self._format_vertex_id(doc2_key)
-                
-                # Create primary edge
-                edge = {
-                    '_from': from_id,
-                    '_to': to_id,
-                    'similarity': round(score, 4),
-                    **edge_metadata
-                }
-                
-                # Add deterministic key if enabled
-                if self.use_deterministic_keys:
-                    edge['_key'] = self._generate_deterministic_key(from_id, to_id)
-                
-                batch_edges.append(edge)
-                
-                # Create reverse edge if bidirectional
-                if bidirectional:
-                    reverse_edge = {
-                        '_from': to_id,
-                        '_to': from_id,
-                        'similarity': round(score, 4),
-                        **edge_metadata
-                    }
-                    
-                    # Add deterministic key for reverse edge if enabled
-                    if self.use_deterministic_keys:
-                        reverse_edge['_key'] = self._generate_deterministic_key(to_id, from_id)
-                    
-                    batch_edges.append(reverse_edge)
+            batch_edges = self.build_edge_documents(
+                matches[i:i + self.batch_size], edge_metadata, bidirectional
+            )
             
             # Insert batch
             if batch_edges:
@@ -222,6 +189,63 @@ class SimilarityEdgeService:
         
         return edges_created
     
+    def build_edge_documents(
+        self,
+        matches: List[Tuple[str, str, float]],
+        edge_metadata: Dict[str, Any],
+        bidirectional: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Build edge documents for matches without inserting them.
+        
+        Used by :meth:`create_edges` and by callers that write edges through
+        another client (e.g. the native async pipeline's bulk imports).
+        
+        Args:
+            matches: List of (doc1_key, doc2_key, score) tuples
+            edge_metadata: Fields copied into every edge
+            bidirectional: If True, also build the reverse edge
+        
+        Returns:
+            Edge documents with ``_from``/``_to``, ``similarity`` and, when
+            deterministic keys are enabled, ``_key``
+        """
+        batch_edges = []
+        for doc1_key, doc2_key, score in matches:
+            # Format vertex IDs
+            from_id = self._format_vertex_id(doc1_key)
+            to_id = self._format_vertex_id(doc2_key)
+            
+            # Create primary edge
+            edge = {
+                '_from': from_id,
+                '_to': to_id,
+                'similarity': round(score, 4),
+                **edge_metadata
+            }
+            
+            # Add deterministic key if enabled
+            if self.use_deterministic_keys:
+                edge['_key'] = self._generate_deterministic_key(from_id, to_id)
+            
+            batch_edges.append(edge)
+            
+            # Create reverse edge if bidirectional
+            if bidirectional:
+                reverse_edge = {
+                    '_from': to_id,
+                    '_to': from_id,
+                    'similarity': round(score, 4),
+                    **edge_metadata
+                }
+                
+                # Add deterministic key for reverse edge if enabled
+                if self.use_deterministic_keys:
+                    reverse_edge['_key'] = self._generate_deterministic_key(to_id, from_id)
+                
+                batch_edges.append(reverse_edge)
+        return batch_edges
+    
     def create_edges_detailed(
         self,
         matches: List[Dict[str, Any]],
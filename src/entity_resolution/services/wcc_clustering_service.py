@@ -13,6 +13,7 @@ import time
 from datetime import datetime
 import logging
 
+from .cluster_membership import ClusterMembershipIndex
 from ..utils.graph_utils import format_vertex_id, extract_key_from_vertex_id
 from ..utils.validation import validate_collection_name
 
@@ -66,6 +67,7 @@ class WCCClusteringService:
         auto_select_threshold_edges: int = 2_000_000,
         sparse_backend_enabled: bool = True,
         gae_config=None,
+        maintain_membership: bool = False,
     ):
         """
         Initialize WCC clustering service.
@@ -86,6 +88,11 @@ class WCCClusteringService:
                 ``python_sparse`` or GAE. Default 2M.
             sparse_backend_enabled: Whether ``auto`` may select ``python_sparse``.
             gae_config: Optional GAEClusteringConfig for GAE backend.
+            maintain_membership: Create the ``<cluster_collection>_membership``
+                member -> cluster index when clusters are stored and keep it
+                in step, so get_cluster_by_member() and feedback re-clustering
+                use indexed lookups instead of scanning cluster member arrays.
+                Default False.
         """
         import warnings
 
@@ -125,6 +132,12 @@ class WCCClusteringService:
         else:
             self.cluster_collection = db.collection(self.cluster_collection_name)
         
+        # The index collection is created on the first store, not here.
+        self.membership: Optional[ClusterMembershipIndex] = (
+            ClusterMembershipIndex(db, self.cluster_collection_name)
+            if maintain_membership else None
+        )
+        
         # Statistics tracking
         self._stats = {
             'total_clusters': 0,
@@ -175,9 +188,7 @@ class WCCClusteringService:
         
         # Store results if requested
         if store_results:
-            if truncate_existing:
-                self.cluster_collection.truncate()
-            self._store_clusters(filtered_clusters)
+            self.store_clusters(filtered_clusters, truncate_existing=truncate_existing)
         
         execution_time = time.time() - start_time
         self._stats['backend_used'] = backend_impl.backend_name()
@@ -192,6 +203,9 @@ class WCCClusteringService:
         """
         Find cluster containing a specific member.
         
+        A primary-index read on the membership index when it is maintained;
+        otherwise a scan of the cluster documents' member arrays.
+        
         Args:
             member_key: Document key to search for
         
@@ -206,7 +220,13 @@ class WCCClusteringService:
                 print(f"Cluster has {cluster['size']} members")
             ```
         """
-        # Format member key properly
+        if self.membership is not None and self.membership.available:
+            cluster_key = self.membership.cluster_key_of(
+                self._extract_key_from_vertex_id(member_key)
+            )
+            return self.cluster_collection.get(cluster_key) if cluster_key else None
+        
+        # No membership index: scan cluster member arrays.
         member_id = self._format_vertex_id(member_key)
         
         query = """
@@ -455,15 +475,55 @@ class WCCClusteringService:
             self.db, self.edge_collection_name, self.vertex_collection
         )
 
-    def _store_clusters(self, clusters: List[List[str]]):
+    def store_clusters(
+        self,
+        clusters: List[List[str]],
+        truncate_existing: bool = True,
+        compute_quality: bool = True,
+    ) -> None:
+        """
+        Store clusters computed outside :meth:`cluster` (e.g. directly from
+        disjoint blocks), keeping the membership index in step.
+
+        Args:
+            clusters: Clusters as lists of document keys.
+            truncate_existing: Clear existing clusters first. Default True.
+            compute_quality: Annotate clusters with similarity-based quality
+                metrics, which reads every edge in the edge collection.
+                Default True; pass False when the clusters did not come from
+                the edges.
+        """
+        run_id = None
+        if self.membership is not None:
+            self.membership.ensure_collection()
+            if not truncate_existing:
+                run_id = self.membership.run_id()
+        if truncate_existing:
+            self.cluster_collection.truncate()
+            if self.membership is not None:
+                self.membership.reset_clusters()
+        self._store_clusters(clusters, run_id=run_id, compute_quality=compute_quality)
+
+    def _store_clusters(
+        self,
+        clusters: List[List[str]],
+        run_id: Optional[str] = None,
+        compute_quality: bool = True,
+    ):
         """
         Store clusters in the cluster collection.
         
         Args:
             clusters: List of clusters to store
+            run_id: Membership run to stamp when appending to clusters the
+                index already describes; a new run otherwise.
+            compute_quality: Add edge-based quality metrics (scans the edges).
         """
+        if self.membership is not None:
+            self.membership.ensure_collection()
+            run_id = run_id or self.membership.new_run_id()
         cluster_docs = []
-        quality_by_members = self._compute_cluster_quality(clusters)
+        quality_by_members = self._compute_cluster_quality(clusters) if compute_quality else {}
         
         for i, cluster_members in enumerate(clusters):
             cluster_doc = {
@@ -476,6 +536,8 @@ class WCCClusteringService:
                 'method': 'aql_graph_traversal'
             }
             cluster_doc.update(quality_by_members.get(tuple(sorted(cluster_members)), {}))
+            if self.membership is not None:
+                cluster_doc['membership_run'] = run_id
             cluster_docs.append(cluster_doc)
         
         if cluster_docs:
@@ -484,6 +546,10 @@ class WCCClusteringService:
             for i in range(0, len(cluster_docs), batch_size):
                 batch = cluster_docs[i:i + batch_size]
                 self.cluster_collection.insert_many(batch)
+            if self.membership is not None:
+                self.membership.assign_many({
+                    doc['_key']: doc['member_keys'] for doc in cluster_docs
+                }, run_id)
 
     def _compute_cluster_quality(self, clusters: List[List[str]]) -> Dict[tuple[str, ...], Dict[str, Any]]:
         """Compute quality metrics for stored clusters from existing edge similarities."""
@@ -11,12 +11,27 @@ collection over all keys), cache it, then join pair features in memory. The
 features are continuous scores in ``[0, 1]`` so they slot into the
 Fellegi-Sunter comparison vector as ordinary fields with their own EM-learned
 m/u.
+
+Two neighbourhood representations are supported (``backend``):
+
+* ``"sets"`` — ``{key: {vertex_id, ...}}`` of strings; simple and mutable (the
+  collective resolver augments it in place between rounds).
+* ``"csr"`` — :class:`NeighborCSR`: vertices interned to integers and each
+  record's neighbourhood stored as a sorted slice of one int32 array. Hub-heavy
+  graphs (shared addresses, phone numbers) no longer hold one string set per
+  record, and :meth:`GraphContextSimilarity.pair_features_batch` computes whole
+  batches of pairs by probing the smaller endpoint's neighbours into the
+  larger endpoint's sorted row.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, List, Sequence, Set
+from collections.abc import Mapping
+from itertools import repeat
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from ..utils.graph_utils import format_vertex_id
 
@@ -24,10 +39,157 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FEATURES = ("shared_neighbor_count", "neighbor_jaccard", "path_within_k")
 
+BACKENDS = ("sets", "csr")
+
+#: Upper bound on neighbour ids probed per vectorized chunk in
+#: :meth:`GraphContextSimilarity.pair_features_batch` (each pair probes its
+#: smaller row, so chunks are sized by degree, not pair count).
+_GATHER_BUDGET = 4_000_000
+
 #: Graph features are namespaced so they never collide with attribute fields.
 FEATURE_PREFIX = "graph_"
 
 
+class NeighborCSR(Mapping):
+    """Read-only ``key -> neighbour vertex ids`` mapping stored as CSR arrays.
+
+    ``indices[indptr[r]:indptr[r + 1]]`` holds the sorted, de-duplicated
+    interned vertex ids of row ``r``. Mapping access (``cache[key]``,
+    ``cache.get(key)``, ``items()``) materialises a frozenset of vertex-id
+    strings, so code written against the ``"sets"`` representation keeps
+    working; hot paths use :meth:`rows_of` / :meth:`vertex_indices` instead.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        vertex_ids: Sequence[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+    ) -> None:
+        self._keys = list(keys)
+        self._row = {k: i for i, k in enumerate(self._keys)}
+        self._vertex_ids = list(vertex_ids)
+        self._vertex_index = {v: i for i, v in enumerate(self._vertex_ids)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self._row_codes: Optional[np.ndarray] = None
+        self._own_vertices: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def build(
+        cls,
+        keys: Sequence[str],
+        neighbor_rows: Iterable[Tuple[str, Iterable[str]]],
+    ) -> "NeighborCSR":
+        """Build from ``(key, vertex_ids)`` rows; repeated keys are unioned."""
+        vertex_index: Dict[str, int] = {}
+        row = {k: i for i, k in enumerate(keys)}
+        parts: List[List[int]] = [[] for _ in keys]
+        for key, vids in neighbor_rows:
+            target = parts[row[key]]
+            for vid in vids:
+                idx = vertex_index.get(vid)
+                if idx is None:
+                    idx = vertex_index[vid] = len(vertex_index)
+                target.append(idx)
+        rows = [np.unique(np.asarray(p, dtype=np.int32)) for p in parts]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([r.size for r in rows], out=indptr[1:])
+        indices = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+        return cls(keys, list(vertex_index), indptr, indices)
+
+    @classmethod
+    def from_sets(
+        cls,
+        cache: Dict[str, Set[str]],
+        keys: Optional[Iterable[str]] = None,
+    ) -> "NeighborCSR":
+        """Convert a ``"sets"`` cache (optionally only ``keys`` of it)."""
+        wanted = list(dict.fromkeys(keys)) if keys is not None else list(cache)
+        return cls.build(wanted, ((k, cache.get(k) or ()) for k in wanted))
+
+    def __getitem__(self, key: str) -> FrozenSet[str]:
+        r = self._row[key]
+        ids = self.indices[self.indptr[r]:self.indptr[r + 1]]
+        return frozenset(self._vertex_ids[i] for i in ids.tolist())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self._vertex_ids)
+
+    def rows_of(self, keys: Sequence[str]) -> np.ndarray:
+        """Row index per key (-1 for keys without a row)."""
+        return np.fromiter(map(self._row.get, keys, repeat(-1)), dtype=np.int64, count=len(keys))
+
+    def vertex_indices(self, vertex_ids: Sequence[str]) -> np.ndarray:
+        """Interned id per vertex id (-1 if no row has it as a neighbour)."""
+        return np.fromiter(
+            map(self._vertex_index.get, vertex_ids, repeat(-1)),
+            dtype=np.int64,
+            count=len(vertex_ids),
+        )
+
+    def own_vertices(self, vertex_collection: str) -> np.ndarray:
+        """Interned id of each row's own vertex (``collection/key``), -1 if absent.
+
+        Cached per collection; used to look up direct record-to-record edges.
+        """
+        own = self._own_vertices.get(vertex_collection)
+        if own is None:
+            own = self._own_vertices[vertex_collection] = self.vertex_indices(
+                [format_vertex_id(k, vertex_collection) for k in self._keys]
+            )
+        return own
+
+    @property
+    def row_codes(self) -> np.ndarray:
+        """``row * num_vertices + vertex`` per stored entry, ascending.
+
+        Rows are laid out in order and sorted within, so the codes are sorted
+        without a sort; membership of ``(row, vertex)`` is one binary search.
+        Built on first use and kept, since the cache is read-only.
+        """
+        if self._row_codes is None:
+            owner = np.repeat(np.arange(len(self._keys), dtype=np.int64), np.diff(self.indptr))
+            self._row_codes = owner * max(self.num_vertices, 1) + self.indices
+        return self._row_codes
+
+    def contains(self, rows: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+        """Whether each ``vertices[i]`` is a neighbour of ``rows[i]`` (-1 never is)."""
+        codes = self.row_codes
+        valid = (rows >= 0) & (vertices >= 0)
+        if not codes.size:
+            return np.zeros(rows.shape, dtype=bool)
+        query = rows * max(self.num_vertices, 1) + vertices
+        # Probing in ascending order keeps the binary searches cache-local.
+        order = np.argsort(query)
+        ordered = query[order]
+        pos = np.minimum(np.searchsorted(codes, ordered), codes.size - 1)
+        found = np.empty(query.shape, dtype=bool)
+        found[order] = codes[pos] == ordered
+        return valid & found
+
+    def degrees(self, rows: np.ndarray) -> np.ndarray:
+        safe = np.maximum(rows, 0)
+        return np.where(rows >= 0, self.indptr[safe + 1] - self.indptr[safe], 0)
+
+    def gather(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """``(owner, vertex)`` for every neighbour of ``rows`` (owner = position in rows)."""
+        lengths = self.degrees(rows)
+        total = int(lengths.sum())
+        owner = np.repeat(np.arange(rows.size, dtype=np.int64), lengths)
+        starts = np.repeat(self.indptr[np.maximum(rows, 0)], lengths)
+        offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return owner, self.indices[starts + offsets].astype(np.int64)
+
+
 class GraphContextSimilarity:
     """Compute batched graph-evidence features for candidate pairs."""
 
@@ -40,13 +202,17 @@ class GraphContextSimilarity:
         max_hops: int = 2,
         features: Sequence[str] = DEFAULT_FEATURES,
         count_saturation: int = 5,
+        backend: str = "sets",
     ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
         self.db = db
         self.vertex_collection = vertex_collection
         self.edge_collections = list(edge_collections)
         self.max_hops = int(max_hops)
         self.features = list(features)
         self.count_saturation = max(1, int(count_saturation))
+        self.backend = backend
 
     def feature_field_names(self) -> List[str]:
         """The field-score keys this service contributes (namespaced)."""
@@ -60,12 +226,21 @@ class GraphContextSimilarity:
 
         One traversal query per configured edge collection over *all* keys;
         results are unioned across collections. Missing collections are skipped.
+        With ``backend="csr"`` the result is a :class:`NeighborCSR` (a read-only
+        mapping with the same keys), built without per-record string sets.
         """
         unique_keys = sorted({k for k in keys if k})
+        if self.backend == "csr":
+            return NeighborCSR.build(unique_keys, self._neighbor_rows(unique_keys))
         cache: Dict[str, Set[str]] = {k: set() for k in unique_keys}
-        if not unique_keys:
-            return cache
+        for key, ns in self._neighbor_rows(unique_keys):
+            cache[key].update(ns)
+        return cache
 
+    def _neighbor_rows(self, unique_keys: List[str]) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(key, neighbour_ids)`` rows, one per key per edge collection."""
+        if not unique_keys:
+            return
         for edge_coll in self.edge_collections:
             try:
                 if not self.db.has_collection(edge_coll):
@@ -82,11 +257,11 @@ class GraphContextSimilarity:
                     """,
                     bind_vars={"keys": unique_keys, "vc": self.vertex_collection, "@edges": edge_coll},
                 )
-                for row in cursor:
-                    cache[row["key"]].update(row.get("ns") or [])
+                rows = [(row["key"], row.get("ns") or []) for row in cursor]
             except Exception as exc:  # a bad edge collection must not kill scoring
                 logger.warning("graph_context: neighbour fetch failed for %r: %s", edge_coll, exc)
-        return cache
+                continue
+            yield from rows
 
     def pair_features(
         self,
@@ -95,6 +270,8 @@ class GraphContextSimilarity:
         cache: Dict[str, Set[str]],
     ) -> Dict[str, float]:
         """Graph feature scores for one pair, from a prefetched neighbour cache."""
+        if isinstance(cache, NeighborCSR):
+            return self.pair_features_batch([(key_a, key_b)], cache)[0]
         na = cache.get(key_a, set())
         nb = cache.get(key_b, set())
         inter = na & nb
@@ -117,3 +294,71 @@ class GraphContextSimilarity:
             connected = direct or (self.max_hops >= 2 and bool(inter))
             out[FEATURE_PREFIX + "path_within_k"] = 1.0 if connected else 0.0
         return out
+
+    def pair_features_batch(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        cache: Dict[str, Set[str]],
+    ) -> List[Dict[str, float]]:
+        """:meth:`pair_features` for many pairs at once.
+
+        With a :class:`NeighborCSR` the features are vectorized: each pair's
+        smaller row is gathered and binary-searched in the larger endpoint's
+        sorted row (:meth:`NeighborCSR.contains`), so the work is the sum of
+        the smaller degrees and nothing is re-sorted. A ``"sets"`` cache is
+        scored pair by pair; converting it would cost more than the join.
+        """
+        if not isinstance(cache, NeighborCSR):
+            return [self.pair_features(a, b, cache) for a, b in pairs]
+        if not pairs:
+            return []
+        keys_a, keys_b = zip(*pairs)
+        rows_a = cache.rows_of(keys_a)
+        rows_b = cache.rows_of(keys_b)
+        deg_a = cache.degrees(rows_a)
+        deg_b = cache.degrees(rows_b)
+        a_smaller = deg_a <= deg_b
+        probe = np.where(a_smaller, rows_a, rows_b)
+        other = np.where(a_smaller, rows_b, rows_a)
+
+        shared = np.zeros(len(pairs), dtype=np.int64)
+        for lo, hi in self._chunks(np.minimum(deg_a, deg_b)):
+            owner, vert = cache.gather(probe[lo:hi])
+            hits = cache.contains(other[lo:hi][owner], vert)
+            shared[lo:hi] = np.bincount(owner[hits], minlength=hi - lo)
+        target_b = np.where(
+            rows_b >= 0, cache.own_vertices(self.vertex_collection)[np.maximum(rows_b, 0)], -1
+        )
+        unrowed = np.flatnonzero(rows_b < 0)
+        if unrowed.size:  # b has no row of its own but may still be a's neighbour
+            target_b[unrowed] = cache.vertex_indices([self._vid(keys_b[i]) for i in unrowed])
+        direct = cache.contains(rows_a, target_b)
+
+        columns: Dict[str, List[float]] = {}
+        if "shared_neighbor_count" in self.features:
+            columns[FEATURE_PREFIX + "shared_neighbor_count"] = (
+                np.minimum(shared, self.count_saturation) / self.count_saturation
+            ).tolist()
+        if "neighbor_jaccard" in self.features:
+            union = deg_a + deg_b - shared
+            columns[FEATURE_PREFIX + "neighbor_jaccard"] = np.divide(
+                shared, union, out=np.zeros(len(pairs)), where=union > 0
+            ).tolist()
+        if "path_within_k" in self.features:
+            connected = direct | ((shared > 0) if self.max_hops >= 2 else False)
+            columns[FEATURE_PREFIX + "path_within_k"] = connected.astype(np.float64).tolist()
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())] if names else [
+            {} for _ in pairs
+        ]
+
+    @staticmethod
+    def _chunks(gathered: np.ndarray) -> Iterator[Tuple[int, int]]:
+        """Split pair positions so each chunk gathers about ``_GATHER_BUDGET`` ids."""
+        bounds = np.cumsum(gathered)
+        lo = 0
+        while lo < gathered.size:
+            start = int(bounds[lo - 1]) if lo else 0
+            hi = max(int(np.searchsorted(bounds, start + _GATHER_BUDGET, side="right")), lo + 1)
+            yield lo, hi
+            lo = hi
@@ -6,10 +6,13 @@ scores across multiple fields between two documents. It supports multiple
 similarity algorithms and configurable field weights.
 """
 
-from typing import Dict, Any, Callable, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple, Union
 import logging
 import re
 
+import numpy as np
+
 # Similarity algorithms
 try:
     import jellyfish
@@ -23,6 +26,64 @@ try:
 except ImportError:
     LEVENSHTEIN_AVAILABLE = False
 
+# Optional batch kernels: rapidfuzz's cpdist scores aligned string arrays in C
+# (cpdist arrived in rapidfuzz 3.6).
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import JaroWinkler as RapidfuzzJaroWinkler
+    from rapidfuzz.distance import Levenshtein as RapidfuzzLevenshtein
+    RAPIDFUZZ_AVAILABLE = hasattr(rapidfuzz_process, "cpdist")
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# MinHash universal hashing (a * id + b) mod p; p = 2**31 - 1 keeps the
+# products inside int64 for token ids below 2**31.
+_MINHASH_PRIME = (1 << 31) - 1
+_MINHASH_SEED = 1729
+
+
+@lru_cache(maxsize=65536)
+def _token_set(value: str) -> frozenset:
+    """Whitespace token set of a normalized string (memoized)."""
+    return frozenset(value.split())
+
+
+class _TokenSets:
+    """
+    Column of strings as interned token ids.
+    
+    Each distinct string is tokenized once into a sorted, de-duplicated int64
+    array of token ids (and, for large sets, a MinHash signature), so set
+    similarities over a batch never rebuild Python sets per comparison.
+    """
+    
+    def __init__(self, minhash_a: Optional[np.ndarray] = None, minhash_b: Optional[np.ndarray] = None):
+        self.vocab: Dict[str, int] = {}
+        self._ids: Dict[str, np.ndarray] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._minhash_a = minhash_a
+        self._minhash_b = minhash_b
+    
+    def ids(self, value: str) -> np.ndarray:
+        arr = self._ids.get(value)
+        if arr is None:
+            vocab = self.vocab
+            arr = np.unique(np.fromiter(
+                (vocab.setdefault(token, len(vocab)) for token in value.split()),
+                dtype=np.int64,
+            ))
+            self._ids[value] = arr
+        return arr
+    
+    def signature(self, value: str) -> np.ndarray:
+        sig = self._signatures.get(value)
+        if sig is None:
+            ids = self.ids(value)
+            sig = ((np.outer(self._minhash_a, ids) + self._minhash_b[:, None])
+                   % _MINHASH_PRIME).min(axis=1)
+            self._signatures[value] = sig
+        return sig
+
 
 class WeightedFieldSimilarity:
     """
@@ -55,11 +116,19 @@ class WeightedFieldSimilarity:
     ALGORITHMS = {
         'jaro_winkler': 'jaro_winkler',
         'levenshtein': 'levenshtein',
-        'jaccard': 'jaccard'
+        'jaccard': 'jaccard',
+        'overlap': 'overlap'
     }
     
+    # Token-set algorithms scored from interned token ids in compute_batch()
+    SET_ALGORITHMS = {'jaccard', 'overlap'}
+    
     # Null handling strategies
     NULL_STRATEGIES = {'skip', 'zero', 'default'}
+
+    # Batch kernel backends for compute_batch()
+    BATCH_BACKENDS = {'auto', 'rapidfuzz', 'numpy'}
+
     VALID_TRANSFORMERS = {
         'strip',
         'lower',
@@ -87,6 +156,11 @@ class WeightedFieldSimilarity:
         handle_nulls: str = "skip",
         normalization_config: Optional[Dict[str, Any]] = None,
         field_transformers: Optional[Dict[str, Union[str, list[Union[str, Dict[str, Any]]]]]] = None,
+        batch_backend: str = "auto",
+        batch_workers: int = 1,
+        minhash_threshold: Optional[int] = None,
+        minhash_permutations: int = 128,
+        prenormalized_fields: Optional[Sequence[str]] = None,
     ):
         """
         Initialize weighted field similarity.
@@ -99,6 +173,7 @@ class WeightedFieldSimilarity:
                 - "jaro_winkler" (default, best for names, requires jellyfish)
                 - "levenshtein" (edit distance, requires python-Levenshtein)
                 - "jaccard" (set-based similarity, built-in)
+                - "overlap" (overlap coefficient |A & B| / min(|A|, |B|), built-in)
                 - Custom callable: (str1, str2) -> float (0.0-1.0)
             normalize: Whether to normalize weights to sum to 1.0. Default True.
             handle_nulls: How to handle missing/null values:
@@ -125,6 +200,27 @@ class WeightedFieldSimilarity:
                 A transformer that blanks a value (e.g. missing_sentinels) makes
                 the field follow handle_nulls, so under "skip" it becomes the
                 null comparison level rather than a spurious agreement.
+            batch_backend: Kernel used by compute_batch() / similarity_batch():
+                - "auto" (default): rapidfuzz when installed and the algorithm
+                  has a rapidfuzz kernel, else "numpy"
+                - "rapidfuzz": process.cpdist over aligned string arrays
+                  (jaro_winkler and levenshtein only; requires rapidfuzz>=3.6)
+                - "numpy": per-pair loop into a NumPy score vector, calling
+                  the scalar algorithm once per distinct value pair
+                Both backends return exactly the scalar algorithm's scores.
+                Set algorithms (jaccard, overlap) always use interned token
+                ids and one sorted-merge intersection over the whole batch.
+            batch_workers: Threads for the rapidfuzz kernel (-1 = all cores).
+            minhash_threshold: For set algorithms in compute_batch(), pairs
+                where both sides have at least this many distinct tokens are
+                estimated from MinHash signatures instead of intersected
+                exactly. Default None (always exact).
+            minhash_permutations: MinHash signature length. Default 128
+                (standard error of the Jaccard estimate ~0.09 at J=0.5).
+            prenormalized_fields: Fields whose values already arrive with
+                normalization_config applied (e.g. normalized in the AQL
+                projection), so it is not applied again. Fields with
+                transformers are always normalized here.
         
         Raises:
             ValueError: If configuration is invalid
@@ -133,6 +229,11 @@ class WeightedFieldSimilarity:
         if not field_weights:
             raise ValueError("field_weights cannot be empty")
         
+        if minhash_threshold is not None and minhash_threshold < 1:
+            raise ValueError(f"minhash_threshold must be >= 1, got: {minhash_threshold}")
+        if minhash_permutations < 1:
+            raise ValueError(f"minhash_permutations must be >= 1, got: {minhash_permutations}")
+        
         if handle_nulls not in self.NULL_STRATEGIES:
             raise ValueError(
                 f"handle_nulls must be one of {self.NULL_STRATEGIES}, "
@@ -162,10 +263,22 @@ class WeightedFieldSimilarity:
         }
         self.normalization_config = {**default_norm, **(normalization_config or {})}
         self.field_transformers = self._normalize_field_transformers(field_transformers or {})
+        self.prenormalized_fields = set(prenormalized_fields or ()) - set(self.field_transformers)
         
         # Set up similarity algorithm
         self.similarity_fn = self._setup_algorithm(algorithm)
         self.algorithm_name = algorithm if isinstance(algorithm, str) else "custom"
+        self.batch_workers = batch_workers
+        self.batch_backend = self._setup_batch_backend(batch_backend)
+        self.set_algorithm = (
+            self.algorithm_name.lower()
+            if isinstance(algorithm, str) and self.algorithm_name.lower() in self.SET_ALGORITHMS
+            else None
+        )
+        self.minhash_threshold = minhash_threshold
+        rng = np.random.default_rng(_MINHASH_SEED)
+        self._minhash_a = rng.integers(1, _MINHASH_PRIME, size=minhash_permutations, dtype=np.int64)
+        self._minhash_b = rng.integers(0, _MINHASH_PRIME, size=minhash_permutations, dtype=np.int64)
         
         # Initialize logger
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -313,6 +426,248 @@ class WeightedFieldSimilarity:
             'weighted_score': weighted_score
         }
     
+    def compute_batch(
+        self,
+        docs1: Sequence[Dict[str, Any]],
+        docs2: Sequence[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Compute weighted similarity for aligned lists of document pairs.
+        
+        Equivalent to ``[compute(a, b) for a, b in zip(docs1, docs2)]`` — same
+        null handling and rounding — but each field is normalized once per
+        distinct value and scored for the whole batch with one kernel call
+        (see ``batch_backend``), removing the per-comparison Python call.
+        
+        Args:
+            docs1: Left documents
+            docs2: Right documents, aligned with docs1
+        
+        Returns:
+            Float array of weighted scores (0.0-1.0), one per pair
+        """
+        return self.compute_batch_detailed(docs1, docs2)[0]
+    
+    def compute_batch_detailed(
+        self,
+        docs1: Sequence[Dict[str, Any]],
+        docs2: Sequence[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Batch counterpart of :meth:`compute_detailed`.
+        
+        Args:
+            docs1: Left documents
+            docs2: Right documents, aligned with docs1
+        
+        Returns:
+            ``(scores, field_scores)``: the :meth:`compute_batch` scores, and
+            per field an array of that field's similarity, NaN where the field
+            did not count toward the weighted score (skipped null or failed
+            comparison)
+        """
+        if len(docs1) != len(docs2):
+            raise ValueError("docs1 and docs2 must have the same length")
+        n = len(docs1)
+        total_score = np.zeros(n)
+        total_weight = np.zeros(n)
+        field_scores: Dict[str, np.ndarray] = {}
+        
+        for field, weight in self.field_weights.items():
+            left = self._normalize_column(field, [d.get(field) for d in docs1])
+            right = self._normalize_column(field, [d.get(field) for d in docs2])
+            present = np.fromiter(
+                (bool(a) and bool(b) for a, b in zip(left, right)), dtype=bool, count=n
+            )
+            # "default" compares even blank values, mirroring compute().
+            compared = present if self.handle_nulls != "default" else np.ones(n, dtype=bool)
+            
+            scores = np.zeros(n)
+            idx = np.flatnonzero(compared)
+            if idx.size:
+                scores[idx] = self.similarity_batch(
+                    [left[i] for i in idx], [right[i] for i in idx]
+                )
+            failed = np.isnan(scores)
+            scores[failed] = 0.0
+            
+            if self.handle_nulls == "skip":
+                counted = present & ~failed
+            else:
+                counted = ~failed
+            total_score += np.where(counted, scores * weight, 0.0)
+            total_weight += np.where(counted, weight, 0.0)
+            field_scores[field] = np.where(counted, scores, np.nan)
+        
+        ratio = np.divide(
+            total_score, total_weight, out=np.zeros(n), where=total_weight > 0
+        )
+        # Python's round() (not np.round) so scores match compute() exactly.
+        return np.array([round(x, 4) for x in ratio.tolist()], dtype=float), field_scores
+    
+    def similarity_batch(
+        self,
+        left: Sequence[str],
+        right: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Score aligned arrays of already-normalized strings with the configured
+        algorithm.
+        
+        Args:
+            left: Left strings
+            right: Right strings, aligned with left
+        
+        Returns:
+            Float array of similarities; NaN where the algorithm raised
+        """
+        if len(left) != len(right):
+            raise ValueError("left and right must have the same length")
+        if not len(left):
+            return np.zeros(0)
+        if self.set_algorithm is not None:
+            return self._token_set_similarity(left, right)
+        if self.batch_backend == "rapidfuzz":
+            scores = rapidfuzz_process.cpdist(
+                left, right,
+                scorer=self._rapidfuzz_scorer(),
+                dtype=np.float64,
+                workers=self.batch_workers,
+            )
+            # The scalar algorithms disagree with rapidfuzz only on blank
+            # input (jellyfish scores two blanks 0.0); defer to them there.
+            for i in (i for i, (a, b) in enumerate(zip(left, right)) if not a or not b):
+                scores[i] = self._safe_similarity(left[i], right[i])
+            return scores
+        return self._loop_similarity(left, right)
+    
+    def _normalize_column(self, field: str, values: Sequence[Any]) -> list:
+        """Normalize a column of raw values, once per distinct value."""
+        cache: Dict[str, str] = {}
+        out = []
+        for value in values:
+            raw = str(value) if value is not None else ''
+            norm = cache.get(raw)
+            if norm is None:
+                norm = cache[raw] = self._normalize_value(field, raw)
+            out.append(norm)
+        return out
+    
+    def _token_set_similarity(self, left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+        """Jaccard / overlap over interned token ids for a whole batch."""
+        n = len(left)
+        table = _TokenSets(self._minhash_a, self._minhash_b)
+        ids_left = [table.ids(s) for s in left]
+        ids_right = [table.ids(s) for s in right]
+        len_left = np.fromiter(map(len, ids_left), dtype=np.int64, count=n)
+        len_right = np.fromiter(map(len, ids_right), dtype=np.int64, count=n)
+        
+        intersection = np.zeros(n)
+        if self.minhash_threshold is not None:
+            sketched = (len_left >= self.minhash_threshold) & (len_right >= self.minhash_threshold)
+        else:
+            sketched = np.zeros(n, dtype=bool)
+        exact = np.flatnonzero(~sketched)
+        if exact.size:
+            intersection[exact] = self._merge_intersections(
+                [ids_left[i] for i in exact], [ids_right[i] for i in exact], len(table.vocab)
+            )
+        sketch = np.flatnonzero(sketched)
+        if sketch.size:
+            # One signature per distinct value, gathered by row index.
+            rows: Dict[str, int] = {}
+            row_left = [rows.setdefault(left[i], len(rows)) for i in sketch]
+            row_right = [rows.setdefault(right[i], len(rows)) for i in sketch]
+            signatures = np.stack([table.signature(value) for value in rows])
+            estimate = (signatures[row_left] == signatures[row_right]).mean(axis=1)
+            # |A & B| from J = |A & B| / (|A| + |B| - |A & B|)
+            intersection[sketch] = (
+                estimate * (len_left[sketch] + len_right[sketch]) / (1.0 + estimate)
+            )
+        
+        if self.set_algorithm == "overlap":
+            denominator = np.minimum(len_left, len_right).astype(float)
+        else:
+            denominator = (len_left + len_right) - intersection
+        scores = np.divide(
+            intersection, denominator, out=np.zeros(n), where=denominator > 0
+        )
+        # Same edge cases as the scalar functions: two empty sets are equal.
+        scores[(len_left == 0) & (len_right == 0)] = 1.0
+        return scores
+    
+    @staticmethod
+    def _merge_intersections(
+        ids_left: List[np.ndarray],
+        ids_right: List[np.ndarray],
+        vocab_size: int
+    ) -> np.ndarray:
+        """
+        Intersection sizes of aligned sorted token-id arrays.
+        
+        Offsetting every id by ``pair_index * vocab_size`` makes the keys of
+        different pairs disjoint, so a single sorted merge (intersect1d) over
+        the concatenated batch yields all pairwise intersections at once.
+        """
+        n = len(ids_left)
+        stride = max(vocab_size, 1)
+        
+        def keys(ids: List[np.ndarray]) -> np.ndarray:
+            lengths = np.fromiter(map(len, ids), dtype=np.int64, count=n)
+            return np.repeat(np.arange(n, dtype=np.int64) * stride, lengths) + np.concatenate(ids)
+        
+        common = np.intersect1d(keys(ids_left), keys(ids_right), assume_unique=True)
+        return np.bincount(common // stride, minlength=n)
+    
+    def _loop_similarity(self, left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+        """NumPy fallback kernel: one scalar call per distinct value pair."""
+        cache: Dict[tuple, float] = {}
+        scores = np.empty(len(left))
+        for i, pair in enumerate(zip(left, right)):
+            score = cache.get(pair)
+            if score is None:
+                score = cache[pair] = self._safe_similarity(*pair)
+            scores[i] = score
+        return scores
+    
+    def _safe_similarity(self, str1: str, str2: str) -> float:
+        try:
+            return self.similarity_fn(str1, str2)
+        except Exception as e:
+            self.logger.warning(f"Similarity computation failed: {e}", exc_info=True)
+            return float("nan")
+    
+    def _rapidfuzz_scorer(self) -> Optional[Callable[..., float]]:
+        """rapidfuzz kernel equivalent to the configured algorithm, if any."""
+        if not RAPIDFUZZ_AVAILABLE or not isinstance(self.algorithm_name, str):
+            return None
+        return {
+            "jaro_winkler": RapidfuzzJaroWinkler.normalized_similarity,
+            "levenshtein": RapidfuzzLevenshtein.normalized_similarity,
+        }.get(self.algorithm_name.lower())
+    
+    def _setup_batch_backend(self, batch_backend: str) -> str:
+        """Resolve the batch kernel backend ("auto" -> concrete backend)."""
+        if batch_backend not in self.BATCH_BACKENDS:
+            raise ValueError(
+                f"batch_backend must be one of {self.BATCH_BACKENDS}, got: {batch_backend}"
+            )
+        if batch_backend == "rapidfuzz":
+            if not RAPIDFUZZ_AVAILABLE:
+                raise ImportError(
+                    "rapidfuzz>=3.6 required for batch_backend='rapidfuzz'. "
+                    "Install with: pip install rapidfuzz"
+                )
+            if self._rapidfuzz_scorer() is None:
+                raise ValueError(
+                    f"batch_backend='rapidfuzz' has no kernel for algorithm "
+                    f"'{self.algorithm_name}'; use 'numpy' or 'auto'"
+                )
+            return "rapidfuzz"
+        if batch_backend == "auto" and self._rapidfuzz_scorer() is not None:
+            return "rapidfuzz"
+        return "numpy"
+    
     def _normalize_value(self, field: str, value: str) -> str:
         """
         Normalize a string value according to configuration.
@@ -324,6 +679,9 @@ class WeightedFieldSimilarity:
         Returns:
             Normalized string
         """
+        if field in self.prenormalized_fields:
+            return value
+
         value = self._apply_field_transformers(field, value)
 
         if self.normalization_config.get('strip'):
@@ -614,18 +972,26 @@ class WeightedFieldSimilarity:
                     "python-Levenshtein library required for levenshtein algorithm. "
                     "Install with: pip install python-Levenshtein"
                 )
-            # Normalize to 0-1 range
-            return lambda s1, s2: 1.0 - (Levenshtein.distance(s1, s2) / max(len(s1), len(s2), 1))
+            return self._levenshtein_similarity
         
         elif algorithm == "jaccard":
             return self._jaccard_similarity
         
+        elif algorithm == "overlap":
+            return self._overlap_similarity
+        
         else:
             raise ValueError(
                 f"Unknown algorithm: {algorithm}. "
-                f"Supported: 'jaro_winkler', 'levenshtein', 'jaccard', or custom callable"
+                f"Supported: 'jaro_winkler', 'levenshtein', 'jaccard', 'overlap', "
+                f"or custom callable"
             )
     
+    @staticmethod
+    def _levenshtein_similarity(str1: str, str2: str) -> float:
+        """Edit distance normalized to 0-1 by the longer string's length."""
+        return 1.0 - (Levenshtein.distance(str1, str2) / max(len(str1), len(str2), 1))
+    
     @staticmethod
     def _jaccard_similarity(str1: str, str2: str) -> float:
         """
@@ -638,8 +1004,8 @@ class WeightedFieldSimilarity:
         Returns:
             Jaccard similarity (0.0-1.0)
         """
-        set1 = set(str1.split())
-        set2 = set(str2.split())
+        set1 = _token_set(str1)
+        set2 = _token_set(str2)
         
         if not set1 and not set2:
             return 1.0
@@ -647,10 +1013,35 @@ class WeightedFieldSimilarity:
             return 0.0
         
         intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        union = len(set1) + len(set2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
+    @staticmethod
+    def _overlap_similarity(str1: str, str2: str) -> float:
+        """
+        Compute the overlap coefficient between two strings (word-based).
+        
+        Unlike Jaccard, a short value fully contained in a longer one scores
+        1.0 (e.g. "MAIN ST" vs "MAIN ST SUITE 200").
+        
+        Args:
+            str1: First string
+            str2: Second string
+        
+        Returns:
+            Overlap coefficient (0.0-1.0)
+        """
+        set1 = _token_set(str1)
+        set2 = _token_set(str2)
+        
+        if not set1 and not set2:
+            return 1.0
+        if not set1 or not set2:
+            return 0.0
+        
+        return len(set1 & set2) / min(len(set1), len(set2))
+    
     def __repr__(self) -> str:
         """String representation."""
         fields_str = ', '.join(self.field_weights.keys())
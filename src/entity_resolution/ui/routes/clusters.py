@@ -125,6 +125,37 @@ async def cluster_stats(request: Request, collection: str) -> Dict[str, Any]:
     return results[0] if results else {"total_clusters": 0, "size_distribution": {}}
 
 
+@router.get("/{collection}/by-member/{member_key}")
+async def cluster_by_member(
+    request: Request, collection: str, member_key: str
+) -> Dict[str, Any]:
+    """Cluster containing a record, via the member -> cluster index."""
+    from entity_resolution.services.cluster_membership import ClusterMembershipIndex
+    from entity_resolution.utils.validation import validate_collection_name
+
+    validate_collection_name(collection)
+    db = _db(request)
+
+    from entity_resolution.ui.routes.collections import resolve_collection_name
+    cluster_coll = resolve_collection_name(request, f"{collection}_clusters")
+    if not db.has_collection(cluster_coll):
+        return {"error": f"Cluster collection {cluster_coll} not found"}
+
+    membership = ClusterMembershipIndex(db, cluster_coll, create=False)
+    if membership.available:
+        cluster_key = membership.cluster_key_of(member_key)
+    else:
+        # Clusters stored without the index: fall back to a member-array scan.
+        rows = list(db.aql.execute(
+            "FOR c IN @@coll FILTER @key IN c.member_keys LIMIT 1 RETURN c._key",
+            bind_vars={"@coll": cluster_coll, "key": member_key},
+        ))
+        cluster_key = rows[0] if rows else None
+    if cluster_key is None:
+        return {"error": f"Record '{member_key}' is not in any cluster"}
+    return await cluster_detail(request, collection, cluster_key)
+
+
 @router.get("/{collection}/{key}")
 async def cluster_detail(request: Request, collection: str, key: str) -> Dict[str, Any]:
     """Full cluster detail with member documents."""
@@ -63,6 +63,7 @@ def _build_applier(request: Request, collection: str):
         vertex_collection=collection,
         cluster_collection=cluster_coll,
         golden_collection=golden_coll,
+        scoped=True,
     )
     return applier, cluster_coll
 
@@ -219,6 +219,18 @@ async def apply_golden_record(
         "fieldOverrides": field_overrides,
         **({"mergeStrategy": body.merge_strategy} if body.merge_strategy else {}),
     }
+
+    # Keep member -> golden lookups (feedback staleness checks) pointing here;
+    # without the index the record is left unstamped so they fall back to a scan.
+    from entity_resolution.services.cluster_membership import (
+        GOLDEN_INDEXED_FIELD,
+        ClusterMembershipIndex,
+    )
+
+    membership = ClusterMembershipIndex(db, f"{collection}_clusters", create=False)
+    if membership.available:
+        membership.set_golden({k: key for k in body.member_keys})
+        doc[GOLDEN_INDEXED_FIELD] = True
     coll.insert(doc, overwrite=True)
 
     actor = getattr(request.state, "reviewer", None) or "human"
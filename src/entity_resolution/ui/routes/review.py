@@ -192,6 +192,7 @@ async def submit_verdict(
             vertex_collection=collection,
             cluster_collection=cluster_coll,
             golden_collection=golden_coll,
+            scoped=True,
         )
         try:
             result = applier.apply_and_recluster(
@@ -253,6 +254,7 @@ async def batch_verdict(
         applier = FeedbackApplicationService(
             db=db, edge_collection=edge_coll, vertex_collection=collection,
             cluster_collection=cluster_coll, golden_collection=golden_coll,
+            scoped=True,
         )
 
     results: List[Dict[str, Any]] = []
@@ -0,0 +1,216 @@
+"""
+Native asyncio client for the ArangoDB HTTP API.
+
+python-arango is synchronous, so async callers normally park a thread on
+every in-flight request. This thin client talks to the REST API directly
+through ``httpx.AsyncClient`` and covers what the async pipeline's data
+plane needs:
+
+- AQL cursors read batch by batch (``aql``), so results stream into the
+  caller while the server prepares the next batch
+- bulk imports (``import_documents``) split into chunks that are sent
+  concurrently, bounded by ``max_concurrent_imports``
+
+Requires the optional ``httpx`` dependency::
+
+    pip install "arango-entity-resolution[async]"
+
+Usage::
+
+    async with AsyncArangoClient("http://localhost:8529", database="er",
+                                 username="root", password=pw) as client:
+        async for batch in client.aql("FOR d IN companies RETURN d._key"):
+            ...
+        await client.import_documents("similarTo", edges, on_duplicate="ignore")
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from urllib.parse import quote
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_IMPORT_COUNTERS = ("created", "errors", "empty", "updated", "ignored")
+
+
+class AsyncArangoError(RuntimeError):
+    """An ArangoDB HTTP API call failed.
+
+    ``http_status`` is the HTTP status code and ``error_num`` the ArangoDB
+    error number, when the server reported one.
+    """
+
+    def __init__(self, message: str, http_status: int, error_num: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.http_status = http_status
+        self.error_num = error_num
+
+
+class AsyncArangoClient:
+    """Minimal async ArangoDB client for cursors and bulk imports.
+
+    Parameters
+    ----------
+    hosts:
+        Server URL, e.g. ``"http://localhost:8529"``.
+    database:
+        Database name; requests go to ``/_db/<database>/...``.
+    username, password:
+        Basic-auth credentials.
+    max_connections:
+        HTTP connection pool size shared by all concurrent requests.
+    max_concurrent_imports:
+        Import chunks in flight at once per :meth:`import_documents` call.
+    timeout:
+        Per-request timeout in seconds.
+    transport:
+        Optional ``httpx`` transport (tests pass ``httpx.MockTransport``).
+    """
+
+    def __init__(
+        self,
+        hosts: str = "http://localhost:8529",
+        database: str = "_system",
+        username: str = "root",
+        password: str = "",
+        max_connections: int = 16,
+        max_concurrent_imports: int = 4,
+        timeout: float = 60.0,
+        transport: Optional[Any] = None,
+    ) -> None:
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx is required for the native async client. "
+                "Install with: pip install \"arango-entity-resolution[async]\""
+            )
+        if max_concurrent_imports < 1:
+            raise ValueError(f"max_concurrent_imports must be >= 1, got {max_concurrent_imports}")
+
+        self.database = database
+        self.max_concurrent_imports = max_concurrent_imports
+        self._http = httpx.AsyncClient(
+            base_url=f"{hosts.rstrip('/')}/_db/{quote(database, safe='')}",
+            auth=(username, password),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncArangoClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def aql(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        stream: bool = True,
+    ) -> AsyncIterator[List[Any]]:
+        """Run an AQL query and yield its results one server batch at a time.
+
+        With ``stream=True`` (default) the server produces results lazily
+        instead of materializing the whole result set first. A cursor left
+        open because the caller stopped iterating early is deleted.
+        """
+        body = await self._request(
+            "POST",
+            "/_api/cursor",
+            json={
+                "query": query,
+                "bindVars": bind_vars or {},
+                "batchSize": batch_size,
+                "options": {"stream": stream},
+            },
+        )
+        cursor_id = body.get("id")
+        try:
+            yield body.get("result", [])
+            while body.get("hasMore"):
+                body = await self._request("PUT", f"/_api/cursor/{cursor_id}")
+                yield body.get("result", [])
+        finally:
+            if body.get("hasMore") and cursor_id:
+                try:
+                    await self._request("DELETE", f"/_api/cursor/{cursor_id}")
+                except Exception as exc:
+                    logger.debug("Failed to delete cursor %s: %s", cursor_id, exc)
+
+    async def aql_all(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+    ) -> List[Any]:
+        """Run an AQL query and return all results as one list."""
+        results: List[Any] = []
+        async for batch in self.aql(query, bind_vars=bind_vars, batch_size=batch_size):
+            results.extend(batch)
+        return results
+
+    async def import_documents(
+        self,
+        collection: str,
+        documents: Sequence[Dict[str, Any]],
+        on_duplicate: str = "error",
+        chunk_size: int = 1000,
+    ) -> Dict[str, int]:
+        """Bulk-import documents through ``/_api/import``.
+
+        Chunks of ``chunk_size`` documents are sent concurrently, at most
+        ``max_concurrent_imports`` at a time. ``on_duplicate`` is passed
+        through (``"error"``, ``"update"``, ``"replace"`` or ``"ignore"``).
+
+        Returns the summed server counters: ``created``, ``errors``,
+        ``empty``, ``updated`` and ``ignored``.
+        """
+        totals = {name: 0 for name in _IMPORT_COUNTERS}
+        if not documents:
+            return totals
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_imports)
+        params = {"collection": collection, "type": "list", "onDuplicate": on_duplicate}
+
+        async def send(chunk: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._request("POST", "/_api/import", params=params, json=list(chunk))
+
+        replies = await asyncio.gather(*(
+            send(documents[i:i + chunk_size]) for i in range(0, len(documents), chunk_size)
+        ))
+        for reply in replies:
+            for name in _IMPORT_COUNTERS:
+                totals[name] += int(reply.get(name, 0))
+        if totals["errors"]:
+            logger.warning(
+                "Import into %s reported %d document errors", collection, totals["errors"]
+            )
+        return totals
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        response = await self._http.request(method, path, **kwargs)
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if response.status_code >= 400 or body.get("error"):
+            raise AsyncArangoError(
+                body.get("errorMessage") or f"HTTP {response.status_code} for {method} {path}",
+                http_status=response.status_code,
+                error_num=body.get("errorNum"),
+            )
+        return body
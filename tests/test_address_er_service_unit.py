@@ -169,3 +169,85 @@ def test_run_uses_csv_or_api_edge_loading_and_optional_clustering(monkeypatch) -
     assert out2["edges_created"] == 7
     assert out2["clusters_found"] is None
 
+
+
+@pytest.mark.parametrize(
+    "topology, expected",
+    [
+        ("clique", [("a/1", "a/2"), ("a/1", "a/3"), ("a/1", "a/4"), ("a/2", "a/3"), ("a/2", "a/4"), ("a/3", "a/4")]),
+        ("star", [("a/1", "a/2"), ("a/1", "a/3"), ("a/1", "a/4")]),
+        ("chain", [("a/1", "a/2"), ("a/2", "a/3"), ("a/3", "a/4")]),
+    ],
+)
+def test_create_edges_follows_edge_topology(topology, expected) -> None:
+    db = _FakeDB()
+    svc = AddressERService(
+        db=db, collection="addresses", edge_collection="address_sameAs",
+        config={"edge_batch_size": 2, "edge_topology": topology},
+    )
+    blocks = {"k1": ["a/1", "a/2", "a/3", "a/4"], "k2": ["a/5", "a/6"]}
+    created = svc._create_edges(blocks)
+    assert created == svc._count_block_edges(blocks) == len(expected) + 1
+    pairs = [(e["_from"], e["_to"]) for e in db.collection("address_sameAs").inserted]
+    assert pairs == expected + [("a/5", "a/6")]
+
+
+def test_unknown_edge_topology_rejected() -> None:
+    with pytest.raises(ValueError, match="edge_topology"):
+        AddressERService(db=_FakeDB(), config={"edge_topology": "mesh"})
+
+
+def test_run_cluster_from_blocks_skips_edges(monkeypatch) -> None:
+    import entity_resolution.services.address_er_service as mod
+
+    stored = {}
+
+    class _FakeWCC:
+        def __init__(self, **kwargs):
+            stored["init"] = kwargs
+
+        def store_clusters(self, clusters, truncate_existing=True, compute_quality=True):
+            stored["clusters"] = clusters
+            stored["compute_quality"] = compute_quality
+
+    monkeypatch.setattr(mod, "WCCClusteringService", _FakeWCC)
+    db = _FakeDB()
+    svc = AddressERService(db=db, collection="addresses")
+    _empty_skip = {"blocks_skipped_max_size": 0, "largest_skipped_block_size": 0, "skipped_block_samples": []}
+    blocks = {"k1": ["addresses/3", "addresses/1"], "k2": ["addresses/4", "addresses/5", "addresses/6"]}
+    monkeypatch.setattr(svc, "_find_duplicate_addresses", lambda max_block_size: (blocks, 5, _empty_skip))
+
+    out = svc.run(create_edges=False, cluster=True, min_cluster_size=3, cluster_from_blocks=True)
+
+    assert out["edges_created"] == 0
+    assert out["clusters_found"] == 1
+    assert stored["clusters"] == [["4", "5", "6"]]
+    assert stored["init"]["vertex_collection"] == "addresses"
+    assert stored["compute_quality"] is False
+    assert not db.has_collection("address_sameAs")
+
+
+def test_cluster_from_blocks_never_queries_edge_collection(monkeypatch) -> None:
+    class _RecordingDB(_FakeDB):
+        def collection(self, name: str):
+            # WCC takes a handle to the edge collection up front; any use of
+            # it would go through AQL, recorded below.
+            return self._collections.get(name) or _FakeEdgeCollection()
+
+    db = _RecordingDB()
+    svc = AddressERService(db=db, collection="addresses")
+    _empty_skip = {"blocks_skipped_max_size": 0, "largest_skipped_block_size": 0, "skipped_block_samples": []}
+    blocks = {"k1": ["addresses/1", "addresses/2"], "k2": ["addresses/3", "addresses/4"]}
+    monkeypatch.setattr(svc, "_find_duplicate_addresses", lambda max_block_size: (blocks, 4, _empty_skip))
+
+    out = svc.run(create_edges=False, cluster=True, min_cluster_size=2, cluster_from_blocks=True)
+
+    assert out["clusters_found"] == 2
+    stored = db._collections["addresses_clusters"].inserted
+    assert [d["member_keys"] for d in stored] == [["1", "2"], ["3", "4"]]
+    assert "quality_score" not in stored[0]
+    edge_queries = [
+        c for c in db.aql.calls
+        if svc.edge_collection in c["bind_vars"].values() or "@edge_collection" in c["bind_vars"]
+    ]
+    assert edge_queries == []
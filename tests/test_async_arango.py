@@ -0,0 +1,305 @@
+"""
+Tests for the native async ArangoDB client and AsyncERPipeline's native path.
+
+ArangoDB's HTTP API is simulated with ``httpx.MockTransport``; no live
+server required.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from entity_resolution.utils.async_arango import AsyncArangoClient, AsyncArangoError
+
+
+class FakeArango:
+    """Just enough of the cursor and import APIs for the client."""
+
+    def __init__(self, cursor_batches: List[List[Any]], documents: Dict[str, Dict[str, Any]] = None):
+        self.cursor_batches = cursor_batches
+        self.documents = documents or {}
+        self.requests: List[httpx.Request] = []
+        self.imports: List[Dict[str, Any]] = []
+        self.deleted: List[str] = []
+        self.position = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if request.method == "POST" and path.endswith("/_api/cursor"):
+            body = json.loads(request.content)
+            if "keys" in body["bindVars"]:
+                docs = [self.documents[k] for k in body["bindVars"]["keys"] if k in self.documents]
+                return httpx.Response(201, json={"result": docs, "hasMore": False})
+            return self._batch(0)
+        if request.method == "PUT" and path.endswith("/_api/cursor/c1"):
+            return self._batch(self.position + 1)
+        if request.method == "DELETE" and "/_api/cursor/" in path:
+            self.deleted.append(path.rsplit("/", 1)[1])
+            return httpx.Response(202, json={"error": False})
+        if request.method == "POST" and path.endswith("/_api/import"):
+            docs = json.loads(request.content)
+            self.imports.append({"params": dict(request.url.params), "docs": docs})
+            return httpx.Response(201, json={"created": len(docs), "errors": 0})
+        return httpx.Response(404, json={"error": True, "errorNum": 404, "errorMessage": "not found"})
+
+    def _batch(self, index: int) -> httpx.Response:
+        self.position = index
+        has_more = index + 1 < len(self.cursor_batches)
+        body = {"result": self.cursor_batches[index], "hasMore": has_more}
+        if has_more:
+            body["id"] = "c1"
+        return httpx.Response(201, json=body)
+
+
+def _client(fake: FakeArango, **kwargs) -> AsyncArangoClient:
+    return AsyncArangoClient(
+        "http://arango:8529", database="er", transport=httpx.MockTransport(fake), **kwargs
+    )
+
+
+class TestAsyncArangoClient:
+    def test_aql_yields_each_server_batch(self):
+        fake = FakeArango([[1, 2], [3], [4, 5]])
+
+        async def run():
+            async with _client(fake) as client:
+                return [batch async for batch in client.aql("FOR x IN 1..5 RETURN x", batch_size=2)]
+
+        assert asyncio.run(run()) == [[1, 2], [3], [4, 5]]
+        first = json.loads(fake.requests[0].content)
+        assert first["batchSize"] == 2
+        assert first["options"] == {"stream": True}
+        assert fake.requests[0].url.path == "/_db/er/_api/cursor"
+        assert [r.method for r in fake.requests] == ["POST", "PUT", "PUT"]
+
+    def test_cursor_deleted_when_iteration_stops_early(self):
+        fake = FakeArango([[1], [2], [3]])
+
+        async def run():
+            async with _client(fake) as client:
+                gen = client.aql("FOR x IN 1..3 RETURN x")
+                async for _ in gen:
+                    break
+                await gen.aclose()
+
+        asyncio.run(run())
+        assert fake.deleted == ["c1"]
+
+    def test_import_documents_chunks_and_sums_counters(self):
+        fake = FakeArango([])
+        docs = [{"_key": str(i)} for i in range(5)]
+
+        async def run():
+            async with _client(fake, max_concurrent_imports=2) as client:
+                return await client.import_documents("edges", docs, on_duplicate="ignore", chunk_size=2)
+
+        totals = asyncio.run(run())
+        assert totals["created"] == 5
+        assert sorted(len(i["docs"]) for i in fake.imports) == [1, 2, 2]
+        assert fake.imports[0]["params"] == {
+            "collection": "edges", "type": "list", "onDuplicate": "ignore",
+        }
+
+    def test_server_error_raises(self):
+        def handler(request):
+            return httpx.Response(
+                400, json={"error": True, "errorNum": 1501, "errorMessage": "syntax error"}
+            )
+
+        async def run():
+            async with AsyncArangoClient(transport=httpx.MockTransport(handler)) as client:
+                await client.aql_all("FOR")
+
+        with pytest.raises(AsyncArangoError, match="syntax error") as excinfo:
+            asyncio.run(run())
+        assert excinfo.value.error_num == 1501
+        assert excinfo.value.http_status == 400
+
+    def test_rejects_invalid_import_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrent_imports"):
+            AsyncArangoClient(max_concurrent_imports=0)
+
+
+class TestAsyncERPipelineNative:
+    DOCUMENTS = {
+        "a": {"_key": "a", "name": "ACME"},
+        "b": {"_key": "b", "name": "ACME"},
+        "c": {"_key": "c", "name": "GLOBEX"},
+        "d": {"_key": "d", "name": "GLOBEX"},
+        "e": {"_key": "e", "name": "INITECH"},
+        "f": {"_key": "f", "name": "UMBRELLA"},
+    }
+
+    def _make_config(self, **similarity):
+        from entity_resolution.config.er_config import (
+            BlockingConfig, ClusteringConfig, ERPipelineConfig, SimilarityConfig,
+        )
+        return ERPipelineConfig(
+            entity_type="company",
+            collection_name="companies",
+            edge_collection="similarTo",
+            blocking=BlockingConfig(strategy="exact", fields=["name"]),
+            similarity=SimilarityConfig(threshold=0.9, field_weights={"name": 1.0}, **similarity),
+            clustering=ClusteringConfig(),
+        )
+
+    def _services(self):
+        from entity_resolution.services.batch_similarity_service import BatchSimilarityService
+        from entity_resolution.services.similarity_edge_service import SimilarityEdgeService
+
+        sync_pipeline = MagicMock()
+        sync_pipeline.run_clustering.return_value = [["a", "b"], ["c", "d"]]
+        sim = BatchSimilarityService(
+            db=MagicMock(), collection="companies", field_weights={"name": 1.0}
+        )
+        edges = SimilarityEdgeService(db=MagicMock(), edge_collection="similarTo", batch_size=1000)
+        return sync_pipeline, sim, edges
+
+    def test_native_run_streams_partial_results_per_chunk(self):
+        from entity_resolution.core.async_pipeline import AsyncERPipeline
+
+        fake = FakeArango(
+            cursor_batches=[
+                [{"doc1_key": "b", "doc2_key": "a"}, {"doc1_key": "c", "doc2_key": "d"}],
+                [{"doc1_key": "e", "doc2_key": "f"}],
+            ],
+            documents=self.DOCUMENTS,
+        )
+        seen = []
+
+        async def callback(stage, result):
+            seen.append((stage, result["partial"]))
+
+        async def run():
+            async with _client(fake) as client:
+                pipeline = AsyncERPipeline(
+                    db=MagicMock(), config=self._make_config(), client=client,
+                    chunk_size=2, progress_callback=callback,
+                )
+                with patch.object(pipeline, "_prepare_native_services", return_value=self._services()):
+                    return [event async for event in pipeline.run_streaming()]
+
+        events = asyncio.run(run())
+        partial = [(stage, r["chunk"]) for stage, r in events if r["partial"]]
+        assert partial == [("blocking", 0), ("similarity", 0), ("blocking", 1), ("similarity", 1)]
+        assert [m[:2] for m in events[1][1]["matches"]] == [("a", "b"), ("c", "d")]
+        assert events[3][1]["matches"] == []
+
+        summaries = {stage: r for stage, r in events if not r["partial"]}
+        assert summaries["blocking"]["total_unique_pairs"] == 3
+        assert summaries["blocking"]["chunks"] == 2
+        assert summaries["similarity"]["matches_found"] == 2
+        assert summaries["similarity"]["edges_created"] == 2
+        assert summaries["clustering"]["clusters_found"] == 2
+        assert len(seen) == len(events)
+
+        (edge_import,) = fake.imports
+        assert edge_import["params"]["collection"] == "similarTo"
+        assert edge_import["params"]["onDuplicate"] == "ignore"
+        assert {e["_from"] for e in edge_import["docs"]} == {"vertices/a", "vertices/c"}
+        assert all("_key" in e for e in edge_import["docs"])
+
+    def test_native_and_executor_runs_write_the_same_edges(self, monkeypatch):
+        from entity_resolution.core.async_pipeline import AsyncERPipeline
+        from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
+
+        monkeypatch.setenv("ER_NO_MIGRATE", "1")
+        monkeypatch.setattr(ConfigurableERPipeline, "run_clustering", lambda self: [["a", "b"], ["c", "d"]])
+        pairs = [{"doc1_key": "a", "doc2_key": "b"}, {"doc1_key": "c", "doc2_key": "d"},
+                 {"doc1_key": "e", "doc2_key": "f"}]
+
+        sync_db = MagicMock()
+        sync_db.aql.execute.side_effect = lambda query, bind_vars=None, **kw: iter(
+            [self.DOCUMENTS[k] for k in bind_vars["keys"] if k in self.DOCUMENTS]
+        )
+        with patch.object(ConfigurableERPipeline, "run_blocking", return_value=pairs):
+            sync_results = ConfigurableERPipeline(db=sync_db, config=self._make_config()).run()
+        sync_edges = [
+            edge for call in sync_db.collection.return_value.insert_many.call_args_list
+            for edge in call.args[0]
+        ]
+
+        fake = FakeArango(cursor_batches=[pairs], documents=self.DOCUMENTS)
+
+        async def run():
+            async with _client(fake) as client:
+                pipeline = AsyncERPipeline(db=MagicMock(), config=self._make_config(), client=client)
+                return await pipeline.run()
+
+        native_results = asyncio.run(run())
+        native_edges = [edge for i in fake.imports for edge in i["docs"]]
+
+        def comparable(edges):
+            return sorted(({k: v for k, v in e.items() if k != "timestamp"} for e in edges),
+                          key=lambda e: e["_key"])
+
+        assert len(sync_edges) == 2
+        assert comparable(native_edges) == comparable(sync_edges)
+        assert native_results["similarity"]["matches_found"] == sync_results["similarity"]["matches_found"]
+        assert native_results["clustering"]["clusters_found"] == sync_results["clustering"]["clusters_found"]
+
+    def test_configs_the_native_path_cannot_honour_run_the_sync_pipeline(self):
+        from entity_resolution.core.async_pipeline import AsyncERPipeline
+        from entity_resolution.core.configurable_pipeline import ConfigurableERPipeline
+
+        fake = FakeArango(cursor_batches=[[]])
+        sync_results = {
+            "blocking": {"candidate_pairs": 4},
+            "similarity": {"matches_found": 2, "auto_threshold": {"threshold": 0.8}},
+            "total_runtime_seconds": 0.1,
+        }
+
+        async def run():
+            async with _client(fake) as client:
+                pipeline = AsyncERPipeline(
+                    db=MagicMock(), config=self._make_config(auto_threshold=True), client=client,
+                )
+                assert pipeline._native_unsupported_features() == ["similarity.auto_threshold"]
+                with patch.object(ConfigurableERPipeline, "run", return_value=sync_results):
+                    return [event async for event in pipeline.run_streaming()]
+
+        events = asyncio.run(run())
+        assert events == [
+            ("blocking", {"candidate_pairs": 4, "partial": False}),
+            ("similarity", {"matches_found": 2, "auto_threshold": {"threshold": 0.8}, "partial": False}),
+        ]
+        assert fake.requests == []
+
+    def test_run_returns_stage_summaries_on_native_path(self):
+        from entity_resolution.core.async_pipeline import AsyncERPipeline
+
+        fake = FakeArango(cursor_batches=[[]])
+
+        async def run():
+            async with _client(fake) as client:
+                pipeline = AsyncERPipeline(db=MagicMock(), config=self._make_config(), client=client)
+                with patch.object(pipeline, "_prepare_native_services", return_value=self._services()):
+                    return await pipeline.run()
+
+        results = asyncio.run(run())
+        assert results["blocking"]["total_unique_pairs"] == 0
+        assert results["similarity"]["partial"] is False
+        assert results["similarity"]["edges_created"] == 0
+        assert fake.imports == []
+
+    def test_blocking_failure_propagates(self):
+        from entity_resolution.core.async_pipeline import AsyncERPipeline
+
+        def handler(request):
+            return httpx.Response(500, json={"error": True, "errorMessage": "boom"})
+
+        async def run():
+            async with AsyncArangoClient(transport=httpx.MockTransport(handler)) as client:
+                pipeline = AsyncERPipeline(db=MagicMock(), config=self._make_config(), client=client)
+                with patch.object(pipeline, "_prepare_native_services", return_value=self._services()):
+                    return await pipeline.run()
+
+        with pytest.raises(AsyncArangoError, match="boom"):
+            asyncio.run(run())
@@ -0,0 +1,161 @@
+"""
+Unit tests for BatchSimilarityService document fetching.
+
+DB-free: a fake AQL executor serves the projection query from an in-memory
+collection, optionally failing the first few calls.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from entity_resolution.services.batch_similarity_service import BatchSimilarityService
+
+
+class FakeAQL:
+    def __init__(self, documents: Dict[str, Dict[str, Any]], failures: int = 0):
+        self.documents = documents
+        self.failures = failures
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def execute(self, query: str, bind_vars: Dict[str, Any], **kwargs: Any):
+        with self._lock:
+            self.calls.append({"query": query, "bind_vars": bind_vars, **kwargs})
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("connection reset")
+        return iter(
+            {"_key": k, "name": self.documents[k]["name"]}
+            for k in bind_vars["keys"] if k in self.documents
+        )
+
+
+def _service(aql: FakeAQL, **kwargs) -> BatchSimilarityService:
+    db = MagicMock()
+    db.aql = aql
+    kwargs.setdefault("fetch_retry_backoff_seconds", 0.0)
+    return BatchSimilarityService(db=db, collection="companies", field_weights={"name": 1.0}, **kwargs)
+
+
+DOCS = {str(i): {"name": f"Company {i}"} for i in range(10)}
+
+
+class TestBatchFetchDocuments:
+    def test_fetch_uses_primary_index_lookup_and_projection(self):
+        aql = FakeAQL(DOCS)
+        docs = _service(aql, batch_size=4).batch_fetch_documents(list(DOCS))
+
+        assert set(docs) == set(DOCS)
+        assert len(aql.calls) == 3
+        call = aql.calls[0]
+        assert "DOCUMENT(@@collection, @keys)" in call["query"]
+        assert "FILTER" not in call["query"]
+        assert call["bind_vars"]["@collection"] == "companies"
+        assert call["batch_size"] == len(call["bind_vars"]["keys"])
+
+    def test_chunks_are_fetched_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class SlowAQL(FakeAQL):
+            def execute(self, query, bind_vars, **kwargs):
+                barrier.wait()  # deadlocks unless two chunks are in flight
+                return super().execute(query, bind_vars, **kwargs)
+
+        aql = SlowAQL(DOCS)
+        docs = _service(aql, batch_size=5, fetch_concurrency=2).batch_fetch_documents(list(DOCS))
+        assert set(docs) == set(DOCS)
+
+    def test_failed_chunk_is_retried_with_backoff_not_per_key(self):
+        aql = FakeAQL(DOCS, failures=2)
+        service = _service(aql, batch_size=10, fetch_retry_backoff_seconds=0.1)
+        with patch("entity_resolution.services.batch_similarity_service.time.sleep") as sleep:
+            docs = service.batch_fetch_documents(list(DOCS))
+
+        assert set(docs) == set(DOCS)
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2]
+        assert service.get_statistics()["fetch_retries"] == 2
+        service.db.collection.assert_not_called()
+
+    def test_chunk_failing_after_retries_raises(self):
+        aql = FakeAQL(DOCS, failures=100)
+        service = _service(aql, batch_size=10, fetch_retries=2)
+        with pytest.raises(ConnectionError, match="connection reset"):
+            service.batch_fetch_documents(list(DOCS))
+        assert len(aql.calls) == 3
+
+    def test_partial_fetch_leaves_out_failed_chunk_when_allowed(self):
+        aql = FakeAQL(DOCS, failures=3)
+        service = _service(
+            aql, batch_size=5, fetch_concurrency=1, fetch_retries=2, allow_partial_fetch=True,
+        )
+        docs = service.batch_fetch_documents(list(DOCS))
+
+        assert set(docs) == {str(i) for i in range(5, 10)}
+        assert len(aql.calls) == 4
+        stats = service.get_statistics()
+        assert stats["fetch_failed_keys"] == 5
+        assert stats["fetch_retries"] == 2
+
+    def test_retries_from_concurrent_chunks_are_all_counted(self):
+        aql = FakeAQL(DOCS, failures=4)
+        service = _service(aql, batch_size=2, fetch_concurrency=4, fetch_retries=5)
+        docs = service.batch_fetch_documents(list(DOCS))
+
+        assert set(docs) == set(DOCS)
+        assert service.get_statistics()["fetch_retries"] == 4
+
+    def test_rejects_invalid_fetch_settings(self):
+        with pytest.raises(ValueError, match="fetch_concurrency"):
+            _service(FakeAQL({}), fetch_concurrency=0)
+        with pytest.raises(ValueError, match="fetch_retries"):
+            _service(FakeAQL({}), fetch_retries=-1)
+
+
+class TestServerSideNormalization:
+    def test_projection_applies_normalization_in_python_order(self):
+        service = _service(
+            FakeAQL({}),
+            server_side_normalization=True,
+            normalization_config={"remove_punctuation": True},
+        )
+        query = service.fetch_query()
+        assert (
+            'REGEX_REPLACE(TRIM(REGEX_REPLACE(UPPER(TRIM(doc.name || "")), "\\\\s+", " ")), '
+            in query
+        )
+        assert service.similarity_computer.prenormalized_fields == {"name"}
+
+    def test_fields_with_transformers_stay_in_python(self):
+        db = MagicMock()
+        service = BatchSimilarityService(
+            db=db,
+            collection="companies",
+            field_weights={"name": 0.5, "phone": 0.5},
+            field_transformers={"phone": ["digits_only"]},
+            server_side_normalization=True,
+        )
+        query = service.fetch_query()
+        assert '"phone": doc.phone || ""' in query
+        assert "UPPER(TRIM(doc.name" in query
+        assert service.similarity_computer.prenormalized_fields == {"name"}
+
+    def test_prenormalized_values_score_like_python_normalized_ones(self):
+        plain = _service(FakeAQL({}))
+        pushed = _service(FakeAQL({}), server_side_normalization=True)
+
+        raw = plain.similarity_computer.compute({"name": "  acme   corp "}, {"name": "ACME CORP"})
+        # What the AQL projection returns for "  acme   corp ":
+        pre = pushed.similarity_computer.compute({"name": "ACME CORP"}, {"name": "ACME CORP"})
+        assert raw == pre == 1.0
+        # Pushed fields are not normalized again in Python.
+        assert pushed.similarity_computer._normalize_value("name", " x ") == " x "
+
+    def test_default_projection_unchanged(self):
+        query = _service(FakeAQL({})).fetch_query()
+        assert '"name": doc.name || ""' in query
+        assert "UPPER" not in query
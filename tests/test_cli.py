@@ -2079,3 +2079,52 @@ def test_cli_benchmark_outputs_results(runner: CliRunner, monkeypatch: pytest.Mo
     assert payload["metadata"]["collection"] == "companies"
     assert payload["output_files"]["json"] == "a.json"
 
+
+
+def test_cli_watch_retries_failed_batch_record_by_record(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from types import SimpleNamespace
+
+    import entity_resolution.core.incremental_maintainer as maintainer_module
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("entity_resolution: {}\n")
+    calls: Dict[str, Any] = {"pending": [], "single": []}
+
+    class FakePipeline:
+        def __init__(self, db: object, config_path: str):
+            self.config = SimpleNamespace(
+                collection_name="people", edge_collection="edges",
+                cluster_collection="clusters", similarity=SimpleNamespace(threshold=0.8),
+            )
+
+        def _effective_field_weights(self) -> Dict[str, float]:
+            return {"name": 1.0}
+
+    class FakeMaintainer:
+        def __init__(self, **kwargs: Any):
+            pass
+
+        def pending_keys(self, limit: int = 100):
+            calls["pending"].append(limit)
+            return ["a", "bad", "c"]
+
+        def resolve_many(self, keys):
+            raise ValueError("bad record in batch")
+
+        def resolve_and_commit(self, key):
+            calls["single"].append(key)
+            if key == "bad":
+                raise ValueError("malformed name")
+            return {"key": key, "matches": [], "recluster": None}
+
+    monkeypatch.setattr(cli_module, "_get_db_from_options", lambda *args: object())
+    monkeypatch.setattr(cli_module, "ConfigurableERPipeline", FakePipeline)
+    monkeypatch.setattr(maintainer_module, "IncrementalMaintainer", FakeMaintainer)
+
+    result = runner.invoke(cli_module.main, ["watch", "--config", str(config_path), "--once"])
+    assert result.exit_code == 0
+    assert calls["single"] == ["a", "bad", "c"]
+    assert "bad: malformed name; skipping" in result.output
+    assert "Resolved 2 record(s)" in result.output
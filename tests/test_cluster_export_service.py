@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+import pytest
+
 from entity_resolution.services.cluster_export_service import ClusterExportService
 
 
@@ -132,3 +135,100 @@ def test_export_writes_json_and_csv(tmp_path: Path, monkeypatch) -> None:
         rows = list(csv.DictReader(handle))
     assert rows[0]["cluster_id"] == "cluster_1"
     assert rows[0]["member_keys"] == "a1|b1"
+
+
+def _stream_db(raw_clusters: List[Dict[str, Any]]) -> FakeDB:
+    def dispatch(query: str, bind_vars: Optional[Dict[str, Any]]) -> Iterable[Any]:
+        if "RETURN c" in query:
+            limit = (bind_vars or {}).get("limit")
+            return raw_clusters[:limit] if limit is not None else raw_clusters
+        return []
+
+    return FakeDB(
+        collections={"companies": FakeCollection(10), "companies_clusters": FakeCollection(len(raw_clusters))},
+        aql=FakeAQL(dispatch=dispatch),
+    )
+
+
+def _raw_clusters(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "_key": f"cluster_{i}",
+            "members": [f"companies/a{i}", f"companies/b{i}"],
+            "average_similarity": 0.8 + i / 100,
+            "quality_score": 0.5 + i / 100 if i % 2 == 0 else None,
+        }
+        for i in range(n)
+    ]
+
+
+def test_export_stream_shards_csv_and_jsonl(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        "entity_resolution.services.cluster_export_service.get_pipeline_statistics",
+        lambda *args, **kwargs: {"clusters": {"total": 5}},
+    )
+    db = _stream_db(_raw_clusters(5))
+    service = ClusterExportService(db=db, source_collection="companies")
+
+    exported = service.export_stream(
+        output_dir=str(tmp_path),
+        filename_prefix="clusters",
+        formats=("csv", "jsonl"),
+        batch_size=2,
+        rows_per_shard=3,
+    )
+
+    assert exported["clusters_exported"] == 5
+    assert [len(exported["files"][fmt]) for fmt in ("csv", "jsonl")] == [2, 2]
+    assert exported["files"]["csv"][0].endswith("_00000.csv")
+
+    rows = []
+    for path in exported["files"]["csv"]:
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows.extend(csv.DictReader(handle))
+    assert [r["cluster_id"] for r in rows] == [f"cluster_{i}" for i in range(5)]
+    assert rows[0]["member_keys"] == "a0|b0"
+
+    lines = []
+    for path in exported["files"]["jsonl"]:
+        lines.extend(Path(path).read_text(encoding="utf-8").splitlines())
+    assert json.loads(lines[4])["member_keys"] == ["a4", "b4"]
+
+    # The cluster query is streamed and unsorted by default.
+    cluster_call = next(c for c in db.aql.calls if "RETURN c" in c["query"])
+    assert "SORT" not in cluster_call["query"]
+
+    summary = json.loads(Path(exported["summary"]).read_text(encoding="utf-8"))
+    assert summary["clusters_exported"] == 5
+    assert summary["stats"]["quality"] == ClusterExportService._quality_summary(
+        service._load_clusters()
+    )
+    assert summary["stats"]["quality"]["clusters_with_quality"] == 3
+
+
+def test_export_stream_gzip_and_limit(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        "entity_resolution.services.cluster_export_service.get_pipeline_statistics",
+        lambda *args, **kwargs: {},
+    )
+    service = ClusterExportService(db=_stream_db(_raw_clusters(5)), source_collection="companies")
+
+    exported = service.export_stream(
+        output_dir=str(tmp_path), formats=("jsonl",), limit=3, compression="gzip"
+    )
+
+    (path,) = exported["files"]["jsonl"]
+    assert path.endswith(".jsonl.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        assert len(handle.read().splitlines()) == 3
+    assert exported["clusters_exported"] == 3
+
+
+def test_export_stream_rejects_bad_options(tmp_path: Path) -> None:
+    service = ClusterExportService(db=_stream_db([]), source_collection="companies")
+    with pytest.raises(ValueError, match="formats"):
+        service.export_stream(str(tmp_path), formats=("xml",))
+    with pytest.raises(ValueError, match="compression"):
+        service.export_stream(str(tmp_path), compression="zip")
+    with pytest.raises(ValueError, match="rows_per_shard"):
+        service.export_stream(str(tmp_path), rows_per_shard=0)
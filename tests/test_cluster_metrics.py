@@ -0,0 +1,65 @@
+"""Parity tests for the contingency-count cluster metrics."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from entity_resolution.services import cluster_metrics
+from entity_resolution.services.cluster_metrics import b_cubed, pairwise_closure_metrics
+
+
+def _set_based(predicted, truth, all_records=None):
+    """Reference results from the set-based definitions (contingency path disabled)."""
+    original = cluster_metrics._Contingency.build
+    cluster_metrics._Contingency.build = classmethod(lambda cls, *a, **k: None)
+    try:
+        return (
+            b_cubed(predicted, truth, all_records),
+            pairwise_closure_metrics(predicted, truth),
+        )
+    finally:
+        cluster_metrics._Contingency.build = original
+
+
+def _random_partition(records, rng):
+    clusters, current = [], []
+    for record in records:
+        current.append(record)
+        if rng.random() < 0.35:
+            clusters.append(current)
+            current = []
+    if current:
+        clusters.append(current)
+    return clusters
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_contingency_metrics_match_set_based_definitions(seed):
+    rng = random.Random(seed)
+    records = [f"r{i}" for i in range(60)]
+    predicted = _random_partition(rng.sample(records, 50), rng)
+    truth = _random_partition(rng.sample(records, 45), rng)
+
+    for all_records in (None, records):
+        expected_b3, expected_pw = _set_based(predicted, truth, all_records)
+        assert b_cubed(predicted, truth, all_records) == pytest.approx(expected_b3)
+        assert pairwise_closure_metrics(predicted, truth) == pytest.approx(expected_pw)
+
+
+def test_overlapping_clusters_fall_back_to_set_semantics():
+    predicted = [["a", "b"], ["b", "c"]]  # b in two clusters: not a partition
+    truth = [["a", "b", "c"]]
+    assert cluster_metrics._Contingency.build(predicted, truth) is None
+
+    out = pairwise_closure_metrics(predicted, truth)
+    assert out["predicted_pairs"] == 2
+    assert out["true_positives"] == 2
+    assert b_cubed(predicted, truth)["records_evaluated"] == 3
+
+
+def test_duplicate_members_and_empty_clusters_are_ignored():
+    out = pairwise_closure_metrics([["a", "a", "b"], []], [["a", "b"]])
+    assert out["predicted_pairs"] == 1
+    assert out["precision"] == pytest.approx(1.0)
@@ -115,3 +115,105 @@ def test_pipeline_config_parses_collective():
     assert cfg.collective.enabled and cfg.collective.max_rounds == 4
     assert cfg.validate() == [] or all("collective" not in e for e in cfg.validate())
     assert cfg.to_dict()["entity_resolution"]["collective"]["max_rounds"] == 4
+
+
+# --- incremental mode ---
+
+def _lift_scorer(calls):
+    attr = {("A", "B"): 0.9}
+
+    def score(pairs, cache):
+        calls.append(list(pairs))
+        out = []
+        for a, b in pairs:
+            name = attr.get((a, b), attr.get((b, a), 0.0))
+            shared = 1.0 if (cache.get(a, set()) & cache.get(b, set())) else 0.0
+            out.append((a, b, max(name, shared)))
+        return out
+
+    return score
+
+
+def test_incremental_matches_full_rescoring_and_scores_fewer_pairs():
+    base = {"A": set(), "B": {"Acme"}, "C": {"Acme"}, "D": {"Acme"},
+            "X": {"Other"}, "Y": set(), "Z": set()}
+    pairs = [("A", "B"), ("A", "C"), ("A", "D"), ("X", "Y"), ("Y", "Z")]
+
+    results = {}
+    calls = {}
+    for incremental in (False, True):
+        calls[incremental] = []
+        results[incremental] = CollectiveResolver(
+            score_pairs=_lift_scorer(calls[incremental]), cluster=connected_components,
+            base_neighbor_cache=base, threshold=0.7, max_rounds=5, incremental=incremental,
+        ).resolve(pairs)
+
+    full, inc = results[False], results[True]
+    assert inc["converged"] and full["converged"]
+    assert sorted(inc["clusters"]) == sorted(full["clusters"]) == [["A", "B", "C", "D"]]
+    assert inc["rounds"] == full["rounds"]
+    assert full["pairs_scored"] == [5] * full["rounds"]
+    # Round 2 only re-scores pairs touching A/B (whose sets changed); X-Y, Y-Z never again.
+    assert inc["pairs_scored"][0] == 5
+    assert all(n < 5 for n in inc["pairs_scored"][1:])
+    assert not any(("X", "Y") in batch for batch in calls[True][1:])
+
+
+def test_augment_delta_reports_only_changed_records():
+    resolver = CollectiveResolver(
+        score_pairs=lambda p, c: [], cluster=connected_components,
+        base_neighbor_cache={"A": {"n1"}, "B": {"n2"}, "C": {"n3"}}, threshold=0.5,
+    )
+    base = resolver.base_neighbor_cache
+    cache, changed, clustered = resolver._augment_delta([["A", "B"], ["C"]], dict(base), set())
+    assert changed == {"A", "B"} == clustered
+    assert cache["A"] == {"n1", "n2"}
+    assert cache["C"] is base["C"]  # untouched records share the base set
+
+    # Same clustering again: nothing changed.
+    _, changed, _ = resolver._augment_delta([["A", "B"]], cache, clustered)
+    assert changed == set()
+
+    # Split: A and B fall back to their base sets.
+    _, changed, _ = resolver._augment_delta([["A"], ["B"]], cache, clustered)
+    assert changed == {"A", "B"}
+
+
+def test_compute_similarities_cached_reuses_attribute_scores(monkeypatch):
+    from entity_resolution.services.batch_similarity_service import BatchSimilarityService
+
+    docs = {"A": {"_key": "A", "name": "Globex"}, "B": {"_key": "B", "name": "Globex"},
+            "C": {"_key": "C", "name": "Initech"}}
+    fetches = []
+
+    class _Graph:
+        def pair_features(self, a, b, cache):
+            shared = cache.get(a, set()) & cache.get(b, set())
+            return {"graph_shared": 1.0 if shared else 0.0}
+
+    class _FS:
+        def score(self, field_scores, exact_values=None):
+            return max(field_scores.get("name") or 0.0, field_scores.get("graph_shared", 0.0))
+
+    sim = BatchSimilarityService(
+        db=None, collection="people", field_weights={"name": 1.0},
+        scoring_method="fellegi_sunter", fs_scorer=_FS(), graph_context=_Graph(),
+    )
+
+    def fetch(keys):
+        fetches.append(sorted(keys))
+        return {k: docs[k] for k in keys if k in docs}
+
+    monkeypatch.setattr(sim, "batch_fetch_documents", fetch)
+
+    attribute_cache = {}
+    pairs = [("A", "B"), ("A", "C"), ("A", "missing")]
+    first = sim.compute_similarities_cached(pairs, attribute_cache, neighbor_cache={})
+    assert [(a, b) for a, b, _ in first] == [("A", "B"), ("A", "C")]
+    assert dict(((a, b), s) for a, b, s in first)[("A", "C")] < 0.7
+
+    second = sim.compute_similarities_cached(
+        pairs, attribute_cache, neighbor_cache={"A": {"o1"}, "C": {"o1"}}
+    )
+    assert dict(((a, b), s) for a, b, s in second)[("A", "C")] == 1.0
+    assert len(fetches) == 1  # documents fetched and compared once
@@ -491,6 +491,13 @@ def test_run_similarity_with_active_learning_overrides_uncertain_scores(monkeypa
                 "score_override": 0.92,
             }
 
+        def verify_batch(self, pairs, field_scores_list=None):
+            assert len(pairs) == 1
+            return [
+                self.verify(a, b, s, fs)
+                for (a, b, s), fs in zip(pairs, field_scores_list)
+            ]
+
     monkeypatch.setattr(pipe, "_build_active_learning_verifier", lambda: _FakeVerifier())
     matches = pipe._run_similarity_with_active_learning(_FakeSimilarityService(), [("a", "b"), ("c", "d")])
     assert matches == [("a", "b", 0.92), ("c", "d", 0.9)]
@@ -524,6 +531,42 @@ def test_run_similarity_passes_transformers_to_batch_service(monkeypatch) -> Non
     assert captured["field_transformers"] == {"phone": ["digits_only"]}
 
 
+def test_build_similarity_service_passes_batch_workers() -> None:
+    cfg = _FakeConfig()
+    cfg.similarity.field_weights = {"name": 1.0}
+    cfg.similarity.batch_workers = 4
+    service = ConfigurableERPipeline(db=_FakeDB(), config=cfg).build_similarity_service()
+
+    assert service.similarity_computer.batch_workers == 4
+
+
+def test_minhash_settings_reach_similarity_scoring_from_pipeline_config() -> None:
+    from unittest.mock import MagicMock
+
+    from entity_resolution.config.er_config import ERPipelineConfig
+
+    def score(similarity: dict) -> float:
+        cfg = ERPipelineConfig.from_dict({
+            "entity_type": "product",
+            "collection_name": "products",
+            "blocking": {"strategy": "exact", "fields": ["title"]},
+            "similarity": {"algorithm": "jaccard", "field_weights": {"title": 1.0}, **similarity},
+        })
+        service = ConfigurableERPipeline(db=MagicMock(), config=cfg).build_similarity_service()
+        docs = {
+            "a": {"title": " ".join(f"t{i}" for i in range(40))},
+            "b": {"title": " ".join(f"t{i}" for i in range(20, 60))},
+        }
+        ((_, _, value),) = service.score_pairs([("a", "b")], docs, threshold=0.0, return_all=True)
+        return value
+
+    exact = score({})
+    assert exact == pytest.approx(1 / 3, abs=1e-4)
+    # 40-token sets clear the threshold, so the score is a MinHash estimate.
+    assert score({"minhash_threshold": 8, "minhash_permutations": 64}) != exact
+    assert score({"minhash_threshold": 100}) == exact
+
+
 # ---------------------------------------------------------------------------
 # Tests for #5 — BM25 blocking field resolution
 # ---------------------------------------------------------------------------
@@ -161,7 +161,10 @@ def test_match_entities_executes_batches_and_creates_edges() -> None:
     db = _FakeDB(edge_collection=edge)
     svc = _configured_service(db, search_view=None)
 
-    stats = svc.match_entities(threshold=0.85, batch_size=10, limit=None, use_bm25=False, mark_as_inferred=True)
+    stats = svc.match_entities(
+        threshold=0.85, batch_size=10, limit=None, use_bm25=False, mark_as_inferred=True,
+        pagination="offset",
+    )
     assert stats["edges_created"] == 1
     assert stats["candidates_evaluated"] == 1
     assert stats["batches_processed"] == 1
@@ -172,6 +175,230 @@ def test_match_entities_executes_batches_and_creates_edges() -> None:
     assert match_calls
 
 
+class _KeysetAQL:
+    """Serves key pages, the matched-edge scan, and one match per key."""
+
+    def __init__(self, source_keys, matched_ids=(), fail_after=None):
+        self.source_keys = sorted(source_keys)
+        self.matched_ids = list(matched_ids)
+        self.fail_after = fail_after
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        q = str(query)
+        bv = dict(bind_vars or {})
+        self.calls.append({"query": q, "bind_vars": bv, "kwargs": dict(kwargs)})
+        if "COLLECT WITH COUNT INTO cnt" in q:
+            return [len(self.source_keys)]
+        if "RETURN DISTINCT e._to" in q:
+            return list(self.matched_ids)
+        if q.rstrip().endswith("RETURN s._key"):
+            after = bv.get("after_key")
+            keys = [k for k in self.source_keys if after is None or k > after]
+            return keys[: bv["batch_size"]]
+        if "FILTER s._key IN @keys" in q:
+            if self.fail_after is not None and max(bv["keys"]) > self.fail_after:
+                raise RuntimeError("query killed")
+            return [
+                {"source_key": k, "target_key": f"t_{k}", "confidence": 0.9, "field_scores": {}}
+                for k in bv["keys"]
+            ]
+        return []
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_keyset_matching_skips_matched_keys_and_pages_by_key(concurrency) -> None:
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    db.aql = _KeysetAQL(
+        [f"s{i:02d}" for i in range(10)],
+        matched_ids=["source/s03", "source/s04", "other/s05"],
+    )
+    svc = _configured_service(db, search_view=None)
+    progress = []
+
+    stats = svc.match_entities(
+        batch_size=3, use_bm25=False, concurrency=concurrency,
+        progress_callback=lambda done, total: progress.append(done),
+    )
+
+    assert [e["_to"] for e in edge.inserted] == [
+        f"source/s{i:02d}" for i in range(10) if i not in (3, 4)
+    ]
+    assert stats["source_records_processed"] == 8
+    assert stats["batches_processed"] == 4  # page [s03 s04 s05] holds one key
+    assert stats["last_key"] == "s09"
+    assert progress == sorted(progress)
+
+    match_calls = [c for c in db.aql.calls if "FILTER s._key IN @keys" in c["query"]]
+    assert all("@@edge_collection" not in c["query"] for c in match_calls)
+    assert all("LIMIT @offset" not in c["query"] for c in match_calls)
+    # Only declared bind parameters are sent (AQL rejects unused ones).
+    assert all("@search_view" not in c["bind_vars"] for c in match_calls)
+    assert all("@edge_collection" not in c["bind_vars"] for c in match_calls)
+    assert all("_filter_s_0_eq" not in c["bind_vars"] for c in match_calls)
+    page_calls = [c for c in db.aql.calls if c["query"].rstrip().endswith("RETURN s._key")]
+    assert "FILTER s.state == @_filter_s_0_eq" in page_calls[0]["query"]
+    assert "after_key" not in page_calls[0]["bind_vars"]
+
+
+def test_keyset_matching_resumes_after_key_and_honours_limit() -> None:
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    db.aql = _KeysetAQL([f"s{i:02d}" for i in range(10)])
+    svc = _configured_service(db, search_view=None)
+
+    stats = svc.match_entities(batch_size=4, use_bm25=False, after_key="s02", limit=5)
+
+    assert [e["_to"] for e in edge.inserted] == [f"source/s{i:02d}" for i in range(3, 8)]
+    assert stats["last_key"] == "s07"
+
+
+def test_keyset_matching_stops_at_failed_batch_with_safe_resume_key() -> None:
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    db.aql = _KeysetAQL([f"s{i:02d}" for i in range(10)], fail_after="s05")
+    svc = _configured_service(db, search_view=None)
+
+    stats = svc.match_entities(batch_size=3, use_bm25=False, concurrency=2)
+
+    assert stats["last_key"] == "s05"
+    assert len(edge.inserted) == 6
+
+
+def test_keyset_rejects_offset_and_bad_concurrency() -> None:
+    svc = _configured_service(_FakeDB())
+    with pytest.raises(ValueError, match="after_key"):
+        svc.match_entities(offset=10)
+    with pytest.raises(ValueError, match="concurrency"):
+        svc.match_entities(concurrency=0)
+    with pytest.raises(ValueError, match="pagination"):
+        svc.match_entities(pagination="cursor")
+
+
+class _LocalScoringAQL(_KeysetAQL):
+    """Adds candidate-key and projected-fetch queries for local scoring."""
+
+    def __init__(self, sources, targets, candidates):
+        super().__init__(list(sources))
+        self.sources = sources
+        self.targets = targets
+        self.candidates = candidates
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        q = str(query)
+        bv = dict(bind_vars or {})
+        if "candidates: candidates" in q:
+            self.calls.append({"query": q, "bind_vars": bv, "kwargs": dict(kwargs)})
+            return [
+                {"source_key": k, "candidates": [[t, 1.5] for t in self.candidates[k][: bv["candidate_limit"]]]}
+                for k in bv["keys"] if self.candidates.get(k)
+            ]
+        if "FOR d IN @@collection" in q:
+            self.calls.append({"query": q, "bind_vars": bv, "kwargs": dict(kwargs)})
+            docs = self.sources if bv["@collection"] == "source" else self.targets
+            return [{"_key": k, "name": docs[k]} for k in bv["keys"] if k in docs]
+        return super().execute(query, bind_vars, **kwargs)
+
+
+def _local_scoring_db():
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    db.aql = _LocalScoringAQL(
+        sources={"s1": "ACME CORP", "s2": "Globex", "s3": "Initrode  "},
+        targets={"t1": " acme corp", "t2": "Acme Corporation", "t3": "Initrode"},
+        candidates={"s1": ["t2", "t1"], "s2": ["t3"], "s3": ["t3"]},
+    )
+    return db, edge
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_local_scoring_scores_candidate_keys_in_process(workers) -> None:
+    db, edge = _local_scoring_db()
+    svc = _configured_service(db, search_view="target_view")
+
+    stats = svc.match_entities(threshold=0.7, batch_size=2, scoring="local", scoring_workers=workers)
+
+    assert [(e["_from"], e["_to"]) for e in edge.inserted] == [
+        ("target/t1", "source/s1"), ("target/t3", "source/s3"),
+    ]
+    assert edge.inserted[0]["confidence"] == 1.0
+    assert edge.inserted[0]["match_details"]["field_scores"] == {"name": 1.0}
+    assert edge.inserted[0]["match_details"]["bm25_score"] == 1.5
+    assert stats["edges_created"] == 2
+
+    candidate_calls = [c for c in db.aql.calls if "candidates: candidates" in c["query"]]
+    assert candidate_calls and all("LEVENSHTEIN" not in c["query"] for c in candidate_calls)
+    assert "BM25(t)" in candidate_calls[0]["query"]
+    assert candidate_calls[0]["bind_vars"]["candidate_limit"] == 10
+    projections = [c["query"] for c in db.aql.calls if "FOR d IN @@collection" in c["query"]]
+    assert "RETURN {_key: d._key, name: d.company_name}" in projections[0]
+    assert "RETURN {_key: d._key, name: d.legal_name}" in projections[1]
+
+
+def test_local_scoring_uses_fellegi_sunter_posterior() -> None:
+    from entity_resolution.learning.fellegi_sunter_scorer import FellegiSunterScorer
+
+    db, edge = _local_scoring_db()
+    svc = _configured_service(db, search_view=None)
+    fs = FellegiSunterScorer(m={"name": 0.9}, u={"name": 0.1}, default_threshold=0.95)
+
+    svc.match_entities(threshold=0.8, scoring="local", fs_scorer=fs)
+
+    assert [e["_to"] for e in edge.inserted] == ["source/s1", "source/s3"]
+    assert edge.inserted[0]["confidence"] == 0.9
+    candidate_query = next(c["query"] for c in db.aql.calls if "candidates: candidates" in c["query"])
+    assert "FOR t IN @@target_collection" in candidate_query
+    assert "FILTER LENGTH(t.city) >= @_filter_t_0_min_length" in candidate_query
+
+
+def test_local_scoring_without_bm25_scores_the_whole_block() -> None:
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    targets = {f"t{i:02d}": f"Other {i}" for i in range(15)}
+    targets["t14"] = "ACME CORP"  # sorts after the first candidates_per_source keys
+    db.aql = _LocalScoringAQL(
+        sources={"s1": "ACME CORP"}, targets=targets, candidates={"s1": sorted(targets)},
+    )
+    svc = _configured_service(db, search_view=None)
+
+    svc.match_entities(threshold=0.9, scoring="local", candidates_per_source=10)
+
+    assert [(e["_from"], e["_to"]) for e in edge.inserted] == [("target/t14", "source/s1")]
+    candidate_call = next(c for c in db.aql.calls if "candidates: candidates" in c["query"])
+    assert candidate_call["bind_vars"]["candidate_limit"] == 10_001
+
+
+def test_local_scoring_caps_oversized_blocks_with_warning(caplog) -> None:
+    edge = _FakeEdgeCollection()
+    db = _FakeDB(edge_collection=edge)
+    targets = {f"t{i}": "ACME CORP" for i in range(5)}
+    db.aql = _LocalScoringAQL(
+        sources={"s1": "ACME CORP"}, targets=targets, candidates={"s1": sorted(targets)},
+    )
+    svc = _configured_service(db, search_view=None)
+
+    with caplog.at_level("WARNING"):
+        svc.match_entities(threshold=0.9, scoring="local", max_block_size=3)
+
+    assert "exceeds max_block_size=3" in caplog.text
+    target_fetch = [
+        c for c in db.aql.calls
+        if "FOR d IN @@collection" in c["query"] and c["bind_vars"]["@collection"] == "target"
+    ]
+    assert target_fetch[0]["bind_vars"]["keys"] == ["t0", "t1", "t2"]
+    with pytest.raises(ValueError, match="max_block_size"):
+        svc.match_entities(scoring="local", max_block_size=0)
+
+
+def test_local_scoring_requires_keyset_pagination() -> None:
+    svc = _configured_service(_FakeDB())
+    with pytest.raises(ValueError, match="keyset"):
+        svc.match_entities(scoring="local", pagination="offset")
+    with pytest.raises(ValueError, match="scoring"):
+        svc.match_entities(scoring="remote")
+
+
 def test_clear_inferred_edges_returns_removed_count_and_builds_query() -> None:
     db = _FakeDB()
     svc = _configured_service(db)
@@ -143,6 +143,20 @@ class TestSimilarityConfig:
 
         assert config_dict['transformers'] == {'state': ['state_code']}
 
+    def test_batch_workers_round_trips(self):
+        """batch_workers reaches the config and survives save/reload."""
+        assert SimilarityConfig().batch_workers == 1
+        config = SimilarityConfig.from_dict({'batch_workers': -1})
+        assert config.batch_workers == -1
+        assert SimilarityConfig.from_dict(config.to_dict()).batch_workers == -1
+
+    def test_minhash_settings_round_trip(self):
+        """MinHash settings reach the config and survive save/reload."""
+        config = SimilarityConfig.from_dict({'minhash_threshold': 64, 'minhash_permutations': 256})
+        reloaded = SimilarityConfig.from_dict(config.to_dict())
+        assert (reloaded.minhash_threshold, reloaded.minhash_permutations) == (64, 256)
+        assert SimilarityConfig().minhash_threshold is None
+
 
 class TestClusteringConfig:
     """Test cases for ClusteringConfig."""
@@ -431,6 +445,29 @@ entity_resolution:
 
         errors = config.validate()
         assert any('similarity.transformers' in e for e in errors)
+
+    def test_validate_invalid_batch_workers(self):
+        """Test validation rejects batch_workers other than -1 or >= 1."""
+        config = ERPipelineConfig(
+            entity_type='company',
+            collection_name='companies',
+            similarity=SimilarityConfig(batch_workers=0),
+        )
+
+        errors = config.validate()
+        assert any('similarity.batch_workers' in e for e in errors)
+
+    def test_validate_invalid_minhash_settings(self):
+        """Test validation rejects non-positive MinHash settings."""
+        config = ERPipelineConfig(
+            entity_type='company',
+            collection_name='companies',
+            similarity=SimilarityConfig(minhash_threshold=0, minhash_permutations=0),
+        )
+
+        errors = config.validate()
+        assert any('similarity.minhash_threshold' in e for e in errors)
+        assert any('similarity.minhash_permutations' in e for e in errors)
     
     def test_validate_invalid_algorithm(self):
         """Test validation catches invalid algorithm."""
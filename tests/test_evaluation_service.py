@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from entity_resolution.services.evaluation_service import (
@@ -131,3 +133,62 @@ class TestClusterQuality:
         assert out["size_distribution"]["2"] == 1
         assert out["size_distribution"]["3-5"] == 1
         assert out["size_distribution"]["6-10"] == 1
+
+
+def _reference_sweep(scored, truth, thresholds=None):
+    """Straightforward per-threshold recount of the sweep definition."""
+    scores = {}
+    for a, b, s in scored:
+        pid = canonical_pair_id(a, b)
+        scores[pid] = max(s, scores.get(pid, s))
+    grid = thresholds if thresholds is not None else sorted(set(scores.values()), reverse=True)
+    out = []
+    for t in grid:
+        tp = sum(1 for pid, s in scores.items() if s >= t and pid in truth)
+        fp = sum(1 for pid, s in scores.items() if s >= t and pid not in truth)
+        out.append((round(t, 6), tp, fp))
+    return out
+
+
+@pytest.mark.parametrize("thresholds", [None, [0.0, 0.25, 0.5, 0.5, 0.99, 1.0]])
+def test_threshold_sweep_matches_reference_with_ties_and_duplicates(thresholds):
+    rng = random.Random(7)
+    scored = [
+        (f"n{rng.randrange(40)}", f"n{rng.randrange(40)}", round(rng.random(), 2))
+        for _ in range(400)
+    ]
+    truth = {canonical_pair_id(a, b) for a, b, _ in scored[::3]}
+    sweep = threshold_sweep(scored, truth, thresholds=thresholds)
+    got = [(p["threshold"], p["true_positives"], p["false_positives"]) for p in sweep["points"]]
+    assert got == _reference_sweep(scored, truth, thresholds)
+
+
+def test_threshold_sweep_empty_input():
+    sweep = threshold_sweep([], {"a|b"}, thresholds=[0.5])
+    assert sweep["points"][0]["true_positives"] == 0
+    assert sweep["points"][0]["false_negatives"] == 1
+    assert threshold_sweep([], set())["best_f1"] is None
+
+
+def test_service_sweep_interns_ids_and_streams(monkeypatch):
+    from entity_resolution.services.evaluation_service import EvaluationService
+
+    edges = [["v/a", "v/b", 0.9], ["v/b", "v/a", 0.4], ["v/c", "v/d", 0.6]]
+    truth_rows = [["v/b", "v/a"], ["v/x", "v/y"]]
+
+    class _AQL:
+        def __init__(self):
+            self.kwargs = []
+
+        def execute(self, query, bind_vars=None, **kwargs):
+            self.kwargs.append(kwargs)
+            return iter(truth_rows if "@@truth" in query else edges)
+
+    class _DB:
+        aql = _AQL()
+
+    service = EvaluationService(_DB(), "v_edges")
+    sweep = service.threshold_sweep("truth")
+    expected = threshold_sweep([tuple(e) for e in edges], {canonical_pair_id(a, b) for a, b in truth_rows})
+    assert sweep == expected
+    assert all(k.get("stream") for k in _DB.aql.kwargs)
@@ -159,3 +159,24 @@ def test_auto_refresh_deletes_orphaned_golden(er_collections):
 
     # Orphaned golden record (its {A,B,C} cluster no longer exists) is deleted.
     assert db.collection(names["golden"]).get("g_abc") is None
+
+
+def test_scoped_recluster_uses_component_traversal(er_collections):
+    db, names = er_collections
+    _seed_chain(db, names)
+    svc = FeedbackApplicationService(
+        db=db,
+        edge_collection=names["edge"],
+        vertex_collection=names["vertex"],
+        cluster_collection=names["cluster"],
+        golden_collection=names["golden"],
+        scoped=True,
+    )
+
+    result = svc.apply_and_recluster("B", "C", "no_match", actor="steward")
+
+    clusters = list(db.collection(names["cluster"]).all())
+    assert sorted(tuple(sorted(c["member_keys"])) for c in clusters) == [("A", "B")]
+    assert result["recluster"]["golden"]["flagged_stale"] == 1
+    index_names = {i.get("name") for i in db.collection(names["cluster"]).indexes()}
+    assert "idx_cluster_member_keys" in index_names
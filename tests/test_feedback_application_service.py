@@ -50,6 +50,9 @@ class _FakeCollection:
     def add_index(self, spec):
         return {"id": "ttl"}
 
+    def add_persistent_index(self, fields, name=None, **kwargs):
+        return {"id": name, "fields": fields}
+
 
 class _FakeAQL:
     def __init__(self, db):
@@ -58,6 +61,7 @@ class _FakeAQL:
     def execute(self, query, bind_vars=None):
         bind_vars = bind_vars or {}
         q = " ".join(query.split())
+        self.db.queries.append(q)
 
         if q.startswith("UPSERT"):
             edges = self.db._coll(bind_vars["@edges"])
@@ -78,6 +82,25 @@ class _FakeAQL:
             ]
             return iter(out)
 
+        if "@members" in bind_vars:
+            return self._membership(q, bind_vars)
+
+        if "1..1 ANY v" in q:
+            # One hop of active edges around the frontier.
+            edges = self.db._coll(bind_vars["@edges"])
+            frontier = set(bind_vars["frontier"])
+            return iter([
+                [e["_from"], e["_to"]] for e in edges.docs.values()
+                if not e.get("suppressed") and (e["_from"] in frontier or e["_to"] in frontier)
+            ])
+
+        if "c.member_keys[*]" in q:
+            clusters = self.db._coll(bind_vars["@clusters"])
+            return iter([
+                dict(c) for k in bind_vars["keys"] for c in clusters.docs.values()
+                if k in c.get("member_keys", [])
+            ])
+
         if "INTERSECTION" in q and "@clusters" in bind_vars:
             clusters = self.db._coll(bind_vars["@clusters"])
             needle = set(bind_vars.get("touched") or bind_vars.get("seeds") or [])
@@ -86,6 +109,10 @@ class _FakeAQL:
                 if needle.intersection(c.get("member_keys", []))
             ])
 
+        if "membershipIndexed == null" in q:
+            golden = self.db._coll(bind_vars["@golden"])
+            return iter([all(g.get("membershipIndexed") is not None for g in golden.docs.values())])
+
         if "INTERSECTION" in q and "@golden" in bind_vars:
             golden = self.db._coll(bind_vars["@golden"])
             touched = set(bind_vars["touched"])
@@ -96,11 +123,42 @@ class _FakeAQL:
 
         return iter([])
 
+    def _membership(self, q, bind_vars):
+        members = self.db._coll(bind_vars["@members"]).docs
+        if q.startswith("FOR r IN @rows"):
+            for row in bind_vars["rows"]:
+                members.setdefault(row["_key"], {}).update(row)
+            return iter([])
+        assigned_run = next(
+            (m.get("run") for m in members.values() if m.get("cluster_key") is not None), None
+        )
+        if q.startswith("LET cluster = FIRST"):
+            # Index consistency check: a sampled cluster carries the index's run.
+            clusters = list(self.db._coll(bind_vars["@clusters"]).docs.values())
+            if not clusters:
+                return iter([True])
+            run = clusters[0].get("membership_run")
+            return iter([run is not None and run == assigned_run])
+        if q.endswith("RETURN m.run"):
+            return iter([assigned_run] if assigned_run is not None else [])
+        keys = set(bind_vars.get("keys", []))
+        if "UPDATE m WITH { cluster_key: null }" in q:
+            for k in keys & set(members):
+                members[k]["cluster_key"] = None
+            return iter([])
+        field, target = (
+            ("cluster_key", "@clusters") if "COLLECT ck" in q else ("golden_key", "@golden")
+        )
+        docs = self.db._coll(bind_vars[target]).docs
+        wanted = {members[k].get(field) for k in keys & set(members)} - {None}
+        return iter([dict(docs[k]) for k in sorted(wanted) if k in docs])
+
 
 class _FakeDB:
     def __init__(self):
         self._collections = {}
         self.aql = _FakeAQL(self)
+        self.queries = []
 
     def _coll(self, name):
         return self._collections.setdefault(name, _FakeCollection(name))
@@ -384,3 +442,130 @@ def test_golden_record_survives_when_cluster_unchanged():
 
     g = db._coll("golden_records").docs["g_ab"]
     assert g["stale"] is False  # member set still matches a live cluster
+
+
+# ---------------------------------------------------------------------------
+# Scoped (component-local) re-clustering
+# ---------------------------------------------------------------------------
+
+def _scoped_service(db, **kwargs):
+    return FeedbackApplicationService(
+        db=db,
+        edge_collection="similarTo",
+        vertex_collection="Person",
+        cluster_collection="person_clusters",
+        scoped=True,
+        **kwargs,
+    )
+
+
+def _seed_two_components(db, svc):
+    # Chain A-B-C-D plus an unrelated component X-Y.
+    _add_edge(db, svc, "A", "B", 0.9)
+    _add_edge(db, svc, "B", "C", 0.55)
+    _add_edge(db, svc, "C", "D", 0.9)
+    _add_edge(db, svc, "X", "Y", 0.9)
+    clusters = db._coll("person_clusters").docs
+    clusters["c_abcd"] = {"_key": "c_abcd", "member_keys": ["A", "B", "C", "D"], "size": 4}
+    clusters["c_xy"] = {"_key": "c_xy", "member_keys": ["X", "Y"], "size": 2}
+
+
+def test_scoped_recluster_matches_global_without_full_edge_scan():
+    results = {}
+    for scoped in (False, True):
+        db = _FakeDB()
+        svc = _scoped_service(db) if scoped else _service(db)
+        _seed_two_components(db, svc)
+        svc.apply_and_recluster("B", "C", "no_match")
+        results[scoped] = sorted(
+            tuple(c["member_keys"]) for c in db._coll("person_clusters").docs.values()
+        )
+        full_scans = [q for q in db.queries if "RETURN { from" in q]
+        assert bool(full_scans) is not scoped
+    assert results[True] == results[False] == [("A", "B"), ("C", "D"), ("X", "Y")]
+
+
+def test_scoped_recluster_leaves_other_clusters_untouched():
+    db = _FakeDB()
+    svc = _scoped_service(db)
+    _seed_two_components(db, svc)
+    result = svc.apply_and_recluster("A", "X", "match")
+    assert result["recluster"]["clusters_before"] == 2
+    member_sets = sorted(
+        tuple(c["member_keys"]) for c in db._coll("person_clusters").docs.values()
+    )
+    assert member_sets == [("A", "B", "C", "D", "X", "Y")]
+
+
+def test_scoped_recluster_falls_back_for_oversized_component():
+    db = _FakeDB()
+    svc = _scoped_service(db, max_component_size=3)
+    _seed_two_components(db, svc)
+    svc.apply_and_recluster("B", "C", "no_match")
+    assert any("RETURN { from" in q for q in db.queries)
+    member_sets = sorted(
+        tuple(c["member_keys"]) for c in db._coll("person_clusters").docs.values()
+    )
+    assert member_sets == [("A", "B"), ("C", "D"), ("X", "Y")]
+
+
+# ---------------------------------------------------------------------------
+# Member -> cluster index
+# ---------------------------------------------------------------------------
+
+def test_recluster_uses_and_maintains_membership_index():
+    db = _FakeDB()
+    svc = _service_with_golden(db)
+    _seed_split_scenario(db, svc)
+    db.create_collection("person_clusters_membership")
+    db._coll("person_clusters").docs["cluster_000000"]["membership_run"] = "r1"
+    members = db._coll("person_clusters_membership").docs
+    for k in "ABC":
+        members[k] = {"_key": k, "cluster_key": "cluster_000000", "golden_key": "g_abc", "run": "r1"}
+    db._coll("golden_records").docs["g_abc"]["membershipIndexed"] = True
+
+    result = svc.apply_and_recluster("B", "C", "no_match")
+
+    assert not any("INTERSECTION" in q for q in db.queries)
+    (new_key,) = result["recluster"]["cluster_keys"]
+    assert members["A"]["cluster_key"] == members["B"]["cluster_key"] == new_key
+    assert members["A"]["run"] == "r1"
+    assert db._coll("person_clusters").docs[new_key]["membership_run"] == "r1"
+    assert members["C"]["cluster_key"] is None  # dropped to a singleton
+    assert db._coll("golden_records").docs["g_abc"]["stale"] is True
+
+
+def test_golden_records_missing_from_membership_index_are_still_flagged():
+    db = _FakeDB()
+    svc = _service_with_golden(db)
+    _seed_split_scenario(db, svc)
+    db.create_collection("person_clusters_membership")
+    db._coll("person_clusters").docs["cluster_000000"]["membership_run"] = "r1"
+    members = db._coll("person_clusters_membership").docs
+    # Clusters are indexed, but g_abc predates the index: no golden_key rows.
+    for k in "ABC":
+        members[k] = {"_key": k, "cluster_key": "cluster_000000", "run": "r1"}
+
+    result = svc.apply_and_recluster("B", "C", "no_match")
+
+    assert any("INTERSECTION(g.memberKeys" in q for q in db.queries)
+    assert db._coll("golden_records").docs["g_abc"]["stale"] is True
+    assert result["recluster"]["golden"]["flagged_stale"] == 1
+
+
+def test_recluster_ignores_membership_index_out_of_step_with_clusters():
+    db = _FakeDB()
+    svc = _service_with_golden(db)
+    _seed_split_scenario(db, svc)
+    # The index describes an earlier run; cluster_000000 was since rewritten
+    # (same key, new members) by a writer that left the index alone.
+    db.create_collection("person_clusters_membership")
+    members = db._coll("person_clusters_membership").docs
+    for k in "XY":
+        members[k] = {"_key": k, "cluster_key": "cluster_000000", "run": "r0"}
+
+    result = svc.apply_and_recluster("B", "C", "no_match")
+
+    assert any("INTERSECTION" in q for q in db.queries)  # fell back to the scan
+    assert result["recluster"]["clusters_before"] == 1
+    assert members["X"]["cluster_key"] == "cluster_000000"  # stale index not written
@@ -39,9 +39,44 @@ def db():
         def __iter__(self):
             return iter(self.docs)
 
+    class MockAQL:
+        """Interprets the bulk reads issued by run(batch_size=...)."""
+
+        def __init__(self, db):
+            self.db = db
+            self.queries = []
+
+        def execute(self, query, bind_vars=None, **kwargs):
+            self.queries.append(query)
+            keys = bind_vars.get("keys", [])
+            if "@source" in bind_vars:
+                coll = self.db.collection(bind_vars["@source"])
+                found = [coll.docs_by_key[k] for k in keys if k in coll.docs_by_key]
+                if "d._rev" in query:
+                    return iter([[d["_key"], d.get("_rev")] for d in found])
+                return iter([dict(d) for d in found])
+            coll = self.db.collection(bind_vars["@golden"])
+            if "KEEP(" in query:
+                return iter([dict(coll.docs_by_key[k]) for k in keys if k in coll.docs_by_key])
+            if "RETURN g._key" in query:
+                return iter([
+                    k for k, g in coll.docs_by_key.items()
+                    if g.get("sourceClusterHash") is not None and not g.get("stale")
+                ])
+            if "UPDATE" in query:
+                for k in keys:
+                    coll.docs_by_key[k].update(stale=True, staleReason=bind_vars["reason"])
+                return iter([])
+            return iter([
+                [k, coll.docs_by_key[k]["fieldOverrides"]]
+                for k in keys
+                if coll.docs_by_key.get(k, {}).get("fieldOverrides") is not None
+            ])
+
     class MockDB:
         def __init__(self):
             self._collections = {}
+            self.aql = MockAQL(self)
 
         def has_collection(self, name):
             return name in self._collections
@@ -253,3 +288,171 @@ def test_source_priority_requires_source_config(survivorship_db):
             cluster_collection="person_clusters",
             field_strategies={"email": "source_priority"},
         )
+
+
+def test_batched_run_matches_per_record_run_with_bulk_reads(db):
+    db.collection("person_clusters").docs.append(
+        {"_key": "cluster_000003", "cluster_id": 3, "member_keys": ["p3", "p4"]}
+    )
+    db.collection("Person").docs_by_key["p4"] = {"_key": "p4", "name": "Bobby"}
+
+    def run(batch_size):
+        for name in ("GoldenRecord", "resolvedTo"):
+            db.create_collection(name)
+        svc = GoldenRecordPersistenceService(
+            db=db,
+            source_collection="Person",
+            cluster_collection="person_clusters",
+            golden_collection="GoldenRecord",
+            resolved_edge_collection="resolvedTo",
+            include_fields=["name", "panNumber"],
+        )
+        # A steward override on the {p1, p2} record must survive either mode.
+        key = svc._golden_key(["Person/p1", "Person/p2"])
+        db.collection("GoldenRecord").docs_by_key[key] = {
+            "_key": key, "fieldOverrides": {"name": "Alice A.", "stale": True},
+        }
+        out = svc.run(run_id="r", batch_size=batch_size)
+        docs = {
+            k: {f: v for f, v in d.items() if f != "updatedAt"}
+            for k, d in db.collection("GoldenRecord").docs_by_key.items()
+        }
+        return out, docs
+
+    db.aql.queries.clear()
+    legacy = run(None)
+    assert db.aql.queries == []
+    batched = run(1)
+    assert batched == legacy
+    assert legacy[0] == {
+        "clusters_processed": 2, "golden_records_upserted": 2, "resolved_edges_upserted": 4,
+    }
+    # One member query and one override query per chunk of one cluster.
+    assert len(db.aql.queries) == 4
+    names = sorted(d["name"] for d in legacy[1].values())
+    assert names == ["Alice A.", "Bobby"]
+
+
+def test_batch_size_must_be_positive(db):
+    svc = GoldenRecordPersistenceService(
+        db=db, source_collection="Person", cluster_collection="person_clusters",
+    )
+    with pytest.raises(ValueError, match="batch_size"):
+        svc.run(batch_size=0)
+
+
+def test_process_pool_consolidation_matches_serial(survivorship_db):
+    def run(**kwargs):
+        for name in ("GoldenRecord", "resolvedTo"):
+            survivorship_db.create_collection(name)
+        svc = GoldenRecordPersistenceService(
+            db=survivorship_db,
+            source_collection="Person",
+            cluster_collection="person_clusters",
+            golden_collection="GoldenRecord",
+            resolved_edge_collection="resolvedTo",
+            merge_strategy="most_recent",
+            recency_field="updated_at",
+            field_strategies={"name": "most_complete"},
+        )
+        out = svc.run(run_id="r", batch_size=10, **kwargs)
+        docs = {
+            k: {f: v for f, v in d.items() if f != "updatedAt"}
+            for k, d in survivorship_db.collection("GoldenRecord").docs_by_key.items()
+        }
+        return out, docs
+
+    serial = run()
+    pooled = run(workers=2)
+    assert pooled == serial
+    assert serial[0]["golden_records_upserted"] == 2
+
+
+def test_workers_must_be_positive(db):
+    svc = GoldenRecordPersistenceService(
+        db=db, source_collection="Person", cluster_collection="person_clusters",
+    )
+    with pytest.raises(ValueError, match="workers"):
+        svc.run(workers=0)
+
+
+def _incremental_service(db):
+    return GoldenRecordPersistenceService(
+        db=db,
+        source_collection="Person",
+        cluster_collection="person_clusters",
+        golden_collection="GoldenRecord",
+        resolved_edge_collection="resolvedTo",
+        include_fields=["name"],
+    )
+
+
+def test_incremental_run_skips_unchanged_clusters(db):
+    people = db.collection("Person").docs_by_key
+    for key, doc in people.items():
+        doc["_rev"] = "r1"
+    db.collection("person_clusters").docs.append(
+        {"_key": "cluster_000003", "member_keys": ["p3", "p4"]}
+    )
+    people["p4"] = {"_key": "p4", "_id": "Person/p4", "name": "Bobby", "_rev": "r1"}
+    svc = _incremental_service(db)
+
+    first = svc.run(run_id="r1", incremental=True)
+    assert first["golden_records_upserted"] == 2
+    assert first["clusters_unchanged"] == 0
+
+    db.aql.queries.clear()
+    second = svc.run(run_id="r2", incremental=True)
+    assert second["golden_records_upserted"] == 0
+    assert second["clusters_unchanged"] == 2
+    # Unchanged clusters never fetch member documents.
+    assert not any(q.endswith("RETURN d") for q in db.aql.queries)
+
+    # A member edit (new _rev) rebuilds only its cluster.
+    people["p4"].update(name="Robert", _rev="r2")
+    third = svc.run(run_id="r3", incremental=True)
+    assert third["golden_records_upserted"] == 1
+    assert third["clusters_unchanged"] == 1
+    golden = db.collection("GoldenRecord").docs_by_key
+    assert {g["runId"] for g in golden.values()} == {"r1", "r3"}
+
+
+def test_incremental_run_retires_records_of_vanished_clusters(db):
+    svc = _incremental_service(db)
+    svc.run(run_id="r1", incremental=True)
+    old_key = svc._golden_key(["Person/p1", "Person/p2"])
+    manual = {"_key": "manual", "memberKeys": ["p1"], "method": "manual_edit"}
+    db.collection("GoldenRecord").docs_by_key["manual"] = manual
+
+    # Membership change: p3 joins the {p1, p2} cluster.
+    db.collection("person_clusters").docs[:] = [
+        {"_key": "c", "member_keys": ["p1", "p2", "p3"]},
+    ]
+    out = svc.run(run_id="r2", incremental=True)
+
+    golden = db.collection("GoldenRecord").docs_by_key
+    assert out["golden_records_upserted"] == 1
+    assert out["golden_records_retired"] == 1
+    assert golden[old_key]["stale"] is True
+    assert "stale" not in golden["manual"]  # steward records are never retired
+
+
+def test_golden_records_stamped_only_when_members_are_indexed(db, monkeypatch):
+    from entity_resolution.services.cluster_membership import ClusterMembershipIndex
+
+    svc = _incremental_service(db)
+    indexed = {}
+    monkeypatch.setattr(ClusterMembershipIndex, "available", property(lambda self: True))
+    monkeypatch.setattr(ClusterMembershipIndex, "set_golden", lambda self, rows: indexed.update(rows))
+    svc.run(run_id="r1")
+
+    golden = db.collection("GoldenRecord").docs_by_key
+    (key,) = golden
+    assert indexed == {"p1": key, "p2": key}
+    assert golden[key]["membershipIndexed"] is True
+
+    # A rewrite that cannot reach the index clears the stamp, so feedback
+    # staleness checks fall back to scanning memberKeys.
+    monkeypatch.setattr(ClusterMembershipIndex, "available", property(lambda self: False))
+    svc.run(run_id="r2")
+    assert golden[key]["membershipIndexed"] is None
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import random
+import time
+
 import pytest
 
 from entity_resolution.config.er_config import GraphContextConfig, SimilarityConfig
-from entity_resolution.similarity.graph_context import GraphContextSimilarity
+from entity_resolution.similarity.graph_context import GraphContextSimilarity, NeighborCSR
 
 
 def _svc(**kw):
@@ -58,6 +61,122 @@ def test_feature_field_names_namespaced():
     assert set(f) == {"graph_neighbor_jaccard"}
 
 
+# --- CSR backend ---
+
+def _random_cache(seed, n_keys=30, n_vertices=12):
+    rng = random.Random(seed)
+    cache = {
+        f"k{i}": {f"Org/{rng.randrange(n_vertices)}" for _ in range(rng.randrange(6))}
+        for i in range(n_keys)
+    }
+    # A few direct person-person edges so path_within_k sees length-1 paths.
+    cache["k0"].add("Person/k1")
+    cache["k2"].add("Person/k3")
+    return cache
+
+
+@pytest.mark.parametrize("max_hops", [1, 2])
+def test_batch_features_match_set_path(max_hops):
+    svc = _svc(max_hops=max_hops, count_saturation=2)
+    cache = _random_cache(max_hops)
+    keys = sorted(cache) + ["unknown"]
+    pairs = [(a, b) for a in keys[:12] for b in keys[:12] if a != b] + [("k0", "unknown")]
+
+    expected = [svc.pair_features(a, b, cache) for a, b in pairs]
+    csr = NeighborCSR.from_sets(cache)
+    assert svc.pair_features_batch(pairs, csr) == pytest.approx(expected)
+    assert svc.pair_features_batch(pairs, cache) == pytest.approx(expected)
+    assert svc.pair_features("k0", "k1", csr) == pytest.approx(svc.pair_features("k0", "k1", cache))
+
+
+def test_batch_features_chunking(monkeypatch):
+    import entity_resolution.similarity.graph_context as gc_module
+
+    svc = _svc()
+    cache = _random_cache(3)
+    pairs = [(a, b) for a in cache for b in cache if a < b]
+    expected = svc.pair_features_batch(pairs, cache)
+    monkeypatch.setattr(gc_module, "_GATHER_BUDGET", 7)
+    assert svc.pair_features_batch(pairs, cache) == expected
+
+
+def test_batch_features_with_sets_cache_use_set_join(monkeypatch):
+    svc = _svc()
+    cache = _random_cache(4)
+    monkeypatch.setattr(NeighborCSR, "from_sets", None)  # no per-call conversion
+    pairs = [("k0", "k1"), ("k2", "k3")]
+    assert svc.pair_features_batch(pairs, cache) == [svc.pair_features(a, b, cache) for a, b in pairs]
+
+
+def test_batch_features_direct_edge_to_key_without_row():
+    svc = _svc()
+    csr = NeighborCSR.from_sets({"a": {"Person/z", "Org/1"}, "b": {"Org/1"}})
+    (f,) = svc.pair_features_batch([("a", "z")], csr)
+    assert f["graph_path_within_k"] == 1.0
+    assert f["graph_shared_neighbor_count"] == 0.0
+
+
+@pytest.mark.performance
+def test_csr_batch_path_beats_set_loop():
+    rng = random.Random(7)
+    cache = {
+        f"r{i}": {f"Hub/h{rng.randrange(1000)}" for _ in range(rng.randrange(1, 20))}
+        for i in range(20000)
+    }
+    keys = list(cache)
+    pairs = [(rng.choice(keys), rng.choice(keys)) for _ in range(50000)]
+    csr = NeighborCSR.from_sets(cache)
+    svc = _svc()
+
+    def best_of(fn, repeats=3):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    loop_s = best_of(lambda: [svc.pair_features(a, b, cache) for a, b in pairs])
+    batch_s = best_of(lambda: svc.pair_features_batch(pairs, csr))
+    assert batch_s < loop_s, f"CSR batch {batch_s:.3f}s vs set loop {loop_s:.3f}s"
+
+
+def test_neighbor_csr_behaves_as_mapping():
+    cache = {"a": {"Org/1", "Org/2"}, "b": set(), "c": {"Org/2"}}
+    csr = NeighborCSR.from_sets(cache)
+    assert len(csr) == 3
+    assert {k: set(v) for k, v in csr.items()} == cache
+    assert csr.get("missing", set()) == set()
+    assert csr.num_vertices == 2
+
+
+def test_csr_backend_fetch_builds_csr():
+    class _AQL:
+        def execute(self, query, bind_vars=None, **kwargs):
+            ns = {"worksAt": {"a": ["Org/1", "Org/2"], "b": ["Org/2"]},
+                  "livesAt": {"a": ["Addr/9", "Org/1"]}}[bind_vars["@edges"]]
+            return [{"key": k, "ns": ns.get(k, [])} for k in bind_vars["keys"]]
+
+    class _DB:
+        aql = _AQL()
+
+        def has_collection(self, name):
+            return True
+
+    sets = GraphContextSimilarity(_DB(), "Person", ["worksAt", "livesAt"])
+    csr = GraphContextSimilarity(_DB(), "Person", ["worksAt", "livesAt"], backend="csr")
+    expected = sets.batch_fetch_neighbor_sets(["a", "b", "c"])
+    fetched = csr.batch_fetch_neighbor_sets(["a", "b", "c"])
+    assert isinstance(fetched, NeighborCSR)
+    assert {k: set(v) for k, v in fetched.items()} == expected
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="backend"):
+        _svc(backend="dense")
+    assert any("backend" in e for e in GraphContextConfig(edge_collections=["e"], backend="x").validate())
+
+
 # --- GraphContextConfig ---
 
 def test_config_from_dict_none_returns_none():
@@ -132,3 +132,60 @@ class TestGraphRAGLinker:
         assert results[0]["linked"] is True
         assert results[0]["edge_key"] is None
         db._edge_col.insert.assert_not_called()
+
+
+class TestGraphRAGLinkerRetrieval:
+    ENTITIES = [
+        {"_key": "c1", "name": "Acme Corporation"},
+        {"_key": "c2", "name": "Globex Industries"},
+        {"_key": "c3", "name": "Initech"},
+    ]
+
+    def _scan_db(self):
+        db = MagicMock()
+        db.aql.execute.side_effect = lambda query, bind_vars=None, **kw: iter(
+            [{"key": e["_key"], "name": e["name"]} for e in self.ENTITIES]
+        )
+        return db
+
+    def _index_db(self):
+        db = MagicMock()
+        db.aql.execute.side_effect = lambda query, bind_vars=None, **kw: iter(
+            [{k: e[k] for k in bind_vars["fields"] if k in e} for e in self.ENTITIES]
+        )
+        return db
+
+    def test_link_scans_collection_once_for_all_mentions(self):
+        db = self._scan_db()
+        linker = GraphRAGLinker(db=db, entity_collection="companies", edge_collection="e")
+        results = linker.link([
+            {"name": "Acme Corp"}, {"name": "Globex"}, {"name": "Acme Corp"}, {"name": ""},
+        ])
+        assert [r["matched_key"] for r in results] == ["c1", "c2", "c1", None]
+        assert db.aql.execute.call_count == 1
+        assert db.aql.execute.call_args.kwargs["stream"] is True
+
+    def test_link_batch_single_lookup_across_documents(self):
+        db = self._scan_db()
+        linker = GraphRAGLinker(db=db, entity_collection="companies", edge_collection="e")
+        batch = linker.link_batch([[{"name": "Initech"}], [{"name": "Globex"}, {"name": "Zzz"}]])
+        assert [[r["matched_key"] for r in doc] for doc in batch] == [["c3"], ["c2", None]]
+        assert db.aql.execute.call_count == 1
+        with pytest.raises(ValueError, match="source_doc_keys"):
+            linker.link_batch([[{"name": "Initech"}]], source_doc_keys=[])
+
+    def test_index_retrieval_matches_scan_and_builds_once(self):
+        extracted = [{"name": "Acme Corp"}, {"name": "Globex Ind"}, {"name": "Initec"}]
+        scan = GraphRAGLinker(db=self._scan_db(), entity_collection="companies", edge_collection="e")
+        db = self._index_db()
+        indexed = GraphRAGLinker(
+            db=db, entity_collection="companies", edge_collection="e", retrieval="index",
+        )
+        expected = [(r["matched_key"], r["score"]) for r in scan.link(extracted)]
+        assert [(r["matched_key"], r["score"]) for r in indexed.link(extracted)] == expected
+        indexed.link([{"name": "Acme"}])
+        assert db.aql.execute.call_count == 1  # index built once, reused
+
+    def test_invalid_retrieval_rejected(self):
+        with pytest.raises(ValueError, match="retrieval"):
+            GraphRAGLinker(db=MagicMock(), entity_collection="c", edge_collection="e", retrieval="bm25")
@@ -12,3 +12,122 @@ def test_edge_key_matches_feedback_service_and_is_order_independent():
     # with (and is preserved through) an incremental upsert.
     assert IncrementalMaintainer._edge_key(a, b) == FeedbackApplicationService._edge_key(a, b)
     assert IncrementalMaintainer._edge_key(a, b) == IncrementalMaintainer._edge_key(b, a)
+
+
+class _BatchDB:
+    """Minimal fake DB recording the AQL the batched path issues."""
+
+    def __init__(self, docs, clusters=()):
+        from unittest.mock import MagicMock
+
+        self.docs = {d["_key"]: d for d in docs}
+        self.clusters = list(clusters)
+        self.queries = []
+        self.aql = MagicMock()
+        self.aql.execute.side_effect = self._execute
+        self.locks = set()
+        self.lock_coll = MagicMock()
+        self.lock_coll.insert.side_effect = self._lock
+        self.lock_coll.delete.side_effect = lambda k: self.locks.discard(k)
+
+    def _lock(self, doc):
+        if doc["_key"] in self.locks:
+            raise RuntimeError("exists")
+        self.locks.add(doc["_key"])
+
+    def _execute(self, query, bind_vars=None, **kwargs):
+        self.queries.append((query, bind_vars))
+        if "d._key IN @keys" in query:
+            return iter([self.docs[k] for k in bind_vars["keys"] if k in self.docs])
+        if "LOWER(LEFT" in query:
+            return iter(list(self.docs.values()))
+        if "LET cluster = FIRST" in query:
+            return iter([True])  # member index in step with the clusters
+        if "COLLECT ck = m.cluster_key" in query:
+            keys = set(bind_vars["keys"])
+            return iter([c for c in self.clusters if keys & set(c["member_keys"])])
+        return iter([])
+
+    def has_collection(self, name):
+        return True
+
+    def collection(self, name):
+        return self.lock_coll
+
+
+def _batch_maintainer(db):
+    m = IncrementalMaintainer(
+        db=db, collection="people", fields=["name"],
+        edge_collection="edges", cluster_collection="clusters",
+        confidence_threshold=0.8,
+    )
+    m.applier.recluster_component = lambda *keys, **kw: {"seeds": sorted(keys)}
+    return m
+
+
+def test_resolve_many_batches_fetch_edges_and_stamp():
+    db = _BatchDB([
+        {"_key": "a", "name": "Acme Corporation"},
+        {"_key": "b", "name": "Acme Corporatn"},
+        {"_key": "c", "name": "Globex"},
+    ])
+    m = _batch_maintainer(db)
+    out = m.resolve_many(["a", "b", "c", "zz"])
+
+    assert sorted(out["resolved"]) == ["a", "b", "c"]
+    assert out["missing"] == ["zz"]
+    assert [x["_key"] for x in out["matches"]["a"]] == ["b"]
+    # a->b and b->a collapse to one canonical edge in a single bulk upsert.
+    upserts = [bv for q, bv in db.queries if "FOR e IN @edges" in q]
+    assert len(upserts) == 1 and len(upserts[0]["edges"]) == 1
+    # One candidate query for the whole batch.
+    assert sum("LOWER(LEFT" in q for q, _ in db.queries) == 1
+    stamps = [bv for q, bv in db.queries if "_er_resolved_at: @now" in q]
+    assert len(stamps) == 1 and sorted(stamps[0]["keys"]) == ["a", "b", "c"]
+    assert out["recluster"]["seeds"] == ["a", "b", "c"]
+    assert db.locks == set()
+
+
+def test_resolve_many_skips_locked_groups():
+    db = _BatchDB([
+        {"_key": "a", "name": "Acme Corporation"},
+        {"_key": "b", "name": "Acme Corporatn"},
+        {"_key": "c", "name": "Globex"},
+    ])
+    m = _batch_maintainer(db)
+    db.locks.add(m.applier._component_lock_key("a"))
+    out = m.resolve_many(["a", "b", "c"])
+
+    assert sorted(out["locked"]) == ["a", "b"]
+    assert out["resolved"] == ["c"]
+    assert not [q for q, _ in db.queries if "FOR e IN @edges" in q]
+
+
+def test_batches_touching_one_existing_cluster_contend_for_its_lock():
+    db = _BatchDB(
+        [
+            {"_key": "x", "name": "Acme Corporation"},
+            {"_key": "y", "name": "Globex Industries"},
+            {"_key": "n1", "name": "Acme Corporatio"},
+            {"_key": "n2", "name": "Globex Industrie"},
+        ],
+        clusters=[{"_key": "c1", "member_keys": ["x", "y"]}],
+    )
+    first, second = _batch_maintainer(db), _batch_maintainer(db)
+    concurrent = {}
+
+    def recluster_while_locked(*keys, **kw):
+        # A second worker's batch arrives while the first still holds its locks.
+        concurrent.update(second.resolve_many(["n2"]))
+        return {"seeds": sorted(keys)}
+
+    first.applier.recluster_component = recluster_while_locked
+    out = first.resolve_many(["n1"])
+
+    # The records reach cluster c1 through different members.
+    assert [m["_key"] for m in out["matches"]["n1"]] == ["x"]
+    assert out["resolved"] == ["n1"]
+    assert concurrent["locked"] == ["n2"] and concurrent["resolved"] == []
+    assert db.locks == set()
+    # Once released, the second batch goes through.
+    assert second.resolve_many(["n2"])["resolved"] == ["n2"]
@@ -54,6 +54,25 @@ def test_commit_merges_matching_records(maint_fixture):
     assert m.pending_keys() == []
 
 
+def test_resolve_many_matches_sequential_commits(maint_fixture):
+    db, person, edge, cluster = maint_fixture
+    db.collection(person).insert_many([
+        {"_key": "a", "name": "Acme Corporation"},
+        {"_key": "b", "name": "Acme Corporatn"},
+        {"_key": "c", "name": "Umbrella Group"},
+    ])
+    m = _maintainer(db, person, edge, cluster)
+    out = m.resolve_many(["a", "b", "c"])
+    assert sorted(out["resolved"]) == ["a", "b", "c"]
+    assert _member_sets(db, cluster) == [("a", "b")]
+    assert m.pending_keys() == []
+
+    # A later batch joins the existing cluster under its cluster lock.
+    db.collection(person).insert({"_key": "d", "name": "Acme Corporaton"})
+    assert m.resolve_many(["d"])["resolved"] == ["d"]
+    assert _member_sets(db, cluster) == [("a", "b", "d")]
+
+
 def test_sequence_neutral(db_connection):
     # Same records, two insertion/commit orders => identical final clusters.
     def run(order):
@@ -101,3 +120,53 @@ def test_suppressed_edge_not_resurrected(maint_fixture):
     # The suppression must hold: no cluster contains both a and b.
     for members in _member_sets(db, cluster):
         assert not ({"a", "b"} <= set(members))
+
+
+def test_queue_leases_are_exclusive_across_workers(maint_fixture):
+    from entity_resolution.core.resolution_queue import ResolutionQueue
+
+    db, person, edge, cluster = maint_fixture
+    queue_name = f"im_queue_{uuid.uuid4().hex[:8]}"
+    try:
+        w1 = ResolutionQueue(db, person, queue_collection=queue_name, worker_id="w1")
+        w2 = ResolutionQueue(db, person, queue_collection=queue_name, worker_id="w2")
+        w1.enqueue(["a", "b", "c"])
+        first = w1.lease(limit=2)
+        second = w2.lease(limit=5)
+        assert len(first) == 2 and len(second) == 1
+        assert not set(first) & set(second)
+
+        w1.enqueue([first[0]])      # updated while leased -> must survive the ack
+        w1.ack(first)
+        w2.ack(second)
+        assert w1.peek() == [first[0]]
+        assert w1.depth() == 1
+    finally:
+        if db.has_collection(queue_name):
+            db.delete_collection(queue_name)
+
+
+def test_queue_parks_record_after_max_attempts(maint_fixture):
+    from entity_resolution.core.resolution_queue import ResolutionQueue
+
+    db, person, edge, cluster = maint_fixture
+    queue_name = f"im_queue_{uuid.uuid4().hex[:8]}"
+    try:
+        q = ResolutionQueue(db, person, queue_collection=queue_name, max_attempts=2)
+        q.enqueue(["x"])
+        for _ in range(3):          # contention never uses up the budget
+            assert q.lease() == ["x"]
+            q.release(["x"])
+        for _ in range(2):
+            assert q.lease() == ["x"]
+            q.release(["x"], count_attempt=True)
+        assert q.lease() == []
+        assert q.failed_keys() == ["x"]
+        assert q.depth() == 0
+
+        q.enqueue(["x"])            # record fixed and re-submitted
+        assert q.failed_keys() == []
+        assert q.lease() == ["x"]
+    finally:
+        if db.has_collection(queue_name):
+            db.delete_collection(queue_name)
@@ -6,6 +6,8 @@ LLM calls are mocked — no API key or network required.
 from __future__ import annotations
 
 import json
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -204,3 +206,139 @@ class TestLLMHardening:
         est = v.estimate_cost(num_pairs=100)
         assert est["num_pairs"] == 100
         assert "cost_usd" in est
+
+
+class _CacheDB:
+    """In-memory stand-in for the verdict-cache collection."""
+
+    def __init__(self):
+        self.docs = {}
+        self.queries = 0
+        self.aql = MagicMock()
+        self.aql.execute.side_effect = self._execute
+
+    def has_collection(self, name):
+        return True
+
+    def collection(self, name):
+        col = MagicMock()
+        col.insert.side_effect = lambda doc, overwrite=False: self.docs.__setitem__(doc["_key"], doc)
+        return col
+
+    def _execute(self, query, bind_vars=None):
+        self.queries += 1
+        return iter([self.docs[k] for k in bind_vars["keys"] if k in self.docs])
+
+
+class TestConcurrentVerification:
+    def _verifier(self, **kwargs):
+        from entity_resolution.reasoning.llm_verifier import LLMMatchVerifier
+        return LLMMatchVerifier(model="test/model", api_key="test-key", **kwargs)
+
+    def _slow_completion(self, tracker, delay=0.05):
+        lock = threading.Lock()
+
+        def completion(**kwargs):
+            with lock:
+                tracker["active"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["active"])
+            time.sleep(delay)
+            with lock:
+                tracker["active"] -= 1
+            # Echo the pair's name so callers can check result ordering.
+            prompt = kwargs["messages"][0]["content"]
+            r = MagicMock()
+            r.choices[0].message.content = json.dumps({
+                "decision": "match", "confidence": 0.9,
+                "reasoning": "pair-%d" % int(prompt.split("Item")[1].split('"')[0]),
+            })
+            return r
+        return completion
+
+    def _pairs(self, n):
+        return [({"name": f"Item{i}"}, {"name": f"Item{i} Inc"}, 0.70) for i in range(n)]
+
+    @patch("entity_resolution.reasoning.llm_verifier.litellm")
+    def test_verify_batch_overlaps_calls_and_preserves_order(self, mock_litellm):
+        tracker = {"active": 0, "peak": 0}
+        mock_litellm.completion.side_effect = self._slow_completion(tracker)
+        v = self._verifier(max_concurrency=4)
+        pairs = self._pairs(8)
+        pairs.insert(3, (RECORD_A, RECORD_B, 0.95))  # fast path, stays in place
+        results = v.verify_batch(pairs)
+        assert tracker["peak"] > 1
+        assert results[3]["llm_called"] is False
+        reasons = [r["reasoning"] for i, r in enumerate(results) if i != 3]
+        assert reasons == [f"pair-{i}" for i in range(8)]
+        assert v.stats()["calls"] == 8
+
+    @patch("entity_resolution.reasoning.llm_verifier.litellm")
+    def test_max_calls_budget_holds_under_concurrency(self, mock_litellm):
+        tracker = {"active": 0, "peak": 0}
+        mock_litellm.completion.side_effect = self._slow_completion(tracker)
+        v = self._verifier(max_concurrency=8, max_calls=3)
+        results = v.verify_batch(self._pairs(10))
+        assert mock_litellm.completion.call_count == 3
+        assert sum(r["llm_called"] for r in results) == 3
+        assert sum(r["decision"] == "pending_review" for r in results) == 7
+        assert v.stats()["budget_stops"] == 7
+
+    def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            self._verifier(max_concurrency=0)
+        with pytest.raises(ValueError):
+            self._verifier(requests_per_minute=0)
+
+    def test_token_bucket_paces_after_burst(self):
+        from entity_resolution.reasoning.llm_verifier import _TokenBucket
+        bucket = _TokenBucket(rate=50.0, capacity=2)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        # Two tokens are available immediately; three more need ~60 ms.
+        assert time.monotonic() - start >= 0.05
+
+    @patch("entity_resolution.reasoning.llm_verifier.litellm")
+    def test_verdict_cache_skips_llm_on_repeat(self, mock_litellm):
+        from entity_resolution.reasoning.feedback import VerdictCache
+        tracker = {"active": 0, "peak": 0}
+        mock_litellm.completion.side_effect = self._slow_completion(tracker, delay=0)
+        db = _CacheDB()
+        pairs = self._pairs(3)
+
+        first = self._verifier(verdict_cache=VerdictCache(db), max_concurrency=2)
+        first.verify_batch(pairs)
+        assert mock_litellm.completion.call_count == 3
+        assert len(db.docs) == 3
+
+        # A fresh verifier (new process) reads the persisted verdicts.
+        second = self._verifier(verdict_cache=VerdictCache(db), max_concurrency=2)
+        results = second.verify_batch(pairs)
+        assert mock_litellm.completion.call_count == 3
+        assert all(r["cached"] and not r["llm_called"] for r in results)
+        assert [r["reasoning"] for r in results] == ["pair-0", "pair-1", "pair-2"]
+        assert second.stats()["cache_hits"] == 3
+        assert db.queries == 2  # one batched lookup per verify_batch
+
+        # Single verify() consults the same cache.
+        one = self._verifier(verdict_cache=VerdictCache(db))
+        assert one.verify(*pairs[0])["cached"] is True
+        assert mock_litellm.completion.call_count == 3
+
+    def test_verdict_cache_key_is_order_and_metadata_independent(self):
+        from entity_resolution.reasoning.feedback import VerdictCache
+        from entity_resolution.reasoning.llm_verifier import PROMPT_VERSION
+        a, b = {"_key": "1", "name": "Acme"}, {"_key": "2", "name": "Acme Inc"}
+        key = VerdictCache.key_for("m", PROMPT_VERSION, a, b)
+        assert key == VerdictCache.key_for("m", PROMPT_VERSION, b, a)
+        assert key == VerdictCache.key_for("m", PROMPT_VERSION, {"name": "Acme"}, {"name": "Acme Inc"})
+        assert key != VerdictCache.key_for("other", PROMPT_VERSION, a, b)
+        assert key != VerdictCache.key_for("m", "v0", a, b)
+        assert key != VerdictCache.key_for("m", PROMPT_VERSION, a, {"name": "Acme Ltd"})
+
+    def test_verdict_cache_ignores_indecisive_results(self):
+        from entity_resolution.reasoning.feedback import VerdictCache
+        db = _CacheDB()
+        cache = VerdictCache(db)
+        cache.put("k", {"decision": "error", "confidence": 0.0})
+        assert cache.get("k") is None
@@ -0,0 +1,194 @@
+"""
+Unit tests for MCP background jobs and the advisor result cache.
+
+No live ArangoDB required.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from entity_resolution.mcp import jobs
+from entity_resolution.mcp.jobs import JobManager, ResultCache, collection_revision
+
+
+@pytest.fixture(autouse=True)
+def _fresh_singletons(monkeypatch):
+    monkeypatch.setattr(jobs, "_JOB_MANAGER", None)
+    monkeypatch.setattr(jobs, "_RESULT_CACHE", None)
+    yield
+    if jobs._JOB_MANAGER is not None:
+        jobs._JOB_MANAGER.shutdown()
+
+
+def _wait(manager, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.status(job_id)
+        if job["state"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestJobManager:
+    def test_job_returns_immediately_and_reports_result_and_progress(self):
+        manager = JobManager(max_workers=1)
+        release = threading.Event()
+
+        def work(on_progress):
+            on_progress({"type": "stage_start", "stage": "blocking"})
+            release.wait(5)
+            return {"pairs": 3}
+
+        job = manager.submit("find_duplicates", work)
+        assert job["state"] in ("queued", "running")
+        assert job["result"] is None
+        release.set()
+
+        done = _wait(manager, job["job_id"])
+        assert done["state"] == "succeeded"
+        assert done["result"] == {"pairs": 3}
+        assert done["progress"] == [{"type": "stage_start", "stage": "blocking"}]
+        assert done["elapsed_seconds"] >= 0
+        manager.shutdown()
+
+    def test_failed_job_records_error(self):
+        manager = JobManager(max_workers=1)
+
+        def work(on_progress):
+            raise ValueError("Collection not found: nope")
+
+        job = manager.submit("profile_dataset", work)
+        done = _wait(manager, job["job_id"])
+        assert done["state"] == "failed"
+        assert "Collection not found" in done["error"]
+        manager.shutdown()
+
+    def test_unknown_job_is_none(self):
+        assert JobManager().status("missing") is None
+
+    def test_finished_jobs_are_bounded(self):
+        manager = JobManager(max_workers=1, max_finished=2)
+        ids = []
+        for i in range(4):
+            job = manager.submit("evaluate_blocking_plan", lambda on_progress, i=i: i)
+            _wait(manager, job["job_id"])
+            ids.append(job["job_id"])
+        manager.submit("evaluate_blocking_plan", lambda on_progress: None)
+
+        assert manager.status(ids[0]) is None
+        assert manager.status(ids[-1])["result"] == 3
+        manager.shutdown()
+
+
+class TestResultCache:
+    def test_key_is_stable_and_revision_sensitive(self):
+        a = ResultCache.key("profile_dataset", {"x": 1, "y": [1, 2]}, "rev:1")
+        b = ResultCache.key("profile_dataset", {"y": [1, 2], "x": 1}, "rev:1")
+        assert a == b
+        assert a != ResultCache.key("profile_dataset", {"x": 1, "y": [1, 2]}, "rev:2")
+        assert a != ResultCache.key("other_tool", {"x": 1, "y": [1, 2]}, "rev:1")
+
+    def test_lru_eviction_and_copy_isolation(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", {"v": [1]})
+        cache.put("b", {"v": [2]})
+        cache.get("a")  # refresh "a"
+        cache.put("c", {"v": [3]})
+        assert cache.get("b") is None
+        got = cache.get("a")
+        got["v"].append(99)
+        assert cache.get("a") == {"v": [1]}
+
+    def test_entries_expire(self):
+        cache = ResultCache(ttl_seconds=0.0)
+        cache.put("a", 1)
+        time.sleep(0.001)
+        assert cache.get("a") is None
+
+    def test_collection_revision_falls_back_to_count(self):
+        db = MagicMock()
+        db.has_collection.return_value = True
+        db.collection.return_value.revision.return_value = "_abc"
+        assert collection_revision(db, "companies") == "rev:_abc"
+
+        db.collection.return_value.revision.side_effect = RuntimeError("no revision")
+        db.collection.return_value.count.return_value = 12
+        assert collection_revision(db, "companies") == "count:12"
+
+        db.has_collection.return_value = False
+        assert collection_revision(db, "missing") is None
+
+
+class TestServerIntegration:
+    @patch("entity_resolution.mcp.connection.get_pooled_db")
+    @patch("entity_resolution.mcp.tools.advisor.run_profile_dataset")
+    def test_profile_dataset_is_cached_per_collection_revision(self, mock_profile, mock_get_db):
+        from entity_resolution.mcp import server
+
+        db = MagicMock()
+        db.has_collection.return_value = True
+        db.collection.return_value.revision.return_value = "r1"
+        mock_get_db.return_value = db
+        mock_profile.side_effect = lambda **kw: {
+            "status": "ok", "request_id": kw["request_id"], "result": {"sample_size": 10},
+        }
+
+        first = server.profile_dataset(source_type="collection", dataset_id="companies", request_id="q1")
+        second = server.profile_dataset(source_type="collection", dataset_id="companies", request_id="q2")
+
+        assert mock_profile.call_count == 1
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["request_id"] == "q2"
+        assert second["result"] == first["result"]
+
+        db.collection.return_value.revision.return_value = "r2"  # collection changed
+        server.profile_dataset(source_type="collection", dataset_id="companies")
+        assert mock_profile.call_count == 2
+
+    @patch("entity_resolution.mcp.tools.advisor.run_evaluate_blocking_plan")
+    def test_evaluate_blocking_plan_async_job(self, mock_eval):
+        from entity_resolution.mcp import server
+
+        mock_eval.return_value = {"status": "ok", "request_id": None, "result": {"risk_flags": []}}
+        accepted = server.evaluate_blocking_plan(
+            profile={"field_profiles": []}, blocking_plan={"keys": ["name"]}, run_async=True,
+        )
+        assert accepted["status"] == "accepted"
+        assert accepted["poll_with"] == "job_status"
+
+        done = _wait(jobs.get_job_manager(), accepted["job_id"])
+        status = server.job_status(accepted["job_id"])
+        assert done["state"] == "succeeded"
+        assert status["state"] == "succeeded"
+        assert status["result"]["result"] == {"risk_flags": []}
+        listed = server.job_status()["jobs"]
+        assert [j["job_id"] for j in listed] == [accepted["job_id"]]
+
+    def test_job_status_unknown_id(self):
+        from entity_resolution.mcp import server
+
+        result = server.job_status("does-not-exist")
+        assert result["status"] == "error"
+        assert result["error"]["code"] == "job_not_found"
+
+    @patch("entity_resolution.mcp.tools.pipeline.run_find_duplicates_request")
+    def test_find_duplicates_async_forwards_progress(self, mock_run):
+        from entity_resolution.mcp import server
+
+        def fake_run(**kwargs):
+            kwargs["on_progress"]({"type": "stage_complete", "stage": "blocking"})
+            return {"blocking": {"candidate_pairs": 4}}
+
+        mock_run.side_effect = fake_run
+        accepted = server.find_duplicates(collection="companies", fields=["name"], run_async=True)
+        done = _wait(jobs.get_job_manager(), accepted["job_id"])
+
+        assert done["state"] == "succeeded"
+        assert done["progress"] == [{"type": "stage_complete", "stage": "blocking"}]
+        assert done["result"]["blocking"] == {"candidate_pairs": 4}
@@ -13,6 +13,16 @@ from unittest.mock import MagicMock, patch
 # Helpers / stubs
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _fresh_connection_pool():
+    """Pooled handles must not leak mocked clients between tests."""
+    from entity_resolution.mcp.connection import close_pooled_connections
+
+    close_pooled_connections()
+    yield
+    close_pooled_connections()
+
+
 def _make_db(docs=None, edge_docs=None, collection_count=5):
     """Return a lightweight mock ArangoDB database."""
     db = MagicMock()
@@ -35,6 +45,21 @@ def _make_db(docs=None, edge_docs=None, collection_count=5):
     return db
 
 
+def _projection_aql(docs):
+    """aql.execute stand-in serving the precision gates' projected key fetch."""
+    def _aql(query, bind_vars=None, **kwargs):
+        bind_vars = bind_vars or {}
+        if "d._key IN @keys" not in query:
+            return iter([])
+        rows = []
+        for key in bind_vars["keys"]:
+            if key in docs:
+                row = {f: docs[key][f] for f in bind_vars["fields"] if f in docs[key]}
+                rows.append({**row, "_key": key})
+        return iter(rows)
+    return _aql
+
+
 # ---------------------------------------------------------------------------
 # IncrementalResolver
 # ---------------------------------------------------------------------------
@@ -100,15 +125,40 @@ class TestIncrementalResolver:
     def test_full_scan_fallback_when_no_blocking_keys(self):
         from entity_resolution.core.incremental_resolver import IncrementalResolver
 
-        candidate = {"_key": "k1", "score_field": 42}  # no text fields
+        candidate = {"_key": "k1", "score_field": 42}
         db = _make_db(docs=[candidate])
 
         resolver = IncrementalResolver(
             db=db, collection="things", fields=["score_field"],
             confidence_threshold=0.0,
         )
-        # Should not raise even with non-string field
-        resolver.resolve({"score_field": 42})
+        # A null field yields no blocking key: falls back to a full scan
+        resolver.resolve({"score_field": None})
+        assert "LOWER(LEFT" not in db.aql.execute.call_args.args[0]
+
+    def test_resolve_many_groups_numeric_blocking_fields_like_aql(self):
+        from entity_resolution.core.incremental_resolver import IncrementalResolver
+
+        # LOWER(LEFT(doc.zip, 3)) stringifies numbers (10001.0 -> "10001"),
+        # so b and c are grouped under the "213" / "100" prefixes sent.
+        docs = [
+            {"_key": "a", "_id": "things/a", "zip": "02139"},
+            {"_key": "b", "_id": "things/b", "zip": 2139},
+            {"_key": "c", "_id": "things/c", "zip": 10001.0},
+        ]
+        db = _make_db(docs=docs)
+
+        resolver = IncrementalResolver(
+            db=db, collection="things", fields=["zip"], confidence_threshold=0.0,
+        )
+        results = resolver.resolve_many([
+            {"_key": "q1", "zip": 2138},
+            {"_key": "q2", "zip": "10001"},
+        ])
+
+        assert db.aql.execute.call_args.kwargs["bind_vars"]["prefixes_0"] == ["100", "213"]
+        assert {m["_key"] for m in results[0]} == {"b"}
+        assert {m["_key"] for m in results[1]} == {"c"}
 
 
 # ---------------------------------------------------------------------------
@@ -259,10 +309,8 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {"a1": {"name": "ibm"}, "a2": {"name": "international business machines"}}
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -349,13 +397,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "Acme Holdings"},
             "a2": {"name": "Globex Partners"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -399,13 +445,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "Acme Holdings"},
             "a2": {"name": "Globex Partners"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -452,13 +496,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "River Holdings Limited"},
             "a2": {"name": "Sunset Bistro Group"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -502,13 +544,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "ibm"},
             "a2": {"name": "international business machines"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -549,10 +589,8 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {"a1": {"name": "ibm"}, "a2": {"name": "international business machines"}}
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -598,13 +636,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "ibm"},
             "a2": {"name": "international business machines"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -660,13 +696,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "River Bank Group", "type": "organization"},
             "a2": {"name": "River Bistro", "type": "restaurant"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -709,13 +743,11 @@ class TestFindDuplicates:
         from entity_resolution.mcp.tools.pipeline import run_find_duplicates_request
 
         mock_db = MagicMock()
-        mock_coll = MagicMock()
         docs = {
             "a1": {"name": "ibm"},
             "a2": {"name": "international business machines"},
         }
-        mock_coll.get.side_effect = lambda key: docs.get(key)
-        mock_db.collection.return_value = mock_coll
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
         mock_get_db.return_value = mock_db
         mock_has_any_edges.return_value = False
 
@@ -823,6 +855,78 @@ class TestFindDuplicates:
         assert gate_stats["aliasing"]["managed_ref_applied"] == []
         assert gate_stats["aliasing"]["managed_ref_missing"] == ["missing_ref"]
 
+    def test_precision_gates_fetch_projected_fields_in_one_batch(self):
+        from entity_resolution.mcp.contracts import FindDuplicatesRequest
+        from entity_resolution.mcp.tools.pipeline import _apply_precision_gates
+
+        docs = {
+            "a1": {"name": "Acme Holdings", "kind": "company", "notes": "x" * 1000},
+            "a2": {"name": "Acme Holdings Inc", "kind": "company"},
+            "b1": {"name": "Globex", "kind": "company"},
+        }
+        mock_db = MagicMock()
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
+        req = FindDuplicatesRequest(
+            collection="companies",
+            fields=["name"],
+            strategy="exact",
+            confidence_threshold=0.8,
+            require_token_overlap=True,
+            token_overlap_bypass_score=0.95,
+            token_type_affinity={"holdings": ["company"]},
+            target_type_field="kind",
+        )
+        accepted, gate_stats = _apply_precision_gates(
+            db=mock_db,
+            collection="companies",
+            matches=[("a1", "a2", 0.9), ("a1", "b1", 0.85)],
+            fields=["name"],
+            request=req,
+        )
+
+        assert accepted == [("a1", "a2", 0.9)]
+        assert gate_stats["rejected_token_overlap"] == 1
+        assert mock_db.aql.execute.call_count == 1
+        bind_vars = mock_db.aql.execute.call_args.kwargs["bind_vars"]
+        assert bind_vars["keys"] == ["a1", "a2", "b1"]
+        assert set(bind_vars["fields"]) == {"name", "kind"}
+        mock_db.collection.return_value.get.assert_not_called()
+
+    def test_precision_gate_fetch_is_chunked(self, monkeypatch):
+        from entity_resolution.mcp.tools import pipeline as pipeline_tools
+
+        monkeypatch.setattr(pipeline_tools, "_FETCH_CHUNK", 2)
+        docs = {f"k{i}": {"name": f"n{i}"} for i in range(5)}
+        mock_db = MagicMock()
+        mock_db.aql.execute.side_effect = _projection_aql(docs)
+
+        fetched = pipeline_tools._fetch_doc_projections(
+            mock_db,
+            collection="companies",
+            doc_ids={f"companies/k{i}" for i in range(5)} | {"companies/missing"},
+            fields=["name"],
+        )
+
+        assert mock_db.aql.execute.call_count == 3
+        assert fetched["companies/k3"] == {"name": "n3", "_key": "k3"}
+        assert fetched["companies/missing"] == {}
+
+    def test_unresolved_doc_ids_subtracts_one_edge_collect(self):
+        from entity_resolution.mcp.tools.pipeline import _get_unresolved_doc_ids
+
+        mock_db = MagicMock()
+        mock_db.has_collection.return_value = True
+
+        def _aql(query, bind_vars=None, **kwargs):
+            if "COLLECT" in query:
+                assert bind_vars["prefix"] == "companies/"
+                return iter(["companies/a", "companies/b"])
+            return iter(["companies/a", "companies/b", "companies/c"])
+
+        mock_db.aql.execute.side_effect = _aql
+        assert _get_unresolved_doc_ids(mock_db, "companies", "edges") == {"companies/c"}
+        assert mock_db.aql.execute.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # MCP tool: explain_match
@@ -867,7 +971,7 @@ def test_probabilistic_explanation_uses_creation_time_across_config_versions():
 
 
 class TestExplainMatch:
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_returns_breakdown(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -895,7 +999,7 @@ class TestExplainMatch:
         }
         assert "gates" not in result
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_missing_doc(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -910,7 +1014,7 @@ class TestExplainMatch:
         )
         assert "error" in result
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_includes_gate_failures(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -964,7 +1068,7 @@ class TestExplainMatch:
         assert gates["aliasing"]["inline_alias_count"] == 1
         assert gates["token_jaccard"]["configured"] is False
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_token_jaccard_similarity_failure(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -997,7 +1101,7 @@ class TestExplainMatch:
         assert "token_jaccard" in failures
         assert result["gates"]["token_jaccard"]["configured"] is True
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_token_overlap_uses_managed_ref_aliases(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1039,7 +1143,7 @@ class TestExplainMatch:
         assert result["gates"]["aliasing"]["managed_ref_applied"] == ["entity_aliases_v1"]
         assert result["gates"]["aliasing"]["managed_ref_missing"] == []
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_reports_missing_managed_ref_alias(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1078,7 +1182,7 @@ class TestExplainMatch:
         failures = [f["gate"] for f in result["gates"]["summary"]["gate_failures"]]
         assert "token_overlap" in failures
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_empty_managed_ref_map_counts_as_applied(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1117,7 +1221,7 @@ class TestExplainMatch:
         failures = [f["gate"] for f in result["gates"]["summary"]["gate_failures"]]
         assert "token_overlap" in failures
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_non_list_aliasing_sources(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1142,7 +1246,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": {"type": "managed_ref", "ref": "entity_aliases_v1"}}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_non_object_alias_source_entry(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1167,7 +1271,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": ["managed_ref"]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_alias_source_without_type(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1192,7 +1296,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": [{}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_non_object_inline_alias_map(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1217,7 +1321,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": [{"type": "inline", "map": ["bad"]}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_field_alias_source_without_field(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1242,7 +1346,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": [{"type": "field"}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_non_object_managed_refs(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1272,7 +1376,7 @@ class TestExplainMatch:
                 },
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_non_object_managed_ref_entry(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1302,7 +1406,7 @@ class TestExplainMatch:
                 },
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_managed_ref_without_ref(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1327,7 +1431,7 @@ class TestExplainMatch:
                 options={"aliasing": {"sources": [{"type": "managed_ref"}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_explain_match_rejects_unknown_alias_source_type(self, mock_client_cls):
         from entity_resolution.mcp.tools.entity import run_explain_match
 
@@ -1354,7 +1458,7 @@ class TestExplainMatch:
 
 
 class TestResolveEntityCrossCollection:
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     @patch("entity_resolution.services.cross_collection_matching_service.CrossCollectionMatchingService")
     def test_run_resolve_cross_collection_request_with_guardrails(self, mock_service_cls, mock_client_cls):
         from entity_resolution.mcp.normalization import normalize_cross_collection_args
@@ -1436,7 +1540,7 @@ class TestResolveEntityCrossCollection:
 # ---------------------------------------------------------------------------
 
 class TestListCollections:
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_returns_non_system_collections(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_list_collections
 
@@ -1465,7 +1569,7 @@ class TestListCollections:
 # ---------------------------------------------------------------------------
 
 class TestGetClusters:
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_get_clusters_returns_quality_fields_when_present(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_get_clusters
 
@@ -1501,7 +1605,7 @@ class TestGetClusters:
         assert result[0]["density"] == 1.0
         assert "quality_score" in result[0]
 
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_get_clusters_preserves_older_docs_without_quality_fields(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_get_clusters
 
@@ -1536,7 +1640,7 @@ class TestGetClusters:
         assert result[0]["average_similarity"] is None
         assert result[0]["quality_score"] is None
 
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_get_clusters_fallback_includes_similarity_stats(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_get_clusters
 
@@ -1571,7 +1675,7 @@ class TestGetClusters:
 # ---------------------------------------------------------------------------
 
 class TestMergeEntities:
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_merge_entities_uses_most_complete_and_backfills_missing_fields(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_merge_entities
 
@@ -1602,7 +1706,7 @@ class TestMergeEntities:
         assert result["golden_record"]["phone"] == "6175551234"
         assert result["golden_record"]["city"] == "Boston"
 
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_merge_entities_newest_prefers_latest_timestamp(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_merge_entities
 
@@ -1630,7 +1734,7 @@ class TestMergeEntities:
         assert result["canonical_key"] == "b1"
         assert result["golden_record"]["name"] == "Acme Corporation"
 
-    @patch("entity_resolution.mcp.tools.cluster.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_merge_entities_rejects_missing_docs(self, mock_client_cls):
         from entity_resolution.mcp.tools.cluster import run_merge_entities
 
@@ -1658,7 +1762,7 @@ class TestMergeEntities:
 # ---------------------------------------------------------------------------
 
 class TestAdvisorTools:
-    @patch("entity_resolution.mcp.tools.advisor.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_profile_dataset_returns_field_profiles(self, mock_client_cls):
         from entity_resolution.mcp.tools.advisor import run_profile_dataset
 
@@ -2193,7 +2297,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": {"type": "managed_ref"}}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_non_list_aliasing_sources(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2213,7 +2317,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": {"type": "managed_ref", "ref": "entity_aliases_v1"}}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_non_object_alias_source_entry(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2233,7 +2337,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": ["managed_ref"]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_alias_source_without_type(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2253,7 +2357,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": [{}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_non_object_inline_alias_map(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2273,7 +2377,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": [{"type": "inline", "map": ["bad"]}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_field_alias_source_without_field(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2293,7 +2397,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": [{"type": "field"}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_non_object_managed_ref_entry(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2318,7 +2422,7 @@ class TestMcpServerOptionsCompatibility:
                 },
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_non_object_managed_refs(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2343,7 +2447,7 @@ class TestMcpServerOptionsCompatibility:
                 },
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_accepts_null_managed_refs(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2371,7 +2475,7 @@ class TestMcpServerOptionsCompatibility:
         assert result["gates"]["aliasing"]["managed_ref_applied"] == []
         assert result["gates"]["aliasing"]["managed_ref_missing"] == ["entity_aliases_v1"]
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_managed_ref_without_ref(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2391,7 +2495,7 @@ class TestMcpServerOptionsCompatibility:
                 options={"aliasing": {"sources": [{"type": "managed_ref"}]}},
             )
 
-    @patch("entity_resolution.mcp.tools.entity.ArangoClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
     def test_server_explain_match_rejects_unknown_alias_source_type(self, mock_client_cls):
         from entity_resolution.mcp import server
 
@@ -2852,3 +2956,71 @@ class TestMcpServerOptionsCompatibility:
         req = mock_run.call_args.kwargs["request"]
         assert req.source_fields == {"company": "BR_Name"}
         assert req.target_fields == {"company": "DUNS_NAME"}
+
+
+# ---------------------------------------------------------------------------
+# Connection pooling
+# ---------------------------------------------------------------------------
+
+class TestConnectionPool:
+    _ARGS = dict(host="localhost", port=8529, username="root", password="pass", database="test")
+
+    @patch("entity_resolution.mcp.connection.ArangoClient")
+    def test_repeat_calls_reuse_one_client_and_handle(self, mock_client_cls):
+        from entity_resolution.mcp.connection import get_pooled_db
+
+        first = get_pooled_db(**self._ARGS)
+        second = get_pooled_db(**self._ARGS)
+
+        assert first is second
+        assert mock_client_cls.call_count == 1
+        assert mock_client_cls.return_value.db.call_count == 1
+
+    @patch("entity_resolution.mcp.connection.ArangoClient")
+    def test_handles_are_keyed_by_database_and_credentials(self, mock_client_cls):
+        from entity_resolution.mcp.connection import get_pooled_db
+
+        mock_client_cls.return_value.db.side_effect = lambda *a, **k: MagicMock()
+        base = get_pooled_db(**self._ARGS)
+        other_db = get_pooled_db(**{**self._ARGS, "database": "other"})
+        other_pw = get_pooled_db(**{**self._ARGS, "password": "changed"})
+
+        assert len({id(base), id(other_db), id(other_pw)}) == 3
+        assert mock_client_cls.call_count == 1  # one HTTP session per endpoint
+
+    @patch("entity_resolution.mcp.connection.DefaultHTTPClient")
+    @patch("entity_resolution.mcp.connection.ArangoClient")
+    def test_pool_settings_come_from_environment(self, mock_client_cls, mock_http_cls, monkeypatch):
+        from entity_resolution.mcp.connection import get_pooled_db
+
+        monkeypatch.setenv("ARANGO_POOL_SIZE", "32")
+        monkeypatch.setenv("ARANGO_REQUEST_TIMEOUT", "5")
+        get_pooled_db(**self._ARGS)
+
+        assert mock_http_cls.call_args.kwargs == {
+            "request_timeout": 5.0, "pool_connections": 32, "pool_maxsize": 32,
+        }
+        assert mock_client_cls.call_args.kwargs["http_client"] is mock_http_cls.return_value
+
+    @patch("entity_resolution.mcp.connection.ArangoClient")
+    def test_idle_handle_failing_health_check_is_rebuilt(self, mock_client_cls, monkeypatch):
+        from entity_resolution.mcp.connection import get_pooled_db
+
+        monkeypatch.setenv("ARANGO_POOL_HEALTH_CHECK_SECONDS", "0")
+        broken, fresh = MagicMock(), MagicMock()
+        broken.version.side_effect = ConnectionError("connection reset")
+        mock_client_cls.return_value.db.side_effect = [broken, fresh]
+
+        assert get_pooled_db(**self._ARGS) is broken
+        assert get_pooled_db(**self._ARGS) is fresh
+        assert mock_client_cls.return_value.close.called
+
+    @patch("entity_resolution.mcp.connection.ArangoClient")
+    def test_healthy_idle_handle_is_kept(self, mock_client_cls, monkeypatch):
+        from entity_resolution.mcp.connection import get_pooled_db
+
+        monkeypatch.setenv("ARANGO_POOL_HEALTH_CHECK_SECONDS", "0")
+        db = get_pooled_db(**self._ARGS)
+        assert get_pooled_db(**self._ARGS) is db
+        assert db.version.called
+        assert mock_client_cls.return_value.db.call_count == 1
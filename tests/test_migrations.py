@@ -192,3 +192,13 @@ def test_audit_history_index_migration_is_applied_and_idempotent():
     ]
     assert len(history_indexes) == 1
     assert history_indexes[0]["name"] == "idx_audit_history"
+
+
+def test_resolution_queue_index_migration_creates_collection_and_index():
+    db = _FakeDB()
+    _runner(db).migrate()
+    queue = db.collection("er_resolution_queue")
+    assert queue.indexes_created == [{
+        "fields": ["collection", "lease_until"], "name": "idx_queue_lease",
+        "sparse": False, "unique": False,
+    }]
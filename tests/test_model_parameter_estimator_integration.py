@@ -342,8 +342,8 @@ def test_explain_match_includes_probabilistic_waterfall(estimation_fixture, monk
 
     from entity_resolution.mcp.tools import entity as entity_tools
 
-    # run_explain_match opens its own client; point it at this test database.
-    monkeypatch.setattr(entity_tools, "ArangoClient", lambda hosts: _StubClient(db))
+    # run_explain_match opens its own handle; point it at this test database.
+    monkeypatch.setattr(entity_tools, "get_pooled_db", lambda *args: db)
 
     result = entity_tools.run_explain_match(
         host="localhost", port=8529, username="root", password="x",
@@ -373,7 +373,7 @@ def test_explain_match_without_a_trained_model_returns_none(estimation_fixture,
 
     from entity_resolution.mcp.tools import entity as entity_tools
 
-    monkeypatch.setattr(entity_tools, "ArangoClient", lambda hosts: _StubClient(db))
+    monkeypatch.setattr(entity_tools, "get_pooled_db", lambda *args: db)
     result = entity_tools.run_explain_match(
         host="localhost", port=8529, username="root", password="x",
         database=db.name, collection=vcol,
@@ -386,16 +386,6 @@ def test_explain_match_without_a_trained_model_returns_none(estimation_fixture,
     assert "name" in result["field_breakdown"]
 
 
-class _StubClient:
-    """Returns the already-connected test database, ignoring credentials."""
-
-    def __init__(self, db):
-        self._db = db
-
-    def db(self, *_args, **_kwargs):
-        return self._db
-
-
 def test_config_mismatch_reports_the_mismatch_not_missing_model(
     estimation_fixture, caplog
 ):
@@ -117,3 +117,98 @@ class TestMultiStrategyOrchestrator:
         result = orch.run()
         assert len(result) == 1
         assert sorted(result[0]["sources"]) == ["Alpha", "Beta", "Gamma"]
+
+
+class TestParallelAndCostOrdered:
+    def test_parallel_runs_strategies_concurrently_and_keeps_order(self):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _blocking(name, pairs):
+            s = _make_strategy(name, pairs)
+
+            def generate():
+                barrier.wait()  # deadlocks unless both run at once
+                return pairs
+
+            s.generate_candidates.side_effect = generate
+            return s
+
+        s1 = _blocking("Collect", [{"doc1_key": "a", "doc2_key": "b"}])
+        s2 = _blocking("BM25", [{"doc1_key": "c", "doc2_key": "d"}])
+        orch = MultiStrategyOrchestrator(strategies=[s1, s2], parallel=True)
+        result = orch.run()
+
+        assert [p["sources"] for p in result] == [["Collect"], ["BM25"]]
+        stats = orch.get_statistics()
+        assert stats["parallel"] is True
+        assert [s["strategy_name"] for s in stats["per_strategy"]] == ["Collect", "BM25"]
+
+    def test_cost_ordered_requires_intersection_and_serial(self):
+        s = _make_strategy("S1", [])
+        with pytest.raises(ValueError, match="intersection"):
+            MultiStrategyOrchestrator(strategies=[s], cost_ordered=True)
+        with pytest.raises(ValueError, match="parallel"):
+            MultiStrategyOrchestrator(
+                strategies=[s], merge_mode="intersection", cost_ordered=True, parallel=True
+            )
+
+    def test_cost_ordered_matches_intersection(self):
+        pairs1 = [{"doc1_key": "a", "doc2_key": "b"}, {"doc1_key": "c", "doc2_key": "d"}]
+        pairs2 = [{"doc1_key": "b", "doc2_key": "a"}, {"doc1_key": "e", "doc2_key": "f"}]
+        orch = MultiStrategyOrchestrator(
+            strategies=[_make_strategy("S1", pairs1), _make_strategy("S2", pairs2)],
+            merge_mode="intersection",
+            cost_ordered=True,
+        )
+        result = orch.run()
+        assert len(result) == 1
+        assert sorted(result[0]["sources"]) == ["S1", "S2"]
+        assert orch.get_statistics()["per_strategy"][1]["surviving_candidates"] == 1
+
+    def test_cost_ordered_skips_remaining_strategies_once_empty(self):
+        s1 = _make_strategy("S1", [{"doc1_key": "a", "doc2_key": "b"}])
+        s2 = _make_strategy("S2", [{"doc1_key": "c", "doc2_key": "d"}])
+        s3 = _make_strategy("S3", [{"doc1_key": "a", "doc2_key": "b"}])
+        orch = MultiStrategyOrchestrator(
+            strategies=[s1, s2, s3], merge_mode="intersection", cost_ordered=True
+        )
+        assert orch.run() == []
+        s3.generate_candidates.assert_not_called()
+        assert orch.get_statistics()["strategies_skipped"] == ["S3"]
+
+    def test_cost_ordered_runs_most_selective_first_on_rerun(self):
+        broad = _make_strategy(
+            "Broad", [{"doc1_key": "a", "doc2_key": "b"}, {"doc1_key": "c", "doc2_key": "d"}]
+        )
+        narrow = _make_strategy("Narrow", [{"doc1_key": "a", "doc2_key": "b"}])
+        orch = MultiStrategyOrchestrator(
+            strategies=[broad, narrow], merge_mode="intersection", cost_ordered=True
+        )
+        orch.run()
+        orch.run()
+        names = [s["strategy_name"] for s in orch.get_statistics()["per_strategy"]]
+        assert names == ["Narrow", "Broad"]
+
+    def test_from_config_reads_execution_options(self):
+        db = MagicMock()
+        config = {
+            "merge_mode": "intersection",
+            "cost_ordered": True,
+            "strategies": [
+                {"type": "collect", "collection": "companies", "blocking_fields": ["phone"]},
+            ],
+        }
+        orch = MultiStrategyOrchestrator.from_config(db, config)
+        assert orch.cost_ordered is True
+        assert orch.parallel is False
+
+        config = {
+            "parallel": True,
+            "max_workers": 2,
+            "strategies": config["strategies"],
+        }
+        orch = MultiStrategyOrchestrator.from_config(db, config)
+        assert orch.parallel is True
+        assert orch.max_workers == 2
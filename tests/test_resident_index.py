@@ -0,0 +1,163 @@
+"""Unit tests for the resident in-memory blocking index."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from entity_resolution.core.incremental_resolver import IncrementalResolver
+from entity_resolution.core.resident_index import ResidentBlockingIndex
+
+
+def _db(docs):
+    db = MagicMock()
+    db.aql.execute.side_effect = lambda query, bind_vars=None, **kw: iter(
+        [{k: d[k] for k in bind_vars["fields"] if k in d} for d in docs]
+    )
+    return db
+
+
+DOCS = [
+    {"_key": "a", "name": "Acme Corporation", "city": "Boston", "extra": "x" * 100},
+    {"_key": "b", "name": "Acme Corp", "city": "Boston"},
+    {"_key": "c", "name": "Globex", "city": "Springfield"},
+]
+
+
+def test_build_projects_fields_and_streams():
+    db = _db(DOCS)
+    index = ResidentBlockingIndex("companies", ["name", "city"])
+    assert index.build(db) == 3
+    kwargs = db.aql.execute.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["bind_vars"]["fields"] == ["_key", "name", "city"]
+    assert "extra" not in index.candidates({"name": "Acme"})[0]
+
+
+def test_prefix_candidates_match_aql_prefix_semantics():
+    index = ResidentBlockingIndex("companies", ["name", "city"])
+    index.build(_db(DOCS))
+    keys = {c["_key"] for c in index.candidates({"name": "ACME Inc"})}
+    assert keys == {"a", "b"}
+    cands = index.candidates({"city": "Springfield"}, exclude_key="c")
+    assert cands == []
+    assert index.candidates({"name": "Acme"})[0]["_id"].startswith("companies/")
+
+
+def test_prefix_keys_stringify_scalars_like_aql():
+    index = ResidentBlockingIndex("things", ["zip"], key_types=("prefix", "token"))
+    index.build(_db([{"_key": "a", "zip": 2139}, {"_key": "b", "zip": 2139.0}]))
+    assert {c["_key"] for c in index.candidates({"zip": "21390"})} == {"a", "b"}
+    assert index.blocking_keys({"zip": True}) == {("prefix", "zip", "tru")}
+
+
+def test_phonetic_and_token_keys():
+    index = ResidentBlockingIndex("companies", ["name"], key_types=("phonetic", "token"))
+    index.build(_db(DOCS))
+    # "Akme" shares a Soundex code with "Acme" but not a prefix.
+    assert {c["_key"] for c in index.candidates({"name": "Akme"})} == {"a", "b"}
+    assert {c["_key"] for c in index.candidates({"name": "the corporation"})} == {"a"}
+
+
+def test_hub_keys_are_skipped(caplog):
+    index = ResidentBlockingIndex("companies", ["city"], key_types=("token",), max_postings=1)
+    index.build(_db(DOCS))
+    with caplog.at_level("WARNING", logger="entity_resolution.core.resident_index"):
+        assert index.candidates({"city": "Boston"}) == []
+    assert "skipping hub key" in caplog.text
+    assert [c["_key"] for c in index.candidates({"city": "Springfield"})] == ["c"]
+
+
+def test_prefix_postings_are_served_in_full_by_default():
+    index = ResidentBlockingIndex("companies", ["city"], max_postings=1)
+    index.build(_db(DOCS))
+    # Same candidates as the AQL prefix filter, however common the prefix.
+    assert {c["_key"] for c in index.candidates({"city": "Boston"})} == {"a", "b"}
+
+    capped = ResidentBlockingIndex("companies", ["city"], max_prefix_postings=1)
+    capped.build(_db(DOCS))
+    assert capped.candidates({"city": "Boston"}) == []
+
+
+def test_concurrent_first_lookups_build_once():
+    import threading
+    import time
+
+    db = _db(DOCS)
+    inner = db.aql.execute.side_effect
+
+    def slow_execute(*args, **kwargs):
+        time.sleep(0.05)
+        return inner(*args, **kwargs)
+
+    db.aql.execute.side_effect = slow_execute
+    index = ResidentBlockingIndex("companies", ["name", "city"])
+    resolver = IncrementalResolver(db, "companies", ["name", "city"], resident_index=index)
+    threads = [
+        threading.Thread(target=resolver.resolve, args=({"name": "Acme"},)) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert db.aql.execute.call_count == 1
+
+
+
+def test_ranked_candidates_orders_by_shared_keys():
+    index = ResidentBlockingIndex("companies", ["name"], key_types=("prefix", "token"))
+    index.build(_db(DOCS))
+    ranked = index.ranked_candidates({"name": "Acme Corporation"}, limit=5)
+    # "a" shares prefix + both tokens; "b" only prefix + "acme".
+    assert [c["_key"] for c in ranked] == ["a", "b"]
+    assert [c["_key"] for c in index.ranked_candidates({"name": "Acme"}, limit=1)] == ["a"]
+    assert index.ranked_candidates({"name": "Acme"}, limit=5, exclude_key="a")[0]["_key"] == "b"
+
+def test_upsert_and_remove_keep_postings_fresh():
+    index = ResidentBlockingIndex("companies", ["name"])
+    index.build(_db(DOCS))
+    index.upsert({"_key": "a", "name": "Initech", "ignored": 1})
+    assert {c["_key"] for c in index.candidates({"name": "Acme"})} == {"b"}
+    assert [c["_key"] for c in index.candidates({"name": "Initrode"})] == ["a"]
+    assert index.remove("a") is True
+    assert index.remove("a") is False
+    assert index.candidates({"name": "Initech"}) == []
+    assert len(index) == 2
+
+
+def test_refresh_removes_deleted_keys():
+    index = ResidentBlockingIndex("companies", ["name"])
+    index.build(_db(DOCS))
+    index.refresh(_db([{"_key": "b", "name": "Bluth"}]), ["a", "b"])
+    assert "a" not in index
+    assert [c["_key"] for c in index.candidates({"name": "Blue"})] == ["b"]
+
+
+def test_invalid_configuration_rejected():
+    with pytest.raises(ValueError):
+        ResidentBlockingIndex("companies", ["name"], key_types=("bogus",))
+    with pytest.raises(ValueError):
+        ResidentBlockingIndex("companies", [])
+
+
+def test_resolver_uses_resident_index_without_queries():
+    db = _db(DOCS)
+    index = ResidentBlockingIndex("companies", ["name", "city"])
+    resolver = IncrementalResolver(
+        db, "companies", ["name", "city"], confidence_threshold=0.8, resident_index=index,
+    )
+    first = resolver.resolve({"name": "Acme Corp", "city": "Boston"})
+    assert {m["_key"] for m in first} == {"a", "b"}
+    calls = db.aql.execute.call_count
+    resolver.resolve({"name": "Acme Corp", "city": "Boston"}, exclude_key="b")
+    # Built lazily once; later resolves never hit the database.
+    assert db.aql.execute.call_count == calls == 1
+
+
+def test_resolver_rejects_index_missing_fields():
+    index = ResidentBlockingIndex("companies", ["name"])
+    with pytest.raises(ValueError):
+        IncrementalResolver(MagicMock(), "companies", ["name", "city"], resident_index=index)
+    with pytest.raises(ValueError):
+        IncrementalResolver(MagicMock(), "other", ["name"], resident_index=index)
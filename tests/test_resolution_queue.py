@@ -0,0 +1,167 @@
+"""Unit tests for the lease-based incremental resolution queue."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from entity_resolution.core.incremental_maintainer import IncrementalMaintainer
+from entity_resolution.core.resolution_queue import ResolutionQueue
+
+
+def _db(results=None):
+    db = MagicMock()
+    db.has_collection.return_value = False
+    db.aql.execute.side_effect = lambda q, bind_vars=None, **kw: iter(results or [])
+    return db
+
+
+def test_creates_queue_collection_with_lease_index():
+    db = _db()
+    ResolutionQueue(db, "people")
+    db.create_collection.assert_called_once_with("er_resolution_queue")
+    db.collection.return_value.add_persistent_index.assert_called_once_with(
+        fields=["collection", "lease_until"], name="idx_queue_lease",
+    )
+
+
+def test_enqueue_dedupes_and_scopes_entries_by_collection():
+    db = _db()
+    q = ResolutionQueue(db, "people")
+    assert q.enqueue(["a", "b", "a", None]) == 2
+    bv = db.aql.execute.call_args.kwargs["bind_vars"]
+    assert [e["record_key"] for e in bv["entries"]] == ["a", "b"]
+    assert {e["collection"] for e in bv["entries"]} == {"people"}
+    # Entry keys are stable per (collection, key) so re-enqueue is an upsert.
+    assert bv["entries"][0]["_key"] == q._entry_key("a")
+    assert q._entry_key("a") != ResolutionQueue(db, "companies")._entry_key("a")
+
+
+def test_lease_claims_for_this_worker_and_retries_conflicts():
+    db = _db()
+    q = ResolutionQueue(db, "people", worker_id="w1")
+    calls = {"n": 0}
+
+    def execute(query, bind_vars=None, **kw):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("write-write conflict")
+        return iter(["a", "b"])
+
+    db.aql.execute.side_effect = execute
+    assert q.lease(limit=2, lease_seconds=30) == ["a", "b"]
+    bv = db.aql.execute.call_args.kwargs["bind_vars"]
+    assert bv["owner"] == "w1"
+    assert bv["until"] - bv["now"] == 30
+
+
+def test_lease_parks_entries_that_used_up_their_attempts():
+    db = _db()
+    q = ResolutionQueue(db, "people", max_attempts=3)
+    # The query returns null for entries it marked failed instead of leasing.
+    db.aql.execute.side_effect = lambda query, bind_vars=None, **kw: iter(["a", None, "c"])
+    assert q.lease(limit=3) == ["a", "c"]
+    query = db.aql.execute.call_args.args[0]
+    bv = db.aql.execute.call_args.kwargs["bind_vars"]
+    assert "q.attempts >= @max_attempts" in query and "failed: true" in query
+    assert bv["max_attempts"] == 3
+    assert bv["failed_until"] > bv["until"]
+
+
+def test_enqueue_revives_failed_entries():
+    db = _db()
+    ResolutionQueue(db, "people").enqueue(["a"])
+    query = db.aql.execute.call_args.args[0]
+    assert "OLD.failed == true" in query and "attempts: 0" in query
+
+
+def test_rejects_invalid_max_attempts():
+    with pytest.raises(ValueError, match="max_attempts"):
+        ResolutionQueue(_db(), "people", max_attempts=0)
+
+
+def test_ack_removes_then_releases_requeued_entries():
+    db = _db()
+    q = ResolutionQueue(db, "people", worker_id="w1")
+    q.ack(["a"])
+    queries = [c.args[0] for c in db.aql.execute.call_args_list]
+    assert "REMOVE q" in queries[0] and "requeue != true" in queries[0]
+    assert "lease_until: 0" in queries[1]
+    q.ack([])
+    assert db.aql.execute.call_count == 2
+
+
+def test_release_gives_back_the_attempt_unless_counted():
+    db = _db()
+    q = ResolutionQueue(db, "people", worker_id="w1")
+    q.release(["a"])
+    query = db.aql.execute.call_args.args[0]
+    assert "MAX([0, q.attempts - 1])" in query
+    assert db.aql.execute.call_args.kwargs["bind_vars"]["count_attempt"] is False
+    q.release(["a"], count_attempt=True)
+    assert db.aql.execute.call_args.kwargs["bind_vars"]["count_attempt"] is True
+
+
+def test_maintainer_drain_acks_resolved_and_releases_locked():
+    queue = MagicMock()
+    queue.lease.return_value = ["a", "b", "c"]
+    m = IncrementalMaintainer(
+        db=MagicMock(), collection="people", fields=["name"],
+        edge_collection="edges", cluster_collection="clusters", queue=queue,
+    )
+    m.resolve_many = MagicMock(return_value={
+        "resolved": ["a"], "matches": {}, "locked": ["b"], "missing": ["c"], "recluster": None,
+    })
+    out = m.drain(limit=3)
+    assert out["leased"] == ["a", "b", "c"]
+    queue.ack.assert_called_once_with(["a", "c"])
+    assert queue.release.call_args_list == [call(["b"]), call([], count_attempt=True)]
+
+
+def test_maintainer_drain_releases_batch_on_error():
+    queue = MagicMock()
+    queue.lease.return_value = ["a"]
+    m = IncrementalMaintainer(
+        db=MagicMock(), collection="people", fields=["name"],
+        edge_collection="edges", cluster_collection="clusters", queue=queue,
+    )
+    m.resolve_many = MagicMock(side_effect=RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        m.drain()
+    queue.release.assert_called_once_with(["a"], count_attempt=True)
+    queue.ack.assert_not_called()
+
+
+def test_maintainer_drain_isolates_failing_record():
+    queue = MagicMock()
+    queue.lease.return_value = ["a", "bad", "c"]
+    m = IncrementalMaintainer(
+        db=MagicMock(), collection="people", fields=["name"],
+        edge_collection="edges", cluster_collection="clusters", queue=queue,
+    )
+
+    def resolve_many(keys, **kwargs):
+        if "bad" in keys:
+            raise ValueError("malformed record")
+        return {"resolved": list(keys), "matches": {}, "locked": [], "missing": [], "recluster": None}
+
+    m.resolve_many = MagicMock(side_effect=resolve_many)
+    out = m.drain(limit=3)
+    assert out["resolved"] == ["a", "c"]
+    assert out["failed"] == ["bad"]
+    queue.ack.assert_called_once_with(["a", "c"])
+    # Released with its lease counted, so the queue parks it at max_attempts.
+    assert queue.release.call_args_list == [call([]), call(["bad"], count_attempt=True)]
+
+
+def test_pending_keys_reads_queue_when_configured():
+    queue = MagicMock()
+    queue.peek.return_value = ["x"]
+    db = MagicMock()
+    m = IncrementalMaintainer(
+        db=db, collection="people", fields=["name"],
+        edge_collection="edges", cluster_collection="clusters", queue=queue,
+    )
+    assert m.pending_keys(5) == ["x"]
+    db.aql.execute.assert_not_called()
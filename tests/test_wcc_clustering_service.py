@@ -143,6 +143,58 @@ class TestWCCClusteringService:
         assert stored["density"] == 1.0
         assert stored["quality_score"] > 0.0
 
+    def test_store_clusters_maintains_membership_index(self, db):
+        service = WCCClusteringService(
+            db=db,
+            edge_collection="similarTo",
+            cluster_collection="entity_clusters",
+            vertex_collection="companies",
+            maintain_membership=True,
+        )
+        # Created when clusters are stored, not as a construction side effect.
+        assert not db.has_collection("entity_clusters_membership")
+
+        service.store_clusters([["a", "b"], ["c", "d"]])
+
+        assert db.has_collection("entity_clusters_membership")
+        (run,) = {doc["membership_run"] for doc in db.collection("entity_clusters").docs}
+        rows = [r for q, bv in db.aql.calls if "@members" in bv for r in bv.get("rows", [])]
+        assert rows == [
+            {"_key": "a", "cluster_key": "cluster_000000", "run": run},
+            {"_key": "b", "cluster_key": "cluster_000000", "run": run},
+            {"_key": "c", "cluster_key": "cluster_000001", "run": run},
+            {"_key": "d", "cluster_key": "cluster_000001", "run": run},
+        ]
+
+    def test_get_cluster_by_member_reads_membership_index(self, db):
+        from unittest.mock import PropertyMock, patch
+
+        from entity_resolution.services.cluster_membership import ClusterMembershipIndex
+
+        service = WCCClusteringService(
+            db=db,
+            edge_collection="similarTo",
+            cluster_collection="entity_clusters",
+            vertex_collection="companies",
+            maintain_membership=True,
+        )
+        db.collection("entity_clusters_membership").by_key["c"] = {"cluster_key": "cluster_000001"}
+        db.collection("entity_clusters").by_key["cluster_000001"] = {"_key": "cluster_000001"}
+
+        with patch.object(ClusterMembershipIndex, "available", new_callable=PropertyMock, return_value=True):
+            assert service.get_cluster_by_member("companies/c") == {"_key": "cluster_000001"}
+            assert service.get_cluster_by_member("z") is None
+        assert not db.aql.calls  # no cluster-array scan
+
+    def test_membership_index_is_opt_in(self, db):
+        service = WCCClusteringService(db=db, edge_collection="similarTo")
+        assert service.membership is None
+
+        service.store_clusters([["a", "b"]])
+
+        assert not db.has_collection("entity_clusters_membership")
+        assert "membership_run" not in db.collection("entity_clusters").docs[0]
+
 
 # Mock fixtures for testing
 @pytest.fixture
@@ -152,6 +204,10 @@ def db():
         def __init__(self, name):
             self.name = name
             self.docs = []
+            self.by_key = {}
+        
+        def get(self, key):
+            return self.by_key.get(key)
         
         def truncate(self):
             self.docs = []
@@ -169,8 +225,11 @@ def db():
     class MockAQL:
         def __init__(self):
             self.edges = []
+            self.calls = []
 
         def execute(self, query, bind_vars=None):
+            if "similarity: e.similarity" not in query:
+                self.calls.append((query, bind_vars or {}))
             if "similarity: e.similarity" in query:
                 return list(self.edges)
             # Return empty results for test
@@ -4,6 +4,7 @@ Unit Tests for WeightedFieldSimilarity
 Comprehensive unit tests for the WeightedFieldSimilarity component.
 """
 
+import math
 import pytest
 import sys
 import os
@@ -550,3 +551,119 @@ class TestPhoneticTransformers:
     def test_distinct_names_do_not_collide(self):
         sim = self._sim("soundex")
         assert sim.compute({"name": "Robert"}, {"name": "Xavier"}) < 1.0
+
+
+class TestBatchKernels:
+    """compute_batch() must reproduce compute() exactly on every backend."""
+
+    DOCS1 = [
+        {"name": "John Smith", "city": "Boston", "note": "x"},
+        {"name": "Acme Corp", "city": None},
+        {"name": "", "city": "Paris"},
+        {"name": "Jane Doe", "city": "NYC"},
+        {"city": "Berlin"},
+    ]
+    DOCS2 = [
+        {"name": "Jon Smith", "city": "Boston"},
+        {"name": "ACME Corporation", "city": "Austin"},
+        {"name": "Bob", "city": "Paris"},
+        {"name": "Jane Doe", "city": "NYC"},
+        {"name": "Hans", "city": "Berlin "},
+    ]
+
+    @pytest.mark.parametrize("algorithm", ["jaro_winkler", "levenshtein", "jaccard", "overlap"])
+    @pytest.mark.parametrize("handle_nulls", ["skip", "zero", "default"])
+    @pytest.mark.parametrize("backend", ["auto", "numpy"])
+    def test_batch_matches_scalar(self, algorithm, handle_nulls, backend):
+        sim = WeightedFieldSimilarity(
+            field_weights={"name": 0.7, "city": 0.3},
+            algorithm=algorithm, handle_nulls=handle_nulls, batch_backend=backend,
+        )
+        expected = [sim.compute(a, b) for a, b in zip(self.DOCS1, self.DOCS2)]
+        assert sim.compute_batch(self.DOCS1, self.DOCS2).tolist() == expected
+
+    def test_auto_selects_rapidfuzz_when_kernel_exists(self):
+        from entity_resolution.similarity import weighted_field_similarity as wfs
+
+        jw = WeightedFieldSimilarity(field_weights={"name": 1.0}, algorithm="jaro_winkler")
+        jac = WeightedFieldSimilarity(field_weights={"name": 1.0}, algorithm="jaccard")
+        assert jw.batch_backend == ("rapidfuzz" if wfs.RAPIDFUZZ_AVAILABLE else "numpy")
+        assert jac.batch_backend == "numpy"
+
+    def test_rapidfuzz_backend_rejects_algorithm_without_kernel(self):
+        pytest.importorskip("rapidfuzz")
+        with pytest.raises(ValueError, match="no kernel"):
+            WeightedFieldSimilarity(
+                field_weights={"name": 1.0}, algorithm="jaccard", batch_backend="rapidfuzz"
+            )
+
+    def test_invalid_backend_rejected(self):
+        with pytest.raises(ValueError, match="batch_backend"):
+            WeightedFieldSimilarity(field_weights={"name": 1.0}, batch_backend="gpu")
+
+    def test_custom_callable_failures_skip_field(self):
+        def flaky(a, b):
+            if a == "BOOM":
+                raise RuntimeError("nope")
+            return 1.0
+
+        sim = WeightedFieldSimilarity(field_weights={"name": 0.5, "city": 0.5}, algorithm=flaky)
+        docs1 = [{"name": "BOOM", "city": "X"}, {"name": "A", "city": "Y"}]
+        docs2 = [{"name": "B", "city": "X"}, {"name": "A", "city": "Y"}]
+        assert sim.compute_batch(docs1, docs2).tolist() == [
+            sim.compute(a, b) for a, b in zip(docs1, docs2)
+        ]
+
+    def test_similarity_batch_length_mismatch(self):
+        sim = WeightedFieldSimilarity(field_weights={"name": 1.0})
+        with pytest.raises(ValueError):
+            sim.similarity_batch(["a"], [])
+        assert sim.compute_batch([], []).tolist() == []
+
+    def test_compute_batch_detailed_reports_counted_field_scores(self):
+        sim = WeightedFieldSimilarity(
+            field_weights={"name": 0.5, "city": 0.5}, algorithm="levenshtein"
+        )
+        docs1 = [{"name": "ACME", "city": "Boston"}, {"name": "ACME"}]
+        docs2 = [{"name": "acme", "city": "Bostn"}, {"name": "ACNE", "city": "Boston"}]
+        scores, fields = sim.compute_batch_detailed(docs1, docs2)
+        assert scores.tolist() == sim.compute_batch(docs1, docs2).tolist()
+        assert fields["name"].tolist() == [1.0, 0.75]
+        assert fields["city"][0] == pytest.approx(5 / 6)
+        assert math.isnan(fields["city"][1])  # skipped null
+
+
+class TestTokenSetKernels:
+    """Interned token-id scoring for jaccard / overlap."""
+
+    LEFT = ["123 MAIN ST", "MAIN ST", "", "A A B", "X Y Z", "", "ONE"]
+    RIGHT = ["123 MAIN STREET", "MAIN ST SUITE 200", "", "B A", "P Q", "ONE", "ONE"]
+
+    @pytest.mark.parametrize("algorithm", ["jaccard", "overlap"])
+    def test_merge_intersection_matches_scalar(self, algorithm):
+        sim = WeightedFieldSimilarity(field_weights={"f": 1.0}, algorithm=algorithm)
+        expected = [sim.similarity_fn(a, b) for a, b in zip(self.LEFT, self.RIGHT)]
+        assert sim.similarity_batch(self.LEFT, self.RIGHT).tolist() == expected
+
+    def test_overlap_scores_containment_as_match(self):
+        sim = WeightedFieldSimilarity(field_weights={"f": 1.0}, algorithm="overlap")
+        assert sim.compute({"f": "Main St"}, {"f": "main st suite 200"}) == 1.0
+
+    def test_minhash_estimates_large_sets(self):
+        left = " ".join(f"t{i}" for i in range(200))
+        right = " ".join(f"t{i}" for i in range(100, 300))  # J = 100 / 300
+        exact = WeightedFieldSimilarity(field_weights={"f": 1.0}, algorithm="jaccard")
+        sketched = WeightedFieldSimilarity(
+            field_weights={"f": 1.0}, algorithm="jaccard",
+            minhash_threshold=50, minhash_permutations=256,
+        )
+        assert exact.similarity_batch([left], [right])[0] == pytest.approx(1 / 3)
+        assert sketched.similarity_batch([left], [right])[0] == pytest.approx(1 / 3, abs=0.1)
+        # Pairs below the threshold stay exact.
+        assert sketched.similarity_batch(["A B"], ["A C"]).tolist() == [1 / 3]
+
+    def test_invalid_minhash_config_rejected(self):
+        with pytest.raises(ValueError):
+            WeightedFieldSimilarity(field_weights={"f": 1.0}, minhash_threshold=0)
+        with pytest.raises(ValueError):
+            WeightedFieldSimilarity(field_weights={"f": 1.0}, minhash_permutations=0)